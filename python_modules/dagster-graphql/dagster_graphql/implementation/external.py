@@ -98,12 +98,14 @@ def get_external_execution_plan_or_raise(
     run_config: Mapping[str, object],
     step_keys_to_execute: Optional[Sequence[str]],
     known_state: Optional[KnownExecutionState],
+    tags: Optional[Mapping[str, str]] = None,
 ) -> ExternalExecutionPlan:
     return graphene_info.context.get_external_execution_plan(
         external_job=external_pipeline,
         run_config=run_config,
         step_keys_to_execute=step_keys_to_execute,
         known_state=known_state,
+        tags=tags,
     )
 
 
@@ -9,6 +9,7 @@
     Mapping,
     Optional,
     Sequence,
+    Set,
     Tuple,
     Union,
     cast,
@@ -28,6 +29,7 @@
 from dagster._core.definitions.external_asset_graph import ExternalAssetGraph
 from dagster._core.definitions.multi_dimensional_partitions import (
     MultiPartitionsSubset,
+    PartitionDimensionDefinition,
 )
 from dagster._core.definitions.partition import (
     CachingDynamicPartitionsLoader,
@@ -493,6 +495,38 @@ def build_partition_statuses(
         check.failed("Should not reach this point")
 
 
+def _get_dim2_partition_subsets_by_dim1(
+    partitions_subset: PartitionsSubset,
+    primary_dim_name: str,
+    secondary_dim: PartitionDimensionDefinition,
+) -> Dict[str, PartitionsSubset]:
+    dim2_partition_subset_by_dim1: Dict[str, PartitionsSubset] = defaultdict(
+        lambda: secondary_dim.partitions_def.empty_subset()
+    )
+    if isinstance(partitions_subset, MultiPartitionsSubset):
+        # Primary keys with the same secondary keys share a key set, so build each secondary
+        # subset once
+        subsets_by_secondary_keys_id: Dict[int, PartitionsSubset] = {}
+        for dim1_key, dim2_keys in partitions_subset.secondary_keys_by_primary_key.items():
+            if id(dim2_keys) not in subsets_by_secondary_keys_id:
+                subsets_by_secondary_keys_id[
+                    id(dim2_keys)
+                ] = secondary_dim.partitions_def.empty_subset().with_partition_keys(dim2_keys)
+            dim2_partition_subset_by_dim1[dim1_key] = subsets_by_secondary_keys_id[id(dim2_keys)]
+        return dim2_partition_subset_by_dim1
+
+    dim2_keys_by_dim1: Dict[str, Set[str]] = defaultdict(set)
+    for partition_key in cast(Sequence[MultiPartitionKey], partitions_subset.get_partition_keys()):
+        dim2_keys_by_dim1[partition_key.keys_by_dimension[primary_dim_name]].add(
+            partition_key.keys_by_dimension[secondary_dim.name]
+        )
+    for dim1_key, dim2_keys in dim2_keys_by_dim1.items():
+        dim2_partition_subset_by_dim1[
+            dim1_key
+        ] = secondary_dim.partitions_def.empty_subset().with_partition_keys(dim2_keys)
+    return dim2_partition_subset_by_dim1
+
+
 def get_2d_run_length_encoded_partitions(
     dynamic_partitions_store: DynamicPartitionsStore,
     materialized_partitions_subset: PartitionsSubset,
@@ -514,47 +548,15 @@ def get_2d_run_length_encoded_partitions(
     primary_dim = materialized_partitions_subset.partitions_def.primary_dimension
     secondary_dim = materialized_partitions_subset.partitions_def.secondary_dimension
 
-    dim2_materialized_partition_subset_by_dim1: Dict[str, PartitionsSubset] = defaultdict(
-        lambda: secondary_dim.partitions_def.empty_subset()
+    dim2_materialized_partition_subset_by_dim1 = _get_dim2_partition_subsets_by_dim1(
+        materialized_partitions_subset, primary_dim.name, secondary_dim
     )
-    for partition_key in cast(
-        Sequence[MultiPartitionKey], materialized_partitions_subset.get_partition_keys()
-    ):
-        dim2_materialized_partition_subset_by_dim1[
-            partition_key.keys_by_dimension[primary_dim.name]
-        ] = dim2_materialized_partition_subset_by_dim1[
-            partition_key.keys_by_dimension[primary_dim.name]
-        ].with_partition_keys(
-            [partition_key.keys_by_dimension[secondary_dim.name]]
-        )
-
-    dim2_failed_partition_subset_by_dim1: Dict[str, PartitionsSubset] = defaultdict(
-        lambda: secondary_dim.partitions_def.empty_subset()
+    dim2_failed_partition_subset_by_dim1 = _get_dim2_partition_subsets_by_dim1(
+        failed_partitions_subset, primary_dim.name, secondary_dim
     )
-    for partition_key in cast(
-        Sequence[MultiPartitionKey], failed_partitions_subset.get_partition_keys()
-    ):
-        dim2_failed_partition_subset_by_dim1[
-            partition_key.keys_by_dimension[primary_dim.name]
-        ] = dim2_failed_partition_subset_by_dim1[
-            partition_key.keys_by_dimension[primary_dim.name]
-        ].with_partition_keys(
-            [partition_key.keys_by_dimension[secondary_dim.name]]
-        )
-
-    dim2_in_progress_partition_subset_by_dim1: Dict[str, PartitionsSubset] = defaultdict(
-        lambda: secondary_dim.partitions_def.empty_subset()
+    dim2_in_progress_partition_subset_by_dim1 = _get_dim2_partition_subsets_by_dim1(
+        in_progress_partitions_subset, primary_dim.name, secondary_dim
     )
-    for partition_key in cast(
-        Sequence[MultiPartitionKey], in_progress_partitions_subset.get_partition_keys()
-    ):
-        dim2_in_progress_partition_subset_by_dim1[
-            partition_key.keys_by_dimension[primary_dim.name]
-        ] = dim2_in_progress_partition_subset_by_dim1[
-            partition_key.keys_by_dimension[primary_dim.name]
-        ].with_partition_keys(
-            [partition_key.keys_by_dimension[secondary_dim.name]]
-        )
 
     materialized_2d_ranges = []
 
@@ -529,14 +529,19 @@ def resolve_assetMaterializations(self, graphene_info: ResolveInfo):
         ]
 
     def resolve_eventConnection(self, graphene_info: ResolveInfo, afterCursor=None):
-        conn = graphene_info.context.instance.get_records_for_run(self.run_id, cursor=afterCursor)
-        return GrapheneEventConnection(
-            events=[
+        # stream the records, rather than fetching them all at once, so that only the converted
+        # events are held in memory
+        with graphene_info.context.instance.iter_records_for_run(
+            self.run_id, cursor=afterCursor
+        ) as records:
+            events = [
                 from_event_record(record.event_log_entry, self.dagster_run.job_name)
-                for record in conn.records
-            ],
-            cursor=conn.cursor,
-            hasMore=conn.has_more,
+                for record in records
+            ]
+        return GrapheneEventConnection(
+            events=events,
+            cursor=records.cursor,
+            hasMore=False,
         )
 
     def _get_run_record(self, instance):
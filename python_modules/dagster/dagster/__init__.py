@@ -302,6 +302,7 @@
 )
 from dagster._core.definitions.resource_definition import (
     ResourceDefinition as ResourceDefinition,
+    ResourceLifetimeScope as ResourceLifetimeScope,
     make_values_resource as make_values_resource,
     resource as resource,
 )
@@ -494,9 +495,14 @@
     RootInputManagerDefinition as RootInputManagerDefinition,
     root_input_manager as root_input_manager,
 )
+from dagster._core.storage.shared_memory_io_manager import (
+    SharedMemoryIOManager as SharedMemoryIOManager,
+    shared_memory_io_manager as shared_memory_io_manager,
+)
 from dagster._core.storage.tags import (
     MAX_RUNTIME_SECONDS_TAG as MAX_RUNTIME_SECONDS_TAG,
     MEMOIZED_RUN_TAG as MEMOIZED_RUN_TAG,
+    SKIP_UNCHANGED_STEPS_TAG as SKIP_UNCHANGED_STEPS_TAG,
 )
 from dagster._core.storage.upath_io_manager import UPathIOManager as UPathIOManager
 from dagster._core.types.config_schema import (
@@ -28,6 +28,7 @@ def sync_get_external_execution_plan_grpc(
     step_keys_to_execute: Optional[Sequence[str]] = None,
     known_state: Optional[KnownExecutionState] = None,
     instance: Optional[DagsterInstance] = None,
+    tags: Optional[Mapping[str, str]] = None,
 ) -> ExecutionPlanSnapshot:
     from dagster._grpc.client import DagsterGrpcClient
 
@@ -42,6 +43,7 @@ def sync_get_external_execution_plan_grpc(
     check.str_param(job_snapshot_id, "job_snapshot_id")
     check.opt_inst_param(known_state, "known_state", KnownExecutionState)
     check.opt_inst_param(instance, "instance", DagsterInstance)
+    tags = check.opt_mapping_param(tags, "tags", key_type=str, value_type=str)
 
     result = deserialize_value(
         api_client.execution_plan_snapshot(
@@ -55,6 +57,7 @@ def sync_get_external_execution_plan_grpc(
                 known_state=known_state,
                 instance_ref=instance.get_ref() if instance and instance.is_persistent else None,
                 asset_selection=asset_selection,
+                tags=tags,
             )
         ),
         (ExecutionPlanSnapshot, ExecutionPlanSnapshotErrorData),
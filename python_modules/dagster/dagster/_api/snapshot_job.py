@@ -3,10 +3,11 @@
 import dagster._check as check
 from dagster._core.definitions.events import AssetKey
 from dagster._core.errors import DagsterUserCodeProcessError
-from dagster._core.host_representation.external_data import ExternalJobSubsetResult
-from dagster._core.host_representation.origin import ExternalJobOrigin
+from dagster._core.host_representation.external_data import ExternalJobData, ExternalJobSubsetResult
+from dagster._core.host_representation.origin import ExternalJobOrigin, ExternalRepositoryOrigin
 from dagster._grpc.types import JobSubsetSnapshotArgs
 from dagster._serdes import deserialize_value
+from dagster._utils.error import SerializableErrorInfo
 
 if TYPE_CHECKING:
     from dagster._grpc.client import DagsterGrpcClient
@@ -40,3 +41,25 @@ def sync_get_external_job_subset_grpc(
         raise DagsterUserCodeProcessError.from_error_info(result.error)
 
     return result
+
+
+def sync_get_external_job_grpc(
+    api_client: "DagsterGrpcClient",
+    repository_origin: ExternalRepositoryOrigin,
+    job_name: str,
+) -> ExternalJobData:
+    from dagster._grpc.client import DagsterGrpcClient
+
+    check.inst_param(api_client, "api_client", DagsterGrpcClient)
+    repository_origin = check.inst_param(
+        repository_origin, "repository_origin", ExternalRepositoryOrigin
+    )
+    job_name = check.str_param(job_name, "job_name")
+
+    result = api_client.external_job(repository_origin, job_name)
+    if result.serialized_error:
+        raise DagsterUserCodeProcessError.from_error_info(
+            deserialize_value(result.serialized_error, SerializableErrorInfo)
+        )
+
+    return deserialize_value(result.serialized_job_data, ExternalJobData)
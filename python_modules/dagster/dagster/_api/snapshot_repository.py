@@ -1,11 +1,21 @@
-from typing import TYPE_CHECKING, Mapping
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, Mapping, NamedTuple, Optional
 
 import dagster._check as check
 from dagster._core.errors import DagsterUserCodeProcessError
 from dagster._core.host_representation.external_data import (
+    ExternalAssetNode,
+    ExternalJobData,
+    ExternalJobRef,
     ExternalRepositoryData,
+    ExternalRepositoryDataPiece,
     ExternalRepositoryErrorData,
+    ExternalScheduleData,
+    ExternalSensorData,
+    external_repository_data_from_pieces,
+    external_repository_data_piece_key,
 )
+from dagster._core.host_representation.origin import ExternalRepositoryOrigin
+from dagster._grpc.types import ExternalRepositoryChangesArgs, ExternalRepositoryPieceHashes
 from dagster._serdes import deserialize_value
 
 if TYPE_CHECKING:
@@ -13,36 +23,114 @@
     from dagster._grpc.client import DagsterGrpcClient
 
 
+class HashedExternalRepositoryDataPiece(NamedTuple):
+    piece: ExternalRepositoryDataPiece
+    # None for pieces from servers that don't hash them
+    content_hash: Optional[str]
+
+
+def _deserialize_pieces(serialized_pieces: Iterable[str]) -> Iterator[ExternalRepositoryDataPiece]:
+    # each piece is decoded as soon as it arrives, rather than after the whole repository
+    for serialized_piece in serialized_pieces:
+        piece = deserialize_value(
+            serialized_piece,
+            (
+                ExternalRepositoryData,
+                ExternalRepositoryErrorData,
+                ExternalJobData,
+                ExternalJobRef,
+                ExternalAssetNode,
+                ExternalScheduleData,
+                ExternalSensorData,
+            ),
+        )
+        if isinstance(piece, ExternalRepositoryErrorData):
+            raise DagsterUserCodeProcessError.from_error_info(piece.error)
+        yield piece
+
+
+def sync_get_streaming_external_repository_pieces_grpc(
+    api_client: "DagsterGrpcClient",
+    repository_origin: ExternalRepositoryOrigin,
+    defer_snapshots: bool = False,
+    previous_pieces: Optional[Mapping[str, HashedExternalRepositoryDataPiece]] = None,
+) -> Mapping[str, HashedExternalRepositoryDataPiece]:
+    """Fetches the pieces of a repository's ExternalRepositoryData, keyed by
+    external_repository_data_piece_key in the order they were built in. Pieces that haven't changed
+    since previous_pieces were fetched are reused rather than fetched again.
+    """
+    check.inst_param(repository_origin, "repository_origin", ExternalRepositoryOrigin)
+    check.bool_param(defer_snapshots, "defer_snapshots")
+    previous_pieces = check.opt_mapping_param(previous_pieces, "previous_pieces", key_type=str)
+
+    serialized_values = iter(
+        api_client.streaming_external_repository_changes(
+            ExternalRepositoryChangesArgs(
+                repository_origin=repository_origin,
+                defer_snapshots=defer_snapshots,
+                piece_hashes={
+                    key: previous.content_hash
+                    for key, previous in previous_pieces.items()
+                    if previous.content_hash is not None
+                },
+            )
+        )
+    )
+    piece_hashes = deserialize_value(
+        next(serialized_values),
+        (ExternalRepositoryPieceHashes, ExternalRepositoryData, ExternalRepositoryErrorData),
+    )
+    if isinstance(piece_hashes, ExternalRepositoryErrorData):
+        raise DagsterUserCodeProcessError.from_error_info(piece_hashes.error)
+
+    if isinstance(piece_hashes, ExternalRepositoryData):
+        # servers that can't compare pieces send all of them, without hashes
+        return {
+            external_repository_data_piece_key(piece): HashedExternalRepositoryDataPiece(
+                piece, None
+            )
+            for piece in [piece_hashes, *_deserialize_pieces(serialized_values)]
+        }
+
+    changed_pieces = {
+        external_repository_data_piece_key(piece): piece
+        for piece in _deserialize_pieces(serialized_values)
+    }
+    pieces: Dict[str, HashedExternalRepositoryDataPiece] = {}
+    for key, content_hash in piece_hashes.piece_hashes:
+        if key in changed_pieces:
+            pieces[key] = HashedExternalRepositoryDataPiece(changed_pieces[key], content_hash)
+        else:
+            previous = previous_pieces.get(key)
+            check.invariant(
+                previous is not None and previous.content_hash == content_hash,
+                (
+                    f"Code server did not send changed piece {key} of repository"
+                    f" {repository_origin.repository_name}"
+                ),
+            )
+            pieces[key] = check.not_none(previous)
+    return pieces
+
+
 def sync_get_streaming_external_repositories_data_grpc(
-    api_client: "DagsterGrpcClient", code_location: "CodeLocation"
+    api_client: "DagsterGrpcClient",
+    code_location: "CodeLocation",
+    defer_snapshots: bool = False,
 ) -> Mapping[str, ExternalRepositoryData]:
-    from dagster._core.host_representation import CodeLocation, ExternalRepositoryOrigin
+    from dagster._core.host_representation import CodeLocation
 
     check.inst_param(code_location, "code_location", CodeLocation)
+    check.bool_param(defer_snapshots, "defer_snapshots")
 
     repo_datas = {}
     for repository_name in code_location.repository_names:  # type: ignore
-        external_repository_chunks = list(
-            api_client.streaming_external_repository(
-                external_repository_origin=ExternalRepositoryOrigin(
-                    code_location.origin,
-                    repository_name,
-                )
-            )
+        pieces = sync_get_streaming_external_repository_pieces_grpc(
+            api_client,
+            ExternalRepositoryOrigin(code_location.origin, repository_name),
+            defer_snapshots=defer_snapshots,
         )
-
-        result = deserialize_value(
-            "".join(
-                [
-                    chunk["serialized_external_repository_chunk"]
-                    for chunk in external_repository_chunks
-                ]
-            ),
-            (ExternalRepositoryData, ExternalRepositoryErrorData),
+        repo_datas[repository_name] = external_repository_data_from_pieces(
+            hashed_piece.piece for hashed_piece in pieces.values()
         )
-
-        if isinstance(result, ExternalRepositoryErrorData):
-            raise DagsterUserCodeProcessError.from_error_info(result.error)
-
-        repo_datas[repository_name] = result
     return repo_datas
@@ -18,7 +18,7 @@
 from dagster._core.definitions.metadata import MetadataValue
 from dagster._core.errors import DagsterExecutionInterruptedError
 from dagster._core.events import DagsterEvent, DagsterEventType, EngineEventData
-from dagster._core.execution.api import create_execution_plan, execute_plan_iterator
+from dagster._core.execution.api import create_execution_plan_for_steps, execute_plan_iterator
 from dagster._core.execution.context_creation_job import create_context_free_log_manager
 from dagster._core.execution.run_cancellation_thread import start_run_cancellation_thread
 from dagster._core.instance import DagsterInstance, InstanceRef
@@ -349,12 +349,15 @@ def execute_step_command(input_json, compressed_input_json):
 
             buff = []
 
-            for event in _execute_step_command_body(
-                args,
-                instance,
-                dagster_run,
-            ):
-                buff.append(serialize_value(event))
+            # step workers of a run execute concurrently, so batch their event writes to reduce
+            # the load on the event log storage
+            with instance.batch_event_writes():
+                for event in _execute_step_command_body(
+                    args,
+                    instance,
+                    dagster_run,
+                ):
+                    buff.append(serialize_value(event))
 
             for line in buff:
                 click.echo(line)
@@ -409,11 +412,15 @@ def _execute_step_command_body(
             if not success:
                 return
 
+        # the snapshot is only fetched when it is needed for the repository load data, in which
+        # case the step's plan is rebuilt from it rather than built again
         if dagster_run.has_repository_load_data:
-            repository_load_data = instance.get_execution_plan_snapshot(
+            execution_plan_snapshot = instance.get_execution_plan_snapshot(
                 check.not_none(dagster_run.execution_plan_snapshot_id)
-            ).repository_load_data
+            )
+            repository_load_data = execution_plan_snapshot.repository_load_data
         else:
+            execution_plan_snapshot = None
             repository_load_data = None
 
         recon_job = (
@@ -425,11 +432,13 @@ def _execute_step_command_body(
             )
         )
 
-        execution_plan = create_execution_plan(
+        execution_plan = create_execution_plan_for_steps(
             recon_job,
-            run_config=dagster_run.run_config,
+            dagster_run,
+            execution_plan_snapshot,
             step_keys_to_execute=args.step_keys_to_execute,
             known_state=args.known_state,
+            run_config=dagster_run.run_config,
             repository_load_data=repository_load_data,
         )
 
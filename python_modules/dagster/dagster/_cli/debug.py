@@ -24,10 +24,9 @@ def _recent_failed_runs_text(instance):
 
 
 def export_run(instance, run, output_file):
-    debug_payload = DebugRunPayload.build(instance, run)
     with GzipFile(output_file, "wb") as file:
         click.echo(f"Exporting run_id '{run.run_id}' to gzip output file {output_file}.")
-        debug_payload.write(file)
+        DebugRunPayload.write_for_run(instance, run, file)
 
 
 @click.group(name="debug")
@@ -93,6 +93,7 @@ class cached_property:
     ResourceFunction,
     ResourceFunctionWithContext,
     ResourceFunctionWithoutContext,
+    ResourceLifetimeScope,
     has_at_least_one_parameter,
 )
 from dagster._core.storage.io_manager import IOManager, IOManagerDefinition
@@ -578,6 +579,10 @@ def required_resource_keys(self) -> AbstractSet[str]:
             self._resource, self._resource_id_to_key_mapping
         )
 
+    @property
+    def lifetime_scope(self) -> ResourceLifetimeScope:
+        return self._resource.lifetime_scope
+
     @property
     def wrapped_resource(self) -> ResourceDefinition:
         return self._resource
@@ -1,11 +1,13 @@
-from typing import NamedTuple, Sequence
+from typing import IO, NamedTuple, Sequence
+from uuid import uuid4
 
 import dagster._check as check
 from dagster._core.events.log import EventLogEntry
 from dagster._core.instance import DagsterInstance
 from dagster._core.snap import ExecutionPlanSnapshot, JobSnapshot
 from dagster._core.storage.dagster_run import DagsterRun
-from dagster._serdes import serialize_value, whitelist_for_serdes
+from dagster._serdes import pack_value, serialize_value, whitelist_for_serdes
+from dagster._seven import json
 
 
 @whitelist_for_serdes(
@@ -61,3 +63,43 @@ def build(cls, instance: DagsterInstance, run: DagsterRun) -> "DebugRunPayload":
 
     def write(self, output_file):
         return output_file.write(serialize_value(self).encode("utf-8"))
+
+    @classmethod
+    def write_for_run(
+        cls, instance: DagsterInstance, run: DagsterRun, output_file: IO[bytes]
+    ) -> None:
+        """Write the debug payload for a run to `output_file`, in the same format as `write`.
+
+        Unlike `build` followed by `write`, the run's events are streamed from the event log and
+        serialized one at a time, so that exporting a run uses a bounded amount of memory
+        regardless of how many events it has.
+        """
+        from dagster import __version__ as dagster_version
+
+        # serialize the rest of the payload around a placeholder for the event list
+        placeholder = f"__event_list_{uuid4().hex}__"
+        packed = dict(
+            pack_value(
+                cls(
+                    version=dagster_version,
+                    dagster_run=run,
+                    event_list=[],
+                    job_snapshot=instance.get_job_snapshot(run.job_snapshot_id),  # type: ignore  # (possible none)
+                    execution_plan_snapshot=instance.get_execution_plan_snapshot(
+                        run.execution_plan_snapshot_id  # type: ignore  # (possible none)
+                    ),
+                )
+            )
+        )
+        packed["event_list"] = placeholder
+        head, tail = json.dumps(packed).split(json.dumps(placeholder), 1)
+
+        output_file.write(head.encode("utf-8"))
+        output_file.write(b"[")
+        with instance.iter_records_for_run(run.run_id) as records:
+            for i, record in enumerate(records):
+                if i:
+                    output_file.write(b", ")
+                output_file.write(serialize_value(record.event_log_entry).encode("utf-8"))
+        output_file.write(b"]")
+        output_file.write(tail.encode("utf-8"))
@@ -331,12 +331,21 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
     if start_selector:
         start_method, start_cfg = list(start_selector.items())[0]
 
+    worker_pool_cfg = check.opt_nullable_dict_elem(config, "worker_pool")
+
     return MultiprocessExecutor(
         max_concurrent=check.int_elem(config, "max_concurrent"),
         tag_concurrency_limits=check.opt_list_elem(config, "tag_concurrency_limits"),
         retries=RetryMode.from_config(check.dict_elem(config, "retries")),  # type: ignore
         start_method=start_method,
         explicit_forkserver_preload=check.opt_list_elem(start_cfg, "preload_modules", of_type=str),
+        use_worker_pool=worker_pool_cfg is not None,
+        max_steps_per_worker=check.opt_int_elem(worker_pool_cfg, "max_steps_per_worker")
+        if worker_pool_cfg is not None
+        else None,
+        max_memory_growth_mb=check.opt_int_elem(worker_pool_cfg, "max_memory_growth_mb")
+        if worker_pool_cfg is not None
+        else None,
     )
 
 
@@ -390,6 +399,32 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
             ),
         ),
         "retries": get_retries_config(),
+        "worker_pool": Field(
+            {
+                "max_steps_per_worker": Field(
+                    Int,
+                    default_value=100,
+                    description=(
+                        "The number of steps a worker process executes before it is replaced by a"
+                        " new one."
+                    ),
+                ),
+                "max_memory_growth_mb": Field(
+                    Int,
+                    is_required=False,
+                    description=(
+                        "Replace a worker process after the step during which its memory usage"
+                        " grew by more than this many megabytes since it started."
+                    ),
+                ),
+            },
+            is_required=False,
+            description=(
+                "Execute steps in a pool of up to `max_concurrent` long-lived worker processes"
+                " instead of starting a new process for each step. Workers keep the code they"
+                " have loaded between steps, which avoids reloading the job for every step."
+            ),
+        ),
     },
     description="Execute each step in an individual process.",
 )
@@ -418,6 +453,21 @@ def multiprocess_executor(init_context):
     concurrently. By default, or if you set ``max_concurrent`` to be 0, this is the return value of
     :py:func:`python:multiprocessing.cpu_count`.
 
+    For jobs with many short-running steps, set ``worker_pool`` to execute steps in long-lived
+    worker processes that are reused across steps instead of starting a process per step:
+
+    .. code-block:: yaml
+
+        execution:
+          config:
+            multiprocess:
+              worker_pool:
+                max_steps_per_worker: 100
+                max_memory_growth_mb: 512
+
+    Resources with a lifetime scope of ``ResourceLifetimeScope.PROCESS`` are initialized once in each
+    worker process and shared by the steps it executes, rather than being initialized for every step.
+
     Execution priority can be configured using the ``dagster/priority`` tag via op metadata,
     where the higher the number the higher the priority. 0 is the default and both positive
     and negative numbers can be used.
@@ -55,7 +55,7 @@
     OpSelectionData,
 )
 from dagster._core.storage.io_manager import IOManagerDefinition, io_manager
-from dagster._core.storage.tags import MEMOIZED_RUN_TAG
+from dagster._core.storage.tags import MEMOIZED_RUN_TAG, SKIP_UNCHANGED_STEPS_TAG
 from dagster._core.types.dagster_type import DagsterType
 from dagster._core.utils import str_format_set
 from dagster._utils import IHasInternalInit
@@ -448,6 +448,10 @@ def is_using_memoization(self, run_tags: Mapping[str, str]) -> bool:
             MEMOIZED_RUN_TAG in tags and tags.get(MEMOIZED_RUN_TAG) == "true"
         ) or self.version_strategy is not None
 
+    def is_skipping_unchanged_steps(self, run_tags: Mapping[str, str]) -> bool:
+        tags = merge_dicts(self.tags, run_tags)
+        return tags.get(SKIP_UNCHANGED_STEPS_TAG) == "true"
+
     def get_required_resource_defs(self) -> Mapping[str, ResourceDefinition]:
         return {
             resource_key: resource
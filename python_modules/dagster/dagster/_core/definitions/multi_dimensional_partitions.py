@@ -1,9 +1,13 @@
 import hashlib
 import itertools
+import json
+from collections import defaultdict
 from datetime import datetime
 from functools import reduce
 from typing import (
+    AbstractSet,
     Dict,
+    FrozenSet,
     Iterable,
     List,
     Mapping,
@@ -37,6 +41,7 @@
     PartitionsSubset,
     StaticPartitionsDefinition,
 )
+from .partition_key_range import PartitionKeyRange
 from .time_window_partitions import TimeWindow, TimeWindowPartitionsDefinition
 
 INVALID_STATIC_PARTITIONS_KEY_CHARACTERS = set(["|", ",", "[", "]"])
@@ -294,25 +299,23 @@ def get_partition_keys(
     def filter_valid_partition_keys(
         self, partition_keys: Set[str], dynamic_partitions_store: DynamicPartitionsStore
     ) -> Set[MultiPartitionKey]:
-        partition_keys_by_dimension = {
-            dim.name: dim.partitions_def.get_partition_keys(
-                dynamic_partitions_store=dynamic_partitions_store
+        partition_keys_by_dimension = [
+            set(
+                dim.partitions_def.get_partition_keys(
+                    dynamic_partitions_store=dynamic_partitions_store
+                )
             )
             for dim in self.partitions_defs
-        }
+        ]
         validated_partitions = set()
         for partition_key in partition_keys:
             partition_key_strs = partition_key.split(MULTIPARTITION_KEY_DELIMITER)
             if len(partition_key_strs) != len(self.partitions_defs):
                 continue
 
-            multipartition_key = MultiPartitionKey(
-                {dim.name: partition_key_strs[i] for i, dim in enumerate(self._partitions_defs)}
-            )
-
             if all(
-                key in partition_keys_by_dimension.get(dim, [])
-                for dim, key in multipartition_key.keys_by_dimension.items()
+                key in dimension_keys
+                for key, dimension_keys in zip(partition_key_strs, partition_keys_by_dimension)
             ):
                 validated_partitions.add(partition_key)
 
@@ -505,30 +508,326 @@ def get_num_partitions(
 
 
 class MultiPartitionsSubset(DefaultPartitionsSubset):
+    """A subset of the partitions of a MultiPartitionsDefinition.
+
+    Instead of holding a MultiPartitionKey for every partition in the subset, which grows with the
+    cross product of the dimensions, the subset is stored as a mapping from each partition key of
+    the primary dimension to the frozenset of secondary dimension keys it is paired with. Equal
+    secondary key sets are shared between primary keys, so a subset covering the full cross
+    product takes memory proportional to the sum of the dimension sizes. Membership, counts, and
+    per-dimension slices are answered from this mapping; MultiPartitionKeys are only built when the
+    keys are enumerated.
+    """
+
     def __init__(
         self,
         partitions_def: MultiPartitionsDefinition,
         subset: Optional[Set[str]] = None,
     ):
         check.inst_param(partitions_def, "partitions_def", MultiPartitionsDefinition)
-        subset = (
-            set(
-                [
-                    partitions_def.get_partition_key_from_str(key)
-                    for key in subset
-                    if MULTIPARTITION_KEY_DELIMITER in key
-                ]
+        check.opt_set_param(subset, "subset")
+        self._partitions_def = partitions_def
+        self._secondary_keys_by_primary_key = _merge_secondary_keys_by_primary_key(
+            {}, self._group_partition_keys(subset or set())
+        )
+        self._num_partitions: Optional[int] = None
+
+    @classmethod
+    def _from_secondary_keys_by_primary_key(
+        cls,
+        partitions_def: MultiPartitionsDefinition,
+        secondary_keys_by_primary_key: Mapping[str, FrozenSet[str]],
+    ) -> "MultiPartitionsSubset":
+        subset = cls(partitions_def)
+        subset._secondary_keys_by_primary_key = secondary_keys_by_primary_key  # noqa: SLF001
+        return subset
+
+    @property
+    def _multi_partitions_def(self) -> MultiPartitionsDefinition:
+        return cast(MultiPartitionsDefinition, self._partitions_def)
+
+    @property
+    def _subset(self) -> Set[str]:
+        # DefaultPartitionsSubset stores its keys in _subset. Build them from the per-dimension
+        # mapping so that any inherited code reading it sees the same keys as this subset.
+        return {
+            self._build_partition_key(primary_key, secondary_key)
+            for primary_key, secondary_keys in self._secondary_keys_by_primary_key.items()
+            for secondary_key in secondary_keys
+        }
+
+    @property
+    def _primary_dimension_index(self) -> int:
+        partitions_def = self._multi_partitions_def
+        return partitions_def.partition_dimension_names.index(partitions_def.primary_dimension.name)
+
+    def _group_partition_keys(self, partition_keys: Iterable[str]) -> Mapping[str, Set[str]]:
+        primary_index = self._primary_dimension_index
+        num_dimensions = len(self._multi_partitions_def.partitions_defs)
+        secondary_keys_by_primary_key: Dict[str, Set[str]] = defaultdict(set)
+        for partition_key in partition_keys:
+            if MULTIPARTITION_KEY_DELIMITER not in partition_key:
+                continue
+            dimension_keys = partition_key.split(MULTIPARTITION_KEY_DELIMITER)
+            check.invariant(
+                len(dimension_keys) == num_dimensions,
+                (
+                    f"Expected {num_dimensions} partition keys in partition key string"
+                    f" {partition_key}, but got {len(dimension_keys)}"
+                ),
+            )
+            secondary_keys_by_primary_key[dimension_keys[primary_index]].add(
+                dimension_keys[1 - primary_index]
             )
-            if subset
-            else set()
+        return secondary_keys_by_primary_key
+
+    def _build_partition_key(self, primary_key: str, secondary_key: str) -> MultiPartitionKey:
+        partitions_def = self._multi_partitions_def
+        return MultiPartitionKey(
+            {
+                partitions_def.primary_dimension.name: primary_key,
+                partitions_def.secondary_dimension.name: secondary_key,
+            }
         )
-        super(MultiPartitionsSubset, self).__init__(partitions_def, subset)
+
+    @property
+    def secondary_keys_by_primary_key(self) -> Mapping[str, AbstractSet[str]]:
+        """A mapping from each primary dimension key in the subset to the secondary dimension keys
+        it is paired with.
+        """
+        return self._secondary_keys_by_primary_key
+
+    def get_multipartition_keys_with_dimension_value(
+        self, dimension_name: str, dimension_partition_key: str
+    ) -> Set[MultiPartitionKey]:
+        """Returns the keys in the subset whose key for the given dimension is the given value."""
+        check.str_param(dimension_name, "dimension_name")
+        check.str_param(dimension_partition_key, "dimension_partition_key")
+        partitions_def = self._multi_partitions_def
+        check.invariant(
+            dimension_name in partitions_def.partition_dimension_names,
+            (
+                f"Dimension {dimension_name} not found in MultiPartitionsDefinition with dimensions"
+                f" {partitions_def.partition_dimension_names}"
+            ),
+        )
+
+        if dimension_name == partitions_def.primary_dimension.name:
+            return {
+                self._build_partition_key(dimension_partition_key, secondary_key)
+                for secondary_key in self._secondary_keys_by_primary_key.get(
+                    dimension_partition_key, frozenset()
+                )
+            }
+
+        return {
+            self._build_partition_key(primary_key, dimension_partition_key)
+            for primary_key, secondary_keys in self._secondary_keys_by_primary_key.items()
+            if dimension_partition_key in secondary_keys
+        }
+
+    def get_partition_keys_not_in_subset(
+        self,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Iterable[str]:
+        partitions_def = self._multi_partitions_def
+        primary_keys = partitions_def.primary_dimension.partitions_def.get_partition_keys(
+            current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
+        )
+        secondary_keys = partitions_def.secondary_dimension.partitions_def.get_partition_keys(
+            current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
+        )
+        return {
+            self._build_partition_key(primary_key, secondary_key)
+            for primary_key in primary_keys
+            for secondary_key in secondary_keys
+            if secondary_key
+            not in self._secondary_keys_by_primary_key.get(primary_key, frozenset())
+        }
+
+    def get_partition_keys(self, current_time: Optional[datetime] = None) -> Iterable[str]:
+        return self._subset
+
+    def get_partition_key_ranges(
+        self,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Sequence[PartitionKeyRange]:
+        # Walks the cross product in the same order as MultiPartitionsDefinition.get_partition_keys
+        # without materializing it.
+        partitions_def = self._multi_partitions_def
+        dimension_names = partitions_def.partition_dimension_names
+        partition_key_sequences = [
+            dim.partitions_def.get_partition_keys(
+                current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
+            )
+            for dim in partitions_def.partitions_defs
+        ]
+        primary_index = self._primary_dimension_index
+
+        cur_range_start = None
+        cur_range_end = None
+        result = []
+        for partition_key_tuple in itertools.product(*partition_key_sequences):
+            if partition_key_tuple[1 - primary_index] in self._secondary_keys_by_primary_key.get(
+                partition_key_tuple[primary_index], frozenset()
+            ):
+                partition_key = MultiPartitionKey(dict(zip(dimension_names, partition_key_tuple)))
+                if cur_range_start is None:
+                    cur_range_start = partition_key
+                cur_range_end = partition_key
+            else:
+                if cur_range_start is not None and cur_range_end is not None:
+                    result.append(PartitionKeyRange(cur_range_start, cur_range_end))
+                cur_range_start = cur_range_end = None
+
+        if cur_range_start is not None and cur_range_end is not None:
+            result.append(PartitionKeyRange(cur_range_start, cur_range_end))
+
+        return result
 
     def with_partition_keys(self, partition_keys: Iterable[str]) -> "MultiPartitionsSubset":
-        return MultiPartitionsSubset(
-            cast(MultiPartitionsDefinition, self._partitions_def),
-            self._subset | set(partition_keys),
+        return MultiPartitionsSubset._from_secondary_keys_by_primary_key(
+            self._multi_partitions_def,
+            _merge_secondary_keys_by_primary_key(
+                self._secondary_keys_by_primary_key, self._group_partition_keys(partition_keys)
+            ),
+        )
+
+    def _is_compatible_subset(self, other: PartitionsSubset) -> bool:
+        return (
+            isinstance(other, MultiPartitionsSubset)
+            and self._partitions_def == other._partitions_def  # noqa: SLF001
+        )
+
+    def __or__(self, other: PartitionsSubset) -> "PartitionsSubset":
+        if self is other or not self._is_compatible_subset(other):
+            return super().__or__(other)
+        return MultiPartitionsSubset._from_secondary_keys_by_primary_key(
+            self._multi_partitions_def,
+            _merge_secondary_keys_by_primary_key(
+                self._secondary_keys_by_primary_key,
+                cast(MultiPartitionsSubset, other).secondary_keys_by_primary_key,
+            ),
+        )
+
+    def __and__(self, other: PartitionsSubset) -> "PartitionsSubset":
+        if self is other or not self._is_compatible_subset(other):
+            return super().__and__(other)
+        other_secondary_keys_by_primary_key = cast(
+            MultiPartitionsSubset, other
+        ).secondary_keys_by_primary_key
+        secondary_keys_by_primary_key = {}
+        for primary_key, secondary_keys in self._secondary_keys_by_primary_key.items():
+            other_secondary_keys = other_secondary_keys_by_primary_key.get(primary_key)
+            if other_secondary_keys is None:
+                continue
+            intersection = secondary_keys & other_secondary_keys
+            if intersection:
+                secondary_keys_by_primary_key[primary_key] = intersection
+        return MultiPartitionsSubset._from_secondary_keys_by_primary_key(
+            self._multi_partitions_def,
+            _merge_secondary_keys_by_primary_key({}, secondary_keys_by_primary_key),
+        )
+
+    def __sub__(self, other: PartitionsSubset) -> "PartitionsSubset":
+        if self is other or not self._is_compatible_subset(other):
+            return super().__sub__(other)
+        other_secondary_keys_by_primary_key = cast(
+            MultiPartitionsSubset, other
+        ).secondary_keys_by_primary_key
+        secondary_keys_by_primary_key = {}
+        for primary_key, secondary_keys in self._secondary_keys_by_primary_key.items():
+            difference = secondary_keys - other_secondary_keys_by_primary_key.get(
+                primary_key, frozenset()
+            )
+            if difference:
+                secondary_keys_by_primary_key[primary_key] = difference
+        return MultiPartitionsSubset._from_secondary_keys_by_primary_key(
+            self._multi_partitions_def,
+            _merge_secondary_keys_by_primary_key({}, secondary_keys_by_primary_key),
+        )
+
+    def serialize(self) -> str:
+        primary_index = self._primary_dimension_index
+        subset = []
+        for primary_key, secondary_keys in self._secondary_keys_by_primary_key.items():
+            for secondary_key in secondary_keys:
+                dimension_keys = [primary_key, secondary_key]
+                if primary_index == 1:
+                    dimension_keys.reverse()
+                subset.append(MULTIPARTITION_KEY_DELIMITER.join(dimension_keys))
+        return json.dumps({"version": self.SERIALIZATION_VERSION, "subset": subset})
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, MultiPartitionsSubset):
+            return (
+                self._partitions_def == other._partitions_def  # noqa: SLF001
+                and self._secondary_keys_by_primary_key
+                == other._secondary_keys_by_primary_key  # noqa: SLF001
+            )
+        # a DefaultPartitionsSubset over the same definition holds the keys as a plain set
+        return (
+            isinstance(other, DefaultPartitionsSubset)
+            and self._partitions_def == other.partitions_def
+            and self.get_partition_keys() == set(other.get_partition_keys())
+        )
+
+    def __len__(self) -> int:
+        if self._num_partitions is None:
+            self._num_partitions = sum(
+                len(secondary_keys)
+                for secondary_keys in self._secondary_keys_by_primary_key.values()
+            )
+        return self._num_partitions
+
+    def __contains__(self, value) -> bool:
+        if not isinstance(value, str) or MULTIPARTITION_KEY_DELIMITER not in value:
+            return False
+        dimension_keys = value.split(MULTIPARTITION_KEY_DELIMITER)
+        if len(dimension_keys) != len(self._multi_partitions_def.partitions_defs):
+            return False
+        primary_index = self._primary_dimension_index
+        secondary_keys = self._secondary_keys_by_primary_key.get(dimension_keys[primary_index])
+        return secondary_keys is not None and dimension_keys[1 - primary_index] in secondary_keys
+
+    def __repr__(self) -> str:
+        return (
+            "MultiPartitionsSubset("
+            f"secondary_keys_by_primary_key={self._secondary_keys_by_primary_key},"
+            f" partitions_def={self._partitions_def})"
+        )
+
+
+def _merge_secondary_keys_by_primary_key(
+    secondary_keys_by_primary_key: Mapping[str, FrozenSet[str]],
+    new_secondary_keys_by_primary_key: Mapping[str, AbstractSet[str]],
+) -> Mapping[str, FrozenSet[str]]:
+    """Adds the new secondary keys to a copy of the mapping. Equal secondary key sets are replaced
+    by a single shared frozenset, so that primary keys with the same secondary keys (e.g. a fully
+    materialized time dimension) don't each hold their own copy.
+    """
+    if not new_secondary_keys_by_primary_key:
+        return secondary_keys_by_primary_key
+
+    result = dict(secondary_keys_by_primary_key)
+    shared_secondary_key_sets: Dict[FrozenSet[str], FrozenSet[str]] = {}
+    for secondary_keys in result.values():
+        shared_secondary_key_sets.setdefault(secondary_keys, secondary_keys)
+    for primary_key, new_secondary_keys in new_secondary_keys_by_primary_key.items():
+        if not new_secondary_keys:
+            continue
+        existing_secondary_keys = result.get(primary_key)
+        if existing_secondary_keys is not None and new_secondary_keys <= existing_secondary_keys:
+            continue
+        secondary_keys = frozenset(
+            new_secondary_keys
+            if existing_secondary_keys is None
+            else existing_secondary_keys | new_secondary_keys
         )
+        result[primary_key] = shared_secondary_key_sets.setdefault(secondary_keys, secondary_keys)
+    return result
 
 
 def get_tags_from_multi_partition_key(multi_partition_key: MultiPartitionKey) -> Mapping[str, str]:
@@ -853,6 +853,20 @@ def __or__(self, other: "PartitionsSubset") -> "PartitionsSubset[T_str]":
             return self
         return self.with_partition_keys(other.get_partition_keys())
 
+    def __and__(self, other: "PartitionsSubset") -> "PartitionsSubset[T_str]":
+        if self is other:
+            return self
+        return self.partitions_def.empty_subset().with_partition_keys(
+            key for key in self.get_partition_keys() if key in other
+        )
+
+    def __sub__(self, other: "PartitionsSubset") -> "PartitionsSubset[T_str]":
+        if self is other:
+            return self.partitions_def.empty_subset()
+        return self.partitions_def.empty_subset().with_partition_keys(
+            key for key in self.get_partition_keys() if key not in other
+        )
+
     @abstractmethod
     def serialize(self) -> str:
         ...
@@ -127,6 +127,14 @@ def load_all_definitions(self):
         # force load of all lazy constructed code artifacts
         self._repository_data.load_all_definitions()
 
+    @property
+    def has_cached_definitions(self) -> bool:
+        """Whether the definitions in this repository are constructed once and then cached, so that
+        a definition looked up by name later is the same one that was listed earlier. Custom
+        RepositoryData implementations may construct new definitions on every call.
+        """
+        return isinstance(self._repository_data, CachingRepositoryData)
+
     @public
     @property
     def job_names(self) -> Sequence[str]:
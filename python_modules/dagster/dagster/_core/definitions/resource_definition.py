@@ -1,3 +1,4 @@
+from enum import Enum
 from functools import update_wrapper
 from typing import (
     TYPE_CHECKING,
@@ -59,6 +60,29 @@
 ]
 
 
+class ResourceLifetimeScope(Enum):
+    """Determines how long an initialized resource is kept before it is torn down.
+
+    Attributes:
+        RUN: The resource is initialized once in each process that executes steps of a run, and is
+            torn down once that process has finished executing them. This is the default. The
+            in-process executor initializes the resource once per run, while the multiprocess
+            executor initializes it once for each step.
+        PROCESS: The resource is initialized the first time a step that requires it executes in a
+            process, and is reused by every later step that executes in that process with the same
+            resource definition and config, including steps of other runs. It is torn down when the
+            process exits. Workers of the multiprocess executor's worker pool share process-scoped
+            resources between the steps they execute. Since the resource is not tied to a run, its
+            init context has no run, and it logs to the console rather than to a run's logs.
+        STEP: The resource is initialized for each step that requires it, and is torn down once
+            that step and its hooks have finished executing.
+    """
+
+    RUN = "RUN"
+    PROCESS = "PROCESS"
+    STEP = "STEP"
+
+
 class ResourceDefinition(AnonymousConfigurableDefinition, RequiresResources, IHasInternalInit):
     """Core class for defining resources.
 
@@ -87,6 +111,9 @@ class ResourceDefinition(AnonymousConfigurableDefinition, RequiresResources, IHa
         version (Optional[str]): (Experimental) The version of the resource's definition fn. Two
             wrapped resource functions should only have the same version if they produce the same
             resource definition when provided with the same inputs.
+        lifetime_scope (Optional[ResourceLifetimeScope]): (Experimental) How long the initialized
+            resource is kept before it is torn down. Defaults to ``ResourceLifetimeScope.RUN``. A
+            resource can only require resources whose lifetime scope is at least as long as its own.
     """
 
     def __init__(
@@ -96,6 +123,7 @@ def __init__(
         description: Optional[str] = None,
         required_resource_keys: Optional[AbstractSet[str]] = None,
         version: Optional[str] = None,
+        lifetime_scope: Optional[ResourceLifetimeScope] = None,
     ):
         self._resource_fn = check.callable_param(resource_fn, "resource_fn")
         self._config_schema = convert_user_facing_definition_config_schema(config_schema)
@@ -106,6 +134,11 @@ def __init__(
         self._version = check.opt_str_param(version, "version")
         if version:
             experimental_arg_warning("version", "ResourceDefinition.__init__")
+        self._lifetime_scope = check.opt_inst_param(
+            lifetime_scope, "lifetime_scope", ResourceLifetimeScope, ResourceLifetimeScope.RUN
+        )
+        if self._lifetime_scope != ResourceLifetimeScope.RUN:
+            experimental_arg_warning("lifetime_scope", "ResourceDefinition.__init__")
 
     @staticmethod
     def dagster_internal_init(
@@ -115,6 +148,7 @@ def dagster_internal_init(
         description: Optional[str],
         required_resource_keys: Optional[AbstractSet[str]],
         version: Optional[str],
+        lifetime_scope: Optional[ResourceLifetimeScope] = None,
     ) -> "ResourceDefinition":
         return ResourceDefinition(
             resource_fn=resource_fn,
@@ -122,6 +156,7 @@ def dagster_internal_init(
             description=description,
             required_resource_keys=required_resource_keys,
             version=version,
+            lifetime_scope=lifetime_scope,
         )
 
     @property
@@ -147,6 +182,10 @@ def version(self) -> Optional[str]:
     def required_resource_keys(self) -> AbstractSet[str]:
         return self._required_resource_keys
 
+    @property
+    def lifetime_scope(self) -> ResourceLifetimeScope:
+        return self._lifetime_scope
+
     @public
     @staticmethod
     def none_resource(description: Optional[str] = None) -> "ResourceDefinition":
@@ -212,6 +251,7 @@ def copy_for_configured(
             resource_fn=self.resource_fn,
             required_resource_keys=self.required_resource_keys,
             version=self.version,
+            lifetime_scope=self.lifetime_scope,
         )
 
     def __call__(self, *args, **kwargs):
@@ -272,6 +312,7 @@ def __init__(
         description: Optional[str] = None,
         required_resource_keys: Optional[AbstractSet[str]] = None,
         version: Optional[str] = None,
+        lifetime_scope: Optional[ResourceLifetimeScope] = None,
     ):
         self.config_schema = config_schema  # checked by underlying definition
         self.description = check.opt_str_param(description, "description")
@@ -279,6 +320,7 @@ def __init__(
         self.required_resource_keys = check.opt_set_param(
             required_resource_keys, "required_resource_keys"
         )
+        self.lifetime_scope = lifetime_scope  # checked by underlying definition
 
     def __call__(self, resource_fn: ResourceFunction) -> ResourceDefinition:
         check.callable_param(resource_fn, "resource_fn")
@@ -310,6 +352,7 @@ def __call__(self, resource_fn: ResourceFunction) -> ResourceDefinition:
             description=self.description or format_docstring_for_description(resource_fn),
             version=self.version,
             required_resource_keys=self.required_resource_keys,
+            lifetime_scope=self.lifetime_scope,
         )
 
         # `update_wrapper` typing cannot currently handle a Union of Callables correctly
@@ -329,6 +372,7 @@ def resource(
     description: Optional[str] = ...,
     required_resource_keys: Optional[AbstractSet[str]] = ...,
     version: Optional[str] = ...,
+    lifetime_scope: Optional[ResourceLifetimeScope] = ...,
 ) -> Callable[[ResourceFunction], "ResourceDefinition"]:
     ...
 
@@ -338,6 +382,7 @@ def resource(
     description: Optional[str] = None,
     required_resource_keys: Optional[AbstractSet[str]] = None,
     version: Optional[str] = None,
+    lifetime_scope: Optional[ResourceLifetimeScope] = None,
 ) -> Union[Callable[[ResourceFunction], "ResourceDefinition"], "ResourceDefinition"]:
     """Define a resource.
 
@@ -358,6 +403,8 @@ def resource(
             resource functions should only have the same version if they produce the same resource
             definition when provided with the same inputs.
         required_resource_keys (Optional[Set[str]]): Keys for the resources required by this resource.
+        lifetime_scope (Optional[ResourceLifetimeScope]): (Experimental) How long the initialized
+            resource is kept before it is torn down. Defaults to ``ResourceLifetimeScope.RUN``.
     """
     # This case is for when decorator is used bare, without arguments.
     # E.g. @resource versus @resource()
@@ -370,6 +417,7 @@ def _wrap(resource_fn: ResourceFunction) -> "ResourceDefinition":
             description=description,
             required_resource_keys=required_resource_keys,
             version=version,
+            lifetime_scope=lifetime_scope,
         )(resource_fn)
 
     return _wrap
@@ -1,14 +1,19 @@
+import bisect
 import functools
 import hashlib
+import heapq
+import itertools
 import json
 import re
-from datetime import datetime
+import threading
+from datetime import datetime, timedelta, timezone
 from enum import Enum
 from typing import (
     AbstractSet,
     Any,
     Callable,
     Iterable,
+    Iterator,
     List,
     Mapping,
     NamedTuple,
@@ -165,6 +170,10 @@ def get_num_partitions(
         # string format datetimes.
         current_timestamp = self.get_current_timestamp(current_time=current_time)
 
+        index = self._get_time_window_index()
+        if index.has_fixed_cadence:
+            return index.num_partitions_at(current_timestamp, self.end_offset)
+
         partitions_past_current_time = 0
 
         num_partitions = 0
@@ -194,6 +203,13 @@ def get_partition_keys_between_indexes(
         # partition keys included within the indices.
         current_timestamp = self.get_current_timestamp(current_time=current_time)
 
+        index = self._get_time_window_index()
+        if index.has_fixed_cadence:
+            num_partitions = index.num_partitions_at(current_timestamp, self.end_offset)
+            return index.partition_keys_for_index_ranges(
+                [(max(start_idx, 0), min(end_idx, num_partitions))]
+            )
+
         partitions_past_current_time = 0
         partition_keys = []
         reached_end = False
@@ -226,6 +242,12 @@ def get_partition_keys(
     ) -> Sequence[str]:
         current_timestamp = self.get_current_timestamp(current_time=current_time)
 
+        index = self._get_time_window_index()
+        if index.has_fixed_cadence:
+            return index.partition_keys_for_index_ranges(
+                [(0, index.num_partitions_at(current_timestamp, self.end_offset))]
+            )
+
         partitions_past_current_time = 0
         partition_keys: List[str] = []
         for time_window in self._iterate_time_windows(self.start):
@@ -322,6 +344,17 @@ def time_windows_for_partition_keys(
         if len(partition_keys) == 0:
             return []
 
+        index = self._get_time_window_index()
+        if index.has_fixed_cadence:
+            num_partitions = self.get_num_partitions()
+            return [
+                index.time_window_for_index_range(partition_index, partition_index + 1)
+                for partition_index in sorted(
+                    index.index_for_partition_key(partition_key) for partition_key in partition_keys
+                )
+                if 0 <= partition_index < num_partitions
+            ]
+
         sorted_pks = sorted(partition_keys, key=lambda pk: datetime.strptime(pk, self.fmt))
         cur_windows_iterator = iter(
             self._iterate_time_windows(
@@ -412,6 +445,12 @@ def get_prev_partition_window(self, start_dt: datetime) -> Optional[TimeWindow]:
     def _get_first_partition_window(self, *, current_time: datetime) -> Optional[TimeWindow]:
         current_timestamp = current_time.timestamp()
 
+        index = self._get_time_window_index()
+        if index.has_fixed_cadence:
+            if index.num_partitions_at(current_timestamp, self.end_offset) == 0:
+                return None
+            return index.time_window_for_index_range(0, 1)
+
         time_window = next(iter(self._iterate_time_windows(self.start)))
 
         if self.end_offset == 0:
@@ -454,6 +493,13 @@ def get_first_partition_window(
 
     @functools.lru_cache(maxsize=5)
     def _get_last_partition_window(self, *, current_time: datetime) -> Optional[TimeWindow]:
+        index = self._get_time_window_index()
+        if index.has_fixed_cadence:
+            num_partitions = index.num_partitions_at(current_time.timestamp(), self.end_offset)
+            if num_partitions == 0:
+                return None
+            return index.time_window_for_index_range(num_partitions - 1, num_partitions)
+
         if self.get_first_partition_window(current_time) is None:
             return None
 
@@ -511,6 +557,18 @@ def end_time_for_partition_key(self, partition_key: str) -> datetime:
         return self.time_window_for_partition_key(partition_key).end
 
     def get_partition_keys_in_time_window(self, time_window: TimeWindow) -> Sequence[str]:
+        index = self._get_time_window_index()
+        start_timestamp = time_window.start.timestamp()
+        if index.has_fixed_cadence and start_timestamp >= index.start_timestamp:
+            return index.partition_keys_for_index_ranges(
+                [
+                    (
+                        index.index_for_timestamp(start_timestamp),
+                        index.index_for_timestamp(time_window.end.timestamp()),
+                    )
+                ]
+            )
+
         result: List[str] = []
         for partition_time_window in self._iterate_time_windows(time_window.start):
             if partition_time_window.start < time_window.end:
@@ -653,6 +711,13 @@ def get_cron_schedule(
 
     def _iterate_time_windows(self, start: datetime) -> Iterable[TimeWindow]:
         """Returns an infinite generator of time windows that start after the given start time."""
+        index = self._get_time_window_index()
+        start_timestamp = pendulum.instance(start, tz=self.timezone).timestamp()
+        if index.has_fixed_cadence and start_timestamp >= index.start_timestamp:
+            return index.iterate_time_windows(index.index_for_timestamp(start_timestamp))
+        return self._iterate_cron_time_windows(start)
+
+    def _iterate_cron_time_windows(self, start: datetime) -> Iterable[TimeWindow]:
         start_timestamp = pendulum.instance(start, tz=self.timezone).timestamp()
         iterator = cron_string_iterator(
             start_timestamp=start_timestamp,
@@ -704,6 +769,10 @@ def get_partition_key_for_timestamp(self, timestamp: float, end_closed: bool = F
         else:
             return prev_next.strftime(self.fmt)
 
+    @functools.lru_cache(maxsize=100)
+    def _get_time_window_index(self) -> "_TimeWindowIndex":
+        return _TimeWindowIndex(self)
+
     def less_than(self, partition_key1: str, partition_key2: str) -> bool:
         """Returns true if the partition_key1 is earlier than partition_key2."""
         return self.start_time_for_partition_key(
@@ -1312,6 +1381,326 @@ def inner(
     return inner
 
 
+# timezones without offset transitions, in which fixed-length schedules have fixed-length windows
+FIXED_OFFSET_TIMEZONES = {"UTC", "Etc/UTC", "GMT", "Etc/GMT", "Universal", "Zulu"}
+
+SECONDS_PER_UNIT = {
+    "minutes": 60,
+    "hours": 60 * 60,
+    "days": 24 * 60 * 60,
+    "weeks": 7 * 24 * 60 * 60,
+}
+
+
+class _FixedCadence(NamedTuple):
+    unit: str  # one of "minutes", "hours", "days", "weeks", or "months"
+    step: int
+    hour: Optional[int]
+    minute: Optional[int]
+
+
+def _get_fixed_cadence(cron_schedule: str) -> Optional[_FixedCadence]:
+    """Returns the cadence of the given cron schedule, if it ticks at a fixed interval in wall
+    clock time, e.g. every 15 minutes, or hourly, daily, weekly or monthly at a fixed offset.
+    """
+    fields = cron_schedule.split()
+    if len(fields) != 5 or not all(field == "*" or field.isdigit() for field in fields[1:]):
+        return None
+
+    minute, hour, day_of_month, month, day_of_week = fields
+    if month != "*":
+        return None
+
+    if minute.isdigit() and hour.isdigit():
+        if day_of_month == "*" and day_of_week == "*":
+            return _FixedCadence("days", 1, int(hour), int(minute))
+        if day_of_month == "*":
+            return _FixedCadence("weeks", 1, int(hour), int(minute))
+        # later days of the month are skipped in months that are too short to include them
+        if day_of_week == "*" and int(day_of_month) <= 28:
+            return _FixedCadence("months", 1, int(hour), int(minute))
+        return None
+
+    if hour != "*" or day_of_month != "*" or day_of_week != "*":
+        return None
+    if minute.isdigit():
+        return _FixedCadence("hours", 1, None, int(minute))
+    if minute == "*":
+        return _FixedCadence("minutes", 1, None, None)
+    if minute.startswith("*/") and minute[2:].isdigit() and 60 % int(minute[2:]) == 0:
+        return _FixedCadence("minutes", int(minute[2:]), None, None)
+    return None
+
+
+class _TimeWindowIndex:
+    """Maps between the time windows of a TimeWindowPartitionsDefinition and their indices, where
+    index 0 is the first partition.
+
+    Schedules with a fixed cadence are mapped in constant time: by adding a fixed number of
+    seconds, if every window has the same length, or otherwise by calendar arithmetic in the
+    definition's timezone, following the same daylight savings rules as the cron iteration. For
+    all other schedules, window boundaries are recorded as they are iterated, so each window is
+    only computed from the cron schedule once.
+    """
+
+    def __init__(self, partitions_def: TimeWindowPartitionsDefinition):
+        self._partitions_def = partitions_def
+        self._tz = pendulum.timezone(partitions_def.timezone)
+        self._windows_iter = iter(
+            partitions_def._iterate_cron_time_windows(partitions_def.start)  # noqa: SLF001
+        )
+        first_window = next(self._windows_iter)
+        self._start_timestamp = first_window.start.timestamp()
+
+        cadence = _get_fixed_cadence(partitions_def.cron_schedule)
+        is_fixed_offset = partitions_def.timezone in FIXED_OFFSET_TIMEZONES
+        self._period: Optional[int] = None
+        self._cadence: Optional[_FixedCadence] = None
+        if cadence is None or (cadence.unit == "minutes" and not is_fixed_offset):
+            # sub-hourly schedules are only regular in timezones without offset transitions
+            pass
+        elif cadence.unit == "hours" or (is_fixed_offset and cadence.unit != "months"):
+            # hourly schedules advance by a fixed number of seconds in any timezone
+            self._period = SECONDS_PER_UNIT[cadence.unit] * cadence.step
+        else:
+            self._cadence = cadence
+            first_start = first_window.start
+            self._naive_start = datetime(
+                first_start.year,
+                first_start.month,
+                first_start.day,
+                check.not_none(cadence.hour),
+                check.not_none(cadence.minute),
+            )
+
+        self._lock = threading.Lock()
+        self._boundaries = [self._start_timestamp, first_window.end.timestamp()]
+
+        # compared to the timestamps of other partition keys to find the keys before the first
+        # partition, which the start timestamp can't be compared to if the keys leave out offsets
+        self._first_partition_key_timestamp = self._partition_key_timestamp(
+            first_window.start.strftime(partitions_def.fmt)
+        )
+
+    @property
+    def has_fixed_cadence(self) -> bool:
+        return self._period is not None or self._cadence is not None
+
+    @property
+    def start_timestamp(self) -> float:
+        return self._start_timestamp
+
+    def _extend_boundaries(self, timestamp: Optional[float] = None, index: Optional[int] = None):
+        with self._lock:
+            while (timestamp is not None and self._boundaries[-1] < timestamp) or (
+                index is not None and len(self._boundaries) <= index
+            ):
+                self._boundaries.append(next(self._windows_iter).end.timestamp())
+
+    def _naive_datetime_for_index(self, index: int) -> datetime:
+        cadence = check.not_none(self._cadence)
+        if cadence.unit == "months":
+            num_years, month_index = divmod(self._naive_start.month - 1 + index, 12)
+            return self._naive_start.replace(
+                year=self._naive_start.year + num_years, month=month_index + 1
+            )
+        return self._naive_start + timedelta(**{cadence.unit: index * cadence.step})
+
+    def _calendar_datetime_for_index(self, index: int) -> datetime:
+        naive_dt = self._naive_datetime_for_index(index)
+        dt = pendulum.instance(naive_dt, tz=self._tz)
+        if dt.hour != naive_dt.hour:
+            # the time does not exist because of a daylight savings transition, in which case the
+            # cron iteration runs at the start of the first hour that does exist
+            dt = dt.replace(minute=0)
+        return dt
+
+    def _fixed_cadence_index_for_timestamp(self, timestamp: float) -> int:
+        """Returns the index of the first window of the schedule that starts at or after the given
+        timestamp, which is negative for timestamps before the first partition.
+        """
+        if self._period is not None:
+            num_periods, remainder = divmod(timestamp - self._start_timestamp, self._period)
+            return int(num_periods) + (1 if remainder else 0)
+
+        # estimate the index from the wall clock time, then correct for windows that were shifted
+        # by daylight savings transitions
+        cadence = check.not_none(self._cadence)
+        naive_dt = datetime.fromtimestamp(timestamp, tz=self._tz).replace(tzinfo=None)
+        if cadence.unit == "months":
+            index = (naive_dt.year - self._naive_start.year) * 12 + (
+                naive_dt.month - self._naive_start.month
+            )
+        else:
+            unit_delta = timedelta(**{cadence.unit: cadence.step})
+            index = -((self._naive_start - naive_dt) // unit_delta)
+        while self.timestamp_for_index(index - 1) >= timestamp:
+            index -= 1
+        while self.timestamp_for_index(index) < timestamp:
+            index += 1
+        return index
+
+    def index_for_timestamp(self, timestamp: float) -> int:
+        """Returns the index of the first window that starts at or after the given timestamp."""
+        if timestamp <= self._start_timestamp:
+            return 0
+
+        if self.has_fixed_cadence:
+            return self._fixed_cadence_index_for_timestamp(timestamp)
+
+        self._extend_boundaries(timestamp=timestamp)
+        return bisect.bisect_left(self._boundaries, timestamp)
+
+    def timestamp_for_index(self, index: int) -> float:
+        """Returns the start timestamp of the window at the given index."""
+        if self._period is not None:
+            return self._start_timestamp + index * self._period
+
+        if self._cadence is not None:
+            return self._calendar_datetime_for_index(index).timestamp()
+
+        self._extend_boundaries(index=index)
+        return self._boundaries[index]
+
+    def time_window_for_index_range(self, start_index: int, end_index: int) -> TimeWindow:
+        return TimeWindow(
+            pendulum.from_timestamp(
+                self.timestamp_for_index(start_index), tz=self._partitions_def.timezone
+            ),
+            pendulum.from_timestamp(
+                self.timestamp_for_index(end_index), tz=self._partitions_def.timezone
+            ),
+        )
+
+    def iterate_time_windows(self, start_index: int) -> Iterator[TimeWindow]:
+        """Returns an infinite generator of the time windows of each partition, starting at the
+        given index.
+        """
+        window_start = pendulum.from_timestamp(self.timestamp_for_index(start_index), tz=self._tz)
+        for index in itertools.count(start_index + 1):
+            window_end = pendulum.from_timestamp(self.timestamp_for_index(index), tz=self._tz)
+            yield TimeWindow(window_start, window_end)
+            window_start = window_end
+
+    def num_partitions_at(self, timestamp: float, end_offset: int) -> int:
+        """Returns the number of partitions at the given time, for a schedule with a fixed cadence:
+        the number of windows that have ended by then, adjusted by the definition's end offset.
+        """
+        index = self._fixed_cadence_index_for_timestamp(timestamp)
+        if index <= 0:
+            # no window has ended yet, so only the windows covered by a positive end offset exist,
+            # counting from the first window that starts at or after the given time
+            return max(min(end_offset, index + end_offset), 0)
+
+        num_ended = index if self.timestamp_for_index(index) == timestamp else index - 1
+        return max(num_ended + end_offset, 0)
+
+    def _partition_key_timestamp(self, partition_key: str) -> float:
+        """Returns the timestamp of the time in the partition key, which is at or before the start
+        of the partition's window, since the key's format may leave out the hour, minute or day
+        offsets of the schedule.
+        """
+        partition_key_dt = datetime.strptime(partition_key, self._partitions_def.fmt)
+        if self._partitions_def.timezone in FIXED_OFFSET_TIMEZONES and not partition_key_dt.tzinfo:
+            return partition_key_dt.replace(tzinfo=timezone.utc).timestamp()
+        return pendulum.instance(partition_key_dt, tz=self._tz).timestamp()
+
+    def index_for_partition_key(self, partition_key: str) -> int:
+        """Returns the index of the partition with the given key, or -1 if the key is before the
+        first partition.
+        """
+        timestamp = self._partition_key_timestamp(partition_key)
+        if timestamp < self._first_partition_key_timestamp:
+            return -1
+        return self.index_for_timestamp(timestamp)
+
+    def partition_key_for_index(self, index: int) -> str:
+        return self.partition_keys_for_index_ranges([(index, index + 1)])[0]
+
+    def partition_keys_for_index_ranges(self, index_ranges: Sequence[Tuple[int, int]]) -> List[str]:
+        fmt = self._partitions_def.fmt
+        if self._period is not None and self._partitions_def.timezone in FIXED_OFFSET_TIMEZONES:
+            # every window has the same length in wall clock time, so step through the range
+            # without converting each timestamp to the timezone
+            period = timedelta(seconds=self._period)
+            partition_keys = []
+            for start_index, end_index in index_ranges:
+                dt = datetime.fromtimestamp(self.timestamp_for_index(start_index), tz=self._tz)
+                for _ in range(start_index, end_index):
+                    partition_keys.append(dt.strftime(fmt))
+                    dt += period
+            return partition_keys
+
+        if self._cadence is not None:
+            return [
+                self._calendar_datetime_for_index(index).strftime(fmt)
+                for start_index, end_index in index_ranges
+                for index in range(start_index, end_index)
+            ]
+
+        return [
+            datetime.fromtimestamp(self.timestamp_for_index(index), tz=self._tz).strftime(fmt)
+            for start_index, end_index in index_ranges
+            for index in range(start_index, end_index)
+        ]
+
+
+def _merge_index_ranges(index_ranges: Iterable[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Merges sorted half-open index ranges that overlap or touch."""
+    result: List[Tuple[int, int]] = []
+    for start_index, end_index in index_ranges:
+        if start_index >= end_index:
+            continue
+        if result and start_index <= result[-1][1]:
+            if end_index > result[-1][1]:
+                result[-1] = (result[-1][0], end_index)
+        else:
+            result.append((start_index, end_index))
+    return result
+
+
+def _index_ranges_for_indices(indices: Iterable[int]) -> List[Tuple[int, int]]:
+    return _merge_index_ranges((index, index + 1) for index in sorted(set(indices)))
+
+
+def _intersect_index_ranges(
+    left: Sequence[Tuple[int, int]], right: Sequence[Tuple[int, int]]
+) -> List[Tuple[int, int]]:
+    result: List[Tuple[int, int]] = []
+    i = j = 0
+    while i < len(left) and j < len(right):
+        start_index = max(left[i][0], right[j][0])
+        end_index = min(left[i][1], right[j][1])
+        if start_index < end_index:
+            result.append((start_index, end_index))
+        if left[i][1] < right[j][1]:
+            i += 1
+        else:
+            j += 1
+    return result
+
+
+def _subtract_index_ranges(
+    left: Sequence[Tuple[int, int]], right: Sequence[Tuple[int, int]]
+) -> List[Tuple[int, int]]:
+    result: List[Tuple[int, int]] = []
+    j = 0
+    for left_start, left_end in left:
+        while j < len(right) and right[j][1] <= left_start:
+            j += 1
+        # walk through the ranges that overlap this one, keeping the gaps between them
+        start_index = left_start
+        k = j
+        while k < len(right) and right[k][0] < left_end:
+            if right[k][0] > start_index:
+                result.append((start_index, right[k][0]))
+            start_index = max(start_index, right[k][1])
+            k += 1
+        if start_index < left_end:
+            result.append((start_index, left_end))
+    return result
+
+
 class TimeWindowPartitionsSubset(PartitionsSubset):
     # Every time we change the serialization format, we should increment the version number.
     # This will ensure that we can gracefully degrade when deserializing old data.
@@ -1342,78 +1731,114 @@ def __init__(
             included_partition_keys, "included_partition_keys", of_type=str
         )
 
+        # sorted, disjoint, half-open ranges of partition indices. This is the canonical
+        # representation of the subset, and is derived lazily from the time windows or partition
+        # keys when the subset is constructed from those
+        self._included_index_ranges: Optional[Sequence[Tuple[int, int]]] = None
+
+    @classmethod
+    def _from_index_ranges(
+        cls,
+        partitions_def: TimeWindowPartitionsDefinition,
+        index_ranges: Sequence[Tuple[int, int]],
+        num_partitions: Optional[int] = None,
+    ) -> "TimeWindowPartitionsSubset":
+        subset = cls(
+            partitions_def,
+            num_partitions=num_partitions
+            if num_partitions is not None
+            else sum(end_index - start_index for start_index, end_index in index_ranges),
+        )
+        subset._included_index_ranges = index_ranges  # noqa: SLF001
+        return subset
+
+    @property
+    def _time_window_index(self) -> _TimeWindowIndex:
+        return self._partitions_def._get_time_window_index()  # noqa: SLF001
+
+    @property
+    def _index_ranges(self) -> Sequence[Tuple[int, int]]:
+        if self._included_index_ranges is None:
+            if self._included_time_windows is not None:
+                index = self._time_window_index
+                self._included_index_ranges = _merge_index_ranges(
+                    sorted(
+                        (
+                            index.index_for_timestamp(time_window.start.timestamp()),
+                            index.index_for_timestamp(time_window.end.timestamp()),
+                        )
+                        for time_window in self._included_time_windows
+                    )
+                )
+            else:
+                self._included_index_ranges = self._index_ranges_for_partition_keys(
+                    check.not_none(self._included_partition_keys)
+                )
+        return self._included_index_ranges
+
+    def _index_ranges_for_partition_keys(
+        self, partition_keys: Iterable[str]
+    ) -> List[Tuple[int, int]]:
+        """Returns the index ranges covering the given partition keys, ignoring any keys that are
+        outside of the current range of partitions.
+        """
+        partition_keys = list(partition_keys)
+        if not partition_keys:
+            return []
+
+        last_partition_window = self._partitions_def.get_last_partition_window()
+        if last_partition_window is None:
+            check.failed("No partitions in the PartitionsDefinition")
+
+        index = self._time_window_index
+        num_partitions = index.index_for_timestamp(last_partition_window.end.timestamp())
+        return _index_ranges_for_indices(
+            partition_index
+            for partition_index in (
+                index.index_for_partition_key(partition_key) for partition_key in partition_keys
+            )
+            if 0 <= partition_index < num_partitions
+        )
+
     @property
     def included_time_windows(self) -> Sequence[TimeWindow]:
         if self._included_time_windows is None:
-            result_time_windows, _ = self._add_partitions_to_time_windows(
-                initial_windows=[],
-                partition_keys=list(check.not_none(self._included_partition_keys)),
-            )
-            self._included_time_windows = result_time_windows
+            index = self._time_window_index
+            self._included_time_windows = [
+                index.time_window_for_index_range(start_index, end_index)
+                for start_index, end_index in self._index_ranges
+            ]
         return self._included_time_windows
 
-    def _get_partition_time_windows_not_in_subset(
-        self,
-        current_time: Optional[datetime] = None,
-    ) -> Sequence[TimeWindow]:
-        """Returns a list of partition time windows that are not in the subset.
-        Each time window is a single partition.
-        """
+    def _get_partition_index_ranges_not_in_subset(
+        self, current_time: Optional[datetime] = None
+    ) -> Sequence[Tuple[int, int]]:
         first_tw = self._partitions_def.get_first_partition_window(current_time=current_time)
         last_tw = self._partitions_def.get_last_partition_window(current_time=current_time)
 
         if not first_tw or not last_tw:
             check.failed("No partitions found")
 
-        if len(self.included_time_windows) == 0:
-            return [TimeWindow(first_tw.start, last_tw.end)]
-
-        time_windows = []
-        if first_tw.start < self.included_time_windows[0].start:
-            time_windows.append(TimeWindow(first_tw.start, self.included_time_windows[0].start))
-
-        for i in range(len(self.included_time_windows) - 1):
-            if self.included_time_windows[i].start >= last_tw.end:
-                break
-            if self.included_time_windows[i].end < last_tw.end:
-                if self.included_time_windows[i + 1].start <= last_tw.end:
-                    time_windows.append(
-                        TimeWindow(
-                            self.included_time_windows[i].end,
-                            self.included_time_windows[i + 1].start,
-                        )
-                    )
-                else:
-                    time_windows.append(
-                        TimeWindow(
-                            self.included_time_windows[i].end,
-                            last_tw.end,
-                        )
-                    )
-
-        if last_tw.end > self.included_time_windows[-1].end:
-            time_windows.append(TimeWindow(self.included_time_windows[-1].end, last_tw.end))
-
-        return time_windows
+        index = self._time_window_index
+        all_partitions_range = (
+            index.index_for_timestamp(first_tw.start.timestamp()),
+            index.index_for_timestamp(last_tw.end.timestamp()),
+        )
+        return _subtract_index_ranges([all_partitions_range], self._index_ranges)
 
     def get_partition_keys_not_in_subset(
         self,
         current_time: Optional[datetime] = None,
         dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
     ) -> Iterable[str]:
-        partition_keys: List[str] = []
-        for tw in self._get_partition_time_windows_not_in_subset(current_time):
-            partition_keys.extend(self._partitions_def.get_partition_keys_in_time_window(tw))
-        return partition_keys
+        return self._time_window_index.partition_keys_for_index_ranges(
+            self._get_partition_index_ranges_not_in_subset(current_time)
+        )
 
     @public
     def get_partition_keys(self, current_time: Optional[datetime] = None) -> Iterable[str]:
         if self._included_partition_keys is None:
-            return [
-                pk
-                for time_window in self.included_time_windows
-                for pk in self._partitions_def.get_partition_keys_in_time_window(time_window)
-            ]
+            return self._time_window_index.partition_keys_for_index_ranges(self._index_ranges)
         return list(self._included_partition_keys) if self._included_partition_keys else []
 
     def get_partition_key_ranges(
@@ -1421,81 +1846,64 @@ def get_partition_key_ranges(
         current_time: Optional[datetime] = None,
         dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
     ) -> Sequence[PartitionKeyRange]:
+        index = self._time_window_index
         return [
-            self._partitions_def.get_partition_key_range_for_time_window(window)
-            for window in self.included_time_windows
+            PartitionKeyRange(
+                index.partition_key_for_index(start_index),
+                index.partition_key_for_index(end_index - 1),
+            )
+            for start_index, end_index in self._index_ranges
         ]
 
-    def _add_partitions_to_time_windows(
-        self, initial_windows: Sequence[TimeWindow], partition_keys: Sequence[str]
-    ) -> Tuple[Sequence[TimeWindow], int]:
-        """Merges a set of partition keys into an existing set of time windows, returning the
-        minimized set of time windows and the number of partitions added.
-        """
-        result_windows = [*initial_windows]
-        time_windows = self._partitions_def.time_windows_for_partition_keys(
-            list(partition_keys),
+    def with_partition_keys(self, partition_keys: Iterable[str]) -> "TimeWindowPartitionsSubset":
+        return self._from_index_ranges(
+            self._partitions_def,
+            _merge_index_ranges(
+                heapq.merge(
+                    self._index_ranges, self._index_ranges_for_partition_keys(partition_keys)
+                )
+            ),
         )
-        num_added_partitions = 0
-        for window in sorted(time_windows):
-            # go in reverse order because it's more common to add partitions at the end than the
-            # beginning
-            for i in reversed(range(len(result_windows))):
-                included_window = result_windows[i]
-                lt_end_of_range = window.start < included_window.end
-                gte_start_of_range = window.start >= included_window.start
-
-                if lt_end_of_range and gte_start_of_range:
-                    break
-
-                if not lt_end_of_range:
-                    merge_with_range = included_window.end == window.start
-                    merge_with_later_range = i + 1 < len(result_windows) and (
-                        window.end == result_windows[i + 1].start
-                    )
-
-                    if merge_with_range and merge_with_later_range:
-                        result_windows[i] = TimeWindow(
-                            included_window.start, result_windows[i + 1].end
-                        )
-                        del result_windows[i + 1]
-                    elif merge_with_range:
-                        result_windows[i] = TimeWindow(included_window.start, window.end)
-                    elif merge_with_later_range:
-                        result_windows[i + 1] = TimeWindow(window.start, result_windows[i + 1].end)
-                    else:
-                        result_windows.insert(i + 1, window)
-
-                    num_added_partitions += 1
-                    break
-            else:
-                if result_windows and window.start == result_windows[0].start:
-                    result_windows[0] = TimeWindow(window.start, included_window.end)  # type: ignore
-                else:
-                    result_windows.insert(0, window)
 
-                num_added_partitions += 1
-
-        return result_windows, num_added_partitions
+    def _is_compatible_subset(self, other: PartitionsSubset) -> bool:
+        return (
+            isinstance(other, TimeWindowPartitionsSubset)
+            and self._partitions_def == other._partitions_def  # noqa: SLF001
+        )
 
-    def with_partition_keys(self, partition_keys: Iterable[str]) -> "TimeWindowPartitionsSubset":
-        # if we are representing things as a static set of keys, continue doing so
-        if self._included_partition_keys is not None:
-            new_partitions = {*self._included_partition_keys, *partition_keys}
-            return TimeWindowPartitionsSubset(
-                self._partitions_def,
-                num_partitions=len(new_partitions),
-                included_partition_keys=new_partitions,
-            )
+    def __or__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if self is other or not self._is_compatible_subset(other):
+            return super().__or__(other)
+        return self._from_index_ranges(
+            self._partitions_def,
+            _merge_index_ranges(
+                heapq.merge(
+                    self._index_ranges,
+                    cast(TimeWindowPartitionsSubset, other)._index_ranges,  # noqa: SLF001
+                )
+            ),
+        )
 
-        result_windows, added_partitions = self._add_partitions_to_time_windows(
-            self.included_time_windows, list(partition_keys)
+    def __and__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if not self._is_compatible_subset(other):
+            return super().__and__(other)
+        return self._from_index_ranges(
+            self._partitions_def,
+            _intersect_index_ranges(
+                self._index_ranges,
+                cast(TimeWindowPartitionsSubset, other)._index_ranges,  # noqa: SLF001
+            ),
         )
 
-        return TimeWindowPartitionsSubset(
+    def __sub__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if not self._is_compatible_subset(other):
+            return super().__sub__(other)
+        return self._from_index_ranges(
             self._partitions_def,
-            num_partitions=self._num_partitions + added_partitions,
-            included_time_windows=result_windows,
+            _subtract_index_ranges(
+                self._index_ranges,
+                cast(TimeWindowPartitionsSubset, other)._index_ranges,  # noqa: SLF001
+            ),
         )
 
     @classmethod
@@ -1505,29 +1913,26 @@ def from_serialized(
         if not isinstance(partitions_def, TimeWindowPartitionsDefinition):
             check.failed("Partitions definition must be a TimeWindowPartitionsDefinition")
         partitions_def = cast(TimeWindowPartitionsDefinition, partitions_def)
+        index = partitions_def._get_time_window_index()  # noqa: SLF001
 
         loaded = json.loads(serialized)
 
-        def tuples_to_time_windows(tuples):
-            return [
-                TimeWindow(
-                    pendulum.from_timestamp(tup[0], tz=partitions_def.timezone),
-                    pendulum.from_timestamp(tup[1], tz=partitions_def.timezone),
+        def tuples_to_index_ranges(tuples):
+            return _merge_index_ranges(
+                sorted(
+                    (index.index_for_timestamp(tup[0]), index.index_for_timestamp(tup[1]))
+                    for tup in tuples
                 )
-                for tup in tuples
-            ]
+            )
 
         if isinstance(loaded, list):
             # backwards compatibility
-            time_windows = tuples_to_time_windows(loaded)
-            num_partitions = sum(
-                len(partitions_def.get_partition_keys_in_time_window(time_window))
-                for time_window in time_windows
-            )
+            index_ranges = tuples_to_index_ranges(loaded)
+            num_partitions = None
         elif isinstance(loaded, dict) and (
             "version" not in loaded or loaded["version"] == cls.SERIALIZATION_VERSION
         ):  # version 1
-            time_windows = tuples_to_time_windows(loaded["time_windows"])
+            index_ranges = tuples_to_index_ranges(loaded["time_windows"])
             num_partitions = loaded["num_partitions"]
         else:
             raise DagsterInvalidDeserializationVersionError(
@@ -1535,9 +1940,7 @@ def tuples_to_time_windows(tuples):
                 f" but only version {cls.SERIALIZATION_VERSION} is supported."
             )
 
-        return TimeWindowPartitionsSubset(
-            partitions_def, num_partitions=num_partitions, included_time_windows=time_windows
-        )
+        return cls._from_index_ranges(partitions_def, index_ranges, num_partitions=num_partitions)
 
     @classmethod
     def can_deserialize(
@@ -1571,15 +1974,16 @@ def empty_subset(cls, partitions_def: PartitionsDefinition) -> "PartitionsSubset
         if not isinstance(partitions_def, TimeWindowPartitionsDefinition):
             check.failed("Partitions definition must be a TimeWindowPartitionsDefinition")
         partitions_def = cast(TimeWindowPartitionsDefinition, partitions_def)
-        return cls(partitions_def, 0, [], set())
+        return cls._from_index_ranges(partitions_def, [])
 
     def serialize(self) -> str:
+        index = self._time_window_index
         return json.dumps(
             {
                 "version": self.SERIALIZATION_VERSION,
                 "time_windows": [
-                    (window.start.timestamp(), window.end.timestamp())
-                    for window in self.included_time_windows
+                    (index.timestamp_for_index(start_index), index.timestamp_for_index(end_index))
+                    for start_index, end_index in self._index_ranges
                 ],
                 "num_partitions": self._num_partitions,
             }
@@ -1591,18 +1995,8 @@ def partitions_def(self) -> PartitionsDefinition:
 
     def __eq__(self, other):
         return (
-            isinstance(other, TimeWindowPartitionsSubset)
-            and self._partitions_def == other._partitions_def  # noqa: SLF001
-            and (
-                # faster comparison, but will not catch all cases
-                (
-                    self._included_time_windows == other._included_time_windows  # noqa: SLF001
-                    and self._included_partition_keys
-                    == other._included_partition_keys  # noqa: SLF001
-                )
-                # slower comparison, catches all cases
-                or self.included_time_windows == other.included_time_windows
-            )
+            self._is_compatible_subset(other)
+            and self._index_ranges == other._index_ranges  # noqa: SLF001
         )
 
     def __len__(self) -> int:
@@ -1612,13 +2006,15 @@ def __contains__(self, partition_key: str) -> bool:
         if self._included_partition_keys is not None:
             return partition_key in self._included_partition_keys
 
-        time_window = self._partitions_def.time_window_for_partition_key(partition_key)
+        partition_index = self._time_window_index.index_for_partition_key(partition_key)
+        if partition_index < 0:
+            # the key is before the first partition
+            return False
 
-        return any(
-            time_window.start >= included_time_window.start
-            and time_window.start < included_time_window.end
-            for included_time_window in self.included_time_windows
-        )
+        index_ranges = self._index_ranges
+        # find the last range starting at or before the partition
+        i = bisect.bisect_right(index_ranges, (partition_index, float("inf"))) - 1
+        return i >= 0 and partition_index < index_ranges[i][1]
 
     def __repr__(self) -> str:
         return f"TimeWindowPartitionsSubset({self.get_partition_key_ranges()})"
@@ -447,7 +447,12 @@ def from_resource(
         log_manager: DagsterLogManager,
         message: Optional[str] = None,
         event_specific_data: Optional["EngineEventData"] = None,
+        step_handle: Optional[Union[StepHandle, ResolvedFromDynamicStepHandle]] = None,
     ) -> "DagsterEvent":
+        check.opt_inst_param(
+            step_handle, "step_handle", (StepHandle, ResolvedFromDynamicStepHandle)
+        )
+
         event = DagsterEvent(
             event_type_value=check.inst_param(event_type, "event_type", DagsterEventType).value,
             job_name=job_name,
@@ -455,7 +460,7 @@ def from_resource(
             event_specific_data=_validate_event_specific_data(
                 DagsterEventType.ENGINE_EVENT, event_specific_data
             ),
-            step_handle=execution_plan.step_handle_for_single_step_plans(),
+            step_handle=step_handle or execution_plan.step_handle_for_single_step_plans(),
             pid=os.getpid(),
         )
         log_resource_event(log_manager, event)
@@ -1035,6 +1040,7 @@ def resource_init_start(
         execution_plan: "ExecutionPlan",
         log_manager: DagsterLogManager,
         resource_keys: AbstractSet[str],
+        step_handle: Optional[Union[StepHandle, ResolvedFromDynamicStepHandle]] = None,
     ) -> "DagsterEvent":
         return DagsterEvent.from_resource(
             DagsterEventType.RESOURCE_INIT_STARTED,
@@ -1045,6 +1051,7 @@ def resource_init_start(
                 ", ".join(sorted(resource_keys))
             ),
             event_specific_data=EngineEventData(metadata={}, marker_start="resources"),
+            step_handle=step_handle,
         )
 
     @staticmethod
@@ -1054,24 +1061,36 @@ def resource_init_success(
         log_manager: DagsterLogManager,
         resource_instances: Mapping[str, Any],
         resource_init_times: Mapping[str, str],
+        reused_resource_keys: AbstractSet[str] = frozenset(),
+        step_handle: Optional[Union[StepHandle, ResolvedFromDynamicStepHandle]] = None,
     ) -> "DagsterEvent":
         metadata = {}
         for key in resource_instances.keys():
             metadata[key] = MetadataValue.python_artifact(resource_instances[key].__class__)
-            metadata[f"{key}:init_time"] = resource_init_times[key]
+            if key in reused_resource_keys:
+                metadata[f"{key}:reused"] = True
+            else:
+                metadata[f"{key}:init_time"] = resource_init_times[key]
+
+        message = "Finished initialization of resources [{}].".format(
+            ", ".join(sorted(resource_init_times.keys()))
+        )
+        if reused_resource_keys:
+            message += " Reused process-scoped resources [{}].".format(
+                ", ".join(sorted(reused_resource_keys))
+            )
 
         return DagsterEvent.from_resource(
             DagsterEventType.RESOURCE_INIT_SUCCESS,
             job_name=job_name,
             execution_plan=execution_plan,
             log_manager=log_manager,
-            message="Finished initialization of resources [{}].".format(
-                ", ".join(sorted(resource_init_times.keys()))
-            ),
+            message=message,
             event_specific_data=EngineEventData(
                 metadata=metadata,
                 marker_end="resources",
             ),
+            step_handle=step_handle,
         )
 
     @staticmethod
@@ -1081,6 +1100,7 @@ def resource_init_failure(
         log_manager: DagsterLogManager,
         resource_keys: AbstractSet[str],
         error: SerializableErrorInfo,
+        step_handle: Optional[Union[StepHandle, ResolvedFromDynamicStepHandle]] = None,
     ) -> "DagsterEvent":
         return DagsterEvent.from_resource(
             DagsterEventType.RESOURCE_INIT_FAILURE,
@@ -1093,6 +1113,7 @@ def resource_init_failure(
                 marker_end="resources",
                 error=error,
             ),
+            step_handle=step_handle,
         )
 
     @staticmethod
@@ -1102,6 +1123,7 @@ def resource_teardown_failure(
         log_manager: DagsterLogManager,
         resource_keys: AbstractSet[str],
         error: SerializableErrorInfo,
+        step_handle: Optional[Union[StepHandle, ResolvedFromDynamicStepHandle]] = None,
     ) -> "DagsterEvent":
         return DagsterEvent.from_resource(
             DagsterEventType.ENGINE_EVENT,
@@ -1115,6 +1137,7 @@ def resource_teardown_failure(
                 marker_end=None,
                 error=error,
             ),
+            step_handle=step_handle,
         )
 
     @staticmethod
@@ -1,4 +1,5 @@
 import sys
+from collections import OrderedDict
 from contextlib import contextmanager
 from typing import (
     AbstractSet,
@@ -31,6 +32,7 @@
 from dagster._core.execution.retries import RetryMode
 from dagster._core.instance import DagsterInstance, InstanceRef
 from dagster._core.selector import parse_step_selection
+from dagster._core.snap import ExecutionPlanSnapshot
 from dagster._core.storage.dagster_run import DagsterRun, DagsterRunStatus
 from dagster._core.system_config.objects import ResolvedRunConfig
 from dagster._core.telemetry import log_dagster_event, log_repo_stats, telemetry_wrapper
@@ -688,6 +690,7 @@ def _get_execution_plan_from_run(
         run_config=dagster_run.run_config,
         step_keys_to_execute=dagster_run.step_keys_to_execute,
         instance_ref=instance.get_ref() if instance.is_persistent else None,
+        tags=dagster_run.tags,
         repository_load_data=execution_plan_snapshot.repository_load_data
         if execution_plan_snapshot
         else None,
@@ -697,6 +700,72 @@ def _get_execution_plan_from_run(
     )
 
 
+# Execution plan snapshots are stored under a hash of their contents, so a snapshot that was fetched
+# once can be reused by every step of the run executed in this process, e.g. by a pooled worker.
+MAX_CACHED_EXECUTION_PLAN_SNAPSHOTS = 4
+_execution_plan_snapshot_cache: "OrderedDict[str, ExecutionPlanSnapshot]" = OrderedDict()
+
+
+def get_cached_execution_plan_snapshot(
+    instance: DagsterInstance, execution_plan_snapshot_id: str
+) -> ExecutionPlanSnapshot:
+    """Fetches the execution plan snapshot, or reuses it if this process fetched it recently."""
+    if execution_plan_snapshot_id in _execution_plan_snapshot_cache:
+        _execution_plan_snapshot_cache.move_to_end(execution_plan_snapshot_id)
+    else:
+        _execution_plan_snapshot_cache[
+            execution_plan_snapshot_id
+        ] = instance.get_execution_plan_snapshot(execution_plan_snapshot_id)
+        if len(_execution_plan_snapshot_cache) > MAX_CACHED_EXECUTION_PLAN_SNAPSHOTS:
+            _execution_plan_snapshot_cache.popitem(last=False)
+
+    return _execution_plan_snapshot_cache[execution_plan_snapshot_id]
+
+
+def create_execution_plan_for_steps(
+    job: IJob,
+    dagster_run: DagsterRun,
+    execution_plan_snapshot: Optional[ExecutionPlanSnapshot],
+    step_keys_to_execute: Optional[Sequence[str]],
+    known_state: Optional[KnownExecutionState],
+    run_config: Optional[Mapping[str, object]] = None,
+    repository_load_data: Optional[RepositoryLoadData] = None,
+) -> ExecutionPlan:
+    """Creates the plan for executing a subset of the steps of a run, e.g. in a step worker.
+
+    If the run's execution plan snapshot is passed and can be reconstructed, the plan is rebuilt
+    from that snapshot instead of being constructed from the job definition again. Fetching and
+    deserializing the snapshot of a large job costs more than building the plan, so callers should
+    only pass a snapshot they already have, e.g. one fetched for an earlier step of the run.
+    """
+    check.inst_param(job, "job", IJob)
+    check.inst_param(dagster_run, "dagster_run", DagsterRun)
+    check.opt_inst_param(execution_plan_snapshot, "execution_plan_snapshot", ExecutionPlanSnapshot)
+    check.opt_nullable_sequence_param(step_keys_to_execute, "step_keys_to_execute", of_type=str)
+    run_config = check.opt_mapping_param(run_config, "run_config", key_type=str)
+
+    if (
+        step_keys_to_execute is not None
+        and execution_plan_snapshot is not None
+        and execution_plan_snapshot.can_reconstruct_plan
+        and job.solids_to_execute == dagster_run.solids_to_execute
+        and job.asset_selection == dagster_run.asset_selection
+    ):
+        return ExecutionPlan.rebuild_from_snapshot(
+            dagster_run.job_name,
+            execution_plan_snapshot,
+            known_state=known_state,
+        ).build_subset_plan(step_keys_to_execute, job.get_definition())
+
+    return create_execution_plan(
+        job,
+        run_config=run_config,
+        step_keys_to_execute=step_keys_to_execute,
+        known_state=known_state,
+        repository_load_data=repository_load_data,
+    )
+
+
 def create_execution_plan(
     job: Union[IJob, JobDefinition],
     run_config: Optional[Mapping[str, object]] = None,
@@ -761,9 +830,10 @@ def job_execution_iterator(
     generator_closed = False
     try:
         for event in job_context.executor.execute(job_context, execution_plan):
-            if event.is_step_failure:
-                failed_steps.append(event.step_key)
-            elif event.is_resource_init_failure and event.step_key:
+            if (
+                event.is_step_failure or (event.is_resource_init_failure and event.step_key)
+            ) and event.step_key not in failed_steps:
+                # step-scoped resource init failures are followed by a failure of their step
                 failed_steps.append(event.step_key)
 
             # Telemetry
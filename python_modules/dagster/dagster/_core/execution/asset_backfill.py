@@ -493,6 +493,7 @@ def submit_run_request(
             step_keys_to_execute=None,
             known_state=None,
             instance=instance,
+            tags=run_request.tags,
         )
         pipeline_and_execution_plan_cache[selector_id] = (
             external_job,
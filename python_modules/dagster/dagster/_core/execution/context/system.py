@@ -315,10 +315,15 @@ def for_step(
         self,
         step: ExecutionStep,
         known_state: Optional["KnownExecutionState"] = None,
+        scoped_resources_builder: Optional[ScopedResourcesBuilder] = None,
     ) -> IStepContext:
         return StepExecutionContext(
             plan_data=self.plan_data,
-            execution_data=self._execution_data,
+            execution_data=(
+                self._execution_data._replace(scoped_resources_builder=scoped_resources_builder)
+                if scoped_resources_builder
+                else self._execution_data
+            ),
             log_manager=self._log_manager.with_tags(**step.logging_tags),
             step=step,
             output_capture=self.output_capture,
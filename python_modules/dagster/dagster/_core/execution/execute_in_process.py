@@ -41,6 +41,7 @@ def core_execute_in_process(
         job,
         run_config=run_config,
         instance_ref=instance.get_ref() if instance and instance.is_persistent else None,
+        tags=run_tags,
     )
 
     output_capture: Dict[StepOutputHandle, Any] = {}
@@ -1,7 +1,18 @@
+from typing import AbstractSet, Dict, List, Set
+
 import dagster._check as check
+from dagster._core.definitions.data_version import (
+    DEFAULT_DATA_VERSION,
+    DataVersion,
+    extract_data_provenance_from_entry,
+    extract_data_version_from_entry,
+)
+from dagster._core.definitions.events import AssetKey
+from dagster._core.definitions.job_definition import JobDefinition
 from dagster._core.errors import DagsterInvariantViolationError
 from dagster._core.execution.context.system import IPlanContext
 from dagster._core.execution.plan.plan import ExecutionPlan
+from dagster._core.instance import DagsterInstance
 
 
 def validate_reexecution_memoization(
@@ -25,3 +36,77 @@ def validate_reexecution_memoization(
         " a persistent io manager, such as the fs_io_manager, in the resource_defs argument on your"
         ' job: resource_defs={"io_manager": fs_io_manager}'
     )
+
+
+def resolve_unchanged_step_keys(
+    execution_plan: ExecutionPlan, job_def: JobDefinition, instance: DagsterInstance
+) -> AbstractSet[str]:
+    """Returns the keys of the steps in the plan whose execution can be skipped because the assets
+    they produce would not change: the code version of each asset and the data versions of its
+    upstream assets match the ones recorded on its latest materialization.
+
+    Only steps whose outputs are all unpartitioned assets with a code version can be skipped, and
+    only if none of their upstream steps in the plan is executed.
+    """
+    asset_layer = job_def.asset_layer
+    steps = execution_plan.get_steps_to_execute_in_topo_order()
+
+    asset_keys_by_step_key: Dict[str, List[AssetKey]] = {}
+    for step in steps:
+        asset_keys = []
+        for step_output in step.step_outputs:
+            asset_info = asset_layer.asset_info_for_output(step.node_handle, step_output.name)
+            if asset_info is None:
+                break
+            asset_keys.append(asset_info.key)
+        else:
+            if asset_keys:
+                asset_keys_by_step_key[step.key] = asset_keys
+
+    latest_materializations = instance.get_latest_materialization_events(
+        [key for asset_keys in asset_keys_by_step_key.values() for key in asset_keys]
+    )
+    current_data_versions: Dict[AssetKey, DataVersion] = {}
+
+    def _get_current_data_version(key: AssetKey) -> DataVersion:
+        # matches the data version that execution records as input provenance
+        if key not in current_data_versions:
+            entry = latest_materializations.get(key)
+            if entry is None:
+                record = instance.get_latest_data_version_record(key)
+                entry = record.event_log_entry if record else None
+            current_data_versions[key] = (
+                extract_data_version_from_entry(entry) if entry else None
+            ) or DEFAULT_DATA_VERSION
+        return current_data_versions[key]
+
+    def _is_unchanged(key: AssetKey) -> bool:
+        code_version = asset_layer.code_version_for_asset(key)
+        entry = latest_materializations.get(key)
+        if code_version is None or entry is None or asset_layer.partitions_def_for_asset(key):
+            return False
+
+        provenance = extract_data_provenance_from_entry(entry)
+        if provenance is None or provenance.code_version != code_version:
+            return False
+
+        dep_keys = asset_layer.upstream_assets_for_asset(key)
+        if set(provenance.input_data_versions.keys()) != set(dep_keys):
+            return False
+        return all(
+            not asset_layer.partitions_def_for_asset(dep_key)
+            and provenance.input_data_versions[dep_key] == _get_current_data_version(dep_key)
+            for dep_key in dep_keys
+        )
+
+    unchanged_step_keys: Set[str] = set()
+    for step in steps:
+        asset_keys = asset_keys_by_step_key.get(step.key)
+        if (
+            asset_keys
+            and step.get_execution_dependency_keys() <= unchanged_step_keys
+            and all(_is_unchanged(key) for key in asset_keys)
+        ):
+            unchanged_step_keys.add(step.key)
+
+    return unchanged_step_keys
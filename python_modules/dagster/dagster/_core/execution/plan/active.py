@@ -1,4 +1,7 @@
+import heapq
+import itertools
 import time
+from collections import defaultdict
 from types import TracebackType
 from typing import (
     Any,
@@ -10,6 +13,7 @@
     Optional,
     Sequence,
     Set,
+    Tuple,
     Type,
     Union,
     cast,
@@ -73,6 +77,12 @@ def __init__(
         self._tag_concurrency_limits = check.opt_list_param(
             tag_concurrency_limits, "tag_concurrency_limits"
         )
+        # maintained as steps move in and out of _in_flight
+        self._tag_concurrency_limits_counter: Optional[TagConcurrencyLimitsCounter] = (
+            TagConcurrencyLimitsCounter(self._tag_concurrency_limits, [])
+            if self._tag_concurrency_limits
+            else None
+        )
 
         self._context_guard: bool = False  # Prevent accidental direct use
 
@@ -80,7 +90,18 @@ def __init__(
         self._step_outputs: Set[StepOutputHandle] = set(self._plan.known_state.ready_outputs)
 
         # All steps to be executed start out here in _pending
-        self._pending: Dict[str, Set[str]] = dict(self._plan.get_executable_step_deps())
+        self._pending: Dict[str, Set[str]] = {}
+        # Dependencies of every step that has entered _pending, used to requeue retries
+        self._step_deps: Dict[str, Set[str]] = {}
+        # Pending steps are only re-evaluated when one of their dependencies finishes. Each
+        # pending step tracks how many of its dependencies have not finished yet, and each step
+        # tracks which pending steps are waiting on it.
+        self._num_unfinished_deps: Dict[str, int] = {}
+        self._pending_dependents: Dict[str, Set[str]] = defaultdict(set)
+        self._steps_to_evaluate: Set[str] = set()
+        # Order in which steps entered _pending, so that they are evaluated in a stable order
+        self._pending_order: Dict[str, int] = {}
+        self._pending_counter = itertools.count()
 
         # track mapping keys from DynamicOutputs, step_key, output_name -> list of keys
         # to _gathering while in flight
@@ -95,7 +116,9 @@ def __init__(
         self._skipped_deps: Dict[str, Sequence[str]] = {}
 
         # steps move in to these buckets as a result of _update calls
-        self._executable: List[str] = []
+        # _executable is a heap of (sort key, insertion order, step key)
+        self._executable: List[Tuple[float, int, str]] = []
+        self._executable_counter = itertools.count()
         self._pending_skip: List[str] = []
         self._pending_retry: List[str] = []
         self._pending_abandon: List[str] = []
@@ -115,6 +138,9 @@ def __init__(
 
         self._interrupted: bool = False
 
+        for step_key, deps in self._plan.get_executable_step_deps().items():
+            self._add_pending(step_key, deps)
+
         # Start the show by loading _executable with the set of _pending steps that have no deps
         self._update()
 
@@ -133,7 +159,10 @@ def __exit__(
 
         if not self.is_complete:
             pending_action = (
-                self._executable + self._pending_abandon + self._pending_retry + self._pending_skip
+                [step_key for _, _, step_key in sorted(self._executable)]
+                + self._pending_abandon
+                + self._pending_retry
+                + self._pending_skip
             )
             state_str = "{pending_str}{in_flight_str}{action_str}{retry_str}".format(
                 in_flight_str=f"\nSteps still in flight: {self._in_flight}"
@@ -171,31 +200,77 @@ def __exit__(
                     " performing step execution.".format(step_list=self._unknown_state)
                 )
 
+    def _add_pending(self, step_key: str, deps: Set[str]) -> None:
+        self._pending[step_key] = deps
+        self._step_deps[step_key] = deps
+        self._pending_order[step_key] = next(self._pending_counter)
+
+        num_unfinished_deps = 0
+        for dep in deps:
+            if not self._is_finished(dep):
+                self._pending_dependents[dep].add(step_key)
+                num_unfinished_deps += 1
+        self._num_unfinished_deps[step_key] = num_unfinished_deps
+        self._steps_to_evaluate.add(step_key)
+
+    def _remove_pending(self, step_key: str) -> None:
+        del self._pending[step_key]
+        del self._num_unfinished_deps[step_key]
+        del self._pending_order[step_key]
+
+    def _is_finished(self, step_key: str) -> bool:
+        return (
+            step_key in self._success
+            or step_key in self._skipped
+            or step_key in self._failed
+            or step_key in self._abandoned
+        )
+
+    def _on_step_finished(self, step_key: str) -> None:
+        for dependent_key in self._pending_dependents.pop(step_key, ()):
+            if dependent_key in self._num_unfinished_deps:
+                self._num_unfinished_deps[dependent_key] -= 1
+                self._steps_to_evaluate.add(dependent_key)
+
+    def _push_executable(self, step_key: str) -> None:
+        heapq.heappush(
+            self._executable,
+            (
+                self._sort_key_fn(self.get_step_by_key(step_key)),
+                next(self._executable_counter),
+                step_key,
+            ),
+        )
+
     def _update(self) -> None:
         """Moves steps from _pending to _executable / _pending_skip / _pending_retry
         as a function of what has been _completed.
         """
-        new_steps_to_execute: List[str] = []
-        new_steps_to_skip: List[str] = []
-        new_steps_to_abandon: List[str] = []
-
-        successful_or_skipped_steps = self._success | self._skipped
-        failed_or_abandoned_steps = self._failed | self._abandoned
-
         if self._new_dynamic_mappings:
             new_step_deps = self._plan.resolve(self._completed_dynamic_outputs)
             for step_key, deps in new_step_deps.items():
-                self._pending[step_key] = deps
+                self._add_pending(step_key, deps)
 
             self._new_dynamic_mappings = False
 
-        for step_key, requirements in self._pending.items():
+        # Only the pending steps whose dependencies changed since the last update need to be
+        # looked at
+        steps_to_evaluate = sorted(
+            (step_key for step_key in self._steps_to_evaluate if step_key in self._pending),
+            key=self._pending_order.__getitem__,
+        )
+        self._steps_to_evaluate = set()
+
+        for step_key in steps_to_evaluate:
+            requirements = self._pending[step_key]
+
             # If any upstream deps failed - this is not executable
-            if requirements.intersection(failed_or_abandoned_steps):
-                new_steps_to_abandon.append(step_key)
+            if any(dep in self._failed or dep in self._abandoned for dep in requirements):
+                self._remove_pending(step_key)
+                self._pending_abandon.append(step_key)
 
             # If all the upstream steps of a step are complete or skipped
-            elif requirements.issubset(successful_or_skipped_steps):
+            elif self._num_unfinished_deps[step_key] == 0:
                 step = self.get_step_by_key(step_key)
 
                 # The base case is downstream step won't skip
@@ -220,32 +295,22 @@ def _update(self) -> None:
                             ]
                             break
 
+                self._remove_pending(step_key)
                 if should_skip:
-                    new_steps_to_skip.append(step_key)
+                    self._pending_skip.append(step_key)
                 else:
-                    new_steps_to_execute.append(step_key)
+                    self._push_executable(step_key)
 
-        for key in new_steps_to_execute:
-            self._executable.append(key)
-            del self._pending[key]
+        if self._waiting_to_retry:
+            ready_to_retry = []
+            tick_time = time.time()
+            for key, at_time in self._waiting_to_retry.items():
+                if tick_time >= at_time:
+                    ready_to_retry.append(key)
 
-        for key in new_steps_to_skip:
-            self._pending_skip.append(key)
-            del self._pending[key]
-
-        for key in new_steps_to_abandon:
-            self._pending_abandon.append(key)
-            del self._pending[key]
-
-        ready_to_retry = []
-        tick_time = time.time()
-        for key, at_time in self._waiting_to_retry.items():
-            if tick_time >= at_time:
-                ready_to_retry.append(key)
-
-        for key in ready_to_retry:
-            self._executable.append(key)
-            del self._waiting_to_retry[key]
+            for key in ready_to_retry:
+                self._push_executable(key)
+                del self._waiting_to_retry[key]
 
     def sleep_til_ready(self) -> None:
         now = time.time()
@@ -284,22 +349,10 @@ def get_steps_to_execute(
 
         self._update()
 
-        steps = sorted(
-            [self.get_step_by_key(key) for key in self._executable],
-            key=self._sort_key_fn,
-        )
-
-        tag_concurrency_limits_counter = None
-        if self._tag_concurrency_limits:
-            in_flight_steps = [self.get_step_by_key(key) for key in self._in_flight]
-            tag_concurrency_limits_counter = TagConcurrencyLimitsCounter(
-                self._tag_concurrency_limits,
-                in_flight_steps,
-            )
-
         batch: List[ExecutionStep] = []
+        blocked: List[Tuple[float, int, str]] = []
 
-        for step in steps:
+        while self._executable:
             if limit is not None and len(batch) >= limit:
                 break
 
@@ -309,17 +362,22 @@ def get_steps_to_execute(
             ):
                 break
 
-            if tag_concurrency_limits_counter:
-                if tag_concurrency_limits_counter.is_blocked(step):
-                    continue
+            entry = heapq.heappop(self._executable)
+            step = self.get_step_by_key(entry[2])
 
-                tag_concurrency_limits_counter.update_counters_with_launched_item(step)
+            if self._tag_concurrency_limits_counter and (
+                self._tag_concurrency_limits_counter.is_blocked(step)
+            ):
+                blocked.append(entry)
+                continue
 
+            self._add_in_flight(step)
             batch.append(step)
 
+        for entry in blocked:
+            heapq.heappush(self._executable, entry)
+
         for step in batch:
-            self._in_flight.add(step.key)
-            self._executable.remove(step.key)
             self._prep_for_dynamic_outputs(step)
 
         return batch
@@ -328,13 +386,12 @@ def get_steps_to_skip(self) -> Sequence[ExecutionStep]:
         self._update()
 
         steps = []
-        steps_to_skip = list(self._pending_skip)
+        steps_to_skip = self._pending_skip
+        self._pending_skip = []
         for key in steps_to_skip:
             step = self.get_step_by_key(key)
             steps.append(step)
-            self._in_flight.add(key)
-            self._pending_skip.remove(key)
-            self._gathering_dynamic_outputs
+            self._add_in_flight(step)
             self._skip_for_dynamic_outputs(step)
 
         return sorted(steps, key=self._sort_key_fn)
@@ -343,11 +400,12 @@ def get_steps_to_abandon(self) -> Sequence[ExecutionStep]:
         self._update()
 
         steps = []
-        steps_to_abandon = list(self._pending_abandon)
+        steps_to_abandon = self._pending_abandon
+        self._pending_abandon = []
         for key in steps_to_abandon:
-            steps.append(self.get_step_by_key(key))
-            self._in_flight.add(key)
-            self._pending_abandon.remove(key)
+            step = self.get_step_by_key(key)
+            steps.append(step)
+            self._add_in_flight(step)
 
         return sorted(steps, key=self._sort_key_fn)
 
@@ -399,20 +457,24 @@ def plan_events_iterator(
     def mark_failed(self, step_key: str) -> None:
         self._failed.add(step_key)
         self._mark_complete(step_key)
+        self._on_step_finished(step_key)
 
     def mark_success(self, step_key: str) -> None:
         self._success.add(step_key)
         self._mark_complete(step_key)
         self._resolve_any_dynamic_outputs(step_key)
+        self._on_step_finished(step_key)
 
     def mark_skipped(self, step_key: str) -> None:
         self._skipped.add(step_key)
         self._mark_complete(step_key)
         self._resolve_any_dynamic_outputs(step_key)
+        self._on_step_finished(step_key)
 
     def mark_abandoned(self, step_key: str) -> None:
         self._abandoned.add(step_key)
         self._mark_complete(step_key)
+        self._on_step_finished(step_key)
 
     def mark_interrupted(self) -> None:
         self._interrupted = True
@@ -432,16 +494,22 @@ def mark_up_for_retry(self, step_key: str, at_time: Optional[float] = None) -> N
             if at_time:
                 self._waiting_to_retry[step_key] = at_time
             else:
-                self._pending[step_key] = self._plan.get_executable_step_deps()[step_key]
+                self._add_pending(step_key, self._step_deps[step_key])
 
         elif self._retry_mode.deferred:
             # do not attempt to execute again
             self._abandoned.add(step_key)
+            self._on_step_finished(step_key)
 
         self._retry_state.mark_attempt(step_key)
 
         self._mark_complete(step_key)
 
+    def _add_in_flight(self, step: ExecutionStep) -> None:
+        self._in_flight.add(step.key)
+        if self._tag_concurrency_limits_counter:
+            self._tag_concurrency_limits_counter.update_counters_with_launched_item(step)
+
     def _mark_complete(self, step_key: str) -> None:
         check.invariant(
             step_key in self._in_flight,
@@ -450,6 +518,10 @@ def _mark_complete(self, step_key: str) -> None:
             ),
         )
         self._in_flight.remove(step_key)
+        if self._tag_concurrency_limits_counter:
+            self._tag_concurrency_limits_counter.update_counters_with_completed_item(
+                self.get_step_by_key(step_key)
+            )
 
     def handle_event(self, dagster_event: DagsterEvent) -> None:
         check.inst_param(dagster_event, "dagster_event", DagsterEvent)
@@ -15,6 +15,7 @@
 from dagster._core.events import DagsterEvent, EngineEventData
 from dagster._core.execution.compute_logs import create_compute_log_file_key
 from dagster._core.execution.context.system import PlanExecutionContext, StepExecutionContext
+from dagster._core.execution.plan.active import ActiveExecution
 from dagster._core.execution.plan.execute_step import core_dagster_event_sequence_for_step
 from dagster._core.execution.plan.objects import (
     ErrorSource,
@@ -24,6 +25,9 @@
     step_failure_event_from_exc_info,
 )
 from dagster._core.execution.plan.plan import ExecutionPlan
+from dagster._core.execution.plan.state import KnownExecutionState
+from dagster._core.execution.plan.step import ExecutionStep
+from dagster._core.execution.resources_init import step_resource_initialization_manager
 from dagster._core.storage.captured_log_manager import CapturedLogManager
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 
@@ -54,9 +58,22 @@ def inner_plan_execution_iterator(
             # https://github.com/dagster-io/dagster/issues/811
             while not active_execution.is_complete:
                 step = active_execution.get_next_step()
+                known_state = active_execution.get_known_state()
+
+                step_resources_manager = step_resource_initialization_manager(job_context, step)
+                try:
+                    yield from step_resources_manager.generate_setup_events()
+                except DagsterUserCodeExecutionError:
+                    yield from _handle_step_resource_init_error(
+                        job_context, active_execution, step, known_state, sys.exc_info()
+                    )
+                    if job_context.raise_on_error:
+                        raise
+                    continue
+
                 step_context = cast(
                     StepExecutionContext,
-                    job_context.for_step(step, active_execution.get_known_state()),
+                    job_context.for_step(step, known_state, step_resources_manager.get_object()),
                 )
                 step_event_list = []
 
@@ -124,12 +141,34 @@ def inner_plan_execution_iterator(
                 for hook_event in _trigger_hook(step_context, step_event_list):
                     yield hook_event
 
+                # tear down the step-scoped resources once the hooks have run
+                yield from step_resources_manager.generate_teardown_events()
+
             try:
                 capture_stack.close()
             except Exception:
                 yield from _handle_compute_log_teardown_error(job_context, sys.exc_info())
 
 
+def _handle_step_resource_init_error(
+    job_context: PlanExecutionContext,
+    active_execution: ActiveExecution,
+    step: ExecutionStep,
+    known_state: KnownExecutionState,
+    exc_info,
+) -> Iterator[DagsterEvent]:
+    # the step cannot execute without its resources, so fail it like other user code errors
+    step_context = cast(StepExecutionContext, job_context.for_step(step, known_state))
+    step_failure_event = step_failure_event_from_exc_info(
+        step_context, exc_info, error_source=ErrorSource.USER_CODE_ERROR
+    )
+    yield step_failure_event
+    active_execution.handle_event(step_failure_event)
+
+    # process skips from the failure
+    yield from active_execution.plan_events_iterator(job_context)
+
+
 def _handle_compute_log_setup_error(
     context: PlanExecutionContext, exc_info
 ) -> Iterator[DagsterEvent]:
@@ -221,7 +221,6 @@ def build(self) -> "ExecutionPlan":
                 step_dict_by_key,
                 step_handles_to_execute,
                 job_def,
-                self.resolved_run_config,
                 executable_map,
             ),
             executor_name=executor_name,
@@ -245,6 +244,18 @@ def build(self) -> "ExecutionPlan":
             plan = plan.build_memoized_plan(
                 job_def, self.resolved_run_config, instance, self.step_keys_to_execute
             )
+        # Plans for a subset of steps (e.g. the plans executed in child processes) are never
+        # pruned, so the steps selected when the run started are the ones that get executed
+        elif job_def.is_skipping_unchanged_steps(self._tags) and self.step_keys_to_execute is None:
+            if self._instance_ref is None:
+                raise DagsterInvariantViolationError(
+                    "Attempted to build an execution plan that skips unchanged steps without "
+                    "providing a persistent DagsterInstance to create_execution_plan."
+                )
+            instance = DagsterInstance.from_ref(self._instance_ref)
+            plan = plan.build_plan_skipping_unchanged_steps(
+                job_def, self.resolved_run_config, instance
+            )
 
         return plan
 
@@ -746,9 +757,11 @@ def build_subset_plan(
         self,
         step_keys_to_execute: Sequence[str],
         job_def: JobDefinition,
-        resolved_run_config: ResolvedRunConfig,
+        resolved_run_config: Optional[ResolvedRunConfig] = None,
         step_output_versions: Optional[Mapping[StepOutputHandle, Optional[str]]] = None,
     ) -> "ExecutionPlan":
+        # resolved_run_config is no longer needed to build a subset plan, and is accepted for
+        # backwards compatibility
         check.sequence_param(step_keys_to_execute, "step_keys_to_execute", of_type=str)
         step_output_versions = check.opt_mapping_param(
             step_output_versions, "step_output_versions", key_type=StepOutputHandle, value_type=str
@@ -825,7 +838,6 @@ def build_subset_plan(
                 self.step_dict_by_key,
                 step_handles_to_execute,
                 job_def,
-                resolved_run_config,
                 executable_map,
             ),
             executor_name=self.executor_name,
@@ -933,6 +945,37 @@ def build_memoized_plan(
             step_output_versions=step_output_versions,
         )
 
+    def build_plan_skipping_unchanged_steps(
+        self,
+        job_def: JobDefinition,
+        resolved_run_config: ResolvedRunConfig,
+        instance: DagsterInstance,
+    ) -> "ExecutionPlan":
+        """Returns:
+        ExecutionPlan: Execution plan that does not run the steps whose assets are unchanged since
+            their latest materialization. Their stored outputs are loaded by downstream steps.
+        """
+        from ..memoization import resolve_unchanged_step_keys
+
+        unchanged_step_keys = resolve_unchanged_step_keys(self, job_def, instance)
+        if not unchanged_step_keys:
+            return self
+
+        plan = self.build_subset_plan(
+            [key for key in self.step_keys_to_execute if key not in unchanged_step_keys],
+            job_def,
+            resolved_run_config,
+        )
+        # the steps that are still executed load the outputs of the skipped steps they depend on
+        if plan.step_keys_to_execute and not plan.artifacts_persisted:
+            raise DagsterInvariantViolationError(
+                f"{job_def.describe_target().capitalize()} skips unchanged steps, but does not"
+                " persist its outputs. To load the outputs of skipped steps, use a persistent io"
+                " manager, such as the fs_io_manager."
+            )
+
+        return plan
+
     def start(
         self,
         retry_mode: RetryMode,
@@ -1050,7 +1093,12 @@ def rebuild_step_input(
     def rebuild_from_snapshot(
         job_name: str,
         execution_plan_snapshot: "ExecutionPlanSnapshot",
+        known_state: Optional[KnownExecutionState] = None,
     ) -> "ExecutionPlan":
+        """Rebuilds the plan stored in the snapshot, resolving it against the given known state
+        (e.g. the state of an in-progress run) instead of the one it was created with, if provided.
+        """
+        known_state = check.opt_inst_param(known_state, "known_state", KnownExecutionState)
         if not execution_plan_snapshot.can_reconstruct_plan:
             raise DagsterInvariantViolationError(
                 "Tried to reconstruct an old ExecutionPlanSnapshot that was created before"
@@ -1121,11 +1169,13 @@ def rebuild_from_snapshot(
             StepHandle.parse_from_key(key) for key in execution_plan_snapshot.step_keys_to_execute
         ]
 
+        known_state = known_state or execution_plan_snapshot.initial_known_state
+
         executable_map, resolvable_map = _compute_step_maps(
             step_dict,
             step_dict_by_key,
             step_handles_to_execute,
-            execution_plan_snapshot.initial_known_state,
+            known_state,
         )
 
         return ExecutionPlan(
@@ -1134,7 +1184,7 @@ def rebuild_from_snapshot(
             resolvable_map,
             step_handles_to_execute,
             # default to empty known execution state if initial was not persisted
-            execution_plan_snapshot.initial_known_state or KnownExecutionState(),
+            known_state or KnownExecutionState(),
             execution_plan_snapshot.artifacts_persisted,
             executor_name=execution_plan_snapshot.executor_name,
             repository_load_data=execution_plan_snapshot.repository_load_data,
@@ -1151,6 +1201,7 @@ def _update_from_resolved_dynamic_outputs(
 ) -> None:
     resolved_steps: List[ExecutionStep] = []
     key_sets_to_clear: List[FrozenSet[str]] = []
+    step_handles_to_execute_set = set(step_handles_to_execute)
 
     # find entries in the resolvable map whose requirements are now all ready
     for required_keys, unresolved_step_handles in resolvable_map.items():
@@ -1161,7 +1212,7 @@ def _update_from_resolved_dynamic_outputs(
 
         for unresolved_step_handle in unresolved_step_handles:
             # don't resolve steps we are not executing
-            if unresolved_step_handle not in step_handles_to_execute:
+            if unresolved_step_handle not in step_handles_to_execute_set:
                 continue
 
             resolvable_step = step_dict[unresolved_step_handle]
@@ -1280,7 +1331,6 @@ def _compute_artifacts_persisted(
     step_dict_by_key: Dict[str, IExecutionStep],
     step_handles_to_execute: Sequence[StepHandleUnion],
     pipeline_def: JobDefinition,
-    resolved_run_config: ResolvedRunConfig,
     executable_map: Mapping[str, Union[StepHandle, ResolvedFromDynamicStepHandle]],
 ) -> bool:
     """Check if all the border steps of the current run have non-in-memory IO managers for reexecution.
@@ -1343,7 +1393,7 @@ def _get_executable_step_deps(
     # for things transitively downstream of unresolved collect steps
     unresolved_set = set()
 
-    step_keys_to_execute = [handle.to_key() for handle in step_handles_to_execute]
+    step_keys_to_execute = {handle.to_key() for handle in step_handles_to_execute}
 
     for key, handle in executable_map.items():
         step = cast(ExecutionStep, step_dict[handle])
@@ -1413,7 +1463,7 @@ def _compute_step_maps(
             step_keys=missing_steps,
         )
 
-    step_keys_to_execute = [step_handle.to_key() for step_handle in step_handles_to_execute]
+    step_keys_to_execute = {step_handle.to_key() for step_handle in step_handles_to_execute}
     past_mappings = known_state.dynamic_mappings if known_state else {}
 
     executable_map: Dict[str, Union[StepHandle, ResolvedFromDynamicStepHandle]] = {}
@@ -1,14 +1,19 @@
+import atexit
 import inspect
+import logging
 from collections import deque
 from contextlib import ContextDecorator
 from typing import (
+    TYPE_CHECKING,
     AbstractSet,
     Any,
     Callable,
     Deque,
     Dict,
     Generator,
+    List,
     Mapping,
+    NamedTuple,
     Optional,
     Set,
     Union,
@@ -19,10 +24,12 @@
 from dagster._core.definitions.job_definition import JobDefinition
 from dagster._core.definitions.resource_definition import (
     ResourceDefinition,
+    ResourceLifetimeScope,
     ScopedResourcesBuilder,
     has_at_least_one_parameter,
 )
 from dagster._core.errors import (
+    DagsterInvalidDefinitionError,
     DagsterInvariantViolationError,
     DagsterResourceFunctionError,
     DagsterUserCodeExecutionError,
@@ -47,6 +54,16 @@
 
 from .context.init import InitResourceContext
 
+if TYPE_CHECKING:
+    from dagster._core.execution.context.system import PlanExecutionContext
+
+# lifetime scopes from shortest to longest lived
+_LIFETIME_SCOPE_ORDER = [
+    ResourceLifetimeScope.STEP,
+    ResourceLifetimeScope.RUN,
+    ResourceLifetimeScope.PROCESS,
+]
+
 
 def resource_initialization_manager(
     resource_defs: Mapping[str, ResourceDefinition],
@@ -57,6 +74,8 @@ def resource_initialization_manager(
     resource_keys_to_init: Optional[AbstractSet[str]],
     instance: Optional[DagsterInstance],
     emit_persistent_events: Optional[bool],
+    step: Optional[ExecutionStep] = None,
+    initialized_resources: Optional[ScopedResourcesBuilder] = None,
 ):
     generator = resource_initialization_event_generator(
         resource_defs=resource_defs,
@@ -67,10 +86,38 @@ def resource_initialization_manager(
         resource_keys_to_init=resource_keys_to_init,
         instance=instance,
         emit_persistent_events=emit_persistent_events,
+        step=step,
+        initialized_resources=initialized_resources,
     )
     return EventGenerationManager(generator, ScopedResourcesBuilder)
 
 
+def step_resource_initialization_manager(
+    job_context: "PlanExecutionContext", step: ExecutionStep
+) -> EventGenerationManager[ScopedResourcesBuilder]:
+    """Initializes the step-scoped resources required by a step that have not already been
+    initialized for the plan, and yields a ScopedResourcesBuilder that also holds the plan's
+    resources. The step-scoped resources are torn down by the manager's teardown events.
+    """
+    initialized_resources = job_context.scoped_resources_builder
+    resource_keys_to_init = get_step_scoped_resource_keys_to_init(
+        job_context.execution_plan, job_context.job_def, step
+    ) - set(initialized_resources.resource_instance_dict.keys())
+
+    return resource_initialization_manager(
+        resource_defs=job_context.job_def.resource_defs,
+        resource_configs=job_context.resolved_run_config.resources,
+        log_manager=job_context.log,
+        execution_plan=job_context.execution_plan,
+        dagster_run=job_context.dagster_run,
+        resource_keys_to_init=resource_keys_to_init,
+        instance=job_context.instance,
+        emit_persistent_events=True,
+        step=step,
+        initialized_resources=initialized_resources,
+    )
+
+
 def resolve_resource_dependencies(
     resource_defs: Mapping[str, ResourceDefinition]
 ) -> Mapping[str, AbstractSet[str]]:
@@ -106,6 +153,28 @@ def _helper(resource_key):
         _helper(resource_key)
 
 
+def ensure_resource_lifetime_scopes_compatible(
+    resource_defs: Mapping[str, ResourceDefinition], resource_keys: AbstractSet[str]
+) -> None:
+    """Resources are torn down at the end of their lifetime scope, so a resource cannot hold on to a
+    resource with a shorter lifetime scope than its own. Only the given resource keys are checked,
+    so resources that are provided but never initialized don't need compatible scopes.
+    """
+    for resource_key in sorted(resource_keys):
+        resource_def = resource_defs[resource_key]
+        for reqd_resource_key in resource_def.required_resource_keys:
+            reqd_resource_def = resource_defs.get(reqd_resource_key)
+            if reqd_resource_def and _LIFETIME_SCOPE_ORDER.index(
+                reqd_resource_def.lifetime_scope
+            ) < _LIFETIME_SCOPE_ORDER.index(resource_def.lifetime_scope):
+                raise DagsterInvalidDefinitionError(
+                    f"Resource with key '{resource_key}' has lifetime scope"
+                    f" {resource_def.lifetime_scope.value}, but requires resource with key"
+                    f" '{reqd_resource_key}', which has the shorter lifetime scope"
+                    f" {reqd_resource_def.lifetime_scope.value}."
+                )
+
+
 def get_dependencies(
     resource_name: str, resource_deps: Mapping[str, AbstractSet[str]]
 ) -> AbstractSet[str]:
@@ -125,6 +194,56 @@ def _get_deps_helper(resource_key):
     return reqd_resources
 
 
+class _ProcessScopedResource(NamedTuple):
+    resource_name: str
+    resource_def: ResourceDefinition
+    config: Any
+    manager: EventGenerationManager
+    initialized_resource: "InitializedResource"
+
+
+# Process-scoped resources initialized in this process, in the order they were initialized
+_process_scoped_resources: List[_ProcessScopedResource] = []
+
+
+def _get_process_scoped_resource(
+    resource_def: ResourceDefinition, config: Any
+) -> Optional[_ProcessScopedResource]:
+    for process_scoped_resource in _process_scoped_resources:
+        if (
+            process_scoped_resource.resource_def is resource_def
+            and process_scoped_resource.config == config
+        ):
+            return process_scoped_resource
+    return None
+
+
+def _get_process_scoped_log_manager() -> DagsterLogManager:
+    from dagster._core.execution.context_creation_job import initialize_console_manager
+
+    return initialize_console_manager(None)
+
+
+def teardown_process_scoped_resources() -> None:
+    """Tears down the process-scoped resources initialized in this process, in the reverse order of
+    their initialization. This runs when the interpreter exits, and must be called explicitly by
+    processes that exit without running exit handlers, such as forked child processes.
+    """
+    while _process_scoped_resources:
+        process_scoped_resource = _process_scoped_resources.pop()
+        try:
+            for _ in process_scoped_resource.manager.generate_teardown_events():
+                pass
+        except DagsterUserCodeExecutionError:
+            logging.getLogger("dagster").exception(
+                "Error while tearing down process-scoped resource"
+                f" {process_scoped_resource.resource_name}"
+            )
+
+
+atexit.register(teardown_process_scoped_resources)
+
+
 def _core_resource_initialization_event_generator(
     resource_defs: Mapping[str, ResourceDefinition],
     resource_configs: Mapping[str, ResourceConfig],
@@ -135,9 +254,13 @@ def _core_resource_initialization_event_generator(
     resource_keys_to_init: Optional[AbstractSet[str]],
     instance: Optional[DagsterInstance],
     emit_persistent_events: Optional[bool],
+    step_handle: Optional[StepHandleUnion] = None,
+    initialized_resources: Optional[ScopedResourcesBuilder] = None,
 ):
     job_name = ""  # Must be initialized to a string to satisfy typechecker
-    contains_generator = False
+    contains_generator = (
+        initialized_resources.contains_generator if initialized_resources else False
+    )
     if emit_persistent_events:
         check.invariant(
             dagster_run and execution_plan,
@@ -148,8 +271,11 @@ def _core_resource_initialization_event_generator(
         )
         job_name = cast(DagsterRun, dagster_run).job_name
     resource_keys_to_init = check.opt_set_param(resource_keys_to_init, "resource_keys_to_init")
-    resource_instances: Dict[str, "InitializedResource"] = {}
+    resource_instances: Dict[str, "InitializedResource"] = (
+        dict(initialized_resources.resource_instance_dict) if initialized_resources else {}
+    )
     resource_init_times = {}
+    reused_resource_keys = set()
     try:
         if emit_persistent_events and resource_keys_to_init:
             yield DagsterEvent.resource_init_start(
@@ -157,6 +283,7 @@ def _core_resource_initialization_event_generator(
                 cast(ExecutionPlan, execution_plan),
                 resource_log_manager,
                 resource_keys_to_init,
+                step_handle=step_handle,
             )
 
         resource_dependencies = resolve_resource_dependencies(resource_defs)
@@ -166,16 +293,40 @@ def _core_resource_initialization_event_generator(
                 if resource_name not in resource_keys_to_init:
                     continue
 
+                # lifetime scopes only apply when executing steps, resources built outside of
+                # execution are always torn down with the other resources
+                is_process_scoped = (
+                    execution_plan is not None
+                    and resource_def.lifetime_scope == ResourceLifetimeScope.PROCESS
+                )
+                resource_config = resource_configs[resource_name].config
+                if is_process_scoped:
+                    process_scoped_resource = _get_process_scoped_resource(
+                        resource_def, resource_config
+                    )
+                    if process_scoped_resource:
+                        initialized_resource = process_scoped_resource.initialized_resource
+                        resource_instances[resource_name] = initialized_resource.resource
+                        contains_generator = contains_generator or initialized_resource.is_generator
+                        reused_resource_keys.add(resource_name)
+                        continue
+
                 resource_fn = cast(Callable[[InitResourceContext], Any], resource_def.resource_fn)
                 resources = ScopedResourcesBuilder(resource_instances).build(
                     resource_def.required_resource_keys
                 )
                 resource_context = InitResourceContext(
                     resource_def=resource_def,
-                    resource_config=resource_configs[resource_name].config,
-                    dagster_run=dagster_run,
+                    resource_config=resource_config,
+                    # a process-scoped resource outlives the run that initializes it and is torn
+                    # down when the process exits, so it does not log to that run
+                    dagster_run=None if is_process_scoped else dagster_run,
                     # Add tags with information about the resource
-                    log_manager=resource_log_manager.with_tags(
+                    log_manager=(
+                        _get_process_scoped_log_manager()
+                        if is_process_scoped
+                        else resource_log_manager
+                    ).with_tags(
                         resource_name=resource_name,
                         resource_fn_name=str(resource_fn.__name__),
                     ),
@@ -192,15 +343,29 @@ def _core_resource_initialization_event_generator(
                 resource_instances[resource_name] = initialized_resource.resource
                 resource_init_times[resource_name] = initialized_resource.duration
                 contains_generator = contains_generator or initialized_resource.is_generator
-                resource_managers.append(manager)
+                if is_process_scoped:
+                    # torn down when the process exits rather than with the other resources
+                    _process_scoped_resources.append(
+                        _ProcessScopedResource(
+                            resource_name=resource_name,
+                            resource_def=resource_def,
+                            config=resource_config,
+                            manager=manager,
+                            initialized_resource=initialized_resource,
+                        )
+                    )
+                else:
+                    resource_managers.append(manager)
 
         if emit_persistent_events and resource_keys_to_init:
             yield DagsterEvent.resource_init_success(
                 job_name,
                 cast(ExecutionPlan, execution_plan),
                 resource_log_manager,
-                resource_instances,
+                {key: resource_instances[key] for key in resource_keys_to_init},
                 resource_init_times,
+                reused_resource_keys=reused_resource_keys,
+                step_handle=step_handle,
             )
 
         delta_res_keys = resource_keys_to_init - set(resource_instances.keys())
@@ -219,6 +384,7 @@ def _core_resource_initialization_event_generator(
                 resource_log_manager,
                 resource_keys_to_init,
                 serializable_error_info_from_exc_info(dagster_user_error.original_exc_info),
+                step_handle=step_handle,
             )
         raise dagster_user_error
 
@@ -232,6 +398,8 @@ def resource_initialization_event_generator(
     resource_keys_to_init: Optional[AbstractSet[str]],
     instance: Optional[DagsterInstance],
     emit_persistent_events: Optional[bool],
+    step: Optional[ExecutionStep] = None,
+    initialized_resources: Optional[ScopedResourcesBuilder] = None,
 ):
     check.inst_param(log_manager, "log_manager", DagsterLogManager)
     resource_keys_to_init = check.opt_set_param(
@@ -240,8 +408,12 @@ def resource_initialization_event_generator(
     check.opt_inst_param(execution_plan, "execution_plan", ExecutionPlan)
     check.opt_inst_param(dagster_run, "dagster_run", DagsterRun)
     check.opt_inst_param(instance, "instance", DagsterInstance)
+    check.opt_inst_param(step, "step", ExecutionStep)
+    check.opt_inst_param(initialized_resources, "initialized_resources", ScopedResourcesBuilder)
 
-    if execution_plan and execution_plan.step_handle_for_single_step_plans():
+    if step:
+        resource_log_manager = log_manager.with_tags(**step.logging_tags)
+    elif execution_plan and execution_plan.step_handle_for_single_step_plans():
         step = execution_plan.get_step(
             cast(
                 StepHandleUnion,
@@ -266,6 +438,8 @@ def resource_initialization_event_generator(
             resource_keys_to_init=resource_keys_to_init,
             instance=instance,
             emit_persistent_events=emit_persistent_events,
+            step_handle=step.handle if step else None,
+            initialized_resources=initialized_resources,
         )
     except GeneratorExit:
         # Shouldn't happen, but avoid runtime-exception in case this generator gets GC-ed
@@ -288,6 +462,7 @@ def resource_initialization_event_generator(
                     resource_log_manager,
                     resource_keys_to_init,
                     serializable_error_info_from_exc_info(error.original_exc_info),
+                    step_handle=step.handle if step else None,
                 )
 
 
@@ -368,16 +543,49 @@ def get_required_resource_keys_to_init(
         if step_handle not in execution_plan.step_handles_to_execute:
             continue
 
-        hook_defs = pipeline_def.get_all_hooks_for_handle(step.node_handle)
-        for hook_def in hook_defs:
-            resource_keys = resource_keys.union(hook_def.required_resource_keys)
-
         resource_keys = resource_keys.union(
-            get_required_resource_keys_for_step(pipeline_def, step, execution_plan)
+            _get_required_resource_keys_for_step_and_hooks(pipeline_def, step, execution_plan)
         )
 
+    resource_keys = get_transitive_required_resource_keys(resource_keys, pipeline_def.resource_defs)
+
+    # Step-scoped resources are initialized for each step instead, unless only a single step is
+    # executed, in which case the lifetime of the plan's resources is the step
+    if not execution_plan.step_handle_for_single_step_plans():
+        resource_keys = {
+            key
+            for key in resource_keys
+            if pipeline_def.resource_defs[key].lifetime_scope != ResourceLifetimeScope.STEP
+        }
+
+    return frozenset(resource_keys)
+
+
+def get_step_scoped_resource_keys_to_init(
+    execution_plan: ExecutionPlan, pipeline_def: JobDefinition, step: ExecutionStep
+) -> AbstractSet[str]:
+    resource_keys = get_transitive_required_resource_keys(
+        _get_required_resource_keys_for_step_and_hooks(pipeline_def, step, execution_plan),
+        pipeline_def.resource_defs,
+    )
     return frozenset(
-        get_transitive_required_resource_keys(resource_keys, pipeline_def.resource_defs)
+        key
+        for key in resource_keys
+        if pipeline_def.resource_defs[key].lifetime_scope == ResourceLifetimeScope.STEP
+    )
+
+
+def _get_required_resource_keys_for_step_and_hooks(
+    pipeline_def: JobDefinition, step: IExecutionStep, execution_plan: ExecutionPlan
+) -> AbstractSet[str]:
+    resource_keys: Set[str] = set()
+
+    hook_defs = pipeline_def.get_all_hooks_for_handle(step.node_handle)
+    for hook_def in hook_defs:
+        resource_keys = resource_keys.union(hook_def.required_resource_keys)
+
+    return resource_keys.union(
+        get_required_resource_keys_for_step(pipeline_def, step, execution_plan)
     )
 
 
@@ -394,6 +602,8 @@ def get_transitive_required_resource_keys(
             set(get_dependencies(resource_key, resource_dependencies))
         )
 
+    ensure_resource_lifetime_scopes_compatible(resource_defs, transitive_required_resource_keys)
+
     return transitive_required_resource_keys
 
 
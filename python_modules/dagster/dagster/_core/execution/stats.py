@@ -1,6 +1,6 @@
 from collections import defaultdict
 from enum import Enum
-from typing import Any, Dict, Iterable, NamedTuple, Optional, Sequence, cast
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, cast
 
 import dagster._check as check
 from dagster._core.definitions import ExpectationResult
@@ -90,98 +90,146 @@ class StepEventStatus(Enum):
 def build_run_step_stats_from_events(
     run_id: str, records: Iterable[EventLogEntry]
 ) -> Sequence["RunStepKeyStatsSnapshot"]:
-    by_step_key: Dict[str, Dict[str, Any]] = defaultdict(dict)
-    attempts = defaultdict(list)
-    attempt_events = defaultdict(list)
-    markers: Dict[str, Dict[str, Any]] = defaultdict(dict)
-    for event in records:
-        if not event.is_dagster_event:
-            continue
-        dagster_event = event.get_dagster_event()
+    return RunStepStatsAccumulator(run_id).add_events(records).build()
 
-        step_key = dagster_event.step_key
-        if not step_key:
-            continue
 
-        if dagster_event.event_type == DagsterEventType.STEP_START:
-            by_step_key[step_key]["start_time"] = event.timestamp
-            by_step_key[step_key]["attempts"] = 1
-        if dagster_event.event_type == DagsterEventType.STEP_FAILURE:
-            by_step_key[step_key]["end_time"] = event.timestamp
-            by_step_key[step_key]["status"] = StepEventStatus.FAILURE
-        if dagster_event.event_type == DagsterEventType.STEP_RESTARTED:
-            by_step_key[step_key]["attempts"] = int(by_step_key[step_key].get("attempts") or 0) + 1
-        if dagster_event.event_type == DagsterEventType.STEP_SUCCESS:
-            by_step_key[step_key]["end_time"] = event.timestamp
-            by_step_key[step_key]["status"] = StepEventStatus.SUCCESS
-        if dagster_event.event_type == DagsterEventType.STEP_SKIPPED:
-            by_step_key[step_key]["end_time"] = event.timestamp
-            by_step_key[step_key]["status"] = StepEventStatus.SKIPPED
-        if dagster_event.event_type == DagsterEventType.ASSET_MATERIALIZATION:
-            materialization_events = by_step_key[step_key].get("materialization_events", [])
-            materialization_events.append(event)
-            by_step_key[step_key]["materialization_events"] = materialization_events
-        if dagster_event.event_type == DagsterEventType.STEP_EXPECTATION_RESULT:
-            expectation_data = cast(StepExpectationResultData, dagster_event.event_specific_data)
-            expectation_result = expectation_data.expectation_result
-            step_expectation_results = by_step_key[step_key].get("expectation_results", [])
-            step_expectation_results.append(expectation_result)
-            by_step_key[step_key]["expectation_results"] = step_expectation_results
-        if dagster_event.event_type in (
-            DagsterEventType.STEP_UP_FOR_RETRY,
-            DagsterEventType.STEP_RESTARTED,
-        ):
-            attempt_events[step_key].append(event)
-        if dagster_event.event_type in MARKER_EVENTS:
-            if dagster_event.engine_event_data.marker_start:
-                key = dagster_event.engine_event_data.marker_start
-                if key not in markers[step_key]:
-                    markers[step_key][key] = {"key": key, "start": event.timestamp}
-                else:
-                    markers[step_key][key]["start"] = event.timestamp
-
-            if dagster_event.engine_event_data.marker_end:
-                key = dagster_event.engine_event_data.marker_end
-                if key not in markers[step_key]:
-                    markers[step_key][key] = {"key": key, "end": event.timestamp}
-                else:
-                    markers[step_key][key]["end"] = event.timestamp
-
-    for step_key, step_stats in by_step_key.items():
-        events = attempt_events[step_key]
-        step_attempts = []
-        attempt_start = step_stats.get("start_time")
-
-        for event in events:
-            if not event.dagster_event:
+class RunStepStatsAccumulator:
+    """Folds the events of a run into per-step stats.
+
+    Events are expected in storage order. Since events can be added across several calls, stats
+    for a run can be kept up to date by only adding the events stored since the last call.
+    """
+
+    def __init__(self, run_id: str):
+        self._run_id = check.str_param(run_id, "run_id")
+        self._by_step_key: Dict[str, Dict[str, Any]] = defaultdict(dict)
+        self._attempt_events: Dict[str, List[EventLogEntry]] = defaultdict(list)
+        self._markers: Dict[str, Dict[str, Any]] = defaultdict(dict)
+
+    def add_events(self, records: Iterable[EventLogEntry]) -> "RunStepStatsAccumulator":
+        by_step_key = self._by_step_key
+        attempt_events = self._attempt_events
+        markers = self._markers
+        for event in records:
+            if not event.is_dagster_event:
+                continue
+            dagster_event = event.get_dagster_event()
+
+            step_key = dagster_event.step_key
+            if not step_key:
                 continue
-            if event.dagster_event.event_type == DagsterEventType.STEP_UP_FOR_RETRY:
+
+            if dagster_event.event_type == DagsterEventType.STEP_START:
+                by_step_key[step_key]["start_time"] = event.timestamp
+                by_step_key[step_key]["attempts"] = 1
+            if dagster_event.event_type == DagsterEventType.STEP_FAILURE:
+                by_step_key[step_key]["end_time"] = event.timestamp
+                by_step_key[step_key]["status"] = StepEventStatus.FAILURE
+            if dagster_event.event_type == DagsterEventType.STEP_RESTARTED:
+                by_step_key[step_key]["attempts"] = (
+                    int(by_step_key[step_key].get("attempts") or 0) + 1
+                )
+            if dagster_event.event_type == DagsterEventType.STEP_SUCCESS:
+                by_step_key[step_key]["end_time"] = event.timestamp
+                by_step_key[step_key]["status"] = StepEventStatus.SUCCESS
+            if dagster_event.event_type == DagsterEventType.STEP_SKIPPED:
+                by_step_key[step_key]["end_time"] = event.timestamp
+                by_step_key[step_key]["status"] = StepEventStatus.SKIPPED
+            if dagster_event.event_type == DagsterEventType.ASSET_MATERIALIZATION:
+                materialization_events = by_step_key[step_key].get("materialization_events", [])
+                materialization_events.append(event)
+                by_step_key[step_key]["materialization_events"] = materialization_events
+            if dagster_event.event_type == DagsterEventType.STEP_EXPECTATION_RESULT:
+                expectation_data = cast(
+                    StepExpectationResultData, dagster_event.event_specific_data
+                )
+                expectation_result = expectation_data.expectation_result
+                step_expectation_results = by_step_key[step_key].get("expectation_results", [])
+                step_expectation_results.append(expectation_result)
+                by_step_key[step_key]["expectation_results"] = step_expectation_results
+            if dagster_event.event_type in (
+                DagsterEventType.STEP_UP_FOR_RETRY,
+                DagsterEventType.STEP_RESTARTED,
+            ):
+                attempt_events[step_key].append(event)
+            if dagster_event.event_type in MARKER_EVENTS:
+                if dagster_event.engine_event_data.marker_start:
+                    key = dagster_event.engine_event_data.marker_start
+                    if key not in markers[step_key]:
+                        markers[step_key][key] = {"key": key, "start": event.timestamp}
+                    else:
+                        markers[step_key][key]["start"] = event.timestamp
+
+                if dagster_event.engine_event_data.marker_end:
+                    key = dagster_event.engine_event_data.marker_end
+                    if key not in markers[step_key]:
+                        markers[step_key][key] = {"key": key, "end": event.timestamp}
+                    else:
+                        markers[step_key][key]["end"] = event.timestamp
+
+        return self
+
+    def build(self) -> Sequence["RunStepKeyStatsSnapshot"]:
+        """The per-step stats for the events added so far. Does not modify the accumulated state,
+        so more events can be added afterwards.
+        """
+        snapshots = []
+        for step_key, step_stats in self._by_step_key.items():
+            step_attempts = []
+            attempt_start = step_stats.get("start_time")
+
+            for event in self._attempt_events[step_key]:
+                if not event.dagster_event:
+                    continue
+                if event.dagster_event.event_type == DagsterEventType.STEP_UP_FOR_RETRY:
+                    step_attempts.append(
+                        RunStepMarker(start_time=attempt_start, end_time=event.timestamp)
+                    )
+                elif event.dagster_event.event_type == DagsterEventType.STEP_RESTARTED:
+                    attempt_start = event.timestamp
+
+            value = dict(step_stats)
+            if step_stats.get("end_time"):
                 step_attempts.append(
-                    RunStepMarker(start_time=attempt_start, end_time=event.timestamp)
+                    RunStepMarker(start_time=attempt_start, end_time=step_stats["end_time"])
+                )
+            else:
+                value["status"] = StepEventStatus.IN_PROGRESS
+
+            # copy the accumulated lists, so that adding events does not mutate built snapshots
+            for list_key in ("materialization_events", "expectation_results"):
+                if list_key in value:
+                    value[list_key] = list(value[list_key])
+
+            snapshots.append(
+                RunStepKeyStatsSnapshot(
+                    run_id=self._run_id,
+                    step_key=step_key,
+                    attempts_list=step_attempts,
+                    markers=[
+                        RunStepMarker(start_time=marker.get("start"), end_time=marker.get("end"))
+                        for marker in self._markers[step_key].values()
+                    ],
+                    **value,
                 )
-            elif event.dagster_event.event_type == DagsterEventType.STEP_RESTARTED:
-                attempt_start = event.timestamp
-        if step_stats.get("end_time"):
-            step_attempts.append(
-                RunStepMarker(start_time=attempt_start, end_time=step_stats["end_time"])
             )
-        else:
-            by_step_key[step_key]["status"] = StepEventStatus.IN_PROGRESS
-        attempts[step_key] = step_attempts
-
-    return [
-        RunStepKeyStatsSnapshot(
-            run_id=run_id,
-            step_key=step_key,
-            attempts_list=attempts[step_key],
-            markers=[
-                RunStepMarker(start_time=marker.get("start"), end_time=marker.get("end"))
-                for marker in markers[step_key].values()
-            ],
-            **value,
-        )
-        for step_key, value in by_step_key.items()
-    ]
+
+        return snapshots
+
+    def copy(self) -> "RunStepStatsAccumulator":
+        accumulator = RunStepStatsAccumulator(self._run_id)
+        for step_key, step_stats in self._by_step_key.items():
+            accumulator._by_step_key[step_key] = {  # noqa: SLF001
+                key: list(value) if isinstance(value, list) else value
+                for key, value in step_stats.items()
+            }
+        for step_key, events in self._attempt_events.items():
+            accumulator._attempt_events[step_key] = list(events)  # noqa: SLF001
+        for step_key, step_markers in self._markers.items():
+            accumulator._markers[step_key] = {  # noqa: SLF001
+                key: dict(marker) for key, marker in step_markers.items()
+            }
+        return accumulator
 
 
 @whitelist_for_serdes
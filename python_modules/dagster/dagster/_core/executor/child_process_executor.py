@@ -2,17 +2,23 @@
 
 
 import os
+import pickle
 import queue
 import sys
+import time
 from abc import ABC, abstractmethod
 from multiprocessing import Queue
+from multiprocessing.connection import (
+    Connection,
+    wait as wait_for_ready,
+)
 from multiprocessing.context import BaseContext as MultiprocessingBaseContext
-from typing import TYPE_CHECKING, Iterator, NamedTuple, Optional, Union
-
-from typing_extensions import Literal
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, NamedTuple, Optional, Sequence, Union
 
 import dagster._check as check
 from dagster._core.errors import DagsterExecutionInterruptedError
+from dagster._core.execution.resources_init import teardown_process_scoped_resources
+from dagster._utils import start_termination_thread
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 from dagster._utils.interrupts import capture_interrupts
 
@@ -65,67 +71,170 @@ def __init__(self, exit_code=None):
         super().__init__()
 
 
-def _execute_command_in_child_process(event_queue: Queue, command: ChildProcessCommand):
+class _ChildProcessEventSender:
+    """Sending end of the pipe a child process reports its events over. Events are sent along with
+    the time they were sent at, so the parent can measure how long they took to be delivered.
+    """
+
+    def __init__(self, connection: Connection):
+        self._connection = connection
+
+    def put(self, event: object) -> None:
+        self._connection.send((time.time(), event))
+
+
+def _execute_command_in_child_process(event_connection: Connection, command: ChildProcessCommand):
     """Wraps the execution of a ChildProcessCommand.
 
-    Handles errors and communicates across a queue with the parent process.
+    Handles errors and communicates across a pipe with the parent process.
     """
     check.inst_param(command, "command", ChildProcessCommand)
 
+    event_sender = _ChildProcessEventSender(event_connection)
     with capture_interrupts():
         pid = os.getpid()
-        event_queue.put(ChildProcessStartEvent(pid=pid))
+        event_sender.put(ChildProcessStartEvent(pid=pid))
         try:
             for step_event in command.execute():
-                event_queue.put(step_event)
-            event_queue.put(ChildProcessDoneEvent(pid=pid))
+                event_sender.put(step_event)
+            event_sender.put(ChildProcessDoneEvent(pid=pid))
 
         except (
             Exception,
             KeyboardInterrupt,
             DagsterExecutionInterruptedError,
         ):
-            event_queue.put(
+            event_sender.put(
                 ChildProcessSystemErrorEvent(
                     pid=pid, error_info=serializable_error_info_from_exc_info(sys.exc_info())
                 )
             )
+        finally:
+            # child processes may exit without running exit handlers
+            teardown_process_scoped_resources()
 
 
 TICK = 20.0 * 1.0 / 1000.0
 """The minimum interval at which to check for child process liveness -- default 20ms."""
 
-PROCESS_DEAD_AND_QUEUE_EMPTY = "PROCESS_DEAD_AND_QUEUE_EMPTY"
-"""Sentinel value."""
 
+class ChildProcessEventSelector:
+    """Waits for events from many child processes at once.
+
+    When a selector is passed to execute_child_process_command or ChildProcessWorker.execute, the
+    returned iterator does not block: it yields None when no events are available, and the caller
+    calls wait before advancing its iterators again. A single wait returns as soon as any child
+    process sends an event or exits, instead of each child being polled with a timeout in turn.
 
-def _poll_for_event(
-    process, event_queue
-) -> Optional[Union["DagsterEvent", Literal["PROCESS_DEAD_AND_QUEUE_EMPTY"]]]:
+    The selector also keeps track of how long events took to be delivered from child processes.
+    """
+
+    def __init__(self):
+        # event pipe -> sentinel of the process sending on it
+        self._waitables: Dict[Connection, Any] = {}
+        self.num_events_delivered = 0
+        self.total_delivery_latency = 0.0
+        self.max_delivery_latency = 0.0
+
+    def register(self, connection: Connection, sentinel: Any) -> None:
+        self._waitables[connection] = sentinel
+
+    def unregister(self, connection: Connection) -> None:
+        self._waitables.pop(connection, None)
+
+    def wait(self, timeout: float) -> None:
+        if self._waitables:
+            wait_for_ready([*self._waitables.keys(), *self._waitables.values()], timeout)
+
+    def record_delivery(self, sent_at: float) -> None:
+        latency = max(time.time() - sent_at, 0.0)
+        self.num_events_delivered += 1
+        self.total_delivery_latency += latency
+        self.max_delivery_latency = max(self.max_delivery_latency, latency)
+
+    @property
+    def mean_delivery_latency(self) -> Optional[float]:
+        if not self.num_events_delivered:
+            return None
+        return self.total_delivery_latency / self.num_events_delivered
+
+
+def _poll_for_events(
+    process,
+    connection: Connection,
+    selector: Optional[ChildProcessEventSelector],
+    timeout: Optional[float],
+) -> Optional[Sequence[Any]]:
+    """Receives every event that is currently available from a child process, first waiting up to
+    timeout for one to arrive. Returns None once the process has died and all of its events have
+    been received.
+    """
+    if timeout:
+        wait_for_ready([connection, process.sentinel], timeout)
+
+    # Check liveness before draining the pipe, so that events sent right before the process died
+    # are received before it is considered dead.
+    is_alive = process.is_alive()
+
+    events = []
+    while connection.poll():
+        try:
+            sent_at, event = connection.recv()
+        except EOFError:
+            break
+        if selector:
+            selector.record_delivery(sent_at)
+        events.append(event)
+
+    if not events and not is_alive:
+        return None
+
+    return events
+
+
+def _receive_command_events(
+    process,
+    connection: Connection,
+    selector: Optional[ChildProcessEventSelector],
+) -> Iterator[Any]:
+    """Yields the events of a single command from a child process, up to and including its
+    ChildProcessDoneEvent or ChildProcessSystemErrorEvent, and None while waiting on events.
+    Raises ChildProcessCrashException if the process dies before the command completes.
+    """
+    if selector:
+        selector.register(connection, process.sentinel)
     try:
-        return event_queue.get(block=True, timeout=TICK)
-    except queue.Empty:
-        if not process.is_alive():
-            # There is a possibility that after the last queue.get the
-            # process created another event and then died. In that case
-            # we want to continue draining the queue.
-            try:
-                return event_queue.get(block=False)
-            except queue.Empty:
-                # If the queue empty we know that there are no more events
-                # and that the process has died.
-                return PROCESS_DEAD_AND_QUEUE_EMPTY
-    return None
+        while True:
+            events = _poll_for_events(
+                process, connection, selector, timeout=None if selector else TICK
+            )
+            if events is None:
+                # TODO Figure out what to do about stderr/stdout
+                raise ChildProcessCrashException(exit_code=process.exitcode)
+
+            if not events:
+                yield None
+
+            for event in events:
+                yield event
+
+                if isinstance(event, (ChildProcessDoneEvent, ChildProcessSystemErrorEvent)):
+                    return
+    finally:
+        if selector:
+            selector.unregister(connection)
 
 
 def execute_child_process_command(
-    multiprocessing_ctx: MultiprocessingBaseContext, command: ChildProcessCommand
+    multiprocessing_ctx: MultiprocessingBaseContext,
+    command: ChildProcessCommand,
+    selector: Optional[ChildProcessEventSelector] = None,
 ) -> Iterator[Optional["DagsterEvent"]]:
     """Execute a ChildProcessCommand in a new process.
 
     This function starts a new process whose execution target is a ChildProcessCommand wrapped by
-    _execute_command_in_child_process; polls the queue for events yielded by the child process
-    until the process dies and the queue is empty.
+    _execute_command_in_child_process; receives the events yielded by the child process over a pipe
+    until the command completes or the process dies.
 
     This function yields a complex set of objects to enable having multiple child process
     executions in flight:
@@ -143,36 +252,270 @@ def execute_child_process_command(
     Args:
         multiprocessing_ctx: The multiprocessing context to execute in (spawn, forkserver, fork)
         command (ChildProcessCommand): The command to execute in the child process.
+        selector (Optional[ChildProcessEventSelector]): If provided, the iterator yields None
+            instead of waiting when no events are available, leaving the waiting to the selector.
 
     Warning: if the child process is in an infinite loop, this will
     also infinitely loop.
     """
     check.inst_param(command, "command", ChildProcessCommand)
 
-    event_queue = multiprocessing_ctx.Queue()
+    event_connection, child_event_connection = multiprocessing_ctx.Pipe(duplex=False)
     try:
         process = multiprocessing_ctx.Process(  # type: ignore
-            target=_execute_command_in_child_process, args=(event_queue, command)
+            target=_execute_command_in_child_process, args=(child_event_connection, command)
         )
         process.start()
+        # only the child writes to the pipe, closing our copy lets us observe it exiting
+        child_event_connection.close()
 
-        completed_properly = False
+        yield from _receive_command_events(process, event_connection, selector)
 
-        while not completed_properly:
-            event = _poll_for_event(process, event_queue)
+        process.join()
+    finally:
+        child_event_connection.close()
+        event_connection.close()
 
-            if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
-                break
 
-            yield event
+class ChildProcessWorkerRetiringEvent(
+    NamedTuple("ChildProcessWorkerRetiringEvent", [("pid", int)]), ChildProcessEvent
+):
+    """Sent by a worker before the final event of a command when it will exit after that command."""
+
 
-            if isinstance(event, (ChildProcessDoneEvent, ChildProcessSystemErrorEvent)):
-                completed_properly = True
+def _get_memory_usage_bytes() -> Optional[int]:
+    try:
+        import psutil
 
-        if not completed_properly:
-            # TODO Figure out what to do about stderr/stdout
-            raise ChildProcessCrashException(exit_code=process.exitcode)
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
 
-        process.join()
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    # peak resident set size, reported in kilobytes on linux and in bytes on macos
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+WORKER_PARENT_CHECK_INTERVAL = 1.0
+"""How often an idle worker checks whether the process that started it has exited."""
+
+WORKER_SHUTDOWN_TIMEOUT = 10.0
+"""How long an idle worker is given to tear down its process-scoped resources and exit when its pool
+shuts down."""
+
+
+def _execute_commands_in_child_process_worker(
+    command_queue: Queue,
+    event_connection: Connection,
+    term_event: Any,
+    max_commands: Optional[int],
+    max_memory_growth_bytes: Optional[int],
+) -> None:
+    """Executes pickled ChildProcessCommands received over command_queue until receiving None, being
+    terminated, or reaching max_commands or max_memory_growth_bytes.
+    """
+    event_sender = _ChildProcessEventSender(event_connection)
+    with capture_interrupts():
+        pid = os.getpid()
+        parent_pid = os.getppid()
+        start_termination_thread(term_event)
+        initial_memory_usage = _get_memory_usage_bytes()
+        num_commands = 0
+
+        while not term_event.is_set():
+            try:
+                pickled_command = command_queue.get(
+                    block=True, timeout=WORKER_PARENT_CHECK_INTERVAL
+                )
+            except queue.Empty:
+                if os.getppid() != parent_pid:
+                    return
+                continue
+
+            if pickled_command is None:
+                return
+
+            num_commands += 1
+            event_sender.put(ChildProcessStartEvent(pid=pid))
+            try:
+                command = check.inst(pickle.loads(pickled_command), ChildProcessCommand)
+                for step_event in command.execute():
+                    event_sender.put(step_event)
+                final_event: ChildProcessEvent = ChildProcessDoneEvent(pid=pid)
+            except (
+                Exception,
+                KeyboardInterrupt,
+                DagsterExecutionInterruptedError,
+            ):
+                final_event = ChildProcessSystemErrorEvent(
+                    pid=pid, error_info=serializable_error_info_from_exc_info(sys.exc_info())
+                )
+
+            memory_usage = _get_memory_usage_bytes()
+            should_retire = (
+                term_event.is_set()
+                or (max_commands is not None and num_commands >= max_commands)
+                or (
+                    max_memory_growth_bytes is not None
+                    and initial_memory_usage is not None
+                    and memory_usage is not None
+                    and memory_usage - initial_memory_usage >= max_memory_growth_bytes
+                )
+            )
+            if should_retire:
+                event_sender.put(ChildProcessWorkerRetiringEvent(pid=pid))
+            event_sender.put(final_event)
+            if should_retire:
+                return
+
+
+def _run_child_process_worker(*args: Any) -> None:
+    try:
+        _execute_commands_in_child_process_worker(*args)
     finally:
-        event_queue.close()
+        # process-scoped resources are shared by the commands a worker executes, and are torn down
+        # here since child processes may exit without running exit handlers
+        teardown_process_scoped_resources()
+
+
+class ChildProcessWorker:
+    """A long-lived child process that executes ChildProcessCommands one at a time.
+
+    Commands are sent to the worker over a queue, so modules imported and definitions loaded by one
+    command (for example through the lru_cache on ReconstructableJob.get_definition) are reused by
+    the commands that follow it.
+    """
+
+    def __init__(
+        self,
+        multiprocessing_ctx: MultiprocessingBaseContext,
+        max_commands: Optional[int] = None,
+        max_memory_growth_bytes: Optional[int] = None,
+    ):
+        self._command_queue = multiprocessing_ctx.Queue()
+        self._event_connection, child_event_connection = multiprocessing_ctx.Pipe(duplex=False)
+        self.term_event = multiprocessing_ctx.Event()
+        self._process = multiprocessing_ctx.Process(  # type: ignore
+            target=_run_child_process_worker,
+            args=(
+                self._command_queue,
+                child_event_connection,
+                self.term_event,
+                check.opt_int_param(max_commands, "max_commands"),
+                check.opt_int_param(max_memory_growth_bytes, "max_memory_growth_bytes"),
+            ),
+        )
+        self._process.start()
+        child_event_connection.close()
+        self._retiring = False
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self._process.pid
+
+    @property
+    def is_available(self) -> bool:
+        return not self._retiring and not self.term_event.is_set() and self._process.is_alive()
+
+    def execute(
+        self,
+        command: ChildProcessCommand,
+        selector: Optional[ChildProcessEventSelector] = None,
+    ) -> Iterator[Optional["DagsterEvent"]]:
+        """Execute a ChildProcessCommand in this worker.
+
+        Yields the same objects as execute_child_process_command, and raises
+        ChildProcessCrashException if the worker dies before the command completes.
+        """
+        check.inst_param(command, "command", ChildProcessCommand)
+        check.invariant(self.is_available, "Worker is not available to execute commands")
+
+        # pickle eagerly so that errors surface here instead of in the queue's feeder thread
+        self._command_queue.put(pickle.dumps(command))
+
+        try:
+            for event in _receive_command_events(self._process, self._event_connection, selector):
+                if isinstance(event, ChildProcessWorkerRetiringEvent):
+                    self._retiring = True
+                    continue
+
+                yield event
+        except ChildProcessCrashException:
+            self._retiring = True
+            raise
+
+    def shutdown(self, timeout: Optional[float] = None) -> None:
+        if self._process.is_alive() and not self._retiring:
+            self._command_queue.put(None)
+        self._process.join(timeout)
+        if self._process.is_alive():
+            self._process.terminate()
+            self._process.join()
+        self._command_queue.close()
+        self._event_connection.close()
+
+
+class ChildProcessWorkerPool:
+    """Starts ChildProcessWorkers on demand and hands them out to execute one command at a time.
+
+    Workers are reused until they retire, either after max_commands_per_worker commands or once
+    their memory usage has grown by max_memory_growth_bytes, and are then replaced by new workers.
+    """
+
+    def __init__(
+        self,
+        multiprocessing_ctx: MultiprocessingBaseContext,
+        max_commands_per_worker: Optional[int] = None,
+        max_memory_growth_bytes: Optional[int] = None,
+    ):
+        self._multiprocessing_ctx = multiprocessing_ctx
+        self._max_commands_per_worker = check.opt_int_param(
+            max_commands_per_worker, "max_commands_per_worker"
+        )
+        self._max_memory_growth_bytes = check.opt_int_param(
+            max_memory_growth_bytes, "max_memory_growth_bytes"
+        )
+        self._idle_workers: List[ChildProcessWorker] = []
+        self._busy_workers: List[ChildProcessWorker] = []
+
+    def __enter__(self) -> "ChildProcessWorkerPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+
+    def acquire(self) -> ChildProcessWorker:
+        while self._idle_workers:
+            worker = self._idle_workers.pop()
+            if worker.is_available:
+                break
+            worker.shutdown()
+        else:
+            worker = ChildProcessWorker(
+                self._multiprocessing_ctx,
+                max_commands=self._max_commands_per_worker,
+                max_memory_growth_bytes=self._max_memory_growth_bytes,
+            )
+
+        self._busy_workers.append(worker)
+        return worker
+
+    def release(self, worker: ChildProcessWorker) -> None:
+        self._busy_workers.remove(worker)
+        if worker.is_available:
+            self._idle_workers.append(worker)
+        else:
+            worker.shutdown()
+
+    def shutdown(self) -> None:
+        for worker in self._idle_workers:
+            worker.shutdown(timeout=WORKER_SHUTDOWN_TIMEOUT)
+        for worker in self._busy_workers:
+            worker.shutdown(timeout=WORKER_PARENT_CHECK_INTERVAL)
+        self._idle_workers = []
+        self._busy_workers = []
@@ -1,6 +1,7 @@
 import multiprocessing
 import os
 import sys
+from contextlib import ExitStack
 from multiprocessing.context import BaseContext as MultiprocessingBaseContext
 from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Mapping, Optional, Sequence
 
@@ -16,7 +17,11 @@
     DagsterUnmetExecutorRequirementsError,
 )
 from dagster._core.events import DagsterEvent, EngineEventData
-from dagster._core.execution.api import create_execution_plan, execute_plan_iterator
+from dagster._core.execution.api import (
+    create_execution_plan_for_steps,
+    execute_plan_iterator,
+    get_cached_execution_plan_snapshot,
+)
 from dagster._core.execution.context.system import IStepContext, PlanOrchestrationContext
 from dagster._core.execution.context_creation_job import create_context_free_log_manager
 from dagster._core.execution.plan.active import ActiveExecution
@@ -32,10 +37,13 @@
 from dagster._utils.timing import format_duration, time_execution_scope
 
 from .child_process_executor import (
+    TICK,
     ChildProcessCommand,
     ChildProcessCrashException,
     ChildProcessEvent,
+    ChildProcessEventSelector,
     ChildProcessSystemErrorEvent,
+    ChildProcessWorkerPool,
     execute_child_process_command,
 )
 
@@ -53,7 +61,7 @@ def __init__(
         dagster_run: "DagsterRun",
         step_key: str,
         instance_ref: "InstanceRef",
-        term_event: Any,
+        term_event: Optional[Any],
         recon_pipeline: ReconstructableJob,
         retry_mode: RetryMode,
         known_state: Optional[KnownExecutionState],
@@ -72,12 +80,27 @@ def __init__(
     def execute(self) -> Iterator[DagsterEvent]:
         recon_job = self.recon_pipeline
         with DagsterInstance.from_ref(self.instance_ref) as instance:
-            start_termination_thread(self.term_event)
-            execution_plan = create_execution_plan(
-                job=recon_job,
-                run_config=self.run_config,
+            # workers in a ChildProcessWorkerPool watch their own termination event
+            if self.term_event is not None:
+                start_termination_thread(self.term_event)
+
+            # workers in a ChildProcessWorkerPool execute several steps of the run, so they fetch
+            # the run's execution plan snapshot once and rebuild each step's plan from it. A process
+            # that executes a single step builds its plan, which is cheaper than the fetch.
+            execution_plan_snapshot = (
+                get_cached_execution_plan_snapshot(
+                    instance, self.dagster_run.execution_plan_snapshot_id
+                )
+                if self.term_event is None and self.dagster_run.execution_plan_snapshot_id
+                else None
+            )
+            execution_plan = create_execution_plan_for_steps(
+                recon_job,
+                self.dagster_run,
+                execution_plan_snapshot,
                 step_keys_to_execute=[self.step_key],
                 known_state=self.known_state,
+                run_config=self.run_config,
                 repository_load_data=self.repository_load_data,
             )
 
@@ -111,6 +134,9 @@ def __init__(
         tag_concurrency_limits: Optional[List[Dict[str, Any]]] = None,
         start_method: Optional[str] = None,
         explicit_forkserver_preload: Optional[Sequence[str]] = None,
+        use_worker_pool: bool = False,
+        max_steps_per_worker: Optional[int] = None,
+        max_memory_growth_mb: Optional[int] = None,
     ):
         self._retries = check.inst_param(retries, "retries", RetryMode)
         if not max_concurrent:
@@ -138,6 +164,13 @@ def __init__(
             )
         self._start_method = start_method
         self._explicit_forkserver_preload = explicit_forkserver_preload
+        self._use_worker_pool = check.bool_param(use_worker_pool, "use_worker_pool")
+        self._max_steps_per_worker = check.opt_int_param(
+            max_steps_per_worker, "max_steps_per_worker"
+        )
+        self._max_memory_growth_mb = check.opt_int_param(
+            max_memory_growth_mb, "max_memory_growth_mb"
+        )
 
     @property
     def retries(self) -> RetryMode:
@@ -186,7 +219,25 @@ def execute(
             ),
         )
 
-        with time_execution_scope() as timer_result:
+        worker_pool = (
+            ChildProcessWorkerPool(
+                multiproc_ctx,
+                max_commands_per_worker=self._max_steps_per_worker,
+                max_memory_growth_bytes=self._max_memory_growth_mb * 1024 * 1024
+                if self._max_memory_growth_mb is not None
+                else None,
+            )
+            if self._use_worker_pool
+            else None
+        )
+
+        # all child processes are waited on together, see ChildProcessEventSelector
+        selector = ChildProcessEventSelector()
+
+        with time_execution_scope() as timer_result, ExitStack() as stack:
+            if worker_pool:
+                stack.enter_context(worker_pool)
+
             with ActiveExecution(
                 execution_plan,
                 retry_mode=self.retries,
@@ -223,27 +274,44 @@ def execute(
 
                         for step in steps:
                             step_context = plan_context.for_step(step)
-                            term_events[step.key] = multiproc_ctx.Event()
-                            active_iters[step.key] = execute_step_out_of_process(
-                                multiproc_ctx,
-                                job,
-                                step_context,
-                                step,
-                                errors,
-                                term_events,
-                                self.retries,
-                                active_execution.get_known_state(),
-                                execution_plan.repository_load_data,
-                            )
-
-                    # process active iterators
+                            if worker_pool:
+                                active_iters[step.key] = execute_step_in_worker_pool(
+                                    worker_pool,
+                                    job,
+                                    step_context,
+                                    step,
+                                    errors,
+                                    term_events,
+                                    self.retries,
+                                    active_execution.get_known_state(),
+                                    execution_plan.repository_load_data,
+                                    selector,
+                                )
+                            else:
+                                term_events[step.key] = multiproc_ctx.Event()
+                                active_iters[step.key] = execute_step_out_of_process(
+                                    multiproc_ctx,
+                                    job,
+                                    step_context,
+                                    step,
+                                    errors,
+                                    term_events,
+                                    self.retries,
+                                    active_execution.get_known_state(),
+                                    execution_plan.repository_load_data,
+                                    selector,
+                                )
+
+                    # process active iterators, draining every event that is ready
                     empty_iters = []
+                    received_events = False
                     for key, step_iter in active_iters.items():
                         try:
-                            event_or_none = next(step_iter)
-                            if event_or_none is None:
-                                continue
-                            else:
+                            while True:
+                                event_or_none = next(step_iter)
+                                if event_or_none is None:
+                                    break
+                                received_events = True
                                 yield event_or_none
                                 active_execution.handle_event(event_or_none)
 
@@ -276,6 +344,10 @@ def execute(
                         except StopIteration:
                             empty_iters.append(key)
 
+                    # sleep until any child process has sent an event or exited
+                    if active_iters and not received_events and not empty_iters:
+                        selector.wait(TICK)
+
                     # clear and mark complete finished iterators
                     for key in empty_iters:
                         del active_iters[key]
@@ -324,10 +396,30 @@ def execute(
             "Multiprocess executor: parent process exiting after {duration} (pid: {pid})".format(
                 duration=format_duration(timer_result.millis), pid=os.getpid()
             ),
-            event_specific_data=EngineEventData.multiprocess(os.getpid()),
+            event_specific_data=EngineEventData(
+                metadata={
+                    **EngineEventData.multiprocess(os.getpid()).metadata,
+                    **_get_event_delivery_metadata(selector),
+                }
+            ),
         )
 
 
+def _get_event_delivery_metadata(
+    selector: ChildProcessEventSelector,
+) -> Mapping[str, MetadataValue]:
+    if selector.mean_delivery_latency is None:
+        return {}
+
+    return {
+        "child_process_events": MetadataValue.int(selector.num_events_delivered),
+        "mean_event_delivery_latency_ms": MetadataValue.float(
+            selector.mean_delivery_latency * 1000
+        ),
+        "max_event_delivery_latency_ms": MetadataValue.float(selector.max_delivery_latency * 1000),
+    }
+
+
 def execute_step_out_of_process(
     multiproc_ctx: MultiprocessingBaseContext,
     recon_job: ReconstructableJob,
@@ -338,6 +430,7 @@ def execute_step_out_of_process(
     retries: RetryMode,
     known_state: KnownExecutionState,
     repository_load_data: Optional[RepositoryLoadData],
+    selector: Optional[ChildProcessEventSelector] = None,
 ) -> Iterator[Optional[DagsterEvent]]:
     command = MultiprocessExecutorChildProcessCommand(
         run_config=step_context.run_config,
@@ -357,7 +450,54 @@ def execute_step_out_of_process(
         metadata={},
     )
 
-    for ret in execute_child_process_command(multiproc_ctx, command):
+    yield from _handle_child_process_events(
+        execute_child_process_command(multiproc_ctx, command, selector), errors
+    )
+
+
+def execute_step_in_worker_pool(
+    worker_pool: ChildProcessWorkerPool,
+    recon_job: ReconstructableJob,
+    step_context: IStepContext,
+    step: ExecutionStep,
+    errors: Dict[int, SerializableErrorInfo],
+    term_events: Dict[str, Any],
+    retries: RetryMode,
+    known_state: KnownExecutionState,
+    repository_load_data: Optional[RepositoryLoadData],
+    selector: Optional[ChildProcessEventSelector] = None,
+) -> Iterator[Optional[DagsterEvent]]:
+    command = MultiprocessExecutorChildProcessCommand(
+        run_config=step_context.run_config,
+        dagster_run=step_context.dagster_run,
+        step_key=step.key,
+        instance_ref=step_context.instance.get_ref(),
+        term_event=None,
+        recon_pipeline=recon_job,
+        retry_mode=retries,
+        known_state=known_state,
+        repository_load_data=repository_load_data,
+    )
+
+    worker = worker_pool.acquire()
+    # interrupting the step terminates the worker executing it
+    term_events[step.key] = worker.term_event
+    try:
+        yield DagsterEvent.step_worker_starting(
+            step_context,
+            f'Executing "{step.key}" in worker process (pid: {worker.pid}).',
+            metadata={},
+        )
+
+        yield from _handle_child_process_events(worker.execute(command, selector), errors)
+    finally:
+        worker_pool.release(worker)
+
+
+def _handle_child_process_events(
+    child_process_iter: Iterator[Any], errors: Dict[int, SerializableErrorInfo]
+) -> Iterator[Optional[DagsterEvent]]:
+    for ret in child_process_iter:
         if ret is None or isinstance(ret, DagsterEvent):
             yield ret
         elif isinstance(ret, ChildProcessEvent):
@@ -70,9 +70,13 @@ def retries(self):
         return self._retries
 
     def _pop_events(self, instance, run_id) -> Sequence[DagsterEvent]:
-        events = instance.logs_after(run_id, self._event_cursor, of_type=set(DagsterEventType))
-        self._event_cursor += len(events)
-        dagster_events = [event.dagster_event for event in events]
+        # tail the event log of the run with a single query for all events after the storage id
+        # cursor, rather than scanning from an offset
+        conn = instance.get_records_for_run(
+            run_id, self._event_cursor, of_type=set(DagsterEventType)
+        )
+        self._event_cursor = conn.cursor
+        dagster_events = [record.event_log_entry.dagster_event for record in conn.records]
         check.invariant(None not in dagster_events, "Query should not return a non dagster event")
         return dagster_events
 
@@ -99,7 +103,7 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
         check.inst_param(plan_context, "plan_context", PlanOrchestrationContext)
         check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
 
-        self._event_cursor = -1
+        self._event_cursor: Optional[str] = None
 
         DagsterEvent.engine_event(
             plan_context,
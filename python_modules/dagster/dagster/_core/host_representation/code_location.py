@@ -3,6 +3,7 @@
 import threading
 from abc import abstractmethod
 from contextlib import AbstractContextManager
+from functools import partial
 from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, Sequence, Tuple, Union, cast
 
 import dagster._check as check
@@ -10,14 +11,20 @@
 from dagster._api.list_repositories import sync_list_repositories_grpc
 from dagster._api.notebook_data import sync_get_streaming_external_notebook_data_grpc
 from dagster._api.snapshot_execution_plan import sync_get_external_execution_plan_grpc
-from dagster._api.snapshot_job import sync_get_external_job_subset_grpc
+from dagster._api.snapshot_job import (
+    sync_get_external_job_grpc,
+    sync_get_external_job_subset_grpc,
+)
 from dagster._api.snapshot_partition import (
     sync_get_external_partition_config_grpc,
     sync_get_external_partition_names_grpc,
     sync_get_external_partition_set_execution_param_data_grpc,
     sync_get_external_partition_tags_grpc,
 )
-from dagster._api.snapshot_repository import sync_get_streaming_external_repositories_data_grpc
+from dagster._api.snapshot_repository import (
+    HashedExternalRepositoryDataPiece,
+    sync_get_streaming_external_repository_pieces_grpc,
+)
 from dagster._api.snapshot_schedule import sync_get_external_schedule_execution_data_grpc
 from dagster._core.code_pointer import CodePointer
 from dagster._core.definitions.reconstruct import ReconstructableJob
@@ -34,14 +41,19 @@
     ExternalRepository,
 )
 from dagster._core.host_representation.external_data import (
+    ExternalJobData,
+    ExternalJobRef,
     ExternalPartitionNamesData,
     ExternalScheduleExecutionErrorData,
     ExternalSensorExecutionErrorData,
+    external_repository_data_from_pieces,
+    external_repository_data_piece_key,
 )
 from dagster._core.host_representation.grpc_server_registry import GrpcServerRegistry
 from dagster._core.host_representation.handle import JobHandle, RepositoryHandle
 from dagster._core.host_representation.origin import (
     CodeLocationOrigin,
+    ExternalRepositoryOrigin,
     GrpcServerCodeLocationOrigin,
     InProcessCodeLocationOrigin,
 )
@@ -120,6 +132,7 @@ def get_external_execution_plan(
         step_keys_to_execute: Optional[Sequence[str]],
         known_state: Optional[KnownExecutionState],
         instance: Optional[DagsterInstance] = None,
+        tags: Optional[Mapping[str, str]] = None,
     ) -> ExternalExecutionPlan:
         pass
 
@@ -378,6 +391,7 @@ def get_external_execution_plan(
         step_keys_to_execute: Optional[Sequence[str]],
         known_state: Optional[KnownExecutionState],
         instance: Optional[DagsterInstance] = None,
+        tags: Optional[Mapping[str, str]] = None,
     ) -> ExternalExecutionPlan:
         check.inst_param(external_job, "external_job", ExternalJob)
         check.mapping_param(run_config, "run_config")
@@ -386,6 +400,7 @@ def get_external_execution_plan(
         )
         check.opt_inst_param(known_state, "known_state", KnownExecutionState)
         check.opt_inst_param(instance, "instance", DagsterInstance)
+        check.opt_mapping_param(tags, "tags", key_type=str, value_type=str)
 
         execution_plan = create_execution_plan(
             job=self.get_reconstructable_job(
@@ -398,6 +413,7 @@ def get_external_execution_plan(
             step_keys_to_execute=step_keys_to_execute,
             known_state=known_state,
             instance_ref=instance.get_ref() if instance and instance.is_persistent else None,
+            tags=tags,
         )
         return ExternalExecutionPlan(
             execution_plan_snapshot=snapshot_from_execution_plan(
@@ -544,6 +560,7 @@ def __init__(
         watch_server: Optional[bool] = True,
         grpc_server_registry: Optional[GrpcServerRegistry] = None,
         grpc_metadata: Optional[Sequence[Tuple[str, str]]] = None,
+        previous_location: Optional["GrpcServerCodeLocation"] = None,
     ):
         from dagster._grpc.client import DagsterGrpcClient, client_heartbeat_thread
 
@@ -572,6 +589,13 @@ def __init__(
 
         self.server_id = None
         self._external_repositories_data = None
+        self._external_repository_pieces: Mapping[
+            str, Mapping[str, HashedExternalRepositoryDataPiece]
+        ] = {}
+        # job snapshots fetched from deferred refs, keyed by repository and the hash of the ref
+        self._external_job_datas: Dict[Tuple[str, str], ExternalJobData] = {}
+
+        check.opt_inst_param(previous_location, "previous_location", GrpcServerCodeLocation)
 
         self._executable_path = None
         self._container_image = None
@@ -621,10 +645,41 @@ def __init__(
 
             self._container_context = list_repositories_response.container_context
 
-            self._external_repositories_data = sync_get_streaming_external_repositories_data_grpc(
-                self.client,
-                self,
-            )
+            # Job snapshots make up most of the repository data, so they are left out of the
+            # initial fetch and loaded from the server one job at a time, on first access.
+            # When reloading, only the pieces of each repository that changed since the previous
+            # location was loaded are fetched, and job snapshots that didn't change are kept.
+            self._external_repository_pieces = {
+                repo_name: sync_get_streaming_external_repository_pieces_grpc(
+                    self.client,
+                    ExternalRepositoryOrigin(self.origin, repo_name),
+                    defer_snapshots=True,
+                    previous_pieces=(
+                        previous_location._external_repository_pieces.get(repo_name)  # noqa: SLF001
+                        if previous_location
+                        else None
+                    ),
+                )
+                for repo_name in self.repository_names
+            }
+            self._external_repositories_data = {
+                repo_name: external_repository_data_from_pieces(
+                    hashed_piece.piece for hashed_piece in pieces.values()
+                )
+                for repo_name, pieces in self._external_repository_pieces.items()
+            }
+            if previous_location:
+                job_ref_keys = {
+                    (repo_name, hashed_piece.content_hash)
+                    for repo_name, pieces in self._external_repository_pieces.items()
+                    for hashed_piece in pieces.values()
+                    if isinstance(hashed_piece.piece, ExternalJobRef)
+                }
+                self._external_job_datas = {
+                    key: job_data
+                    for key, job_data in previous_location._external_job_datas.items()  # noqa: SLF001
+                    if key in job_ref_keys
+                }
 
             self.external_repositories = {
                 repo_name: ExternalRepository(
@@ -633,6 +688,7 @@ def __init__(
                         repository_name=repo_name,
                         code_location=self,
                     ),
+                    ref_to_data_fn=partial(self._get_external_job_data_from_ref, repo_name),
                 )
                 for repo_name, repo_data in self._external_repositories_data.items()
             }
@@ -719,12 +775,14 @@ def get_external_execution_plan(
         step_keys_to_execute: Optional[Sequence[str]],
         known_state: Optional[KnownExecutionState],
         instance: Optional[DagsterInstance] = None,
+        tags: Optional[Mapping[str, str]] = None,
     ) -> ExternalExecutionPlan:
         check.inst_param(external_job, "external_job", ExternalJob)
         run_config = check.mapping_param(run_config, "run_config")
         check.opt_nullable_sequence_param(step_keys_to_execute, "step_keys_to_execute", of_type=str)
         check.opt_inst_param(known_state, "known_state", KnownExecutionState)
         check.opt_inst_param(instance, "instance", DagsterInstance)
+        check.opt_mapping_param(tags, "tags", key_type=str, value_type=str)
 
         asset_selection = (
             frozenset(check.opt_set_param(external_job.asset_selection, "asset_selection"))
@@ -742,10 +800,34 @@ def get_external_execution_plan(
             step_keys_to_execute=step_keys_to_execute,
             known_state=known_state,
             instance=instance,
+            tags=tags,
         )
 
         return ExternalExecutionPlan(execution_plan_snapshot=execution_plan_snapshot_or_error)
 
+    def _get_external_job_data_from_ref(
+        self, repository_name: str, external_job_ref: ExternalJobRef
+    ) -> ExternalJobData:
+        hashed_ref = self._external_repository_pieces[repository_name].get(
+            external_repository_data_piece_key(external_job_ref)
+        )
+        cache_key = (
+            (repository_name, hashed_ref.content_hash)
+            if hashed_ref and hashed_ref.content_hash
+            else None
+        )
+        if cache_key and cache_key in self._external_job_datas:
+            return self._external_job_datas[cache_key]
+
+        job_data = sync_get_external_job_grpc(
+            self.client,
+            ExternalRepositoryOrigin(self.origin, repository_name),
+            external_job_ref.name,
+        )
+        if cache_key:
+            self._external_job_datas[cache_key] = job_data
+        return job_data
+
     def get_subset_external_job_result(
         self, selector: JobSubsetSelector
     ) -> "ExternalJobSubsetResult":
@@ -114,14 +114,6 @@ def __init__(
 
         self._handle = check.inst_param(repository_handle, "repository_handle", RepositoryHandle)
 
-        self._asset_jobs: Dict[str, List[ExternalAssetNode]] = {}
-        for asset_node in external_repository_data.external_asset_graph_data:
-            for job_name in asset_node.job_names:
-                if job_name not in self._asset_jobs:
-                    self._asset_jobs[job_name] = [asset_node]
-                else:
-                    self._asset_jobs[job_name].append(asset_node)
-
         # memoize job instances to share instances
         self._memo_lock: RLock = RLock()
         self._cached_jobs: Dict[str, ExternalJob] = {}
@@ -265,6 +257,27 @@ def get_external_origin_id(self) -> str:
         """
         return self.get_external_origin().get_id()
 
+    @property
+    @cached_method
+    def _asset_jobs(self) -> Mapping[str, Sequence[ExternalAssetNode]]:
+        asset_jobs: Dict[str, List[ExternalAssetNode]] = {}
+        for asset_node in self.external_repository_data.external_asset_graph_data:
+            for job_name in asset_node.job_names:
+                if job_name not in asset_jobs:
+                    asset_jobs[job_name] = [asset_node]
+                else:
+                    asset_jobs[job_name].append(asset_node)
+        return asset_jobs
+
+    @property
+    @cached_method
+    def _asset_nodes_by_key(self) -> Mapping[AssetKey, ExternalAssetNode]:
+        asset_nodes_by_key: Dict[AssetKey, ExternalAssetNode] = {}
+        for asset_node in self.external_repository_data.external_asset_graph_data:
+            # if a key appears more than once, the first node wins
+            asset_nodes_by_key.setdefault(asset_node.asset_key, asset_node)
+        return asset_nodes_by_key
+
     def get_external_asset_nodes(
         self, job_name: Optional[str] = None
     ) -> Sequence[ExternalAssetNode]:
@@ -275,12 +288,7 @@ def get_external_asset_nodes(
         )
 
     def get_external_asset_node(self, asset_key: AssetKey) -> Optional[ExternalAssetNode]:
-        matching = [
-            asset_node
-            for asset_node in self.external_repository_data.external_asset_graph_data
-            if asset_node.asset_key == asset_key
-        ]
-        return matching[0] if matching else None
+        return self._asset_nodes_by_key.get(asset_key)
 
     def get_display_metadata(self) -> Mapping[str, str]:
         return self.handle.display_metadata
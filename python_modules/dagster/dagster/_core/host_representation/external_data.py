@@ -11,6 +11,7 @@
     Any,
     Dict,
     Iterable,
+    Iterator,
     List,
     Mapping,
     NamedTuple,
@@ -1204,26 +1205,37 @@ def _get_resource_job_usage(job_defs: Sequence[JobDefinition]) -> ResourceJobUsa
     return resource_job_usage_map
 
 
+ExternalRepositoryDataPiece = Union[
+    ExternalRepositoryData,
+    ExternalJobData,
+    ExternalJobRef,
+    ExternalAssetNode,
+    ExternalScheduleData,
+    ExternalSensorData,
+]
+
+
 def external_repository_data_from_def(
     repository_def: RepositoryDefinition,
     defer_snapshots: bool = False,
 ) -> ExternalRepositoryData:
+    return external_repository_data_from_pieces(
+        external_repository_data_pieces_from_def(repository_def, defer_snapshots=defer_snapshots)
+    )
+
+
+def external_repository_data_pieces_from_def(
+    repository_def: RepositoryDefinition,
+    defer_snapshots: bool = False,
+) -> Iterator[ExternalRepositoryDataPiece]:
+    """Builds the ExternalRepositoryData for a repository one piece at a time, so that it can be
+    serialized and sent without holding all of it at once. The first piece is the repository data
+    without its schedule datas, asset nodes, sensor datas and job datas or refs, which follow it one
+    by one. See external_repository_data_piece_key for how the pieces are identified.
+    """
     check.inst_param(repository_def, "repository_def", RepositoryDefinition)
 
     jobs = repository_def.get_all_jobs()
-    if defer_snapshots:
-        job_datas = None
-        job_refs = sorted(
-            list(map(external_job_ref_from_def, jobs)),
-            key=lambda pd: pd.name,
-        )
-    else:
-        job_datas = sorted(
-            list(map(external_job_data_from_def, jobs)),
-            key=lambda pd: pd.name,
-        )
-        job_refs = None
-
     resource_datas = repository_def.get_top_level_resources()
     asset_graph = external_asset_graph_from_defs(
         jobs,
@@ -1247,12 +1259,9 @@ def external_repository_data_from_def(
 
     resource_job_usage_map: ResourceJobUsageMap = _get_resource_job_usage(jobs)
 
-    return ExternalRepositoryData(
+    yield ExternalRepositoryData(
         name=repository_def.name,
-        external_schedule_datas=sorted(
-            list(map(external_schedule_data_from_def, repository_def.schedule_defs)),
-            key=lambda sd: sd.name,
-        ),
+        external_schedule_datas=[],
         # `PartitionSetDefinition` has been deleted, so we now construct `ExternalPartitonSetData`
         # from jobs instead of going through the intermediary `PartitionSetDefinition`. Eventually
         # we will remove `ExternalPartitionSetData` as well.
@@ -1266,16 +1275,10 @@ def external_repository_data_from_def(
             ),
             key=lambda psd: psd.name,
         ),
-        external_sensor_datas=sorted(
-            [
-                external_sensor_data_from_def(sensor_def, repository_def)
-                for sensor_def in repository_def.sensor_defs
-            ],
-            key=lambda sd: sd.name,
-        ),
-        external_asset_graph_data=asset_graph,
-        external_job_datas=job_datas,
-        external_job_refs=job_refs,
+        external_sensor_datas=[],
+        external_asset_graph_data=[],
+        external_job_datas=None if defer_snapshots else [],
+        external_job_refs=[] if defer_snapshots else None,
         external_resource_data=sorted(
             [
                 external_resource_data_from_def(
@@ -1299,6 +1302,83 @@ def external_repository_data_from_def(
         },
     )
 
+    for schedule_def in sorted(repository_def.schedule_defs, key=lambda sd: sd.name):
+        yield external_schedule_data_from_def(schedule_def)
+
+    yield from asset_graph
+
+    for sensor_def in sorted(repository_def.sensor_defs, key=lambda sd: sd.name):
+        yield external_sensor_data_from_def(sensor_def, repository_def)
+
+    for job_def in sorted(jobs, key=lambda jd: jd.name):
+        if defer_snapshots:
+            yield external_job_ref_from_def(job_def)
+        else:
+            yield external_job_data_from_def(job_def)
+
+
+def external_repository_data_piece_key(piece: ExternalRepositoryDataPiece) -> str:
+    """Identifies a piece of an ExternalRepositoryData, so that the pieces of two snapshots of the
+    same repository can be compared.
+    """
+    if isinstance(piece, ExternalRepositoryData):
+        return "repository"
+    elif isinstance(piece, ExternalScheduleData):
+        return f"schedule:{piece.name}"
+    elif isinstance(piece, ExternalSensorData):
+        return f"sensor:{piece.name}"
+    elif isinstance(piece, ExternalAssetNode):
+        return f"asset:{piece.asset_key.to_string()}"
+    elif isinstance(piece, (ExternalJobData, ExternalJobRef)):
+        return f"job:{piece.name}"
+    else:
+        check.failed(f"Unexpected piece of ExternalRepositoryData: {piece}")
+
+
+def external_repository_data_from_pieces(
+    pieces: Iterable[ExternalRepositoryDataPiece],
+) -> ExternalRepositoryData:
+    """Reassembles the pieces of an ExternalRepositoryData, see
+    external_repository_data_pieces_from_def. Pieces after the first are added to its lists.
+    """
+    pieces = iter(pieces)
+    repository_data = check.inst(next(pieces), ExternalRepositoryData)
+    schedule_datas = list(repository_data.external_schedule_datas)
+    sensor_datas = list(repository_data.external_sensor_datas)
+    asset_nodes = list(repository_data.external_asset_graph_data)
+    job_datas = (
+        None
+        if repository_data.external_job_datas is None
+        else list(repository_data.external_job_datas)
+    )
+    job_refs = (
+        None
+        if repository_data.external_job_refs is None
+        else list(repository_data.external_job_refs)
+    )
+
+    for piece in pieces:
+        if isinstance(piece, ExternalScheduleData):
+            schedule_datas.append(piece)
+        elif isinstance(piece, ExternalSensorData):
+            sensor_datas.append(piece)
+        elif isinstance(piece, ExternalAssetNode):
+            asset_nodes.append(piece)
+        elif isinstance(piece, ExternalJobData) and job_datas is not None:
+            job_datas.append(piece)
+        elif isinstance(piece, ExternalJobRef) and job_refs is not None:
+            job_refs.append(piece)
+        else:
+            check.failed(f"Unexpected piece of ExternalRepositoryData: {piece}")
+
+    return repository_data._replace(
+        external_schedule_datas=schedule_datas,
+        external_sensor_datas=sensor_datas,
+        external_asset_graph_data=asset_nodes,
+        external_job_datas=job_datas,
+        external_job_refs=job_refs,
+    )
+
 
 def external_asset_graph_from_defs(
     job_defs: Sequence[JobDefinition],
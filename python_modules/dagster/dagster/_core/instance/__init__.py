@@ -4,9 +4,11 @@
 import logging.config
 import os
 import sys
+import threading
 import time
 import weakref
 from collections import defaultdict
+from contextlib import contextmanager
 from enum import Enum
 from tempfile import TemporaryDirectory
 from types import TracebackType
@@ -17,6 +19,7 @@
     Callable,
     Dict,
     Generic,
+    Iterator,
     List,
     Mapping,
     Optional,
@@ -129,6 +132,7 @@
         AssetRecord,
         EventLogConnection,
         EventLogRecord,
+        EventLogRecordStream,
         EventRecordsFilter,
     )
     from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
@@ -176,15 +180,115 @@ def _format_field_diff(field_diff: Mapping[str, Tuple[Any, Any]]) -> str:
     )
 
 
+# Log messages and asset observations logged through the log manager do not affect the state of a
+# run, so they are buffered and written to the event log in batches. The buffer is flushed when it
+# reaches EVENT_BUFFER_MAX_SIZE events, at most EVENT_BUFFER_MAX_LATENCY seconds after the first
+# event is buffered, and before any other event is written, so that events are always stored in
+# the order they were logged.
+#
+# While event writes are batched (see DagsterInstance.batch_event_writes), all events are buffered
+# the same way, and the buffer is also flushed after each event that ends a step, so that
+# orchestrators tailing the event log learn of finished steps without waiting for the buffer.
+EVENT_BUFFER_MAX_SIZE = 1000
+EVENT_BUFFER_MAX_LATENCY = 0.5  # seconds
+
+
+def _is_bufferable_event(event: "EventLogEntry") -> bool:
+    from dagster._core.events import DagsterEventType
+
+    return (
+        not event.is_dagster_event
+        or event.get_dagster_event().event_type == DagsterEventType.ASSET_OBSERVATION
+    )
+
+
+def _is_step_boundary_event(event: "EventLogEntry") -> bool:
+    if not event.is_dagster_event:
+        return False
+
+    dagster_event = event.get_dagster_event()
+    return (
+        dagster_event.is_job_event
+        or dagster_event.is_step_success
+        or dagster_event.is_step_failure
+        or dagster_event.is_step_skipped
+        or dagster_event.is_step_up_for_retry
+        or (dagster_event.is_resource_init_failure and dagster_event.step_key is not None)
+    )
+
+
+# Tracks whether a thread holds the lock of an event log handler. Events written directly while
+# it does, such as the engine events that report a failed write, don't flush the other handlers:
+# taking their locks while holding one would deadlock with threads that log through them.
+_event_log_handler_lock_state = threading.local()
+
+
+def _is_holding_event_log_handler_lock() -> bool:
+    return getattr(_event_log_handler_lock_state, "depth", 0) > 0
+
+
+@contextmanager
+def _holding_event_log_handler_lock() -> Iterator[None]:
+    _event_log_handler_lock_state.depth = getattr(_event_log_handler_lock_state, "depth", 0) + 1
+    try:
+        yield
+    finally:
+        _event_log_handler_lock_state.depth -= 1
+
+
+class _BufferedEventLogHandlers:
+    """The event log handlers of an instance that hold buffered events, or an error from writing
+    them on their flush timer thread. Events written directly to the instance flush them first.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._handlers: Set["_EventListenerLogHandler"] = set()
+
+    def update(self, handler: "_EventListenerLogHandler", is_buffered: bool) -> None:
+        with self._lock:
+            if is_buffered:
+                self._handlers.add(handler)
+            else:
+                self._handlers.discard(handler)
+
+    def _get_handlers(self) -> Sequence["_EventListenerLogHandler"]:
+        with self._lock:
+            return list(self._handlers)
+
+    def flush(self) -> None:
+        for handler in self._get_handlers():
+            handler.flush()
+
+    def raise_flush_timer_errors(self) -> None:
+        for handler in self._get_handlers():
+            handler.raise_flush_timer_error()
+
+
 class _EventListenerLogHandler(logging.Handler):
-    def __init__(self, instance: "DagsterInstance"):
+    def __init__(self, instance: "DagsterInstance", buffered_handlers: _BufferedEventLogHandlers):
         self._instance = instance
+        self._buffered_handlers = buffered_handlers
+        self._buffer: List["EventLogEntry"] = []
+        self._flush_timer: Optional[threading.Timer] = None
+        self._flush_timer_error: Optional[Exception] = None
         super(_EventListenerLogHandler, self).__init__()
 
+    def _update_buffered_handlers(self) -> None:
+        self._buffered_handlers.update(
+            self, bool(self._buffer) or self._flush_timer_error is not None
+        )
+
     def emit(self, record: DagsterLogRecord) -> None:
-        from dagster._core.events import EngineEventData
+        # logging.Handler.handle holds the handler's lock while calling emit
+        with _holding_event_log_handler_lock():
+            self._emit(record)
+
+    def _emit(self, record: DagsterLogRecord) -> None:
         from dagster._core.events.log import StructuredLoggerMessage, construct_event_record
 
+        self.raise_flush_timer_error()
+
         event = construct_event_record(
             StructuredLoggerMessage(
                 name=record.name,
@@ -195,24 +299,95 @@ def emit(self, record: DagsterLogRecord) -> None:
             )
         )
 
+        batching = self._instance.is_batching_event_writes
+        if batching or _is_bufferable_event(event):
+            self._buffer.append(event)
+            if len(self._buffer) == 1:
+                self._update_buffered_handlers()
+            if len(self._buffer) >= EVENT_BUFFER_MAX_SIZE or (
+                batching and _is_step_boundary_event(event)
+            ):
+                self._flush_buffer()
+            elif not self._flush_timer:
+                self._flush_timer = threading.Timer(
+                    EVENT_BUFFER_MAX_LATENCY, self._flush_from_timer
+                )
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+            return
+
+        self._flush_buffer()
         try:
             self._instance.handle_new_event(event)
         except Exception as e:
-            sys.stderr.write(f"Exception while writing logger call to event log: {str(e)}\n")
-            if event.dagster_event:
-                # Swallow user-generated log failures so that the entire step/run doesn't fail, but
-                # raise failures writing system-generated log events since they are the source of
-                # truth for the state of the run
-                raise
-            elif event.run_id:
+            self._handle_write_error([event], e)
+
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            with _holding_event_log_handler_lock():
+                self._flush_buffer()
+        finally:
+            self.release()
+
+    def _flush_from_timer(self) -> None:
+        self.acquire()
+        try:
+            with _holding_event_log_handler_lock():
+                self._flush_buffer()
+        except Exception as e:
+            # an exception raised on the timer thread would go unnoticed, so it is raised on the
+            # thread that logs the next event or stops batching event writes instead
+            self._flush_timer_error = e
+            self._update_buffered_handlers()
+        finally:
+            self.release()
+
+    def raise_flush_timer_error(self) -> None:
+        """Raise the exception that writing buffered events raised on the flush timer thread, if
+        any.
+        """
+        error = self._flush_timer_error
+        if error:
+            self._flush_timer_error = None
+            self._update_buffered_handlers()
+            raise error
+
+    def _flush_buffer(self) -> None:
+        if self._flush_timer:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+        if not self._buffer:
+            return
+
+        events = self._buffer
+        self._buffer = []
+        self._update_buffered_handlers()
+        try:
+            self._instance.handle_new_events(events)
+        except Exception as e:
+            self._handle_write_error(events, e)
+
+    def _handle_write_error(self, events: Sequence["EventLogEntry"], error: Exception) -> None:
+        from dagster._core.events import EngineEventData
+
+        sys.stderr.write(f"Exception while writing logger call to event log: {str(error)}\n")
+        if any(event.dagster_event for event in events):
+            # Swallow user-generated log failures so that the entire step/run doesn't fail, but
+            # raise failures writing system-generated log events since they are the source of
+            # truth for the state of the run
+            raise error
+
+        error_info = serializable_error_info_from_exc_info(sys.exc_info())
+        for event in events:
+            if event.run_id:
                 self._instance.report_engine_event(
                     "Exception while writing logger call to event log",
                     job_name=event.job_name,
                     run_id=event.run_id,
                     step_key=event.step_key,
-                    engine_event_data=EngineEventData(
-                        error=serializable_error_info_from_exc_info(sys.exc_info()),
-                    ),
+                    engine_event_data=EngineEventData(error=error_info),
                 )
 
 
@@ -406,6 +581,9 @@ def __init__(
         self._ref = check.opt_inst_param(ref, "ref", InstanceRef)
 
         self._subscribers: Dict[str, List[Callable]] = defaultdict(list)
+        # flushed on dispose, so that no buffered events are written after storage is disposed
+        self._buffered_event_log_handlers = _BufferedEventLogHandlers()
+        self._is_batching_event_writes = False
 
         run_monitoring_enabled = self.run_monitoring_settings.get("enabled", False)
         self._run_monitoring_enabled = run_monitoring_enabled
@@ -858,6 +1036,8 @@ def reindex(self, print_fn: PrintFn = lambda _: None) -> None:
         print_fn("Done.")
 
     def dispose(self) -> None:
+        self._buffered_event_log_handlers.flush()
+
         self._local_artifact_storage.dispose()
         self._run_storage.dispose()
         self.run_coordinator.dispose()
@@ -1434,6 +1614,7 @@ def create_reexecuted_run(
             step_keys_to_execute=step_keys_to_execute,
             known_state=known_state,
             instance=self,
+            tags=tags,
         )
 
         return self.create_run(
@@ -1560,6 +1741,18 @@ def get_runs(
     def get_runs_count(self, filters: Optional[RunsFilter] = None) -> int:
         return self._run_storage.get_runs_count(filters)
 
+    @traced
+    def get_run_tag_counts(
+        self, tag_keys: Sequence[str], filters: Optional[RunsFilter] = None
+    ) -> Mapping[Tuple[str, str], int]:
+        return self._run_storage.get_run_tag_counts(tag_keys, filters)
+
+    @traced
+    def get_queued_runs(
+        self, cursor: Optional[str] = None, limit: Optional[int] = None
+    ) -> Sequence[DagsterRun]:
+        return self._run_storage.get_queued_runs(cursor=cursor, limit=limit)
+
     @traced
     def get_run_groups(
         self,
@@ -1649,6 +1842,17 @@ def get_records_for_run(
     ) -> "EventLogConnection":
         return self._event_storage.get_records_for_run(run_id, cursor, of_type, limit)
 
+    def iter_records_for_run(
+        self,
+        run_id: str,
+        cursor: Optional[str] = None,
+        of_type: Optional[Union["DagsterEventType", Set["DagsterEventType"]]] = None,
+        page_size: Optional[int] = None,
+    ) -> "EventLogRecordStream":
+        if page_size is None:
+            return self._event_storage.iter_records_for_run(run_id, cursor, of_type)
+        return self._event_storage.iter_records_for_run(run_id, cursor, of_type, page_size)
+
     def watch_event_logs(self, run_id: str, cursor: Optional[str], cb: "EventHandlerFn") -> None:
         return self._event_storage.watch(run_id, cursor, cb)
 
@@ -1821,8 +2025,13 @@ def _get_yaml_python_handlers(self) -> Sequence[logging.Handler]:
         if self._settings:
             logging_config = self.get_settings("python_logs").get("dagster_handler_config", {})
 
-            if logging_config:
-                experimental_functionality_warning("Handling yaml-defined logging configuration")
+            # dictConfig flushes and closes every existing handler while holding the logging
+            # module's lock, which deadlocks with threads that are logging through those handlers,
+            # so it is only called for instances that configure handlers
+            if not logging_config:
+                return []
+
+            experimental_functionality_warning("Handling yaml-defined logging configuration")
 
             # Handlers can only be retrieved from dictConfig configuration if they are attached
             # to a logger. We add a dummy logger to the configuration that allows us to access user
@@ -1845,10 +2054,34 @@ def _get_yaml_python_handlers(self) -> Sequence[logging.Handler]:
         return []
 
     def _get_event_log_handler(self) -> _EventListenerLogHandler:
-        event_log_handler = _EventListenerLogHandler(self)
+        event_log_handler = _EventListenerLogHandler(self, self._buffered_event_log_handlers)
         event_log_handler.setLevel(10)
         return event_log_handler
 
+    @property
+    def is_batching_event_writes(self) -> bool:
+        return self._is_batching_event_writes
+
+    @contextmanager
+    def batch_event_writes(self) -> Iterator[None]:
+        """Buffers every event logged through this instance and writes them to the event log
+        storage in batches, rather than one write per event. Buffers are flushed when they are
+        full, at most EVENT_BUFFER_MAX_LATENCY seconds after their first event, after each event
+        that ends a step, and when exiting this context. A write that fails after the latency
+        elapses is raised by the next logged event, or when exiting this context.
+
+        Used by step workers, which otherwise write each event of a step in its own transaction.
+        """
+        check.invariant(not self._is_batching_event_writes, "Already batching event writes")
+        self._is_batching_event_writes = True
+        try:
+            yield
+        finally:
+            self._buffered_event_log_handlers.flush()
+            self._is_batching_event_writes = False
+
+        self._buffered_event_log_handlers.raise_flush_timer_errors()
+
     def get_handlers(self) -> Sequence[logging.Handler]:
         handlers: List[logging.Handler] = [self._get_event_log_handler()]
         handlers.extend(self._get_yaml_python_handlers())
@@ -1860,6 +2093,11 @@ def store_event(self, event: EventLogEntry) -> None:
     def handle_new_event(self, event: EventLogEntry) -> None:
         run_id = event.run_id
 
+        # write any buffered events first, so that events are stored in the order they occurred.
+        # Handlers flush their own buffer before writing an event directly.
+        if not _is_holding_event_log_handler_lock():
+            self._buffered_event_log_handlers.flush()
+
         self._event_storage.store_event(event)
 
         if event.is_dagster_event and event.get_dagster_event().is_job_event:
@@ -1868,6 +2106,22 @@ def handle_new_event(self, event: EventLogEntry) -> None:
         for sub in self._subscribers[run_id]:
             sub(event)
 
+    def handle_new_events(self, events: Sequence[EventLogEntry]) -> None:
+        """Store a batch of events with a single write to the event log storage, then dispatch
+        them in order, as `handle_new_event` would.
+        """
+        if not events:
+            return
+
+        self._event_storage.store_events(events)
+
+        for event in events:
+            if event.is_dagster_event and event.get_dagster_event().is_job_event:
+                self._run_storage.handle_run_event(event.run_id, event.get_dagster_event())
+
+            for sub in self._subscribers[event.run_id]:
+                sub(event)
+
     def add_event_listener(self, run_id: str, cb) -> None:
         self._subscribers[run_id].append(cb)
 
@@ -2301,6 +2555,14 @@ def get_instigator_state(self, origin_id: str, selector_id: str) -> Optional["In
             check.failed("Schedule storage not available")
         return self._schedule_storage.get_instigator_state(origin_id, selector_id)
 
+    @traced
+    def get_batch_instigator_states(
+        self, selector_ids: Sequence[str]
+    ) -> Mapping[str, "InstigatorState"]:
+        if not self._schedule_storage:
+            check.failed("Schedule storage not available")
+        return self._schedule_storage.get_batch_instigator_states(selector_ids)
+
     def add_instigator_state(self, state: "InstigatorState") -> "InstigatorState":
         if not self._schedule_storage:
             check.failed("Schedule storage not available")
@@ -1,11 +1,13 @@
 import json
+import logging
 import os
 import threading
 import time
 from abc import abstractmethod
 from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import contextmanager
-from typing import IO, Iterator, Optional, Sequence, Union
+from typing import IO, Any, Iterator, List, Optional, Sequence, Union
 
 from typing_extensions import TypeAlias
 
@@ -32,6 +34,15 @@
 
 SUBSCRIPTION_POLLING_INTERVAL = 5
 
+# While logs are captured, managers that support chunked uploads upload each complete chunk of the
+# captured files in the background, so that only the tail of each file is left to upload when the
+# capture completes. Chunks are read from the local files as they are uploaded, and at most
+# DEFAULT_MAX_PENDING_UPLOAD_CHUNKS chunks are read but not yet uploaded at a time, which bounds the
+# memory used by uploads.
+DEFAULT_UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024  # 8 MiB, above the minimum part size of S3
+DEFAULT_MAX_PENDING_UPLOAD_CHUNKS = 4
+CHUNKED_UPLOAD_POLLING_INTERVAL = 0.5  # seconds
+
 LogSubscription: TypeAlias = Union[CapturedLogSubscription, ComputeLogSubscription]
 
 
@@ -81,9 +92,53 @@ def download_from_cloud_storage(
     ) -> None:
         """Downloads the logs for a given log key from cloud storage to local storage."""
 
+    @property
+    def supports_chunked_upload(self) -> bool:
+        """Whether logs can be uploaded in chunks while they are captured, using
+        `start_chunked_upload`, `upload_chunk` and `complete_chunked_upload`.
+        """
+        return False
+
+    @property
+    def upload_chunk_size(self) -> int:
+        """Returns the size in bytes of the chunks uploaded while logs are captured."""
+        return DEFAULT_UPLOAD_CHUNK_SIZE
+
+    @property
+    def max_pending_upload_chunks(self) -> int:
+        """Returns the maximum number of chunks that are uploaded concurrently."""
+        return DEFAULT_MAX_PENDING_UPLOAD_CHUNKS
+
+    def start_chunked_upload(self, log_key: Sequence[str], io_type: ComputeIOType) -> Any:
+        """Starts uploading the logs for a given log key in chunks, and returns a handle for the
+        upload (e.g. the id of an S3 multipart upload).
+        """
+        raise NotImplementedError()
+
+    def upload_chunk(self, upload: Any, chunk_number: int, data: bytes) -> Any:
+        """Uploads a chunk of logs, numbered from 1. Chunks of the same upload may be uploaded
+        concurrently, from different threads. Returns a value identifying the uploaded chunk.
+        """
+        raise NotImplementedError()
+
+    def complete_chunked_upload(self, upload: Any, chunks: Sequence[Any]) -> None:
+        """Completes an upload, given the values returned by `upload_chunk` for each chunk in
+        order, so that the uploaded logs are stored in cloud storage.
+        """
+        raise NotImplementedError()
+
+    def abort_chunked_upload(self, upload: Any) -> None:
+        """Discards the chunks of an upload that will not be completed."""
+
     @contextmanager
     def capture_logs(self, log_key: Sequence[str]) -> Iterator[CapturedLogContext]:
         with self._poll_for_local_upload(log_key):
+            if self.supports_chunked_upload:
+                with self._upload_chunks_during_capture(log_key):
+                    with self.local_manager.capture_logs(log_key) as context:
+                        yield context
+                return
+
             with self.local_manager.capture_logs(log_key) as context:
                 yield context
         self._on_capture_complete(log_key)
@@ -201,6 +256,40 @@ def _poll_for_local_upload(self, log_key: Sequence[str]) -> Iterator[None]:
         yield
         thread_exit.set()
 
+    @contextmanager
+    def _upload_chunks_during_capture(self, log_key: Sequence[str]) -> Iterator[None]:
+        with ThreadPoolExecutor(
+            max_workers=self.max_pending_upload_chunks, thread_name_prefix="compute-log-upload"
+        ) as executor:
+            pending_chunks = threading.BoundedSemaphore(self.max_pending_upload_chunks)
+            uploads = [
+                _ChunkedLogUpload(self, log_key, io_type, executor, pending_chunks)
+                for io_type in [ComputeIOType.STDOUT, ComputeIOType.STDERR]
+            ]
+
+            thread_exit = threading.Event()
+            thread = threading.Thread(
+                target=_upload_available_chunks,
+                args=(uploads, thread_exit),
+                name="compute-log-chunked-upload",
+            )
+            thread.daemon = True
+            thread.start()
+            try:
+                yield
+            except BaseException:
+                thread_exit.set()
+                thread.join()
+                for upload in uploads:
+                    upload.abort()
+                raise
+
+            thread_exit.set()
+            thread.join()
+            # only the tail of each log remains to be uploaded
+            for upload in uploads:
+                upload.finish()
+
     ###############################################
     #
     # Methods for the ComputeLogManager interface
@@ -410,3 +499,108 @@ def _upload_partial_logs(
         if thread_exit.is_set() or compute_log_manager.is_capture_complete(log_key):
             return
         compute_log_manager.on_progress(log_key)
+
+
+class _ChunkedLogUpload:
+    """Uploads a captured log file in chunks while it is written. The upload is only started once
+    the file holds a complete chunk, so logs smaller than a chunk are uploaded whole when the
+    capture completes, as they would be without chunked uploads.
+    """
+
+    def __init__(
+        self,
+        manager: CloudStorageComputeLogManager,
+        log_key: Sequence[str],
+        io_type: ComputeIOType,
+        executor: ThreadPoolExecutor,
+        pending_chunks: threading.BoundedSemaphore,
+    ):
+        self._manager = manager
+        self._log_key = log_key
+        self._io_type = io_type
+        self._executor = executor
+        self._pending_chunks = pending_chunks
+        self._path = manager.local_manager.get_captured_local_path(
+            log_key, IO_TYPE_EXTENSION[io_type]
+        )
+        self._chunk_size = manager.upload_chunk_size
+        self._upload: Any = None
+        self._offset = 0
+        self._chunks: List[Future] = []
+        self._failed = False
+
+    def upload_available_chunks(self, include_tail: bool = False) -> None:
+        if self._failed or not os.path.exists(self._path):
+            return
+
+        try:
+            size = os.path.getsize(self._path)
+            with open(self._path, "rb") as f:
+                while size - self._offset >= self._chunk_size or (
+                    include_tail and size > self._offset
+                ):
+                    if self._upload is None:
+                        self._upload = self._manager.start_chunked_upload(
+                            self._log_key, self._io_type
+                        )
+
+                    # wait for an upload slot before reading the chunk, to bound memory usage
+                    self._pending_chunks.acquire()
+                    try:
+                        f.seek(self._offset)
+                        data = f.read(min(self._chunk_size, size - self._offset))
+                        chunk = self._executor.submit(
+                            self._manager.upload_chunk, self._upload, len(self._chunks) + 1, data
+                        )
+                    except BaseException:
+                        self._pending_chunks.release()
+                        raise
+                    chunk.add_done_callback(lambda _: self._pending_chunks.release())
+                    self._chunks.append(chunk)
+                    self._offset += len(data)
+        except Exception:
+            self._on_error()
+
+    def finish(self) -> None:
+        self.upload_available_chunks()
+        if self._upload is not None:
+            self.upload_available_chunks(include_tail=True)
+
+        if self._upload is not None and not self._failed:
+            try:
+                chunks = [chunk.result() for chunk in self._chunks]
+                self._manager.complete_chunked_upload(self._upload, chunks)
+                return
+            except Exception:
+                self._on_error()
+
+        # logs smaller than a chunk, or whose chunked upload failed, are uploaded whole
+        self.abort()
+        self._manager.upload_to_cloud_storage(self._log_key, self._io_type)
+
+    def _on_error(self) -> None:
+        logging.getLogger("dagster").warning(
+            (
+                f"Error uploading the compute logs in {self._path} in chunks, uploading them whole"
+                " once the capture completes instead."
+            ),
+            exc_info=True,
+        )
+        self._failed = True
+
+    def abort(self) -> None:
+        if self._upload is None:
+            return
+
+        for chunk in self._chunks:
+            chunk.exception()  # wait for the chunk without raising its error
+        self._manager.abort_chunked_upload(self._upload)
+        self._upload = None
+
+
+def _upload_available_chunks(
+    uploads: Sequence[_ChunkedLogUpload], thread_exit: threading.Event
+) -> None:
+    while not thread_exit.wait(CHUNKED_UPLOAD_POLLING_INTERVAL):
+        for upload in uploads:
+            upload.upload_available_chunks()
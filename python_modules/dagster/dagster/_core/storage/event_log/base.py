@@ -3,6 +3,7 @@
 from enum import Enum
 from typing import (
     TYPE_CHECKING,
+    Iterator,
     Mapping,
     NamedTuple,
     Optional,
@@ -32,6 +33,9 @@
 if TYPE_CHECKING:
     from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
 
+# number of event log records fetched from storage at a time when streaming the records of a run
+DEFAULT_RECORD_STREAM_PAGE_SIZE = 1000
+
 
 class EventLogConnection(NamedTuple):
     records: Sequence[EventLogRecord]
@@ -85,6 +89,48 @@ def from_storage_id(storage_id: int) -> "EventLogCursor":
         return EventLogCursor(EventLogCursorType.STORAGE_ID, storage_id)
 
 
+class EventLogRecordStream:
+    """Lazily evaluated iterator over the event log records of a run, as returned by
+    :py:meth:`EventLogStorage.iter_records_for_run`.
+
+    Records are fetched from storage in pages and deserialized one at a time as the stream is
+    consumed, so that iterating over a run with a very large number of events uses a bounded amount
+    of memory. `cursor` tracks the position of the last record yielded, and can be passed to
+    `get_records_for_run` or `iter_records_for_run` to resume from that point.
+
+    Streams that hold a storage connection open release it when they are exhausted or closed, so
+    streams that may be abandoned partway should be used as a context manager.
+    """
+
+    def __init__(self, records: Iterator[EventLogRecord], cursor: Optional[str] = None):
+        self._records = records
+        self._cursor = check.opt_str_param(cursor, "cursor")
+
+    def __iter__(self) -> "EventLogRecordStream":
+        return self
+
+    def __next__(self) -> EventLogRecord:
+        record = next(self._records)
+        self._cursor = EventLogCursor.from_storage_id(record.storage_id).to_string()
+        return record
+
+    def __enter__(self) -> "EventLogRecordStream":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    @property
+    def cursor(self) -> str:
+        # rely on the fact that all storage ids will be positive integers
+        return self._cursor or EventLogCursor.from_storage_id(-1).to_string()
+
+    def close(self) -> None:
+        close = getattr(self._records, "close", None)
+        if close:
+            close()
+
+
 class AssetEntry(
     NamedTuple(
         "_AssetEntry",
@@ -187,6 +233,44 @@ def get_records_for_run(
             limit (Optional[int]): Max number of records to return.
         """
 
+    def iter_records_for_run(
+        self,
+        run_id: str,
+        cursor: Optional[str] = None,
+        of_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]] = None,
+        page_size: int = DEFAULT_RECORD_STREAM_PAGE_SIZE,
+    ) -> EventLogRecordStream:
+        """Stream the event log records corresponding to a run, fetching them in pages of
+        `page_size` records.
+
+        Args:
+            run_id (str): The id of the run for which to fetch logs.
+            cursor (Optional[str]): Cursor value to resume a previous query from.
+            of_type (Optional[DagsterEventType]): the dagster event type to filter the logs.
+            page_size (int): The number of records to fetch from storage at a time.
+        """
+        check.int_param(page_size, "page_size")
+        check.invariant(page_size > 0, "page_size must be positive")
+        return EventLogRecordStream(
+            self._iter_record_pages_for_run(run_id, cursor, of_type, page_size), cursor
+        )
+
+    def _iter_record_pages_for_run(
+        self,
+        run_id: str,
+        cursor: Optional[str],
+        of_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]],
+        page_size: int,
+    ) -> Iterator[EventLogRecord]:
+        # fetch each page with a separate bounded query, resuming from the storage id of the last
+        # record of the previous page
+        while True:
+            connection = self.get_records_for_run(run_id, cursor, of_type, limit=page_size)
+            yield from connection.records
+            if not connection.has_more:
+                return
+            cursor = connection.cursor
+
     def get_stats_for_run(self, run_id: str) -> DagsterRunStatsSnapshot:
         """Get a summary of events that have ocurred in a run."""
         return build_run_stats_from_events(run_id, self.get_logs_for_run(run_id))
@@ -213,6 +297,16 @@ def store_event(self, event: "EventLogEntry") -> None:
             event (EventLogEntry): The event to store.
         """
 
+    def store_events(self, events: Sequence["EventLogEntry"]) -> None:
+        """Store a batch of events, in order. Storages that can write a batch of events in fewer
+        round trips than one per event should override this method.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        for event in events:
+            self.store_event(event)
+
     @abstractmethod
     def delete_events(self, run_id: str) -> None:
         """Remove events for a given run id."""
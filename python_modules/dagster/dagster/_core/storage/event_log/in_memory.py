@@ -2,11 +2,13 @@
 import uuid
 from collections import defaultdict
 from contextlib import contextmanager
-from typing import Callable, Optional
+from typing import Callable, Iterator, Optional, Set, Union
 
 from sqlalchemy.pool import NullPool
 
-from dagster._core.storage.event_log.base import EventLogCursor
+from dagster._core.event_api import EventLogRecord
+from dagster._core.events import DagsterEventType
+from dagster._core.storage.event_log.base import EventLogCursor, EventLogStorage
 from dagster._core.storage.sql import create_engine, get_alembic_config, stamp_alembic_rev
 from dagster._core.storage.sqlite import create_in_memory_conn_string
 from dagster._serdes import ConfigurableClass
@@ -89,6 +91,24 @@ def store_event(self, event):
             except Exception:
                 logging.exception("Exception in callback for event watch on run %s.", event.run_id)
 
+    def store_events(self, events):
+        # store events one at a time so that each is dispatched to watchers with its own cursor
+        for event in events:
+            self.store_event(event)
+
+    def _iter_record_pages_for_run(
+        self,
+        run_id: str,
+        cursor: Optional[str],
+        of_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]],
+        page_size: int,
+    ) -> Iterator[EventLogRecord]:
+        # a read left open on the shared-cache in-memory database would lock out writes from other
+        # connections, so fetch each page with a separate query
+        return EventLogStorage._iter_record_pages_for_run(  # noqa: SLF001
+            self, run_id, cursor, of_type, page_size
+        )
+
     def watch(self, run_id: str, cursor: str, callback: Callable):
         self._handlers[run_id].add(callback)
 
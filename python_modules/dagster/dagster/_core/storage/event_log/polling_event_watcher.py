@@ -1,49 +1,103 @@
+import logging
 import threading
-from typing import Callable, List, MutableMapping, NamedTuple, Optional
+from typing import Callable, Dict, List, Optional, Sequence, Set
 
 import dagster._check as check
 from dagster._core.events.log import EventLogEntry
+from dagster._core.storage.dagster_run import DagsterRunStatus
 from dagster._core.storage.event_log.base import EventLogCursor, EventLogStorage
 
 POLLING_CADENCE = 0.1  # 100 ms
 
+# when new events are announced via notify(), fall back to polling at this cadence so that a
+# dropped notification only delays delivery instead of losing it
+NOTIFICATION_FALLBACK_CADENCE = 5  # seconds
 
-class CallbackAfterCursor(NamedTuple):
-    """Callback passed from Observer class in event polling.
+# upper bound on the number of events fetched by the shared cursor query on each tick
+BATCH_LIMIT = 1000
 
-    cursor (str): Only process EventLogEntrys after the given cursor
-    callback (Callable[[EventLogEntry], None]): callback passed from Observer
-        to call on new EventLogEntrys, with a string cursor
+TERMINAL_RUN_STATUSES = {
+    DagsterRunStatus.SUCCESS,
+    DagsterRunStatus.FAILURE,
+    DagsterRunStatus.CANCELED,
+}
+
+
+class _WatchedCallback:
+    """A registered callback along with the storage id of the last event delivered to it.
+
+    A callback is caught up once the events of its run since its cursor have been delivered to it
+    by `_poll_run`. Until then, the shared cursor query must not deliver events to it, since that
+    would advance its storage id past the events it has not received yet.
     """
 
-    cursor: Optional[str]
-    callback: Callable[[EventLogEntry, str], None]
+    def __init__(self, cursor: Optional[str], callback: Callable[[EventLogEntry, str], None]):
+        self.callback = callback
+        self.storage_id = EventLogCursor.parse(cursor).storage_id() if cursor else -1
+        self.finished = False
+        self.caught_up = False
+
+    def deliver(self, storage_id: int, event: EventLogEntry) -> Optional[DagsterRunStatus]:
+        """Fire the callback if the event is after its cursor, returning what the callback
+        returned.
+        """
+        if self.finished or storage_id <= self.storage_id:
+            return None
+
+        self.storage_id = storage_id
+        try:
+            return self.callback(event, str(EventLogCursor.from_storage_id(storage_id)))
+        except Exception:
+            logging.exception("Exception in callback for event watch on run %s.", event.run_id)
+            return None
 
 
 class SqlPollingEventWatcher:
-    """Event Log Watcher that uses a multithreaded polling approach to retrieving new events for run_ids
-    This class' job is to manage a collection of threads that each poll the event log for a given run_id
-    Uses one thread (SqlPollingRunIdEventWatcherThread) per watched run_id.
+    """Event Log Watcher that multiplexes every watched run_id onto a single polling thread.
+
+    On each tick, the thread issues one query for all watched runs, using
+    `get_logs_for_all_runs_by_log_id` with a storage id cursor shared across runs, and fans the
+    results out to the registered callbacks. Runs whose callbacks start behind the shared cursor
+    are caught up with a single `get_records_for_run` query when they are first watched. Storages
+    that are sharded by run (and so do not support cross-run queries) fall back to one
+    `get_records_for_run` query per watched run on each tick, still from the single thread.
+
+    If `use_notifications` is set, the thread only polls when woken by `notify` (e.g. from a
+    Postgres LISTEN/NOTIFY channel or a filesystem watch), falling back to polling every
+    NOTIFICATION_FALLBACK_CADENCE seconds, so that idle runs do not cost any queries.
+
+    If `unwatch_on_terminal_status` is set, a callback that returns a terminal run status is no
+    longer called, and a run is no longer polled once none of its callbacks remain.
 
     LOCKING INFO:
-        ORDER: _dict_lock -> run_id_thread.callback_fn_list_lock
-        INVARIANTS: _dict_lock protects _run_id_to_watcher_dict
+        INVARIANTS: _lock protects _callbacks_by_run_id, _pending_run_ids, and _thread
     """
 
-    def __init__(self, event_log_storage: EventLogStorage):
+    def __init__(
+        self,
+        event_log_storage: EventLogStorage,
+        use_notifications: bool = False,
+        unwatch_on_terminal_status: bool = False,
+    ):
         self._event_log_storage = check.inst_param(
             event_log_storage, "event_log_storage", EventLogStorage
         )
+        self._use_notifications = check.bool_param(use_notifications, "use_notifications")
+        self._unwatch_on_terminal_status = check.bool_param(
+            unwatch_on_terminal_status, "unwatch_on_terminal_status"
+        )
 
-        # INVARIANT: dict_lock protects _run_id_to_watcher_dict
-        self._dict_lock: threading.Lock = threading.Lock()
-        self._run_id_to_watcher_dict: MutableMapping[str, SqlPollingRunIdEventWatcherThread] = {}
+        # INVARIANT: _lock protects _callbacks_by_run_id, _pending_run_ids, and _thread
+        self._lock: threading.Lock = threading.Lock()
+        self._callbacks_by_run_id: Dict[str, List[_WatchedCallback]] = {}
+        self._pending_run_ids: Set[str] = set()
+        self._thread: Optional[SqlPollingEventWatcherThread] = None
         self._disposed = False
 
     def has_run_id(self, run_id: str) -> bool:
         run_id = check.str_param(run_id, "run_id")
-        with self._dict_lock:
-            _has_run_id = run_id in self._run_id_to_watcher_dict
+        with self._lock:
+            _has_run_id = run_id in self._callbacks_by_run_id
         return _has_run_id
 
     def watch_run(
@@ -52,23 +106,135 @@ def watch_run(
         run_id = check.str_param(run_id, "run_id")
         cursor = check.opt_str_param(cursor, "cursor")
         callback = check.callable_param(callback, "callback")
-        with self._dict_lock:
-            if run_id not in self._run_id_to_watcher_dict:
-                self._run_id_to_watcher_dict[run_id] = SqlPollingRunIdEventWatcherThread(
-                    self._event_log_storage, run_id
-                )
-                self._run_id_to_watcher_dict[run_id].daemon = True
-                self._run_id_to_watcher_dict[run_id].start()
-            self._run_id_to_watcher_dict[run_id].add_callback(cursor, callback)
+        with self._lock:
+            self._callbacks_by_run_id.setdefault(run_id, []).append(
+                _WatchedCallback(cursor, callback)
+            )
+            self._pending_run_ids.add(run_id)
+            if self._thread is None:
+                self._thread = SqlPollingEventWatcherThread(self)
+                self._thread.daemon = True
+                self._thread.start()
+            thread = self._thread
+        thread.wake()
 
     def unwatch_run(self, run_id: str, handler: Callable[[EventLogEntry, str], None]):
         run_id = check.str_param(run_id, "run_id")
         handler = check.callable_param(handler, "handler")
-        with self._dict_lock:
-            if run_id in self._run_id_to_watcher_dict:
-                self._run_id_to_watcher_dict[run_id].remove_callback(handler)
-                if self._run_id_to_watcher_dict[run_id].should_thread_exit.is_set():
-                    del self._run_id_to_watcher_dict[run_id]
+        with self._lock:
+            if run_id not in self._callbacks_by_run_id:
+                return
+            callbacks = [
+                watched
+                for watched in self._callbacks_by_run_id[run_id]
+                if watched.callback != handler
+            ]
+            if callbacks:
+                self._callbacks_by_run_id[run_id] = callbacks
+            else:
+                del self._callbacks_by_run_id[run_id]
+                self._pending_run_ids.discard(run_id)
+
+    def notify(self, run_id: Optional[str] = None) -> None:
+        """Signal that new events may be available, waking the polling thread.
+
+        Args:
+            run_id (Optional[str]): The run that received new events. If set, the polling thread
+                is only woken if the run is being watched.
+        """
+        with self._lock:
+            thread = self._thread
+            if run_id is not None and run_id not in self._callbacks_by_run_id:
+                return
+        if thread:
+            thread.wake()
+
+    @property
+    def use_notifications(self) -> bool:
+        return self._use_notifications
+
+    @property
+    def watched_run_ids(self) -> Sequence[str]:
+        with self._lock:
+            return list(self._callbacks_by_run_id.keys())
+
+    def _callbacks_for_run(self, run_id: str) -> Sequence[_WatchedCallback]:
+        with self._lock:
+            return list(self._callbacks_by_run_id.get(run_id, []))
+
+    def _deliver(self, watched: _WatchedCallback, storage_id: int, event: EventLogEntry) -> None:
+        status = watched.deliver(storage_id, event)
+        if self._unwatch_on_terminal_status and status in TERMINAL_RUN_STATUSES:
+            watched.finished = True
+            self.unwatch_run(event.run_id, watched.callback)
+
+    def _pop_pending_run_ids(self) -> Sequence[str]:
+        with self._lock:
+            pending = list(self._pending_run_ids)
+            self._pending_run_ids.clear()
+        return pending
+
+    def _poll_run(self, run_id: str) -> None:
+        callbacks = self._callbacks_for_run(run_id)
+        if not callbacks:
+            return
+
+        min_storage_id = min(watched.storage_id for watched in callbacks)
+        conn = self._event_log_storage.get_records_for_run(
+            run_id,
+            cursor=(
+                str(EventLogCursor.from_storage_id(min_storage_id)) if min_storage_id >= 0 else None
+            ),
+        )
+        for record in conn.records:
+            for watched in callbacks:
+                self._deliver(watched, record.storage_id, record.event_log_entry)
+        for watched in callbacks:
+            watched.caught_up = True
+
+    def poll(self, after_storage_id: Optional[int]) -> Optional[int]:
+        """Fetch new events for all watched runs and fire the matching callbacks.
+
+        Args:
+            after_storage_id (Optional[int]): The shared storage id cursor returned by the previous
+                call, or None on the first call.
+
+        Returns:
+            Optional[int]: The shared storage id cursor to pass to the next call. Always None for
+                storages that do not support cross-run queries.
+        """
+        pending_run_ids = self._pop_pending_run_ids()
+        watched_run_ids = self.watched_run_ids
+        if not watched_run_ids:
+            # nothing to watch; the cursor is re-initialized when the next run is watched
+            return None
+
+        if not self._event_log_storage.supports_event_consumer_queries():
+            for run_id in watched_run_ids:
+                self._poll_run(run_id)
+            return None
+
+        if after_storage_id is None:
+            after_storage_id = self._event_log_storage.get_maximum_record_id() or -1
+
+        # catch up newly watched runs to the shared cursor, one query per run
+        for run_id in pending_run_ids:
+            self._poll_run(run_id)
+
+        while True:
+            events_by_id = self._event_log_storage.get_logs_for_all_runs_by_log_id(
+                after_cursor=after_storage_id, limit=BATCH_LIMIT
+            )
+            for storage_id, event in events_by_id.items():
+                after_storage_id = max(after_storage_id, storage_id)
+                for watched in self._callbacks_for_run(event.run_id):
+                    # callbacks watched after the pending runs were caught up are caught up on the
+                    # next call, from their own cursor
+                    if watched.caught_up:
+                        self._deliver(watched, storage_id, event)
+
+            if len(events_by_id) < BATCH_LIMIT:
+                return after_storage_id
 
     def __del__(self):
         self.close()
@@ -76,95 +242,61 @@ def __del__(self):
     def close(self):
         if not self._disposed:
             self._disposed = True
-            with self._dict_lock:
-                for watcher_thread in self._run_id_to_watcher_dict.values():
-                    if not watcher_thread.should_thread_exit.is_set():
-                        watcher_thread.should_thread_exit.set()
-                for run_id in self._run_id_to_watcher_dict:
-                    self._run_id_to_watcher_dict[run_id].join()
-                self._run_id_to_watcher_dict = {}
-
+            with self._lock:
+                thread = self._thread
+                self._thread = None
+                self._callbacks_by_run_id = {}
+                self._pending_run_ids = set()
+            if thread:
+                thread.should_thread_exit.set()
+                thread.wake()
+                if thread is not threading.current_thread():
+                    thread.join()
 
-class SqlPollingRunIdEventWatcherThread(threading.Thread):
-    """subclass of Thread that watches a given run_id for new Events by polling every POLLING_CADENCE.
 
-    Holds a list of callbacks (_callback_fn_list) each passed in by an `Observer`. Note that
-        the callbacks have a cursor associated; this means that the callbacks should be
-        only executed on EventLogEntrys with an associated id >= callback.cursor
-    Exits when `self.should_thread_exit` is set.
-
-    LOCKING INFO:
-        INVARIANTS: _callback_fn_list_lock protects _callback_fn_list
+class SqlPollingEventWatcherThread(threading.Thread):
+    """subclass of Thread that polls the event log for new events for every run watched by a
+    SqlPollingEventWatcher.
 
+    Wakes every POLLING_CADENCE, or, if the watcher is notification-driven, whenever `wake` is
+    called (and at least every NOTIFICATION_FALLBACK_CADENCE). Exits when
+    `self.should_thread_exit` is set.
     """
 
-    def __init__(self, event_log_storage: EventLogStorage, run_id: str):
-        super(SqlPollingRunIdEventWatcherThread, self).__init__()
-        self._event_log_storage = check.inst_param(
-            event_log_storage, "event_log_storage", EventLogStorage
-        )
-        self._run_id = check.str_param(run_id, "run_id")
-        self._callback_fn_list_lock: threading.Lock = threading.Lock()
-        self._callback_fn_list: List[CallbackAfterCursor] = []
+    def __init__(self, watcher: SqlPollingEventWatcher):
+        super(SqlPollingEventWatcherThread, self).__init__()
+        self._watcher = check.inst_param(watcher, "watcher", SqlPollingEventWatcher)
         self._should_thread_exit = threading.Event()
-        self.name = f"sql-event-watch-run-id-{self._run_id}"
+        self._wake_event = threading.Event()
+        self.name = "sql-event-watch"
 
     @property
     def should_thread_exit(self) -> threading.Event:
         return self._should_thread_exit
 
-    def add_callback(self, cursor: Optional[str], callback: Callable[[EventLogEntry, str], None]):
-        """Observer has started watching this run.
-            Add a callback to execute on new EventLogEntrys after the given cursor.
-
-        Args:
-            cursor (Optional[str]): event log cursor for the callback to execute
-            callback (Callable[[EventLogEntry, str], None]): callback to update the Dagster UI
-        """
-        cursor = check.opt_str_param(cursor, "cursor")
-        callback = check.callable_param(callback, "callback")
-        with self._callback_fn_list_lock:
-            self._callback_fn_list.append(CallbackAfterCursor(cursor, callback))
+    def wake(self) -> None:
+        self._wake_event.set()
 
-    def remove_callback(self, callback: Callable[[EventLogEntry, str], None]):
-        """Observer has stopped watching this run;
-            Remove a callback from the list of callbacks to execute on new EventLogEntrys.
-
-            Also kill thread if no callbacks remaining (i.e. no Observers are watching this run_id)
-
-        Args:
-            callback (Callable[[EventLogEntry, str], None]): callback to remove from list of callbacks
-        """
-        callback = check.callable_param(callback, "callback")
-        with self._callback_fn_list_lock:
-            self._callback_fn_list = [
-                callback_with_cursor
-                for callback_with_cursor in self._callback_fn_list
-                if callback_with_cursor.callback != callback
-            ]
-            if not self._callback_fn_list:
-                self._should_thread_exit.set()
+    def _wait(self) -> None:
+        if self._watcher.use_notifications:
+            self._wake_event.wait(NOTIFICATION_FALLBACK_CADENCE)
+            self._wake_event.clear()
+        else:
+            self._should_thread_exit.wait(POLLING_CADENCE)
 
     def run(self):
         """Polling function to update Observers with EventLogEntrys from Event Log DB.
-        Wakes every POLLING_CADENCE &
-            1. executes a SELECT query to get new EventLogEntrys
-            2. fires each callback (taking into account the callback.cursor) on the new EventLogEntrys
-        Uses max_index_so_far as a cursor in the DB to make sure that only new records are retrieved.
+        Wakes every POLLING_CADENCE (or on notification) &
+            1. executes a single batched SELECT query to get new EventLogEntrys for all watched runs
+            2. fires each callback (taking into account the callback cursor) on the new EventLogEntrys
+        Uses a shared storage id cursor to make sure that only new records are retrieved.
         """
         cursor = None
-        while not self._should_thread_exit.wait(POLLING_CADENCE):
-            conn = self._event_log_storage.get_records_for_run(self._run_id, cursor=cursor)
-            cursor = conn.cursor if conn.cursor else cursor
-            for event_record in conn.records:
-                with self._callback_fn_list_lock:
-                    for callback_with_cursor in self._callback_fn_list:
-                        if (
-                            callback_with_cursor.cursor is None
-                            or EventLogCursor.parse(callback_with_cursor.cursor).storage_id()
-                            < event_record.storage_id
-                        ):
-                            callback_with_cursor.callback(
-                                event_record.event_log_entry,
-                                str(EventLogCursor.from_storage_id(event_record.storage_id)),
-                            )
+        while True:
+            self._wait()
+            if self._should_thread_exit.is_set():
+                break
+            try:
+                cursor = self._watcher.poll(cursor)
+            except Exception:
+                logging.exception("Exception while polling the event log for watched runs.")
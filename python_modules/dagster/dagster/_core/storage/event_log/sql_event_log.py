@@ -1,4 +1,5 @@
 import logging
+import threading
 from abc import abstractmethod
 from collections import OrderedDict, defaultdict
 from datetime import datetime
@@ -8,6 +9,7 @@
     ContextManager,
     Dict,
     Iterable,
+    Iterator,
     List,
     Mapping,
     NamedTuple,
@@ -36,7 +38,7 @@
 )
 from dagster._core.event_api import RunShardedEventsCursor
 from dagster._core.events import ASSET_EVENTS, MARKER_EVENTS, DagsterEventType
-from dagster._core.execution.stats import RunStepKeyStatsSnapshot, build_run_step_stats_from_events
+from dagster._core.execution.stats import RunStepKeyStatsSnapshot, RunStepStatsAccumulator
 from dagster._core.storage.sql import SqlAlchemyQuery, SqlAlchemyRow
 from dagster._serdes import (
     deserialize_value,
@@ -75,6 +77,9 @@
 
 MIN_ASSET_ROWS = 25
 
+# maximum number of run and step stats summaries cached by each event log storage
+RUN_STATS_CACHE_SIZE = 1000
+
 # We are using third-party library objects for DB connections-- at this time, these libraries are
 # untyped. When/if we upgrade to typed variants, the `Any` here can be replaced or the alias as a
 # whole can be dropped.
@@ -118,6 +123,11 @@ def prepare_insert_event(self, event):
         the `dagster-postgres` implementation which overrides the generic SQL implementation of
         `store_event`.
         """
+        # https://stackoverflow.com/a/54386260/324449
+        return SqlEventLogStorageTable.insert().values(**self.get_event_insert_values(event))
+
+    def get_event_insert_values(self, event: EventLogEntry) -> Mapping[str, Any]:
+        """The column values of the event log row for the given event."""
         dagster_event_type = None
         asset_key_str = None
         partition = None
@@ -131,8 +141,7 @@ def prepare_insert_event(self, event):
             if event.dagster_event.partition:
                 partition = event.dagster_event.partition
 
-        # https://stackoverflow.com/a/54386260/324449
-        return SqlEventLogStorageTable.insert().values(
+        return dict(
             run_id=event.run_id,
             event=serialize_value(event),
             dagster_event_type=dagster_event_type,
@@ -188,6 +197,41 @@ def store_asset_event(self, event: EventLogEntry, event_id: int):
             except db_exc.IntegrityError:
                 conn.execute(update_statement)
 
+    def _get_asset_entry_values_by_asset_key(
+        self, events_and_ids: Sequence[Tuple[EventLogEntry, int]]
+    ) -> Mapping[str, Mapping[str, Any]]:
+        """Fold the asset key table updates of a batch of asset events into one update per asset
+        key, with later events taking precedence.
+        """
+        has_asset_key_index_cols = self.has_asset_key_index_cols()
+        values_by_asset_key: Dict[str, Dict[str, Any]] = OrderedDict()
+        for event, event_id in events_and_ids:
+            if not (event.dagster_event and event.dagster_event.asset_key):
+                continue
+            asset_key_str = event.dagster_event.asset_key.to_string()
+            values_by_asset_key.setdefault(asset_key_str, {}).update(
+                self._get_asset_entry_values(event, event_id, has_asset_key_index_cols)
+            )
+        return values_by_asset_key
+
+    def store_asset_events(self, events_and_ids: Sequence[Tuple[EventLogEntry, int]]) -> None:
+        """Update the asset key table for a batch of asset events, with one write per asset key."""
+        values_by_asset_key = self._get_asset_entry_values_by_asset_key(events_and_ids)
+        if not values_by_asset_key:
+            return
+
+        with self.index_connection() as conn:
+            for asset_key_str, values in values_by_asset_key.items():
+                try:
+                    conn.execute(AssetKeyTable.insert().values(asset_key=asset_key_str, **values))
+                except db_exc.IntegrityError:
+                    if values:
+                        conn.execute(
+                            AssetKeyTable.update()
+                            .values(**values)
+                            .where(AssetKeyTable.c.asset_key == asset_key_str)
+                        )
+
     def _get_asset_entry_values(
         self, event: EventLogEntry, event_id: int, has_asset_key_index_cols: bool
     ) -> Dict[str, Any]:
@@ -319,11 +363,10 @@ def add_asset_event_tags(
                     ],
                 )
 
-    def store_asset_event_tags(self, event: EventLogEntry, event_id: int) -> None:
-        check.inst_param(event, "event", EventLogEntry)
-        check.int_param(event_id, "event_id")
-
-        if (
+    def _get_asset_event_tag_rows(
+        self, event: EventLogEntry, event_id: int
+    ) -> Sequence[Mapping[str, Any]]:
+        if not (
             event.dagster_event
             and event.dagster_event.asset_key
             and event.dagster_event.is_step_materialization
@@ -332,32 +375,49 @@ def store_asset_event_tags(self, event: EventLogEntry, event_id: int) -> None:
             )
             and event.dagster_event.step_materialization_data.materialization.tags
         ):
-            if not self.has_table(AssetEventTagsTable.name):
-                # If tags table does not exist, silently exit. This is to support OSS
-                # users who have not yet run the migration to create the table.
-                # On read, we will throw an error if the table does not exist.
-                return
+            return []
+
+        check.inst_param(event.dagster_event.asset_key, "asset_key", AssetKey)
+        asset_key_str = event.dagster_event.asset_key.to_string()
+
+        tags = event.dagster_event.step_materialization_data.materialization.tags
+        return [
+            dict(
+                event_id=event_id,
+                asset_key=asset_key_str,
+                key=key,
+                value=value,
+                # Postgres requires a datetime that is in UTC but has no timezone info set
+                # in order to be stored correctly
+                event_timestamp=datetime.utcfromtimestamp(event.timestamp),
+            )
+            for key, value in tags.items()
+        ]
 
-            check.inst_param(event.dagster_event.asset_key, "asset_key", AssetKey)
-            asset_key_str = event.dagster_event.asset_key.to_string()
+    def store_asset_event_tags(self, event: EventLogEntry, event_id: int) -> None:
+        check.inst_param(event, "event", EventLogEntry)
+        check.int_param(event_id, "event_id")
 
-            tags = event.dagster_event.step_materialization_data.materialization.tags
-            with self.index_connection() as conn:
-                conn.execute(
-                    AssetEventTagsTable.insert(),
-                    [
-                        dict(
-                            event_id=event_id,
-                            asset_key=asset_key_str,
-                            key=key,
-                            value=value,
-                            # Postgres requires a datetime that is in UTC but has no timezone info
-                            # set in order to be stored correctly
-                            event_timestamp=datetime.utcfromtimestamp(event.timestamp),
-                        )
-                        for key, value in tags.items()
-                    ],
-                )
+        self.store_asset_events_tags([(event, event_id)])
+
+    def store_asset_events_tags(self, events_and_ids: Sequence[Tuple[EventLogEntry, int]]) -> None:
+        """Store the tags of a batch of asset materialization events with a single insert."""
+        rows = [
+            row
+            for event, event_id in events_and_ids
+            for row in self._get_asset_event_tag_rows(event, event_id)
+        ]
+        if not rows:
+            return
+
+        if not self.has_table(AssetEventTagsTable.name):
+            # If tags table does not exist, silently exit. This is to support OSS
+            # users who have not yet run the migration to create the table.
+            # On read, we will throw an error if the table does not exist.
+            return
+
+        with self.index_connection() as conn:
+            conn.execute(AssetEventTagsTable.insert(), rows)
 
     def store_event(self, event: EventLogEntry) -> None:
         """Store an event corresponding to a pipeline run.
@@ -389,22 +449,58 @@ def store_event(self, event: EventLogEntry) -> None:
 
             self.store_asset_event_tags(event, event_id)
 
-    def get_records_for_run(
-        self,
-        run_id,
-        cursor: Optional[str] = None,
-        of_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]] = None,
-        limit: Optional[int] = None,
-    ) -> EventLogConnection:
-        """Get all of the logs corresponding to a run.
+    def store_events(self, events: Sequence[EventLogEntry]) -> None:
+        """Store a batch of events, in order. Events are written with one connection and
+        transaction per run. The events between asset events are inserted with a single
+        executemany, and each asset event with its own insert, since its storage id is needed to
+        update the asset key and asset event tag tables, which are then updated once for the whole
+        batch.
 
         Args:
-            run_id (str): The id of the run for which to fetch logs.
-            cursor (Optional[int]): Zero-indexed logs will be returned starting from cursor + 1,
-                i.e., if cursor is -1, all logs will be returned. (default: -1)
-            of_type (Optional[DagsterEventType]): the dagster event type to filter the logs.
-            limit (Optional[int]): the maximum number of events to fetch
+            events (Sequence[EventLogEntry]): The events to store.
         """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+
+        asset_events_and_ids = []
+        for run_id, run_events in _group_events_by_run_id(events).items():
+            with self.run_connection(run_id) as conn:
+                with conn.begin():
+                    rows: List[Mapping[str, Any]] = []
+                    for event in run_events:
+                        if not _is_asset_event(event):
+                            rows.append(self.get_event_insert_values(event))
+                            continue
+
+                        if rows:
+                            conn.execute(SqlEventLogStorageTable.insert(), rows)
+                            rows = []
+                        result = conn.execute(self.prepare_insert_event(event))
+                        asset_events_and_ids.append((event, result.inserted_primary_key[0]))
+
+                    if rows:
+                        conn.execute(SqlEventLogStorageTable.insert(), rows)
+
+        self._store_asset_events_batch(asset_events_and_ids)
+
+    def _store_asset_events_batch(
+        self, asset_events_and_ids: Sequence[Tuple[EventLogEntry, Optional[int]]]
+    ) -> None:
+        if not asset_events_and_ids:
+            return
+
+        if any(event_id is None for _, event_id in asset_events_and_ids):
+            raise DagsterInvariantViolationError("Cannot store asset event tags for null event id.")
+
+        events_and_ids = cast(Sequence[Tuple[EventLogEntry, int]], asset_events_and_ids)
+        self.store_asset_events(events_and_ids)
+        self.store_asset_events_tags(events_and_ids)
+
+    def _get_records_for_run_query(
+        self,
+        run_id: str,
+        cursor: Optional[str],
+        of_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]],
+    ) -> SqlAlchemyQuery:
         check.str_param(run_id, "run_id")
         check.opt_str_param(cursor, "cursor")
 
@@ -436,6 +532,25 @@ def get_records_for_run(
             elif cursor_obj.is_id_cursor():
                 query = query.where(SqlEventLogStorageTable.c.id > cursor_obj.storage_id())
 
+        return query
+
+    def get_records_for_run(
+        self,
+        run_id,
+        cursor: Optional[str] = None,
+        of_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]] = None,
+        limit: Optional[int] = None,
+    ) -> EventLogConnection:
+        """Get all of the logs corresponding to a run.
+
+        Args:
+            run_id (str): The id of the run for which to fetch logs.
+            cursor (Optional[int]): Zero-indexed logs will be returned starting from cursor + 1,
+                i.e., if cursor is -1, all logs will be returned. (default: -1)
+            of_type (Optional[DagsterEventType]): the dagster event type to filter the logs.
+            limit (Optional[int]): the maximum number of events to fetch
+        """
+        query = self._get_records_for_run_query(run_id, cursor, of_type)
         if limit:
             query = query.limit(limit)
 
@@ -474,37 +589,107 @@ def get_records_for_run(
             has_more=bool(limit and len(results) == limit),
         )
 
+    def _iter_record_pages_for_run(
+        self,
+        run_id: str,
+        cursor: Optional[str],
+        of_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]],
+        page_size: int,
+    ) -> Iterator[EventLogRecord]:
+        # execute a single query with a server-side cursor (a named cursor on Postgres), fetching
+        # `page_size` rows at a time and deserializing each event only as it is consumed
+        query = self._get_records_for_run_query(run_id, cursor, of_type)
+        with self.run_connection(run_id) as conn:
+            result = conn.execution_options(stream_results=True).execute(query)
+            try:
+                for rows in result.partitions(page_size):
+                    for record_id, json_str in rows:
+                        try:
+                            event_log_entry = deserialize_value(json_str, EventLogEntry)
+                        except (seven.JSONDecodeError, DeserializationError) as err:
+                            raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+                        yield EventLogRecord(storage_id=record_id, event_log_entry=event_log_entry)
+            finally:
+                result.close()
+
+    @property
+    def _stats_cache(self) -> "_RunStatsCache":
+        # lazily initialized, since not every subclass calls `SqlEventLogStorage.__init__`
+        cache = self.__dict__.get("_stats_cache_instance")
+        if cache is None:
+            cache = self.__dict__.setdefault("_stats_cache_instance", _RunStatsCache())
+        return cache
+
+    def _get_cached_stats_entry(
+        self, conn: Connection, cache_key: Tuple[Any, ...], count_query: SqlAlchemyQuery
+    ) -> Optional["_RunStatsCacheEntry"]:
+        """Returns the cached stats entry for the given key, if it is still valid. An entry is
+        invalid if events up to its storage id have been inserted or deleted since it was cached,
+        e.g. because a transaction with a lower storage id committed after the entry was cached.
+        """
+        entry = self._stats_cache.get(cache_key)
+        if entry is None:
+            return None
+
+        count = conn.execute(
+            count_query.where(SqlEventLogStorageTable.c.id <= entry.storage_id)
+        ).scalar()
+        if count != entry.event_count:
+            return None
+
+        return entry
+
     def get_stats_for_run(self, run_id: str) -> DagsterRunStatsSnapshot:
         check.str_param(run_id, "run_id")
 
+        run_filter = db.and_(
+            SqlEventLogStorageTable.c.run_id == run_id,
+            SqlEventLogStorageTable.c.dagster_event_type != None,  # noqa: E711
+        )
         query = (
             db.select(
                 [
                     SqlEventLogStorageTable.c.dagster_event_type,
                     db.func.count().label("n_events_of_type"),
                     db.func.max(SqlEventLogStorageTable.c.timestamp).label("last_event_timestamp"),
+                    db.func.max(SqlEventLogStorageTable.c.id).label("last_event_id"),
                 ]
             )
-            .where(
-                db.and_(
-                    SqlEventLogStorageTable.c.run_id == run_id,
-                    SqlEventLogStorageTable.c.dagster_event_type != None,  # noqa: E711
-                )
-            )
+            .where(run_filter)
             .group_by("dagster_event_type")
         )
+        count_query = db.select([db.func.count()]).where(run_filter)
 
+        # the counts and last timestamps of each event type are cached along with the storage id
+        # they were computed up to, so that only newer events are aggregated on subsequent calls
+        cache_key = ("run_stats", run_id)
         with self.run_connection(run_id) as conn:
+            entry = self._get_cached_stats_entry(conn, cache_key, count_query)
+            if entry:
+                query = query.where(SqlEventLogStorageTable.c.id > entry.storage_id)
             results = conn.execute(query).fetchall()
 
         try:
-            counts = {}
-            times = {}
+            counts: Dict[str, int] = dict(entry.value[0]) if entry else {}
+            times: Dict[str, Any] = dict(entry.value[1]) if entry else {}
+            storage_id = entry.storage_id if entry else -1
+            event_count = entry.event_count if entry else 0
             for result in results:
-                (dagster_event_type, n_events_of_type, last_event_timestamp) = result
+                (dagster_event_type, n_events_of_type, last_event_timestamp, last_event_id) = result
                 check.invariant(dagster_event_type is not None)
-                counts[dagster_event_type] = n_events_of_type
-                times[dagster_event_type] = last_event_timestamp
+                counts[dagster_event_type] = counts.get(dagster_event_type, 0) + n_events_of_type
+                times[dagster_event_type] = (
+                    max(times[dagster_event_type], last_event_timestamp)
+                    if times.get(dagster_event_type)
+                    else last_event_timestamp
+                )
+                storage_id = max(storage_id, last_event_id)
+                event_count += n_events_of_type
+
+            if results:
+                self._stats_cache.set(
+                    cache_key, _RunStatsCacheEntry(storage_id, event_count, (counts, times))
+                )
 
             enqueued_time = times.get(DagsterEventType.PIPELINE_ENQUEUED.value, None)
             launch_time = times.get(DagsterEventType.PIPELINE_STARTING.value, None)
@@ -549,42 +734,73 @@ def get_step_stats_for_run(
         # being able to share code with the in-memory event log storage implementation.  We may
         # choose to revisit this in the future, especially if we are able to do JSON-column queries
         # in SQL as a way of bypassing the serdes layer in all cases.
-        raw_event_query = (
-            db.select([SqlEventLogStorageTable.c.event])
-            .where(SqlEventLogStorageTable.c.run_id == run_id)
-            .where(SqlEventLogStorageTable.c.step_key != None)  # noqa: E711
-            .where(
-                SqlEventLogStorageTable.c.dagster_event_type.in_(
-                    [
-                        DagsterEventType.STEP_START.value,
-                        DagsterEventType.STEP_SUCCESS.value,
-                        DagsterEventType.STEP_SKIPPED.value,
-                        DagsterEventType.STEP_FAILURE.value,
-                        DagsterEventType.STEP_RESTARTED.value,
-                        DagsterEventType.ASSET_MATERIALIZATION.value,
-                        DagsterEventType.STEP_EXPECTATION_RESULT.value,
-                        DagsterEventType.STEP_RESTARTED.value,
-                        DagsterEventType.STEP_UP_FOR_RETRY.value,
-                    ]
-                    + [marker_event.value for marker_event in MARKER_EVENTS]
-                )
-            )
-            .order_by(SqlEventLogStorageTable.c.id.asc())
+        #
+        # To avoid deserializing every event of the run on each call, the accumulated stats are
+        # cached along with the storage id they were computed up to, and only newer events are
+        # fetched and folded in on subsequent calls.
+        step_event_filter = db.and_(
+            SqlEventLogStorageTable.c.run_id == run_id,
+            SqlEventLogStorageTable.c.step_key != None,  # noqa: E711
+            SqlEventLogStorageTable.c.dagster_event_type.in_(
+                [
+                    DagsterEventType.STEP_START.value,
+                    DagsterEventType.STEP_SUCCESS.value,
+                    DagsterEventType.STEP_SKIPPED.value,
+                    DagsterEventType.STEP_FAILURE.value,
+                    DagsterEventType.STEP_RESTARTED.value,
+                    DagsterEventType.ASSET_MATERIALIZATION.value,
+                    DagsterEventType.STEP_EXPECTATION_RESULT.value,
+                    DagsterEventType.STEP_RESTARTED.value,
+                    DagsterEventType.STEP_UP_FOR_RETRY.value,
+                ]
+                + [marker_event.value for marker_event in MARKER_EVENTS]
+            ),
         )
         if step_keys:
-            raw_event_query = raw_event_query.where(
-                SqlEventLogStorageTable.c.step_key.in_(step_keys)
+            step_event_filter = db.and_(
+                step_event_filter, SqlEventLogStorageTable.c.step_key.in_(step_keys)
             )
 
+        raw_event_query = (
+            db.select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
+            .where(step_event_filter)
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+        count_query = db.select([db.func.count()]).where(step_event_filter)
+
+        cache_key = ("step_stats", run_id, tuple(sorted(step_keys)) if step_keys else None)
         with self.run_connection(run_id) as conn:
+            entry = self._get_cached_stats_entry(conn, cache_key, count_query)
+            if entry:
+                raw_event_query = raw_event_query.where(
+                    SqlEventLogStorageTable.c.id > entry.storage_id
+                )
             results = conn.execute(raw_event_query).fetchall()
 
         try:
-            records = [deserialize_value(json_str, EventLogEntry) for (json_str,) in results]
-            return build_run_step_stats_from_events(run_id, records)
+            accumulator = (
+                cast(RunStepStatsAccumulator, entry.value).copy()
+                if entry
+                else RunStepStatsAccumulator(run_id)
+            )
+            accumulator.add_events(
+                deserialize_value(json_str, EventLogEntry) for (_, json_str) in results
+            )
         except (seven.JSONDecodeError, DeserializationError) as err:
             raise DagsterEventLogInvalidForRun(run_id=run_id) from err
 
+        if results:
+            self._stats_cache.set(
+                cache_key,
+                _RunStatsCacheEntry(
+                    storage_id=results[-1][0],
+                    event_count=(entry.event_count if entry else 0) + len(results),
+                    value=accumulator,
+                ),
+            )
+
+        return accumulator.build()
+
     def _apply_migration(self, migration_name, migration_fn, print_fn, force):
         if self.has_secondary_index(migration_name):
             if not force:
@@ -612,6 +828,7 @@ def wipe(self) -> None:
         """Clears the event log storage."""
         # Should be overridden by SqliteEventLogStorage and other storages that shard based on
         # run_id
+        self._stats_cache.clear()
 
         # https://stackoverflow.com/a/54386260/324449
         with self.run_connection(run_id=None) as conn:
@@ -635,6 +852,7 @@ def wipe(self) -> None:
                 conn.execute(DynamicPartitionsTable.delete())
 
     def delete_events(self, run_id: str) -> None:
+        self._stats_cache.clear(run_id)
         with self.run_connection(run_id) as conn:
             self.delete_events_for_run(conn, run_id)
         with self.index_connection() as conn:
@@ -1853,6 +2071,62 @@ def delete_dynamic_partition(self, partitions_def_name: str, partition_key: str)
             )
 
 
+class _RunStatsCacheEntry(NamedTuple):
+    storage_id: int
+    event_count: int
+    value: Any
+
+
+class _RunStatsCache:
+    """Bounded, thread-safe LRU cache of run and step stats, keyed by tuples whose second element
+    is the run id.
+    """
+
+    def __init__(self, max_size: int = RUN_STATS_CACHE_SIZE):
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[Any, ...], _RunStatsCacheEntry]" = OrderedDict()
+
+    def get(self, key: Tuple[Any, ...]) -> Optional[_RunStatsCacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: Tuple[Any, ...], entry: _RunStatsCacheEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self, run_id: Optional[str] = None) -> None:
+        with self._lock:
+            if run_id is None:
+                self._entries.clear()
+            else:
+                for key in [key for key in self._entries if key[1] == run_id]:
+                    del self._entries[key]
+
+
+def _is_asset_event(event: EventLogEntry) -> bool:
+    return bool(
+        event.is_dagster_event
+        and event.dagster_event_type in ASSET_EVENTS
+        and event.get_dagster_event().asset_key
+    )
+
+
+def _group_events_by_run_id(
+    events: Sequence[EventLogEntry],
+) -> Mapping[str, Sequence[EventLogEntry]]:
+    events_by_run_id: Dict[str, List[EventLogEntry]] = OrderedDict()
+    for event in events:
+        events_by_run_id.setdefault(event.run_id, []).append(event)
+    return events_by_run_id
+
+
 def _get_from_row(row: SqlAlchemyRow, column: str) -> object:
     """Utility function for extracting a column from a sqlalchemy row proxy, since '_asdict' is not
     supported in sqlalchemy 1.3.
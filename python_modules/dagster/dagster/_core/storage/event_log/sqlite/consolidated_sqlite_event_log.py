@@ -1,6 +1,4 @@
-import logging
 import os
-from collections import defaultdict
 from contextlib import contextmanager
 from typing import Any, Mapping, Optional
 
@@ -11,8 +9,7 @@
 
 import dagster._check as check
 from dagster._config import StringSource
-from dagster._core.storage.dagster_run import DagsterRunStatus
-from dagster._core.storage.event_log.base import EventLogCursor
+from dagster._core.storage.event_log.polling_event_watcher import SqlPollingEventWatcher
 from dagster._core.storage.sql import (
     check_alembic_revision,
     create_engine,
@@ -56,7 +53,9 @@ def __init__(self, base_dir, inst_data: Optional[ConfigurableClassData] = None):
         self._conn_string = create_db_conn_string(base_dir, SQLITE_EVENT_LOG_FILENAME)
         self._secondary_index_cache = {}
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
-        self._watchers = defaultdict(dict)
+        self._event_watcher = SqlPollingEventWatcher(
+            self, use_notifications=True, unwatch_on_terminal_status=True
+        )
         self._obs = None
 
         if not os.path.exists(self.get_db_path()):
@@ -144,49 +143,19 @@ def watch(self, run_id, cursor, callback):
                 ConsolidatedSqliteEventLogStorageWatchdog(self), self._base_dir, True
             )
 
-        self._watchers[run_id][callback] = cursor
+        self._event_watcher.watch_run(run_id, cursor, callback)
 
     def on_modified(self):
-        keys = [
-            (run_id, callback)
-            for run_id, callback_dict in self._watchers.items()
-            for callback, _ in callback_dict.items()
-        ]
-        for run_id, callback in keys:
-            cursor = self._watchers[run_id][callback]
-
-            # fetch events
-            connection = self.get_records_for_run(run_id, cursor)
-
-            # update cursor
-            if connection.cursor:
-                self._watchers[run_id][callback] = connection.cursor
-
-            for record in connection.records:
-                status = None
-                try:
-                    status = callback(
-                        record.event_log_entry,
-                        str(EventLogCursor.from_storage_id(record.storage_id)),
-                    )
-                except Exception:
-                    logging.exception("Exception in callback for event watch on run %s.", run_id)
-
-                if (
-                    status == DagsterRunStatus.SUCCESS
-                    or status == DagsterRunStatus.FAILURE
-                    or status == DagsterRunStatus.CANCELED
-                ):
-                    self.end_watch(run_id, callback)
+        self._event_watcher.notify()
 
     def end_watch(self, run_id, handler):
-        if run_id in self._watchers and handler in self._watchers[run_id]:
-            del self._watchers[run_id][handler]
+        self._event_watcher.unwatch_run(run_id, handler)
 
     def dispose(self):
         if self._obs:
             self._obs.stop()
             self._obs.join(timeout=15)
+        self._event_watcher.close()
 
 
 class ConsolidatedSqliteEventLogStorageWatchdog(PatternMatchingEventHandler):
@@ -195,10 +164,12 @@ def __init__(self, event_log_storage, **kwargs):
             event_log_storage, "event_log_storage", ConsolidatedSqliteEventLogStorage
         )
         self._log_path = event_log_storage.get_db_path()
+        # in WAL mode, writes land in the write-ahead log and only reach the db file on checkpoint
+        self._wal_path = f"{self._log_path}-wal"
         super(ConsolidatedSqliteEventLogStorageWatchdog, self).__init__(
-            patterns=[self._log_path], **kwargs
+            patterns=[self._log_path, self._wal_path], **kwargs
         )
 
     def on_modified(self, event):
-        check.invariant(event.src_path == self._log_path)
+        check.invariant(event.src_path in (self._log_path, self._wal_path))
         self._event_log_storage.on_modified()
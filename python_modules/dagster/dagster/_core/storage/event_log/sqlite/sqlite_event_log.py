@@ -7,7 +7,17 @@
 import time
 from collections import defaultdict
 from contextlib import contextmanager
-from typing import TYPE_CHECKING, Any, ContextManager, Iterable, Iterator, Optional, Sequence
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ContextManager,
+    Iterable,
+    Iterator,
+    Optional,
+    Sequence,
+    Set,
+    Union,
+)
 
 import sqlalchemy as db
 import sqlalchemy.exc as db_exc
@@ -24,10 +34,15 @@
 from dagster._core.definitions.events import AssetKey
 from dagster._core.errors import DagsterInvariantViolationError
 from dagster._core.event_api import EventHandlerFn
-from dagster._core.events import ASSET_EVENTS
+from dagster._core.events import ASSET_EVENTS, DagsterEventType
 from dagster._core.events.log import EventLogEntry
 from dagster._core.storage.dagster_run import DagsterRunStatus, RunsFilter
-from dagster._core.storage.event_log.base import EventLogCursor, EventLogRecord, EventRecordsFilter
+from dagster._core.storage.event_log.base import (
+    EventLogCursor,
+    EventLogRecord,
+    EventLogStorage,
+    EventRecordsFilter,
+)
 from dagster._core.storage.sql import (
     AlembicVersion,
     check_alembic_revision,
@@ -46,7 +61,7 @@
 from dagster._utils import mkdir_p
 
 from ..schema import SqlEventLogStorageMetadata, SqlEventLogStorageTable
-from ..sql_event_log import RunShardedEventsCursor, SqlEventLogStorage
+from ..sql_event_log import RunShardedEventsCursor, SqlEventLogStorage, _group_events_by_run_id
 
 if TYPE_CHECKING:
     from dagster._core.storage.sqlite_storage import SqliteStorageConfig
@@ -265,6 +280,50 @@ def store_event(self, event: EventLogEntry) -> None:
 
             self.store_asset_event_tags(event, event_id)
 
+    def store_events(self, events: Sequence[EventLogEntry]) -> None:
+        """Overridden method to write each run's events to its shard in a single transaction, and
+        to mirror the batch's asset events in the cross-run index shard in a single transaction.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+
+        for run_id, run_events in _group_events_by_run_id(events).items():
+            with self.run_connection(run_id) as conn:
+                with conn.begin():
+                    conn.execute(
+                        SqlEventLogStorageTable.insert(),
+                        [self.get_event_insert_values(event) for event in run_events],
+                    )
+
+        asset_events = [
+            event
+            for event in events
+            if event.is_dagster_event and event.get_dagster_event().asset_key
+        ]
+        if not asset_events:
+            return
+
+        for event in asset_events:
+            check.invariant(
+                event.dagster_event_type in ASSET_EVENTS,
+                (
+                    "Can only store asset materializations, materialization_planned, and"
+                    " observations in index database"
+                ),
+            )
+
+        # mirror the events in the cross-run index database
+        asset_events_and_ids = []
+        with self.index_connection() as conn:
+            with conn.begin():
+                for event in asset_events:
+                    result = conn.execute(self.prepare_insert_event(event))
+                    asset_events_and_ids.append((event, result.inserted_primary_key[0]))
+
+        self._store_asset_events_batch(asset_events_and_ids)
+
     def get_event_records(
         self,
         event_records_filter: EventRecordsFilter,
@@ -361,7 +420,21 @@ def get_event_records(
     def supports_event_consumer_queries(self) -> bool:
         return False
 
+    def _iter_record_pages_for_run(
+        self,
+        run_id: str,
+        cursor: Optional[str],
+        of_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]],
+        page_size: int,
+    ) -> Iterator[EventLogRecord]:
+        # shard connections are opened under the storage-wide db lock, so instead of holding one
+        # open for the lifetime of the stream, fetch each page with a separate query
+        return EventLogStorage._iter_record_pages_for_run(  # noqa: SLF001
+            self, run_id, cursor, of_type, page_size
+        )
+
     def delete_events(self, run_id: str) -> None:
+        self._stats_cache.clear(run_id)
         with self.run_connection(run_id) as conn:
             self.delete_events_for_run(conn, run_id)
 
@@ -371,6 +444,7 @@ def delete_events(self, run_id: str) -> None:
 
     def wipe(self) -> None:
         # should delete all the run-sharded dbs as well as the index db
+        self._stats_cache.clear()
         for filename in (
             glob.glob(os.path.join(self._base_dir, "*.db"))
             + glob.glob(os.path.join(self._base_dir, "*.db-wal"))
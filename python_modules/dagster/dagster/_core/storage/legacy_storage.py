@@ -17,9 +17,11 @@
 
 from .base_storage import DagsterStorage
 from .event_log.base import (
+    DEFAULT_RECORD_STREAM_PAGE_SIZE,
     AssetRecord,
     EventLogConnection,
     EventLogRecord,
+    EventLogRecordStream,
     EventLogStorage,
     EventRecordsFilter,
 )
@@ -237,6 +239,16 @@ def get_run_tag_keys(self) -> Sequence[str]:
     def add_run_tags(self, run_id: str, new_tags: Mapping[str, str]):
         return self._storage.run_storage.add_run_tags(run_id, new_tags)
 
+    def get_run_tag_counts(
+        self, tag_keys: Sequence[str], filters: Optional["RunsFilter"] = None
+    ) -> Mapping[Tuple[str, str], int]:
+        return self._storage.run_storage.get_run_tag_counts(tag_keys, filters)
+
+    def get_queued_runs(
+        self, cursor: Optional[str] = None, limit: Optional[int] = None
+    ) -> Sequence["DagsterRun"]:
+        return self._storage.run_storage.get_queued_runs(cursor, limit)
+
     def has_run(self, run_id: str) -> bool:
         return self._storage.run_storage.has_run(run_id)
 
@@ -396,6 +408,9 @@ def get_step_stats_for_run(
     def store_event(self, event: "EventLogEntry") -> None:
         return self._storage.event_log_storage.store_event(event)
 
+    def store_events(self, events: Sequence["EventLogEntry"]) -> None:
+        return self._storage.event_log_storage.store_events(events)
+
     def delete_events(self, run_id: str) -> None:
         return self._storage.event_log_storage.delete_events(run_id)
 
@@ -535,6 +550,17 @@ def get_records_for_run(
     ) -> EventLogConnection:
         return self._storage.event_log_storage.get_records_for_run(run_id, cursor, of_type, limit)
 
+    def iter_records_for_run(
+        self,
+        run_id: str,
+        cursor: Optional[str] = None,
+        of_type: Optional[Union["DagsterEventType", Set["DagsterEventType"]]] = None,
+        page_size: int = DEFAULT_RECORD_STREAM_PAGE_SIZE,
+    ) -> EventLogRecordStream:
+        return self._storage.event_log_storage.iter_records_for_run(
+            run_id, cursor, of_type, page_size
+        )
+
 
 class LegacyScheduleStorage(ScheduleStorage, ConfigurableClass):
     def __init__(self, storage: DagsterStorage, inst_data: Optional[ConfigurableClassData] = None):
@@ -590,6 +616,11 @@ def all_instigator_state(
     def get_instigator_state(self, origin_id: str, selector_id: str) -> Optional["InstigatorState"]:
         return self._storage.schedule_storage.get_instigator_state(origin_id, selector_id)
 
+    def get_batch_instigator_states(
+        self, selector_ids: Sequence[str]
+    ) -> Mapping[str, "InstigatorState"]:
+        return self._storage.schedule_storage.get_batch_instigator_states(selector_ids)
+
     def add_instigator_state(self, state: "InstigatorState") -> "InstigatorState":
         return self._storage.schedule_storage.add_instigator_state(state)
 
@@ -1,3 +1,5 @@
+import threading
+from collections import OrderedDict
 from typing import Dict, List, NamedTuple, Optional, Sequence, Set, Tuple
 
 from dagster import (
@@ -37,6 +39,43 @@
     DynamicPartitionsDefinition,
 )
 
+# number of deserialized partition subsets kept in memory, shared across status cache reads
+PARTITIONS_SUBSET_CACHE_SIZE = 128
+
+
+class _PartitionsSubsetCache:
+    """Bounded, thread-safe LRU cache of deserialized partition subsets, so that repeatedly
+    reading the status of an asset does not re-parse large serialized subsets. Entries are keyed
+    by the partitions definition id and the serialized subset itself, which together fully
+    determine the deserialized value.
+    """
+
+    def __init__(self, max_size: int = PARTITIONS_SUBSET_CACHE_SIZE):
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, str], PartitionsSubset]" = OrderedDict()
+
+    def get(self, key: Tuple[str, str]) -> Optional[PartitionsSubset]:
+        with self._lock:
+            subset = self._entries.get(key)
+            if subset is not None:
+                self._entries.move_to_end(key)
+            return subset
+
+    def set(self, key: Tuple[str, str], subset: PartitionsSubset) -> None:
+        with self._lock:
+            self._entries[key] = subset
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_partitions_subset_cache = _PartitionsSubsetCache()
+
 
 def is_cacheable_partition_type(partitions_def: PartitionsDefinition) -> bool:
     check.inst_param(partitions_def, "partitions_def", PartitionsDefinition)
@@ -130,29 +169,40 @@ def from_db_string(db_string: str) -> Optional["AssetStatusCacheValue"]:
 
         return cached_data
 
-    def deserialize_materialized_partition_subsets(
-        self, partitions_def: PartitionsDefinition
+    def _deserialize_subset(
+        self, partitions_def: PartitionsDefinition, serialized_subset: Optional[str]
     ) -> PartitionsSubset:
-        if not self.serialized_materialized_partition_subset:
+        if not serialized_subset:
             return partitions_def.empty_subset()
 
-        return partitions_def.deserialize_subset(self.serialized_materialized_partition_subset)
+        if self.partitions_def_id is None:
+            return partitions_def.deserialize_subset(serialized_subset)
 
-    def deserialize_failed_partition_subsets(
+        key = (self.partitions_def_id, serialized_subset)
+        subset = _partitions_subset_cache.get(key)
+        if subset is None:
+            subset = partitions_def.deserialize_subset(serialized_subset)
+            _partitions_subset_cache.set(key, subset)
+        return subset
+
+    def deserialize_materialized_partition_subsets(
         self, partitions_def: PartitionsDefinition
     ) -> PartitionsSubset:
-        if not self.serialized_failed_partition_subset:
-            return partitions_def.empty_subset()
+        return self._deserialize_subset(
+            partitions_def, self.serialized_materialized_partition_subset
+        )
 
-        return partitions_def.deserialize_subset(self.serialized_failed_partition_subset)
+    def deserialize_failed_partition_subsets(
+        self, partitions_def: PartitionsDefinition
+    ) -> PartitionsSubset:
+        return self._deserialize_subset(partitions_def, self.serialized_failed_partition_subset)
 
     def deserialize_in_progress_partition_subsets(
         self, partitions_def: PartitionsDefinition
     ) -> PartitionsSubset:
-        if not self.serialized_in_progress_partition_subset:
-            return partitions_def.empty_subset()
-
-        return partitions_def.deserialize_subset(self.serialized_in_progress_partition_subset)
+        return self._deserialize_subset(
+            partitions_def, self.serialized_in_progress_partition_subset
+        )
 
 
 def get_materialized_multipartitions(
@@ -212,12 +262,17 @@ def _build_status_cache(
     asset_key: AssetKey,
     latest_storage_id: int,
     partitions_def: Optional[PartitionsDefinition],
+    partitions_def_id: Optional[str],
     dynamic_partitions_store: DynamicPartitionsStore,
 ) -> AssetStatusCacheValue:
     """This method refreshes the asset status cache for a given asset key. It recalculates
     the materialized partition subset for the asset key and updates the cache value.
     """
-    if not partitions_def or not is_cacheable_partition_type(partitions_def):
+    if (
+        not partitions_def
+        or not partitions_def_id
+        or not is_cacheable_partition_type(partitions_def)
+    ):
         return AssetStatusCacheValue(latest_storage_id=latest_storage_id)
 
     materialized_keys: Sequence[str]
@@ -232,13 +287,9 @@ def _build_status_cache(
             if count > 0
         ]
 
-    serialized_materialized_partition_subset = partitions_def.empty_subset()
-
-    serialized_materialized_partition_subset = (
-        serialized_materialized_partition_subset.with_partition_keys(
-            get_validated_partition_keys(
-                dynamic_partitions_store, partitions_def, set(materialized_keys)
-            )
+    materialized_subset = partitions_def.empty_subset().with_partition_keys(
+        get_validated_partition_keys(
+            dynamic_partitions_store, partitions_def, set(materialized_keys)
         )
     )
 
@@ -246,18 +297,43 @@ def _build_status_cache(
         instance, asset_key, partitions_def, dynamic_partitions_store
     )
 
-    return AssetStatusCacheValue(
+    return _build_partitioned_status_cache_value(
         latest_storage_id=latest_storage_id,
-        partitions_def_id=partitions_def.get_serializable_unique_identifier(
-            dynamic_partitions_store=dynamic_partitions_store
-        ),
-        serialized_materialized_partition_subset=serialized_materialized_partition_subset.serialize(),
-        serialized_failed_partition_subset=failed_subset.serialize(),
-        serialized_in_progress_partition_subset=in_progress_subset.serialize(),
+        partitions_def_id=partitions_def_id,
+        materialized_subset=materialized_subset,
+        failed_subset=failed_subset,
+        in_progress_subset=in_progress_subset,
         earliest_in_progress_materialization_event_id=cursor,
     )
 
 
+def _build_partitioned_status_cache_value(
+    latest_storage_id: int,
+    partitions_def_id: str,
+    materialized_subset: PartitionsSubset,
+    failed_subset: PartitionsSubset,
+    in_progress_subset: PartitionsSubset,
+    earliest_in_progress_materialization_event_id: Optional[int],
+) -> AssetStatusCacheValue:
+    """Serializes the given subsets into a cache value, keeping the deserialized subsets in the
+    in-memory subset cache so that reading them back from the new value is free.
+    """
+    serialized_subsets = []
+    for subset in (materialized_subset, failed_subset, in_progress_subset):
+        serialized_subset = subset.serialize()
+        _partitions_subset_cache.set((partitions_def_id, serialized_subset), subset)
+        serialized_subsets.append(serialized_subset)
+
+    return AssetStatusCacheValue(
+        latest_storage_id=latest_storage_id,
+        partitions_def_id=partitions_def_id,
+        serialized_materialized_partition_subset=serialized_subsets[0],
+        serialized_failed_partition_subset=serialized_subsets[1],
+        serialized_in_progress_partition_subset=serialized_subsets[2],
+        earliest_in_progress_materialization_event_id=earliest_in_progress_materialization_event_id,
+    )
+
+
 def build_failed_and_in_progress_partition_subset(
     instance: DagsterInstance,
     asset_key: AssetKey,
@@ -320,7 +396,7 @@ def _get_updated_failed_and_in_progress_partition_subset(
     unevaluated_event_records: Sequence[EventLogRecord],
     dynamic_partitions_store: DynamicPartitionsStore,
 ) -> Tuple[PartitionsSubset, PartitionsSubset, Optional[int]]:
-    current_failed_partitions = set(current_cached_subset.get_partition_keys())
+    newly_materialized_partitions = set()
 
     cursor = None
     incomplete_materialization_records: Dict[str, EventLogRecord] = {}
@@ -335,8 +411,7 @@ def _get_updated_failed_and_in_progress_partition_subset(
         if event.is_step_materialization:
             if event.partition:
                 incomplete_materialization_records.pop(event.partition, None)
-                # if we have a new materialization for a partition, that negates the old failure
-                current_failed_partitions.discard(event.partition)
+                newly_materialized_partitions.add(event.partition)
 
     new_failed_partitions = set()
     in_progress_partitions = set()
@@ -363,12 +438,26 @@ def _get_updated_failed_and_in_progress_partition_subset(
                     # If the run is not finished, keep track of the event id so we can check on it next time
                     cursor = record.storage_id
 
-    return (
-        partitions_def.empty_subset().with_partition_keys(
+    if any(partition in current_cached_subset for partition in newly_materialized_partitions):
+        # if we have a new materialization for a partition, that negates the old failure, so the
+        # failed subset has to be rebuilt from its keys
+        current_failed_partitions = (
+            set(current_cached_subset.get_partition_keys()) - newly_materialized_partitions
+        )
+        failed_subset = partitions_def.empty_subset().with_partition_keys(
             get_validated_partition_keys(
                 instance, partitions_def, new_failed_partitions | current_failed_partitions
             )
-        ),
+        )
+    else:
+        # the previously failed partitions are unaffected, so only the new failures need to be
+        # validated and added, without enumerating the existing subset
+        failed_subset = current_cached_subset.with_partition_keys(
+            get_validated_partition_keys(instance, partitions_def, new_failed_partitions)
+        )
+
+    return (
+        failed_subset,
         partitions_def.empty_subset().with_partition_keys(
             get_validated_partition_keys(instance, partitions_def, in_progress_partitions)
         ),
@@ -381,6 +470,7 @@ def _get_updated_status_cache(
     asset_key: AssetKey,
     current_status_cache_value: AssetStatusCacheValue,
     partitions_def: Optional[PartitionsDefinition],
+    partitions_def_id: Optional[str],
     dynamic_partitions_store: DynamicPartitionsStore,
 ) -> AssetStatusCacheValue:
     """This method accepts the current asset status cache value, and fetches unevaluated
@@ -416,22 +506,16 @@ def _get_updated_status_cache(
     unevaluated_event_records.extend(list(unevaluated_materialization_event_records))
 
     latest_storage_id = max([record.storage_id for record in unevaluated_event_records])
-    if not partitions_def or not is_cacheable_partition_type(partitions_def):
+    if (
+        not partitions_def
+        or not partitions_def_id
+        or not is_cacheable_partition_type(partitions_def)
+    ):
         return AssetStatusCacheValue(latest_storage_id=latest_storage_id)
 
-    check.invariant(
-        current_status_cache_value.partitions_def_id
-        == partitions_def.get_serializable_unique_identifier(
-            dynamic_partitions_store=dynamic_partitions_store
-        )
-    )
-    materialized_subset: PartitionsSubset = (
-        partitions_def.deserialize_subset(
-            current_status_cache_value.serialized_materialized_partition_subset
-        )
-        if current_status_cache_value
-        and current_status_cache_value.serialized_materialized_partition_subset
-        else partitions_def.empty_subset()
+    check.invariant(current_status_cache_value.partitions_def_id == partitions_def_id)
+    materialized_subset = current_status_cache_value.deserialize_materialized_partition_subsets(
+        partitions_def
     )
     newly_materialized_partitions = set()
 
@@ -451,14 +535,7 @@ def _get_updated_status_cache(
         )
     )
 
-    failed_subset: PartitionsSubset = (
-        partitions_def.deserialize_subset(
-            current_status_cache_value.serialized_failed_partition_subset
-        )
-        if current_status_cache_value
-        and current_status_cache_value.serialized_failed_partition_subset
-        else partitions_def.empty_subset()
-    )
+    failed_subset = current_status_cache_value.deserialize_failed_partition_subsets(partitions_def)
 
     (
         failed_subset,
@@ -473,12 +550,12 @@ def _get_updated_status_cache(
         dynamic_partitions_store=dynamic_partitions_store,
     )
 
-    return AssetStatusCacheValue(
+    return _build_partitioned_status_cache_value(
         latest_storage_id=latest_storage_id,
-        partitions_def_id=current_status_cache_value.partitions_def_id,
-        serialized_materialized_partition_subset=materialized_subset.serialize(),
-        serialized_failed_partition_subset=failed_subset.serialize(),
-        serialized_in_progress_partition_subset=in_progress_subset.serialize(),
+        partitions_def_id=partitions_def_id,
+        materialized_subset=materialized_subset,
+        failed_subset=failed_subset,
+        in_progress_subset=in_progress_subset,
         earliest_in_progress_materialization_event_id=new_cursor,
     )
 
@@ -500,19 +577,21 @@ def _fetch_stored_asset_status_cache_value(
 def _get_fresh_asset_status_cache_value(
     instance: DagsterInstance,
     asset_key: AssetKey,
+    cached_status_data: Optional[AssetStatusCacheValue],
     dynamic_partitions_store: DynamicPartitionsStore,
     partitions_def: Optional[PartitionsDefinition] = None,
 ) -> Optional[AssetStatusCacheValue]:
-    cached_status_data = _fetch_stored_asset_status_cache_value(instance, asset_key)
-
-    updated_cache_value = None
-    if cached_status_data is None or cached_status_data.partitions_def_id != (
+    # computing the identifier may require enumerating every partition key, so only do it once
+    partitions_def_id = (
         partitions_def.get_serializable_unique_identifier(
             dynamic_partitions_store=dynamic_partitions_store
         )
         if partitions_def
         else None
-    ):
+    )
+
+    updated_cache_value = None
+    if cached_status_data is None or cached_status_data.partitions_def_id != partitions_def_id:
         planned_event_records = instance.get_event_records(
             event_records_filter=EventRecordsFilter(
                 event_type=DagsterEventType.ASSET_MATERIALIZATION_PLANNED,
@@ -539,6 +618,7 @@ def _get_fresh_asset_status_cache_value(
                 instance=instance,
                 asset_key=asset_key,
                 partitions_def=partitions_def,
+                partitions_def_id=partitions_def_id,
                 latest_storage_id=latest_storage_id,
                 dynamic_partitions_store=dynamic_partitions_store,
             )
@@ -547,6 +627,7 @@ def _get_fresh_asset_status_cache_value(
             instance=instance,
             asset_key=asset_key,
             partitions_def=partitions_def,
+            partitions_def_id=partitions_def_id,
             current_status_cache_value=cached_status_data,
             dynamic_partitions_store=dynamic_partitions_store,
         )
@@ -560,15 +641,18 @@ def get_and_update_asset_status_cache_value(
     partitions_def: Optional[PartitionsDefinition] = None,
     dynamic_partitions_loader: Optional[DynamicPartitionsStore] = None,
 ) -> Optional[AssetStatusCacheValue]:
+    cached_status_data = _fetch_stored_asset_status_cache_value(instance, asset_key)
     updated_cache_value = _get_fresh_asset_status_cache_value(
         instance=instance,
         asset_key=asset_key,
+        cached_status_data=cached_status_data,
         partitions_def=partitions_def,
         dynamic_partitions_store=dynamic_partitions_loader
         if dynamic_partitions_loader
         else instance,
     )
-    if updated_cache_value:
+    # only write back to storage when there were new events to incorporate
+    if updated_cache_value and updated_cache_value != cached_status_data:
         instance.update_asset_cached_status_data(asset_key, updated_cache_value)
 
     return updated_cache_value
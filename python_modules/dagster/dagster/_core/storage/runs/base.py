@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Mapping, Optional, Sequence, Set, Tuple, Union
+from collections import defaultdict
+from typing import TYPE_CHECKING, Dict, Mapping, Optional, Sequence, Set, Tuple, Union
 
 from typing_extensions import TypedDict
 
@@ -9,6 +10,7 @@
 from dagster._core.snap import ExecutionPlanSnapshot, JobSnapshot
 from dagster._core.storage.dagster_run import (
     DagsterRun,
+    DagsterRunStatus,
     JobBucket,
     RunPartitionData,
     RunRecord,
@@ -16,6 +18,7 @@
     TagBucket,
 )
 from dagster._core.storage.sql import AlembicVersion
+from dagster._core.storage.tags import get_run_priority
 from dagster._daemon.types import DaemonHeartbeat
 from dagster._utils import PrintFn
 
@@ -207,6 +210,49 @@ def add_run_tags(self, run_id: str, new_tags: Mapping[str, str]) -> None:
             new_tags (Dict[string, string])
         """
 
+    def get_run_tag_counts(
+        self, tag_keys: Sequence[str], filters: Optional[RunsFilter] = None
+    ) -> Mapping[Tuple[str, str], int]:
+        """Count the runs that match the given filters by the values of the given tag keys.
+
+        Args:
+            tag_keys (Sequence[str]): The tag keys to count runs by.
+            filters (Optional[RunsFilter]): The filter by which to filter runs.
+
+        Returns:
+            Mapping[Tuple[str, str], int]: The number of runs for each tag key and value.
+        """
+        counts: Dict[Tuple[str, str], int] = defaultdict(int)
+        for run in self.get_runs(filters):
+            for key in tag_keys:
+                if key in run.tags:
+                    counts[(key, run.tags[key])] += 1
+        return dict(counts)
+
+    def get_queued_runs(
+        self, cursor: Optional[str] = None, limit: Optional[int] = None
+    ) -> Sequence[DagsterRun]:
+        """Return queued runs in the order in which they should be dequeued: by descending
+        priority, then in the order they were created.
+
+        Args:
+            cursor (Optional[str]): The run_id of the last run of the previous page of the queue.
+            limit (Optional[int]): Number of results to get. Defaults to infinite.
+
+        Returns:
+            List[DagsterRun]
+        """
+        # get_runs returns the most recently created runs first, and sorted is stable
+        runs = sorted(
+            self.get_runs(RunsFilter(statuses=[DagsterRunStatus.QUEUED]))[::-1],
+            key=lambda run: get_run_priority(run.tags),
+            reverse=True,
+        )
+        if cursor:
+            run_ids = [run.run_id for run in runs]
+            runs = runs[run_ids.index(cursor) + 1 :] if cursor in run_ids else []
+        return runs[:limit] if limit else runs
+
     @abstractmethod
     def has_run(self, run_id: str) -> bool:
         """Check if the storage contains a run.
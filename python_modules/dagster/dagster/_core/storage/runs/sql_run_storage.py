@@ -47,8 +47,10 @@
 from dagster._core.storage.tags import (
     PARTITION_NAME_TAG,
     PARTITION_SET_TAG,
+    PRIORITY_TAG,
     REPOSITORY_LABEL_TAG,
     ROOT_RUN_ID_TAG,
+    get_run_priority,
 )
 from dagster._daemon.types import DaemonHeartbeat
 from dagster._serdes import (
@@ -552,6 +554,86 @@ def get_run_tag_keys(self) -> Sequence[str]:
         rows = self.fetchall(query)
         return sorted([r[0] for r in rows])
 
+    def get_run_tag_counts(
+        self, tag_keys: Sequence[str], filters: Optional[RunsFilter] = None
+    ) -> Mapping[Tuple[str, str], int]:
+        check.sequence_param(tag_keys, "tag_keys", of_type=str)
+        if not tag_keys:
+            return {}
+
+        run_ids_query = self._runs_query(filters=filters, columns=["run_id"])
+        query = (
+            db.select([RunTagsTable.c.key, RunTagsTable.c.value, db.func.count()])
+            .where(
+                db.and_(
+                    RunTagsTable.c.key.in_(tag_keys),
+                    RunTagsTable.c.run_id.in_(run_ids_query),
+                )
+            )
+            .group_by(RunTagsTable.c.key, RunTagsTable.c.value)
+        )
+        rows = self.fetchall(query)
+        return {(key, value): count for key, value, count in rows}
+
+    def get_queued_runs(
+        self, cursor: Optional[str] = None, limit: Optional[int] = None
+    ) -> Sequence[DagsterRun]:
+        check.opt_str_param(cursor, "cursor")
+        check.opt_int_param(limit, "limit")
+
+        is_queued = RunsTable.c.status == DagsterRunStatus.QUEUED.value
+
+        # Priority tag values are free-form strings that can't be ordered in the query, but few
+        # queued runs set a priority. Look those up through the tag index and order them here,
+        # before and after the queued runs with the default priority, which are ordered by id.
+        priority_rows = self.fetchall(
+            db.select([RunsTable.c.id, RunsTable.c.run_id, RunTagsTable.c.value])
+            .select_from(RunTagsTable.join(RunsTable, RunTagsTable.c.run_id == RunsTable.c.run_id))
+            .where(db.and_(RunTagsTable.c.key == PRIORITY_TAG, is_queued))
+        )
+        prioritized = sorted(
+            [
+                (-get_run_priority({PRIORITY_TAG: value}), storage_id, run_id)
+                for storage_id, run_id, value in priority_rows
+            ]
+        )
+        high_priority_run_ids = [run_id for priority, _, run_id in prioritized if priority < 0]
+        low_priority_run_ids = [run_id for priority, _, run_id in prioritized if priority > 0]
+        nondefault_run_ids = high_priority_run_ids + low_priority_run_ids
+
+        # the cursor run is either one of the prioritized runs or has the default priority
+        include_default_priority = cursor not in low_priority_run_ids
+        if cursor in high_priority_run_ids:
+            high_priority_run_ids = high_priority_run_ids[high_priority_run_ids.index(cursor) + 1 :]
+        elif cursor in low_priority_run_ids:
+            high_priority_run_ids = []
+            low_priority_run_ids = low_priority_run_ids[low_priority_run_ids.index(cursor) + 1 :]
+        elif cursor:
+            high_priority_run_ids = []
+
+        runs = list(self._get_runs_in_order(high_priority_run_ids[:limit]))
+        if include_default_priority and (not limit or len(runs) < limit):
+            query = db.select([RunsTable.c.run_body, RunsTable.c.status]).where(is_queued)
+            if nondefault_run_ids:
+                query = query.where(RunsTable.c.run_id.notin_(nondefault_run_ids))
+            if cursor and cursor not in nondefault_run_ids:
+                cursor_query = db.select([RunsTable.c.id]).where(RunsTable.c.run_id == cursor)
+                query = query.where(RunsTable.c.id > cursor_query.scalar_subquery())
+            query = query.order_by(RunsTable.c.id.asc())
+            if limit:
+                query = query.limit(limit - len(runs))
+            runs.extend(self._rows_to_runs(self.fetchall(query)))
+        if not limit or len(runs) < limit:
+            remaining = limit - len(runs) if limit else None
+            runs.extend(self._get_runs_in_order(low_priority_run_ids[:remaining]))
+        return runs
+
+    def _get_runs_in_order(self, run_ids: Sequence[str]) -> Sequence[DagsterRun]:
+        if not run_ids:
+            return []
+        runs_by_id = {run.run_id: run for run in self.get_runs(RunsFilter(run_ids=run_ids))}
+        return [runs_by_id[run_id] for run_id in run_ids if run_id in runs_by_id]
+
     def add_run_tags(self, run_id: str, new_tags: Mapping[str, str]) -> None:
         check.str_param(run_id, "run_id")
         check.mapping_param(new_tags, "new_tags", key_type=str, value_type=str)
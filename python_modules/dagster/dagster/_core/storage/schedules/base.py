@@ -47,6 +47,22 @@ def get_instigator_state(self, origin_id: str, selector_id: str) -> Optional[Ins
             selector_id (str): The logical instigator identifier
         """
 
+    def get_batch_instigator_states(
+        self, selector_ids: Sequence[str]
+    ) -> Mapping[str, InstigatorState]:
+        """Return the instigator states for the given ids, keyed by selector id. Ids without a
+        stored state are left out.
+
+        Args:
+            selector_ids (Sequence[str]): The logical instigator identifiers
+        """
+        selector_id_set = set(selector_ids)
+        return {
+            state.selector_id: state
+            for state in self.all_instigator_state()
+            if state.selector_id in selector_id_set
+        }
+
     @abc.abstractmethod
     def add_instigator_state(self, state: InstigatorState) -> InstigatorState:
         """Add an instigator state to storage.
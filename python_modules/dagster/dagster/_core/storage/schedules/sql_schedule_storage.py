@@ -122,6 +122,25 @@ def get_instigator_state(self, origin_id: str, selector_id: str) -> Optional[Ins
         rows = self.execute(query)
         return self._deserialize_rows(rows[:1], InstigatorState)[0] if len(rows) else None
 
+    def get_batch_instigator_states(
+        self, selector_ids: Sequence[str]
+    ) -> Mapping[str, InstigatorState]:
+        check.sequence_param(selector_ids, "selector_ids", of_type=str)
+
+        if not (self.has_instigators_table() and self.has_built_index(SCHEDULE_JOBS_SELECTOR_ID)):
+            return super().get_batch_instigator_states(selector_ids)
+
+        if not selector_ids:
+            return {}
+
+        query = (
+            db.select([InstigatorsTable.c.instigator_body])
+            .select_from(InstigatorsTable)
+            .where(InstigatorsTable.c.selector_id.in_(selector_ids))
+        )
+        rows = self.execute(query)
+        return {state.selector_id: state for state in self._deserialize_rows(rows, InstigatorState)}
+
     def _has_instigator_state_by_selector(self, selector_id: str) -> bool:
         check.str_param(selector_id, "selector_id")
 
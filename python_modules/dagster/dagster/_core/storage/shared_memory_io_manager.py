@@ -0,0 +1,275 @@
+import atexit
+import mmap
+import os
+import pickle
+import shutil
+import struct
+import tempfile
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from pydantic import Field
+
+import dagster._check as check
+from dagster._annotations import experimental
+from dagster._config.pythonic_config import ConfigurableIOManagerFactory
+from dagster._core.definitions.metadata import MetadataValue
+from dagster._core.execution.context.init import InitResourceContext
+from dagster._core.execution.context.input import InputContext
+from dagster._core.execution.context.output import OutputContext
+from dagster._core.instance import DagsterInstance
+from dagster._core.storage.io_manager import IOManager, io_manager
+from dagster._utils import PICKLE_PROTOCOL, mkdir_p
+
+# Out-of-band pickle buffers (PEP 574) are only available from pickle protocol 5 onwards. On
+# interpreters without it, values are pickled in-band and copied on load.
+OUT_OF_BAND_PICKLE_PROTOCOL = 5
+
+# Buffers are aligned so that memory-mapped arrays satisfy the alignment requirements of the
+# vectorized kernels in numpy / arrow.
+BUFFER_ALIGNMENT = 64
+
+_HEADER_SIZE = struct.Struct("<Q")
+
+
+def _get_default_base_dir() -> str:
+    # /dev/shm is a RAM-backed tmpfs on Linux, so mapped files never touch disk
+    shm_dir = "/dev/shm"
+    base_dir = shm_dir if os.path.isdir(shm_dir) else tempfile.gettempdir()
+    return os.path.join(base_dir, "dagster_shared_memory_io_manager")
+
+
+def _align(offset: int) -> int:
+    return (offset + BUFFER_ALIGNMENT - 1) // BUFFER_ALIGNMENT * BUFFER_ALIGNMENT
+
+
+def _dumps(obj: object) -> Tuple[bytes, Sequence[memoryview]]:
+    if pickle.HIGHEST_PROTOCOL < OUT_OF_BAND_PICKLE_PROTOCOL:
+        return pickle.dumps(obj, protocol=PICKLE_PROTOCOL), []
+
+    buffers: List[memoryview] = []
+
+    def _collect_buffer(buffer: Any) -> bool:
+        try:
+            buffers.append(buffer.raw())
+        except BufferError:
+            # non-contiguous buffers cannot be mapped directly, serialize them in-band
+            return True
+        return False
+
+    payload = pickle.dumps(
+        obj, protocol=OUT_OF_BAND_PICKLE_PROTOCOL, buffer_callback=_collect_buffer
+    )
+    return payload, buffers
+
+
+@experimental
+class SharedMemoryIOManager(ConfigurableIOManagerFactory["MemoryMappedIOManager"]):
+    """Experimental IO manager that stores outputs in memory-mapped files, so that downstream ops
+    running in other processes on the same host map the stored buffers instead of unpickling copies
+    of them.
+
+    Values are pickled with protocol 5, and any out-of-band buffers (e.g. the data of NumPy
+    arrays, pandas DataFrames and Arrow tables) are written to the file uncopied and aligned.
+    When loaded, those buffers are mapped copy-on-write, so large values are shared between
+    the processes of a run without being copied.
+
+    Files are written to the "base_dir" configuration value if it is specified, otherwise to a
+    directory under ``/dev/shm`` (a RAM-backed filesystem) where available, or else under the
+    system temporary directory. Each run gets its own directory, which is removed after the run
+    has finished, so outputs are only available while their run is in progress. Outputs cannot be
+    loaded when re-executing a finished run.
+
+    Outputs are removed at two points, whether their run succeeded or failed:
+
+    - When a process that initialized this IO manager exits, the directories of the finished runs
+      of its instance are removed. With the in-process executor, the IO manager is initialized in
+      the run worker process, which exits after the run has finished, so the run's outputs are
+      removed when it exits.
+    - When this IO manager is initialized, the directories of all other finished runs of the
+      instance are removed.
+
+    The step processes of the multi-process executor exit before their run has finished, so the
+    outputs of those runs are left behind until this IO manager is next initialized on the same
+    host, or a process that initialized it exits. Until then they take up memory on RAM-backed
+    filesystems such as ``/dev/shm``, and if the IO manager is never used again on that host they
+    are not removed by Dagster at all.
+
+    Example usage:
+
+    .. code-block:: python
+
+        from dagster import SharedMemoryIOManager, job, op, multiprocess_executor
+
+        @op
+        def op_a():
+            # create large array ...
+            return array
+
+        @op
+        def op_b(array):
+            return array.sum()
+
+        @job(
+            resource_defs={"io_manager": SharedMemoryIOManager()},
+            executor_def=multiprocess_executor,
+        )
+        def job():
+            op_b(op_a())
+
+    """
+
+    base_dir: Optional[str] = Field(
+        default=None, description="Base directory for storing memory-mapped files."
+    )
+
+    def create_io_manager(self, context: InitResourceContext) -> "MemoryMappedIOManager":
+        io_manager = MemoryMappedIOManager(base_dir=self.base_dir or _get_default_base_dir())
+        if context.instance:
+            io_manager.remove_finished_runs(context.instance, exclude_run_id=context.run_id)
+            _instances_by_base_dir[io_manager.base_dir] = context.instance
+        return io_manager
+
+
+@io_manager(
+    config_schema=SharedMemoryIOManager.to_config_schema(),
+    description=(
+        "Experimental IO manager that stores outputs in memory-mapped files shared by the"
+        " processes of a run."
+    ),
+)
+@experimental
+def shared_memory_io_manager(init_context: InitResourceContext) -> "MemoryMappedIOManager":
+    """Experimental IO manager that stores outputs in memory-mapped files, so that downstream ops
+    running in other processes on the same host map the stored buffers instead of unpickling copies
+    of them.
+
+    See :py:class:`SharedMemoryIOManager` for where files are stored and when they are removed.
+
+    Example usage:
+
+    .. code-block:: python
+
+        from dagster import shared_memory_io_manager, job, op, multiprocess_executor
+
+        @op
+        def op_a():
+            # create large array ...
+            return array
+
+        @op
+        def op_b(array):
+            return array.sum()
+
+        @job(
+            resource_defs={"io_manager": shared_memory_io_manager},
+            executor_def=multiprocess_executor,
+        )
+        def job():
+            op_b(op_a())
+
+    """
+    return SharedMemoryIOManager.from_resource_context(init_context)
+
+
+# The instance that the IO manager was last initialized with in this process, by base directory
+_instances_by_base_dir: Dict[str, DagsterInstance] = {}
+
+
+def _remove_finished_runs_at_exit() -> None:
+    """Removes the stored outputs of the finished runs of each instance that the IO manager was
+    initialized with in this process. This runs when the interpreter exits.
+    """
+    while _instances_by_base_dir:
+        base_dir, instance = _instances_by_base_dir.popitem()
+        try:
+            MemoryMappedIOManager(base_dir=base_dir).remove_finished_runs(instance)
+        except Exception:
+            # the instance may already have been disposed, e.g. a temporary test instance. The
+            # outputs of its runs are removed the next time the IO manager is initialized.
+            pass
+
+
+atexit.register(_remove_finished_runs_at_exit)
+
+
+class MemoryMappedIOManager(IOManager):
+    """Stores each output in a file at "<base_dir>/<run_id>/<step_key>/<output_name>" that holds
+    the pickled value followed by its out-of-band buffers, and loads inputs by mapping that file.
+    """
+
+    def __init__(self, base_dir: str):
+        self.base_dir = check.str_param(base_dir, "base_dir")
+
+    def _get_path(self, context: Union[InputContext, OutputContext]) -> str:
+        return os.path.join(self.base_dir, *context.get_identifier())
+
+    def remove_finished_runs(
+        self, instance: DagsterInstance, exclude_run_id: Optional[str] = None
+    ) -> None:
+        """Removes the stored outputs of all runs that have finished. Directories that do not
+        belong to a run of the given instance are left untouched.
+        """
+        if not os.path.isdir(self.base_dir):
+            return
+
+        for run_id in os.listdir(self.base_dir):
+            if run_id == exclude_run_id:
+                continue
+            run = instance.get_run_by_id(run_id)
+            if run and run.is_finished:
+                shutil.rmtree(os.path.join(self.base_dir, run_id), ignore_errors=True)
+
+    def handle_output(self, context: OutputContext, obj: object) -> None:
+        check.inst_param(context, "context", OutputContext)
+
+        path = self._get_path(context)
+        mkdir_p(os.path.dirname(path))
+
+        payload, buffers = _dumps(obj)
+        offsets = []
+        offset = 0
+        for buffer in buffers:
+            offsets.append((offset, buffer.nbytes))
+            offset = _align(offset + buffer.nbytes)
+        header = pickle.dumps((payload, offsets), protocol=PICKLE_PROTOCOL)
+        data_start = _align(_HEADER_SIZE.size + len(header))
+
+        # write to a temporary file first, so that readers never map a partially written file
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER_SIZE.pack(len(header)))
+            f.write(header)
+            for (buffer_offset, _), buffer in zip(offsets, buffers):
+                f.seek(data_start + buffer_offset)
+                f.write(buffer)
+        os.replace(tmp_path, path)
+
+        context.add_output_metadata(
+            {
+                "path": MetadataValue.path(os.path.abspath(path)),
+                "shared_bytes": sum(buffer.nbytes for buffer in buffers),
+            }
+        )
+
+    def load_input(self, context: InputContext) -> object:
+        check.inst_param(context, "context", InputContext)
+
+        path = self._get_path(context)
+        context.log.debug(f"Loading file from: {path}")
+
+        with open(path, "rb") as f:
+            # the mapping stays open for as long as the loaded value references its buffers
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+
+        (header_size,) = _HEADER_SIZE.unpack_from(mapped)
+        header_end = _HEADER_SIZE.size + header_size
+        payload, offsets = pickle.loads(mapped[_HEADER_SIZE.size : header_end])
+        if pickle.HIGHEST_PROTOCOL < OUT_OF_BAND_PICKLE_PROTOCOL:
+            return pickle.loads(payload)
+
+        data_start = _align(header_end)
+        view = memoryview(mapped)
+        buffers = [
+            view[data_start + offset : data_start + offset + nbytes] for offset, nbytes in offsets
+        ]
+        return pickle.loads(payload, buffers=buffers)
@@ -1,4 +1,5 @@
 from enum import Enum
+from typing import Mapping
 
 import dagster._check as check
 
@@ -37,6 +38,8 @@
 
 MEMOIZED_RUN_TAG = f"{SYSTEM_TAG_PREFIX}is_memoized_run"
 
+SKIP_UNCHANGED_STEPS_TAG = f"{SYSTEM_TAG_PREFIX}skip_unchanged_steps"
+
 STEP_SELECTION_TAG = f"{SYSTEM_TAG_PREFIX}step_selection"
 
 SOLID_SELECTION_TAG = f"{SYSTEM_TAG_PREFIX}solid_selection"
@@ -103,3 +106,13 @@ def check_reserved_tags(tags):
                 not tag.startswith(SYSTEM_TAG_PREFIX),
                 desc=f"Attempted to set tag with reserved system prefix: {tag}",
             )
+
+
+def get_run_priority(tags: Mapping[str, str]) -> int:
+    """The priority with which a queued run is dequeued, set by its priority tag. Runs without the
+    tag or with a malformed value have the default priority of 0.
+    """
+    try:
+        return int(tags.get(PRIORITY_TAG, "0"))
+    except ValueError:
+        return 0
@@ -228,6 +228,7 @@ def get_external_execution_plan(
         run_config: Mapping[str, object],
         step_keys_to_execute: Optional[Sequence[str]],
         known_state: Optional[KnownExecutionState],
+        tags: Optional[Mapping[str, str]] = None,
     ) -> ExternalExecutionPlan:
         return self.get_code_location(
             external_job.handle.location_name
@@ -237,6 +238,7 @@ def get_external_execution_plan(
             step_keys_to_execute=step_keys_to_execute,
             known_state=known_state,
             instance=self.instance,
+            tags=tags,
         )
 
     def get_external_partition_config(
@@ -501,8 +503,17 @@ def rm_state_subscriber(self, token: int) -> None:
         if token in self._state_subscribers:
             del self._state_subscribers[token]
 
-    def _create_location_from_origin(self, origin: CodeLocationOrigin) -> Optional[CodeLocation]:
+    def _create_location_from_origin(
+        self, origin: CodeLocationOrigin, previous_location: Optional[CodeLocation] = None
+    ) -> Optional[CodeLocation]:
+        # a location reloaded from a code server only fetches what changed since the previous load
+        previous_grpc_location = (
+            previous_location if isinstance(previous_location, GrpcServerCodeLocation) else None
+        )
+
         if not self._grpc_server_registry.supports_origin(origin):
+            if isinstance(origin, GrpcServerCodeLocationOrigin):
+                return GrpcServerCodeLocation(origin, previous_location=previous_grpc_location)
             return origin.create_location()
         else:
             endpoint = (
@@ -520,6 +531,7 @@ def _create_location_from_origin(self, origin: CodeLocationOrigin) -> Optional[C
                 heartbeat=True,
                 watch_server=False,
                 grpc_server_registry=self._grpc_server_registry,
+                previous_location=previous_grpc_location,
             )
 
     @property
@@ -578,12 +590,14 @@ def _start_watch_thread(self, origin: GrpcServerCodeLocationOrigin) -> None:
         self._watch_threads[location_name] = watch_thread
         watch_thread.start()
 
-    def _load_location(self, origin: CodeLocationOrigin) -> CodeLocationEntry:
+    def _load_location(
+        self, origin: CodeLocationOrigin, previous_location: Optional[CodeLocation] = None
+    ) -> CodeLocationEntry:
         location_name = origin.location_name
         location = None
         error = None
         try:
-            location = self._create_location_from_origin(origin)
+            location = self._create_location_from_origin(origin, previous_location)
         except Exception:
             error = serializable_error_info_from_exc_info(sys.exc_info())
             warnings.warn(
@@ -636,7 +650,8 @@ def has_code_location_error(self, location_name: str) -> bool:
 
     def reload_code_location(self, name: str) -> None:
         # Can be called from a background thread
-        new = self._load_location(self._location_entry_dict[name].origin)
+        previous = self._location_entry_dict[name]
+        new = self._load_location(previous.origin, previous.code_location)
         with self._lock:
             # Relying on GC to clean up the old location once nothing else
             # is referencing it
@@ -647,8 +662,15 @@ def shutdown_code_location(self, name: str) -> None:
             self._location_entry_dict[name].origin.shutdown_server()
 
     def reload_workspace(self) -> None:
+        previous_locations = self.create_snapshot()
         updated_locations = {
-            origin.location_name: self._load_location(origin) for origin in self._origins
+            origin.location_name: self._load_location(
+                origin,
+                previous_locations[origin.location_name].code_location
+                if origin.location_name in previous_locations
+                else None,
+            )
+            for origin in self._origins
         }
         self._update_workspace(updated_locations)
 
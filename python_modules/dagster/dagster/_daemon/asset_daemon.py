@@ -117,6 +117,7 @@ def run_iteration(
                 step_keys_to_execute=None,
                 known_state=None,
                 instance=instance,
+                tags=tags,
             )
             execution_plan_snapshot = external_execution_plan.execution_plan_snapshot
 
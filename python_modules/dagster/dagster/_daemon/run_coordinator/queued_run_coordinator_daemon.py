@@ -3,7 +3,7 @@
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import ExitStack
-from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+from typing import Dict, Iterator, List, Optional
 
 from dagster import (
     DagsterEvent,
@@ -24,13 +24,22 @@
     DagsterRunStatus,
     RunsFilter,
 )
-from dagster._core.storage.tags import PRIORITY_TAG
 from dagster._core.workspace.context import IWorkspaceProcessContext
 from dagster._core.workspace.workspace import IWorkspace
 from dagster._daemon.daemon import DaemonIterator, IntervalDaemon
 from dagster._utils.error import serializable_error_info_from_exc_info
 from dagster._utils.tags import TagConcurrencyLimitsCounter
 
+# minimum number of queued runs fetched at a time from the head of the queue
+QUEUED_RUNS_PAGE_SIZE = 100
+
+# most queued runs checked in an iteration, as a multiple of the number of runs that can be
+# launched. Runs behind a longer blocked head of the queue wait until the head is launched.
+QUEUED_RUNS_SCAN_MULTIPLIER = 10
+
+# most queued runs checked in an iteration when max_concurrent_runs is disabled
+MAX_QUEUED_RUNS_TO_SCAN = 1000
+
 
 class QueuedRunCoordinatorDaemon(IntervalDaemon):
     """Used with the QueuedRunCoordinator on the instance. This process finds queued runs from the run
@@ -190,21 +199,32 @@ def _get_runs_to_dequeue(
         max_concurrent_runs = run_queue_config.max_concurrent_runs
         tag_concurrency_limits = run_queue_config.tag_concurrency_limits
 
-        in_progress_runs = self._get_in_progress_runs(instance)
+        in_progress_runs_filter = RunsFilter(statuses=IN_PROGRESS_RUN_STATUSES)
+        num_in_progress_runs = instance.get_runs_count(in_progress_runs_filter)
 
         max_concurrent_runs_enabled = max_concurrent_runs != -1  # setting to -1 disables the limit
-        max_runs_to_launch = max_concurrent_runs - len(in_progress_runs)
+        max_runs_to_launch = max_concurrent_runs - num_in_progress_runs
         if max_concurrent_runs_enabled:
             # Possibly under 0 if runs were launched without queuing
             if max_runs_to_launch <= 0:
                 self._logger.info(
                     "{} runs are currently in progress. Maximum is {}, won't launch more.".format(
-                        len(in_progress_runs), max_concurrent_runs
+                        num_in_progress_runs, max_concurrent_runs
                     )
                 )
                 return []
 
-        queued_runs = self._get_queued_runs(instance)
+        # fetch the head of the queue, which is already in priority order, a page at a time
+        # until the batch is full or enough runs were checked, so that a long queue is not loaded
+        # on every iteration
+        if max_concurrent_runs_enabled:
+            page_size = max(max_runs_to_launch, QUEUED_RUNS_PAGE_SIZE)
+            max_runs_to_scan = max(max_runs_to_launch * QUEUED_RUNS_SCAN_MULTIPLIER, page_size)
+        else:
+            page_size = QUEUED_RUNS_PAGE_SIZE
+            max_runs_to_scan = MAX_QUEUED_RUNS_TO_SCAN
+        limit = min(page_size, max_runs_to_scan)
+        queued_runs = instance.get_queued_runs(limit=limit)
 
         if not queued_runs:
             self._logger.debug("Poll returned no queued runs.")
@@ -230,51 +250,50 @@ def _get_runs_to_dequeue(
             f"Retrieved %d queued runs, checking limits.{locations_clause}", len(queued_runs)
         )
 
-        # place in order
-        sorted_runs = self._priority_sort(queued_runs)
-        tag_concurrency_limits_counter = TagConcurrencyLimitsCounter(
-            tag_concurrency_limits, in_progress_runs
-        )
-
-        batch: List[DagsterRun] = []
-        for run in sorted_runs:
-            if max_concurrent_runs_enabled and len(batch) >= max_runs_to_launch:
-                break
-
-            if tag_concurrency_limits_counter.is_blocked(run):
-                continue
-
-            location_name = (
-                run.external_job_origin.location_name if run.external_job_origin else None
+        # the counters start from the number of in progress runs with each limited tag, counted
+        # in run storage
+        tag_concurrency_limits_counter = TagConcurrencyLimitsCounter(tag_concurrency_limits, [])
+        if tag_concurrency_limits_counter.tag_keys:
+            tag_concurrency_limits_counter.update_counters_with_tag_counts(
+                instance.get_run_tag_counts(
+                    list(tag_concurrency_limits_counter.tag_keys), in_progress_runs_filter
+                )
             )
-            if location_name and location_name in paused_location_names:
-                continue
-
-            tag_concurrency_limits_counter.update_counters_with_launched_item(run)
-            batch.append(run)
 
-        return batch
+        batch: List[DagsterRun] = []
+        num_scanned_runs = 0
+        while queued_runs:
+            num_scanned_runs += len(queued_runs)
+            for run in queued_runs:
+                if max_concurrent_runs_enabled and len(batch) >= max_runs_to_launch:
+                    return batch
+
+                if tag_concurrency_limits_counter.is_blocked(run):
+                    continue
+
+                location_name = (
+                    run.external_job_origin.location_name if run.external_job_origin else None
+                )
+                if location_name and location_name in paused_location_names:
+                    continue
 
-    def _get_queued_runs(self, instance: DagsterInstance) -> Sequence[DagsterRun]:
-        queued_runs_filter = RunsFilter(statuses=[DagsterRunStatus.QUEUED])
+                tag_concurrency_limits_counter.update_counters_with_launched_item(run)
+                batch.append(run)
 
-        # Reversed for fifo ordering
-        runs = instance.get_runs(filters=queued_runs_filter)[::-1]
-        return runs
+            if len(queued_runs) < limit:
+                break
 
-    def _get_in_progress_runs(self, instance: DagsterInstance) -> Sequence[DagsterRun]:
-        return instance.get_runs(filters=RunsFilter(statuses=IN_PROGRESS_RUN_STATUSES))
+            if num_scanned_runs >= max_runs_to_scan:
+                self._logger.info(
+                    "Checked %d queued runs, won't check more until the next iteration.",
+                    num_scanned_runs,
+                )
+                break
 
-    def _priority_sort(self, runs: Iterable[DagsterRun]) -> Sequence[DagsterRun]:
-        def get_priority(run: DagsterRun) -> int:
-            priority_tag_value = run.tags.get(PRIORITY_TAG, "0")
-            try:
-                return int(priority_tag_value)
-            except ValueError:
-                return 0
+            limit = min(page_size, max_runs_to_scan - num_scanned_runs)
+            queued_runs = instance.get_queued_runs(cursor=queued_runs[-1].run_id, limit=limit)
 
-        # sorted is stable, so fifo is maintained
-        return sorted(runs, key=get_priority, reverse=True)
+        return batch
 
     def _is_location_pausing_dequeues(self, location_name: str, now: float) -> bool:
         with self._location_timeouts_lock:
@@ -1,3 +1,4 @@
+import heapq
 import logging
 import os
 import sys
@@ -16,6 +17,7 @@
     NamedTuple,
     Optional,
     Sequence,
+    Tuple,
     Type,
     Union,
     cast,
@@ -53,6 +55,7 @@
 from dagster._core.storage.tags import RUN_KEY_TAG, SENSOR_NAME_TAG
 from dagster._core.telemetry import SENSOR_RUN_CREATED, hash_name, log_action
 from dagster._core.workspace.context import IWorkspaceProcessContext
+from dagster._core.workspace.workspace import CodeLocationEntry
 from dagster._scheduler.stale import resolve_stale_or_missing_assets
 from dagster._utils import DebugCrashFlags, SingleInstigatorDebugCrashFlags
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
@@ -241,6 +244,127 @@ def _check_for_debug_crash(
 
 VERBOSE_LOGS_INTERVAL = 60
 
+# how often the sensor daemon reads every sensor state to pick up sensors that were started or
+# stopped outside of the daemon, when the workspace hasn't changed in the meantime
+SENSOR_STATE_REFRESH_INTERVAL = 30
+
+
+class SensorTickLateness(NamedTuple):
+    """How long after they were due the sensor daemon started evaluating some sensor ticks."""
+
+    num_ticks: int
+    mean_seconds: float
+    max_seconds: float
+
+
+class SensorEvaluationQueue:
+    """The running sensors in the workspace, ordered by when each of them is next due for a tick.
+
+    The queue is rebuilt from all of the sensor states in storage when the workspace changes, and
+    every SENSOR_STATE_REFRESH_INTERVAL seconds otherwise. In between, the sensor daemon only reads
+    the states of the sensors that are due, instead of reading every sensor state on each loop to
+    find out that most of them are still within their min_interval.
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[float, str]] = []
+        self._due_timestamps: Dict[str, float] = {}
+        self._sensors: Dict[str, ExternalSensor] = {}
+        self._workspace_update_timestamps: Optional[Mapping[str, float]] = None
+        self._last_refresh_timestamp: Optional[float] = None
+        self._num_late_ticks = 0
+        self._total_lateness = 0.0
+        self._max_lateness = 0.0
+
+    def __len__(self) -> int:
+        return len(self._due_timestamps)
+
+    def should_refresh(
+        self, workspace_snapshot: Mapping[str, CodeLocationEntry], now: float
+    ) -> bool:
+        return (
+            self._last_refresh_timestamp is None
+            or now - self._last_refresh_timestamp >= SENSOR_STATE_REFRESH_INTERVAL
+            or _workspace_update_timestamps(workspace_snapshot) != self._workspace_update_timestamps
+        )
+
+    def refresh(
+        self,
+        workspace_snapshot: Mapping[str, CodeLocationEntry],
+        sensors: Mapping[str, ExternalSensor],
+        sensor_states: Mapping[str, InstigatorState],
+        now: float,
+    ) -> None:
+        self._heap = []
+        self._due_timestamps = {}
+        self._sensors = {}
+        for selector_id, external_sensor in sensors.items():
+            self.push(
+                external_sensor,
+                _next_tick_due_timestamp(sensor_states.get(selector_id), external_sensor),
+            )
+
+        self._workspace_update_timestamps = _workspace_update_timestamps(workspace_snapshot)
+        self._last_refresh_timestamp = now
+
+    def push(self, external_sensor: ExternalSensor, due_timestamp: float) -> None:
+        selector_id = external_sensor.selector_id
+        self._sensors[selector_id] = external_sensor
+        self._due_timestamps[selector_id] = due_timestamp
+        heapq.heappush(self._heap, (due_timestamp, selector_id))
+
+    def pop_due(self, now: float) -> Sequence[Tuple[ExternalSensor, float]]:
+        """Remove the sensors that are due at the given time from the queue, returning each of
+        them with the timestamp at which it was due.
+        """
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            due_timestamp, selector_id = heapq.heappop(self._heap)
+            if self._due_timestamps.get(selector_id) != due_timestamp:
+                # the sensor was pushed again with a different due time
+                continue
+            del self._due_timestamps[selector_id]
+            due.append((self._sensors.pop(selector_id), due_timestamp))
+        return due
+
+    def next_due_timestamp(self) -> Optional[float]:
+        while self._heap:
+            due_timestamp, selector_id = self._heap[0]
+            if self._due_timestamps.get(selector_id) == due_timestamp:
+                return due_timestamp
+            heapq.heappop(self._heap)
+        return None
+
+    def record_tick_lateness(self, seconds: float) -> None:
+        seconds = max(0.0, seconds)
+        self._num_late_ticks += 1
+        self._total_lateness += seconds
+        self._max_lateness = max(self._max_lateness, seconds)
+
+    def report_tick_lateness(self) -> Optional[SensorTickLateness]:
+        """Return how late the ticks recorded since the last report were, and start over."""
+        if not self._num_late_ticks:
+            return None
+
+        lateness = SensorTickLateness(
+            num_ticks=self._num_late_ticks,
+            mean_seconds=self._total_lateness / self._num_late_ticks,
+            max_seconds=self._max_lateness,
+        )
+        self._num_late_ticks = 0
+        self._total_lateness = 0.0
+        self._max_lateness = 0.0
+        return lateness
+
+
+def _workspace_update_timestamps(
+    workspace_snapshot: Mapping[str, CodeLocationEntry]
+) -> Mapping[str, float]:
+    return {
+        location_name: location_entry.update_timestamp
+        for location_name, location_entry in workspace_snapshot.items()
+    }
+
 
 def execute_sensor_iteration_loop(
     workspace_process_context: IWorkspaceProcessContext,
@@ -250,11 +374,14 @@ def execute_sensor_iteration_loop(
 ) -> TDaemonGenerator:
     """Helper function that performs sensor evaluations on a tighter loop, while reusing grpc locations
     within a given daemon interval.  Rather than relying on the daemon machinery to run the
-    iteration loop every 30 seconds, sensors are continuously evaluated, every 5 seconds. We rely on
-    each sensor definition's min_interval to check that sensor evaluations are spaced appropriately.
+    iteration loop every 30 seconds, the loop wakes up at least every 5 seconds, or earlier when a
+    sensor is due for a tick according to its definition's min_interval. The running sensors are
+    kept in a SensorEvaluationQueue, so that each wake-up only reads the states of the sensors that
+    are due.
     """
     sensor_state_lock = threading.Lock()
     sensor_tick_futures: Dict[str, Future] = {}
+    sensor_queue = SensorEvaluationQueue()
     with ExitStack() as stack:
         settings = workspace_process_context.instance.get_settings("sensors")
         if settings.get("use_threads"):
@@ -278,30 +405,121 @@ def execute_sensor_iteration_loop(
             verbose_logs_iteration = (
                 last_verbose_time is None or start_time - last_verbose_time > VERBOSE_LOGS_INTERVAL
             )
-            yield from execute_sensor_iteration(
+            yield from _execute_due_sensor_ticks(
                 workspace_process_context,
                 logger,
+                sensor_queue,
                 threadpool_executor=threadpool_executor,
                 sensor_tick_futures=sensor_tick_futures,
                 sensor_state_lock=sensor_state_lock,
                 log_verbose_checks=verbose_logs_iteration,
             )
             # Yield to check for heartbeats in case there were no yields within
-            # execute_sensor_iteration
+            # _execute_due_sensor_ticks
             yield None
 
             end_time = pendulum.now("UTC").timestamp()
 
             if verbose_logs_iteration:
+                tick_lateness = sensor_queue.report_tick_lateness()
+                if tick_lateness:
+                    logger.info(
+                        f"Started evaluating {tick_lateness.num_ticks} sensor ticks an average of"
+                        f" {tick_lateness.mean_seconds:.2f} seconds (at most"
+                        f" {tick_lateness.max_seconds:.2f} seconds) after they were due."
+                    )
                 last_verbose_time = end_time
 
             loop_duration = end_time - start_time
-            sleep_time = max(0, MIN_INTERVAL_LOOP_TIME - loop_duration)
-            shutdown_event.wait(sleep_time)
+            sleep_time = MIN_INTERVAL_LOOP_TIME - loop_duration
+            next_due_timestamp = sensor_queue.next_due_timestamp()
+            if next_due_timestamp is not None:
+                sleep_time = min(sleep_time, next_due_timestamp - end_time)
+            shutdown_event.wait(max(0, sleep_time))
 
             yield None
 
 
+def _execute_due_sensor_ticks(
+    workspace_process_context: IWorkspaceProcessContext,
+    logger: logging.Logger,
+    sensor_queue: SensorEvaluationQueue,
+    threadpool_executor: Optional[ThreadPoolExecutor],
+    sensor_tick_futures: Dict[str, Future],
+    sensor_state_lock: threading.Lock,
+    log_verbose_checks: bool,
+):
+    instance = workspace_process_context.instance
+    workspace_snapshot = _get_workspace_snapshot(workspace_process_context)
+
+    now = pendulum.now("UTC").timestamp()
+    if sensor_queue.should_refresh(workspace_snapshot, now):
+        all_sensor_states = {
+            sensor_state.selector_id: sensor_state
+            for sensor_state in instance.all_instigator_state(instigator_type=InstigatorType.SENSOR)
+        }
+        sensors = _get_running_sensors(
+            workspace_snapshot, all_sensor_states, logger, log_verbose_checks
+        )
+        sensor_queue.refresh(workspace_snapshot, sensors, all_sensor_states, now)
+
+    if not len(sensor_queue):
+        if log_verbose_checks:
+            logger.info("Not checking for any runs since no sensors have been started.")
+        yield
+        return
+
+    due_sensors = []
+    for external_sensor, due_timestamp in sensor_queue.pop_due(now):
+        if _is_tick_in_flight(sensor_tick_futures, external_sensor.selector_id):
+            sensor_queue.push(external_sensor, now + MIN_INTERVAL_LOOP_TIME)
+        else:
+            due_sensors.append((external_sensor, due_timestamp))
+
+    if not due_sensors:
+        return
+
+    sensor_states = instance.get_batch_instigator_states(
+        [external_sensor.selector_id for external_sensor, _ in due_sensors]
+    )
+    tick_retention_settings = instance.get_tick_retention_settings(InstigatorType.SENSOR)
+
+    for external_sensor, due_timestamp in due_sensors:
+        sensor_state = sensor_states.get(external_sensor.selector_id)
+        if not external_sensor.get_current_instigator_state(sensor_state).is_running:
+            # the sensor was stopped since the queue was last refreshed
+            continue
+
+        if not sensor_state:
+            sensor_state = _create_default_running_sensor_state(instance, external_sensor)
+        elif _is_under_min_interval(sensor_state, external_sensor):
+            sensor_queue.push(
+                external_sensor, _next_tick_due_timestamp(sensor_state, external_sensor)
+            )
+            continue
+
+        # the tick records this timestamp as its start, so the sensor is next due exactly when
+        # it is no longer within its min_interval
+        tick_timestamp = pendulum.now("UTC").timestamp()
+        sensor_queue.record_tick_lateness(tick_timestamp - due_timestamp)
+        sensor_queue.push(
+            external_sensor,
+            tick_timestamp + (external_sensor.min_interval_seconds or MIN_INTERVAL_LOOP_TIME),
+        )
+        yield from _submit_tick(
+            workspace_process_context,
+            logger,
+            external_sensor,
+            sensor_state,
+            threadpool_executor,
+            sensor_tick_futures,
+            sensor_state_lock,
+            None,
+            tick_retention_settings,
+            tick_timestamp=tick_timestamp,
+        )
+
+
 def execute_sensor_iteration(
     workspace_process_context: IWorkspaceProcessContext,
     logger: logging.Logger,
@@ -316,12 +534,7 @@ def execute_sensor_iteration(
     if not sensor_state_lock:
         sensor_state_lock = threading.Lock()
 
-    workspace_snapshot = {
-        location_entry.origin.location_name: location_entry
-        for location_entry in workspace_process_context.create_request_context()
-        .get_workspace_snapshot()
-        .values()
-    }
+    workspace_snapshot = _get_workspace_snapshot(workspace_process_context)
 
     all_sensor_states = {
         sensor_state.selector_id: sensor_state
@@ -330,6 +543,63 @@ def execute_sensor_iteration(
 
     tick_retention_settings = instance.get_tick_retention_settings(InstigatorType.SENSOR)
 
+    sensors = _get_running_sensors(
+        workspace_snapshot, all_sensor_states, logger, log_verbose_checks
+    )
+
+    if not sensors:
+        if log_verbose_checks:
+            logger.info("Not checking for any runs since no sensors have been started.")
+        yield
+        return
+
+    for external_sensor in sensors.values():
+        sensor_name = external_sensor.name
+        sensor_debug_crash_flags = debug_crash_flags.get(sensor_name) if debug_crash_flags else None
+        sensor_state = all_sensor_states.get(external_sensor.selector_id)
+        if not sensor_state:
+            sensor_state = _create_default_running_sensor_state(instance, external_sensor)
+        elif _is_under_min_interval(sensor_state, external_sensor):
+            continue
+
+        if threadpool_executor:
+            if sensor_tick_futures is None:
+                check.failed("sensor_tick_futures dict must be passed with threadpool_executor")
+
+            # only allow one tick per sensor to be in flight
+            if _is_tick_in_flight(sensor_tick_futures, external_sensor.selector_id):
+                continue
+
+        yield from _submit_tick(
+            workspace_process_context,
+            logger,
+            external_sensor,
+            sensor_state,
+            threadpool_executor,
+            sensor_tick_futures,
+            sensor_state_lock,
+            sensor_debug_crash_flags,
+            tick_retention_settings,
+        )
+
+
+def _get_workspace_snapshot(
+    workspace_process_context: IWorkspaceProcessContext,
+) -> Mapping[str, CodeLocationEntry]:
+    return {
+        location_entry.origin.location_name: location_entry
+        for location_entry in workspace_process_context.create_request_context()
+        .get_workspace_snapshot()
+        .values()
+    }
+
+
+def _get_running_sensors(
+    workspace_snapshot: Mapping[str, CodeLocationEntry],
+    all_sensor_states: Mapping[str, InstigatorState],
+    logger: logging.Logger,
+    log_verbose_checks: bool,
+) -> Dict[str, ExternalSensor]:
     sensors: Dict[str, ExternalSensor] = {}
     for location_entry in workspace_snapshot.values():
         code_location = location_entry.code_location
@@ -388,64 +658,71 @@ def execute_sensor_iteration(
                     ),
                 )
 
-    if not sensors:
-        if log_verbose_checks:
-            logger.info("Not checking for any runs since no sensors have been started.")
-        yield
-        return
+    return sensors
 
-    for external_sensor in sensors.values():
-        sensor_name = external_sensor.name
-        sensor_debug_crash_flags = debug_crash_flags.get(sensor_name) if debug_crash_flags else None
-        sensor_state = all_sensor_states.get(external_sensor.selector_id)
-        if not sensor_state:
-            assert external_sensor.default_status == DefaultSensorStatus.RUNNING
-            sensor_state = InstigatorState(
-                external_sensor.get_external_origin(),
-                InstigatorType.SENSOR,
-                InstigatorStatus.AUTOMATICALLY_RUNNING,
-                SensorInstigatorData(min_interval=external_sensor.min_interval_seconds),
-            )
-            instance.add_instigator_state(sensor_state)
-        elif _is_under_min_interval(sensor_state, external_sensor):
-            continue
 
-        if threadpool_executor:
-            if sensor_tick_futures is None:
-                check.failed("sensor_tick_futures dict must be passed with threadpool_executor")
+def _create_default_running_sensor_state(
+    instance: DagsterInstance, external_sensor: ExternalSensor
+) -> InstigatorState:
+    assert external_sensor.default_status == DefaultSensorStatus.RUNNING
+    sensor_state = InstigatorState(
+        external_sensor.get_external_origin(),
+        InstigatorType.SENSOR,
+        InstigatorStatus.AUTOMATICALLY_RUNNING,
+        SensorInstigatorData(min_interval=external_sensor.min_interval_seconds),
+    )
+    instance.add_instigator_state(sensor_state)
+    return sensor_state
 
-            # only allow one tick per sensor to be in flight
-            if (
-                external_sensor.selector_id in sensor_tick_futures
-                and not sensor_tick_futures[external_sensor.selector_id].done()
-            ):
-                continue
 
-            future = threadpool_executor.submit(
-                _process_tick,
-                workspace_process_context,
-                logger,
-                external_sensor,
-                sensor_state,
-                sensor_state_lock,
-                sensor_debug_crash_flags,
-                tick_retention_settings,
-            )
-            sensor_tick_futures[external_sensor.selector_id] = future
-            yield
+def _is_tick_in_flight(sensor_tick_futures: Optional[Dict[str, Future]], selector_id: str) -> bool:
+    return bool(
+        sensor_tick_futures
+        and selector_id in sensor_tick_futures
+        and not sensor_tick_futures[selector_id].done()
+    )
 
-        else:
-            # evaluate the sensors in a loop, synchronously, yielding to allow the sensor daemon to
-            # heartbeat
-            yield from _process_tick_generator(
-                workspace_process_context,
-                logger,
-                external_sensor,
-                sensor_state,
-                sensor_state_lock,
-                sensor_debug_crash_flags,
-                tick_retention_settings,
-            )
+
+def _submit_tick(
+    workspace_process_context: IWorkspaceProcessContext,
+    logger: logging.Logger,
+    external_sensor: ExternalSensor,
+    sensor_state: InstigatorState,
+    threadpool_executor: Optional[ThreadPoolExecutor],
+    sensor_tick_futures: Optional[Dict[str, Future]],
+    sensor_state_lock: threading.Lock,
+    sensor_debug_crash_flags: Optional[SingleInstigatorDebugCrashFlags],
+    tick_retention_settings,
+    tick_timestamp: Optional[float] = None,
+):
+    if threadpool_executor:
+        future = threadpool_executor.submit(
+            _process_tick,
+            workspace_process_context,
+            logger,
+            external_sensor,
+            sensor_state,
+            sensor_state_lock,
+            sensor_debug_crash_flags,
+            tick_retention_settings,
+            tick_timestamp,
+        )
+        check.not_none(sensor_tick_futures)[external_sensor.selector_id] = future
+        yield
+
+    else:
+        # evaluate the sensors in a loop, synchronously, yielding to allow the sensor daemon to
+        # heartbeat
+        yield from _process_tick_generator(
+            workspace_process_context,
+            logger,
+            external_sensor,
+            sensor_state,
+            sensor_state_lock,
+            sensor_debug_crash_flags,
+            tick_retention_settings,
+            tick_timestamp,
+        )
 
 
 def _process_tick(
@@ -456,6 +733,7 @@ def _process_tick(
     sensor_state_lock: threading.Lock,
     sensor_debug_crash_flags: Optional[SingleInstigatorDebugCrashFlags],
     tick_retention_settings,
+    tick_timestamp: Optional[float] = None,
 ):
     # evaluate the tick immediately, but from within a thread.  The main thread should be able to
     # heartbeat to keep the daemon alive
@@ -468,6 +746,7 @@ def _process_tick(
             sensor_state_lock,
             sensor_debug_crash_flags,
             tick_retention_settings,
+            tick_timestamp,
         )
     )
 
@@ -480,6 +759,7 @@ def _process_tick_generator(
     sensor_state_lock: threading.Lock,
     sensor_debug_crash_flags: Optional[SingleInstigatorDebugCrashFlags],
     tick_retention_settings,
+    tick_timestamp: Optional[float] = None,
 ):
     instance = workspace_process_context.instance
     error_info = None
@@ -487,7 +767,11 @@ def _process_tick_generator(
         # acquire the lock to avoid a race condition where we're updating the recently touched
         # timestamp on the sensor state, but clobbering it with an older timestamp which might open
         # us up to a new evaluation being delegated within the minimum interval
-        now = pendulum.now("UTC")
+        now = (
+            pendulum.from_timestamp(tick_timestamp, tz="UTC")
+            if tick_timestamp is not None
+            else pendulum.now("UTC")
+        )
         sensor_state = check.not_none(
             instance.get_instigator_state(
                 external_sensor.get_external_origin_id(), external_sensor.selector_id
@@ -821,6 +1105,23 @@ def _is_under_min_interval(state: InstigatorState, external_sensor: ExternalSens
     return elapsed < external_sensor.min_interval_seconds
 
 
+def _next_tick_due_timestamp(
+    state: Optional[InstigatorState], external_sensor: ExternalSensor
+) -> float:
+    """The timestamp after which the sensor is no longer within its min_interval, which is the
+    current time if it is not within its min_interval.
+    """
+    now = pendulum.now("UTC").timestamp()
+    if not state or not _is_under_min_interval(state, external_sensor):
+        return now
+
+    instigator_data = check.not_none(_sensor_instigator_data(state))
+    return max(
+        instigator_data.last_tick_timestamp or 0,
+        instigator_data.last_tick_start_timestamp or 0,
+    ) + check.not_none(external_sensor.min_interval_seconds)
+
+
 def _fetch_existing_runs(
     instance: DagsterInstance,
     external_sensor: ExternalSensor,
@@ -908,23 +1209,24 @@ def _create_sensor_run(
 ) -> DagsterRun:
     from dagster._daemon.daemon import get_telemetry_daemon_session_id
 
+    job_tags = validate_tags(external_job.tags or {}, allow_reserved_tags=False)
+    tags = merge_dicts(
+        merge_dicts(job_tags, run_request.tags),
+        DagsterRun.tags_for_sensor(external_sensor),
+    )
+    if run_request.run_key:
+        tags[RUN_KEY_TAG] = run_request.run_key
+
     external_execution_plan = code_location.get_external_execution_plan(
         external_job,
         run_request.run_config,
         step_keys_to_execute=None,
         known_state=None,
         instance=instance,
+        tags=tags,
     )
     execution_plan_snapshot = external_execution_plan.execution_plan_snapshot
 
-    job_tags = validate_tags(external_job.tags or {}, allow_reserved_tags=False)
-    tags = merge_dicts(
-        merge_dicts(job_tags, run_request.tags),
-        DagsterRun.tags_for_sensor(external_sensor),
-    )
-    if run_request.run_key:
-        tags[RUN_KEY_TAG] = run_request.run_key
-
     log_action(
         instance,
         SENSOR_RUN_CREATED,
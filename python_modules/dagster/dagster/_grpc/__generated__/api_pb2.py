@@ -45,8 +45,11 @@
     b' \x01(\t"a\n\x19\x45xternalRepositoryRequest\x12+\n#serialized_repository_python_origin\x18\x01'
     b" \x01(\t\x12\x17\n\x0f\x64\x65\x66\x65r_snapshots\x18\x02"
     b' \x01(\x08"F\n\x17\x45xternalRepositoryReply\x12+\n#serialized_external_repository_data\x18\x01'
-    b' \x01(\t"i\n StreamingExternalRepositoryEvent\x12\x17\n\x0fsequence_number\x18\x01'
-    b' \x01(\x05\x12,\n$serialized_external_repository_chunk\x18\x02 \x01(\t"W\n'
+    b' \x01(\t"\x7f\n StreamingExternalRepositoryEvent\x12\x17\n\x0fsequence_number\x18\x01'
+    b" \x01(\x05\x12,\n$serialized_external_repository_chunk\x18\x02"
+    b' \x01(\t\x12\x14\n\x0c\x65nd_of_piece\x18\x03 \x01(\x08"W\n'
+    b" ExternalRepositoryChangesRequest\x12\x33\n+serialized_external_repository_changes_args\x18\x01"
+    b' \x01(\t"W\n'
     b" ExternalScheduleExecutionRequest\x12\x33\n+serialized_external_schedule_execution_args\x18\x01"
     b' \x01(\t"S\n\x1e\x45xternalSensorExecutionRequest\x12\x31\n)serialized_external_sensor_execution_args\x18\x01'
     b' \x01(\t"H\n\x13StreamingChunkEvent\x12\x17\n\x0fsequence_number\x18\x01'
@@ -64,9 +67,9 @@
     b" \x01(\t\x12\x10\n\x08job_name\x18\x02"
     b' \x01(\t"I\n\x10\x45xternalJobReply\x12\x1b\n\x13serialized_job_data\x18\x01'
     b" \x01(\t\x12\x18\n\x10serialized_error\x18\x02"
-    b' \x01(\t2\xd3\x0e\n\nDagsterApi\x12*\n\x04Ping\x12\x10.api.PingRequest\x1a\x0e.api.PingReply"\x00\x12/\n\tHeartbeat\x12\x10.api.PingRequest\x1a\x0e.api.PingReply"\x00\x12G\n\rStreamingPing\x12\x19.api.StreamingPingRequest\x1a\x17.api.StreamingPingEvent"\x00\x30\x01\x12\x32\n\x0bGetServerId\x12\n.api.Empty\x1a\x15.api.GetServerIdReply"\x00\x12]\n\x15\x45xecutionPlanSnapshot\x12!.api.ExecutionPlanSnapshotRequest\x1a\x1f.api.ExecutionPlanSnapshotReply"\x00\x12N\n\x10ListRepositories\x12\x1c.api.ListRepositoriesRequest\x1a\x1a.api.ListRepositoriesReply"\x00\x12`\n\x16\x45xternalPartitionNames\x12".api.ExternalPartitionNamesRequest\x1a'
+    b' \x01(\t2\xbb\x10\n\nDagsterApi\x12*\n\x04Ping\x12\x10.api.PingRequest\x1a\x0e.api.PingReply"\x00\x12/\n\tHeartbeat\x12\x10.api.PingRequest\x1a\x0e.api.PingReply"\x00\x12G\n\rStreamingPing\x12\x19.api.StreamingPingRequest\x1a\x17.api.StreamingPingEvent"\x00\x30\x01\x12\x32\n\x0bGetServerId\x12\n.api.Empty\x1a\x15.api.GetServerIdReply"\x00\x12]\n\x15\x45xecutionPlanSnapshot\x12!.api.ExecutionPlanSnapshotRequest\x1a\x1f.api.ExecutionPlanSnapshotReply"\x00\x12N\n\x10ListRepositories\x12\x1c.api.ListRepositoriesRequest\x1a\x1a.api.ListRepositoriesReply"\x00\x12`\n\x16\x45xternalPartitionNames\x12".api.ExternalPartitionNamesRequest\x1a'
     b' .api.ExternalPartitionNamesReply"\x00\x12Z\n\x14\x45xternalNotebookData\x12'
-    b' .api.ExternalNotebookDataRequest\x1a\x1e.api.ExternalNotebookDataReply"\x00\x12\x63\n\x17\x45xternalPartitionConfig\x12#.api.ExternalPartitionConfigRequest\x1a!.api.ExternalPartitionConfigReply"\x00\x12]\n\x15\x45xternalPartitionTags\x12!.api.ExternalPartitionTagsRequest\x1a\x1f.api.ExternalPartitionTagsReply"\x00\x12t\n#ExternalPartitionSetExecutionParams\x12/.api.ExternalPartitionSetExecutionParamsRequest\x1a\x18.api.StreamingChunkEvent"\x00\x30\x01\x12x\n\x1e\x45xternalPipelineSubsetSnapshot\x12*.api.ExternalPipelineSubsetSnapshotRequest\x1a(.api.ExternalPipelineSubsetSnapshotReply"\x00\x12T\n\x12\x45xternalRepository\x12\x1e.api.ExternalRepositoryRequest\x1a\x1c.api.ExternalRepositoryReply"\x00\x12?\n\x0b\x45xternalJob\x12\x17.api.ExternalJobRequest\x1a\x15.api.ExternalJobReply"\x00\x12h\n\x1bStreamingExternalRepository\x12\x1e.api.ExternalRepositoryRequest\x1a%.api.StreamingExternalRepositoryEvent"\x00\x30\x01\x12`\n\x19\x45xternalScheduleExecution\x12%.api.ExternalScheduleExecutionRequest\x1a\x18.api.StreamingChunkEvent"\x00\x30\x01\x12\\\n\x17\x45xternalSensorExecution\x12#.api.ExternalSensorExecutionRequest\x1a\x18.api.StreamingChunkEvent"\x00\x30\x01\x12\x38\n\x0eShutdownServer\x12\n.api.Empty\x1a\x18.api.ShutdownServerReply"\x00\x12K\n\x0f\x43\x61ncelExecution\x12\x1b.api.CancelExecutionRequest\x1a\x19.api.CancelExecutionReply"\x00\x12T\n\x12\x43\x61nCancelExecution\x12\x1e.api.CanCancelExecutionRequest\x1a\x1c.api.CanCancelExecutionReply"\x00\x12\x36\n\x08StartRun\x12\x14.api.StartRunRequest\x1a\x12.api.StartRunReply"\x00\x12:\n\x0fGetCurrentImage\x12\n.api.Empty\x1a\x19.api.GetCurrentImageReply"\x00\x12\x38\n\x0eGetCurrentRuns\x12\n.api.Empty\x1a\x18.api.GetCurrentRunsReply"\x00\x62\x06proto3'
+    b' .api.ExternalNotebookDataRequest\x1a\x1e.api.ExternalNotebookDataReply"\x00\x12\x63\n\x17\x45xternalPartitionConfig\x12#.api.ExternalPartitionConfigRequest\x1a!.api.ExternalPartitionConfigReply"\x00\x12]\n\x15\x45xternalPartitionTags\x12!.api.ExternalPartitionTagsRequest\x1a\x1f.api.ExternalPartitionTagsReply"\x00\x12t\n#ExternalPartitionSetExecutionParams\x12/.api.ExternalPartitionSetExecutionParamsRequest\x1a\x18.api.StreamingChunkEvent"\x00\x30\x01\x12x\n\x1e\x45xternalPipelineSubsetSnapshot\x12*.api.ExternalPipelineSubsetSnapshotRequest\x1a(.api.ExternalPipelineSubsetSnapshotReply"\x00\x12T\n\x12\x45xternalRepository\x12\x1e.api.ExternalRepositoryRequest\x1a\x1c.api.ExternalRepositoryReply"\x00\x12?\n\x0b\x45xternalJob\x12\x17.api.ExternalJobRequest\x1a\x15.api.ExternalJobReply"\x00\x12h\n\x1bStreamingExternalRepository\x12\x1e.api.ExternalRepositoryRequest\x1a%.api.StreamingExternalRepositoryEvent"\x00\x30\x01\x12n\n!StreamingExternalRepositoryPieces\x12\x1e.api.ExternalRepositoryRequest\x1a%.api.StreamingExternalRepositoryEvent"\x00\x30\x01\x12v\n"StreamingExternalRepositoryChanges\x12%.api.ExternalRepositoryChangesRequest\x1a%.api.StreamingExternalRepositoryEvent"\x00\x30\x01\x12`\n\x19\x45xternalScheduleExecution\x12%.api.ExternalScheduleExecutionRequest\x1a\x18.api.StreamingChunkEvent"\x00\x30\x01\x12\\\n\x17\x45xternalSensorExecution\x12#.api.ExternalSensorExecutionRequest\x1a\x18.api.StreamingChunkEvent"\x00\x30\x01\x12\x38\n\x0eShutdownServer\x12\n.api.Empty\x1a\x18.api.ShutdownServerReply"\x00\x12K\n\x0f\x43\x61ncelExecution\x12\x1b.api.CancelExecutionRequest\x1a\x19.api.CancelExecutionReply"\x00\x12T\n\x12\x43\x61nCancelExecution\x12\x1e.api.CanCancelExecutionRequest\x1a\x1c.api.CanCancelExecutionReply"\x00\x12\x36\n\x08StartRun\x12\x14.api.StartRunRequest\x1a\x12.api.StartRunReply"\x00\x12:\n\x0fGetCurrentImage\x12\n.api.Empty\x1a\x19.api.GetCurrentImageReply"\x00\x12\x38\n\x0eGetCurrentRuns\x12\n.api.Empty\x1a\x18.api.GetCurrentRunsReply"\x00\x62\x06proto3'
 )
 
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
@@ -120,35 +123,37 @@
     _EXTERNALREPOSITORYREPLY._serialized_start = 1543
     _EXTERNALREPOSITORYREPLY._serialized_end = 1613
     _STREAMINGEXTERNALREPOSITORYEVENT._serialized_start = 1615
-    _STREAMINGEXTERNALREPOSITORYEVENT._serialized_end = 1720
-    _EXTERNALSCHEDULEEXECUTIONREQUEST._serialized_start = 1722
-    _EXTERNALSCHEDULEEXECUTIONREQUEST._serialized_end = 1809
-    _EXTERNALSENSOREXECUTIONREQUEST._serialized_start = 1811
-    _EXTERNALSENSOREXECUTIONREQUEST._serialized_end = 1894
-    _STREAMINGCHUNKEVENT._serialized_start = 1896
-    _STREAMINGCHUNKEVENT._serialized_end = 1968
-    _SHUTDOWNSERVERREPLY._serialized_start = 1970
-    _SHUTDOWNSERVERREPLY._serialized_end = 2034
-    _CANCELEXECUTIONREQUEST._serialized_start = 2036
-    _CANCELEXECUTIONREQUEST._serialized_end = 2105
-    _CANCELEXECUTIONREPLY._serialized_start = 2107
-    _CANCELEXECUTIONREPLY._serialized_end = 2173
-    _CANCANCELEXECUTIONREQUEST._serialized_start = 2175
-    _CANCANCELEXECUTIONREQUEST._serialized_end = 2251
-    _CANCANCELEXECUTIONREPLY._serialized_start = 2253
-    _CANCANCELEXECUTIONREPLY._serialized_end = 2326
-    _STARTRUNREQUEST._serialized_start = 2328
-    _STARTRUNREQUEST._serialized_end = 2382
-    _STARTRUNREPLY._serialized_start = 2384
-    _STARTRUNREPLY._serialized_end = 2436
-    _GETCURRENTIMAGEREPLY._serialized_start = 2438
-    _GETCURRENTIMAGEREPLY._serialized_end = 2494
-    _GETCURRENTRUNSREPLY._serialized_start = 2496
-    _GETCURRENTRUNSREPLY._serialized_end = 2550
-    _EXTERNALJOBREQUEST._serialized_start = 2552
-    _EXTERNALJOBREQUEST._serialized_end = 2628
-    _EXTERNALJOBREPLY._serialized_start = 2630
-    _EXTERNALJOBREPLY._serialized_end = 2703
-    _DAGSTERAPI._serialized_start = 2706
-    _DAGSTERAPI._serialized_end = 4581
+    _STREAMINGEXTERNALREPOSITORYEVENT._serialized_end = 1742
+    _EXTERNALREPOSITORYCHANGESREQUEST._serialized_start = 1744
+    _EXTERNALREPOSITORYCHANGESREQUEST._serialized_end = 1831
+    _EXTERNALSCHEDULEEXECUTIONREQUEST._serialized_start = 1833
+    _EXTERNALSCHEDULEEXECUTIONREQUEST._serialized_end = 1920
+    _EXTERNALSENSOREXECUTIONREQUEST._serialized_start = 1922
+    _EXTERNALSENSOREXECUTIONREQUEST._serialized_end = 2005
+    _STREAMINGCHUNKEVENT._serialized_start = 2007
+    _STREAMINGCHUNKEVENT._serialized_end = 2079
+    _SHUTDOWNSERVERREPLY._serialized_start = 2081
+    _SHUTDOWNSERVERREPLY._serialized_end = 2145
+    _CANCELEXECUTIONREQUEST._serialized_start = 2147
+    _CANCELEXECUTIONREQUEST._serialized_end = 2216
+    _CANCELEXECUTIONREPLY._serialized_start = 2218
+    _CANCELEXECUTIONREPLY._serialized_end = 2284
+    _CANCANCELEXECUTIONREQUEST._serialized_start = 2286
+    _CANCANCELEXECUTIONREQUEST._serialized_end = 2362
+    _CANCANCELEXECUTIONREPLY._serialized_start = 2364
+    _CANCANCELEXECUTIONREPLY._serialized_end = 2437
+    _STARTRUNREQUEST._serialized_start = 2439
+    _STARTRUNREQUEST._serialized_end = 2493
+    _STARTRUNREPLY._serialized_start = 2495
+    _STARTRUNREPLY._serialized_end = 2547
+    _GETCURRENTIMAGEREPLY._serialized_start = 2549
+    _GETCURRENTIMAGEREPLY._serialized_end = 2605
+    _GETCURRENTRUNSREPLY._serialized_start = 2607
+    _GETCURRENTRUNSREPLY._serialized_end = 2661
+    _EXTERNALJOBREQUEST._serialized_start = 2663
+    _EXTERNALJOBREQUEST._serialized_end = 2739
+    _EXTERNALJOBREPLY._serialized_start = 2741
+    _EXTERNALJOBREPLY._serialized_end = 2814
+    _DAGSTERAPI._serialized_start = 2817
+    _DAGSTERAPI._serialized_end = 4924
 # @@protoc_insertion_point(module_scope)
@@ -96,6 +96,16 @@ def __init__(self, channel):
             request_serializer=api__pb2.ExternalRepositoryRequest.SerializeToString,
             response_deserializer=api__pb2.StreamingExternalRepositoryEvent.FromString,
         )
+        self.StreamingExternalRepositoryPieces = channel.unary_stream(
+            "/api.DagsterApi/StreamingExternalRepositoryPieces",
+            request_serializer=api__pb2.ExternalRepositoryRequest.SerializeToString,
+            response_deserializer=api__pb2.StreamingExternalRepositoryEvent.FromString,
+        )
+        self.StreamingExternalRepositoryChanges = channel.unary_stream(
+            "/api.DagsterApi/StreamingExternalRepositoryChanges",
+            request_serializer=api__pb2.ExternalRepositoryChangesRequest.SerializeToString,
+            response_deserializer=api__pb2.StreamingExternalRepositoryEvent.FromString,
+        )
         self.ExternalScheduleExecution = channel.unary_stream(
             "/api.DagsterApi/ExternalScheduleExecution",
             request_serializer=api__pb2.ExternalScheduleExecutionRequest.SerializeToString,
@@ -231,6 +241,18 @@ def StreamingExternalRepository(self, request, context):
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def StreamingExternalRepositoryPieces(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def StreamingExternalRepositoryChanges(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
     def ExternalScheduleExecution(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -357,6 +379,16 @@ def add_DagsterApiServicer_to_server(servicer, server):
             request_deserializer=api__pb2.ExternalRepositoryRequest.FromString,
             response_serializer=api__pb2.StreamingExternalRepositoryEvent.SerializeToString,
         ),
+        "StreamingExternalRepositoryPieces": grpc.unary_stream_rpc_method_handler(
+            servicer.StreamingExternalRepositoryPieces,
+            request_deserializer=api__pb2.ExternalRepositoryRequest.FromString,
+            response_serializer=api__pb2.StreamingExternalRepositoryEvent.SerializeToString,
+        ),
+        "StreamingExternalRepositoryChanges": grpc.unary_stream_rpc_method_handler(
+            servicer.StreamingExternalRepositoryChanges,
+            request_deserializer=api__pb2.ExternalRepositoryChangesRequest.FromString,
+            response_serializer=api__pb2.StreamingExternalRepositoryEvent.SerializeToString,
+        ),
         "ExternalScheduleExecution": grpc.unary_stream_rpc_method_handler(
             servicer.ExternalScheduleExecution,
             request_deserializer=api__pb2.ExternalScheduleExecutionRequest.FromString,
@@ -841,6 +873,64 @@ def StreamingExternalRepository(
             metadata,
         )
 
+    @staticmethod
+    def StreamingExternalRepositoryPieces(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/api.DagsterApi/StreamingExternalRepositoryPieces",
+            api__pb2.ExternalRepositoryRequest.SerializeToString,
+            api__pb2.StreamingExternalRepositoryEvent.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+        )
+
+    @staticmethod
+    def StreamingExternalRepositoryChanges(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/api.DagsterApi/StreamingExternalRepositoryChanges",
+            api__pb2.ExternalRepositoryChangesRequest.SerializeToString,
+            api__pb2.StreamingExternalRepositoryEvent.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+        )
+
     @staticmethod
     def ExternalScheduleExecution(
         request,
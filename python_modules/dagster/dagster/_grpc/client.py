@@ -1,8 +1,9 @@
 import os
 import sys
+import threading
 from contextlib import contextmanager
 from threading import Event
-from typing import Any, Iterator, Optional, Sequence, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 import grpc
 from google.protobuf.reflection import GeneratedProtocolMessageType
@@ -26,6 +27,7 @@
     CancelExecutionRequest,
     ExecuteExternalJobArgs,
     ExecutionPlanSnapshotArgs,
+    ExternalRepositoryChangesArgs,
     ExternalScheduleExecutionArgs,
     JobSubsetSnapshotArgs,
     PartitionArgs,
@@ -33,12 +35,61 @@
     PartitionSetExecutionParamArgs,
     SensorExecutionArgs,
 )
-from .utils import default_grpc_timeout, max_rx_bytes, max_send_bytes
+from .utils import (
+    COMPRESSION_METADATA_KEY,
+    default_grpc_timeout,
+    max_rx_bytes,
+    max_send_bytes,
+)
 
 CLIENT_HEARTBEAT_INTERVAL = 1
 
 DEFAULT_GRPC_TIMEOUT = default_grpc_timeout()
 
+# Pings during calls detect connections that were dropped without being closed. Servers reject
+# pings more frequent than every 5 minutes by default.
+CLIENT_KEEPALIVE_TIME_MS = 5 * 60 * 1000
+CLIENT_KEEPALIVE_TIMEOUT_MS = 20 * 1000
+
+INITIAL_RECONNECT_BACKOFF_MS = 100
+MAX_RECONNECT_BACKOFF_MS = 5 * 1000
+
+MAX_POOLED_CHANNELS = 64
+
+ChannelKey = Tuple[int, str, bool, Tuple[Tuple[str, Any], ...]]
+
+# Channels are kept open between calls and shared by the clients of a server in this process, so
+# that each call does not pay for a new connection. They are keyed by pid since channels can't be
+# used across a fork.
+_channels_lock = threading.Lock()
+_channels: Dict[ChannelKey, grpc.Channel] = {}
+
+
+def _channel_options() -> Tuple[Tuple[str, Any], ...]:
+    return (
+        ("grpc.max_receive_message_length", max_rx_bytes()),
+        ("grpc.max_send_message_length", max_send_bytes()),
+        ("grpc.keepalive_time_ms", CLIENT_KEEPALIVE_TIME_MS),
+        ("grpc.keepalive_timeout_ms", CLIENT_KEEPALIVE_TIMEOUT_MS),
+        ("grpc.initial_reconnect_backoff_ms", INITIAL_RECONNECT_BACKOFF_MS),
+        ("grpc.max_reconnect_backoff_ms", MAX_RECONNECT_BACKOFF_MS),
+    )
+
+
+def _is_local_address(host: Optional[str], socket: Optional[str]) -> bool:
+    return bool(socket) or host in ("localhost", "127.0.0.1", "::1")
+
+
+def _join_serialized_pieces(
+    events: Iterable[api_pb2.StreamingExternalRepositoryEvent],  # type: ignore
+) -> Iterator[str]:
+    chunks: List[str] = []
+    for event in events:
+        chunks.append(event.serialized_external_repository_chunk)
+        if event.end_of_piece:
+            yield "".join(chunks)
+            chunks = []
+
 
 def client_heartbeat_thread(client: "DagsterGrpcClient", shutdown_event: Event) -> None:
     while True:
@@ -60,6 +111,7 @@ def __init__(
         host: str = "localhost",
         use_ssl: bool = False,
         metadata: Optional[Sequence[Tuple[str, str]]] = None,
+        compression: Optional[grpc.Compression] = None,
     ):
         self.port = check.opt_int_param(port, "port")
         self.socket = check.opt_str_param(socket, "socket")
@@ -89,6 +141,18 @@ def __init__(
             socket = check.not_none(socket)
             self._server_address = "unix:" + os.path.abspath(socket)
 
+        # compressing large snapshots costs more time than it saves when the server is local
+        self._compression = check.opt_inst_param(
+            compression,
+            "compression",
+            grpc.Compression,
+            default=(
+                grpc.Compression.NoCompression
+                if _is_local_address(host, socket)
+                else grpc.Compression.Gzip
+            ),
+        )
+
     @property
     def metadata(self) -> Sequence[Tuple[str, str]]:
         return self._metadata
@@ -97,37 +161,69 @@ def metadata(self) -> Sequence[Tuple[str, str]]:
     def use_ssl(self) -> bool:
         return self._use_ssl
 
+    @property
+    def compression(self) -> grpc.Compression:
+        return self._compression
+
+    def _channel_key(self) -> ChannelKey:
+        return (os.getpid(), self._server_address, self._use_ssl, _channel_options())
+
+    def _get_channel(self) -> grpc.Channel:
+        key = self._channel_key()
+        with _channels_lock:
+            channel = _channels.get(key)
+            if channel is None:
+                options = list(key[3])
+                channel = (
+                    grpc.secure_channel(self._server_address, self._ssl_creds, options=options)
+                    if self._use_ssl
+                    else grpc.insecure_channel(self._server_address, options=options)
+                )
+                if len(_channels) >= MAX_POOLED_CHANNELS:
+                    # the channel is closed once the calls still using it complete
+                    del _channels[next(iter(_channels))]
+                _channels[key] = channel
+            return channel
+
+    def _discard_channel(self, channel: Optional[grpc.Channel] = None) -> None:
+        # only discard the given channel, another call may already have replaced it
+        key = self._channel_key()
+        with _channels_lock:
+            if key in _channels and (channel is None or _channels[key] is channel):
+                del _channels[key]
+
     @contextmanager
     def _channel(self) -> Iterator[grpc.Channel]:
-        options = [
-            ("grpc.max_receive_message_length", max_rx_bytes()),
-            ("grpc.max_send_message_length", max_send_bytes()),
-        ]
-        with (
-            grpc.secure_channel(
-                self._server_address,
-                self._ssl_creds,
-                options=options,
-                compression=grpc.Compression.Gzip,
-            )
-            if self._use_ssl
-            else grpc.insecure_channel(
-                self._server_address,
-                options=options,
-                compression=grpc.Compression.Gzip,
-            )
-        ) as channel:
+        channel = self._get_channel()
+        try:
             yield channel
+        except grpc.RpcError as e:
+            if e.code() == grpc.StatusCode.UNAVAILABLE:  # type: ignore  # (bad stubs)
+                # The server is down or restarting. Connect with a new channel on the next call,
+                # rather than failing until this channel's reconnect backoff has passed.
+                self._discard_channel(channel)
+            raise
+
+    def _call_metadata(self, compression: grpc.Compression) -> Sequence[Tuple[str, str]]:
+        # servers compress their responses like the request, see ResponseCompressionInterceptor
+        return [*self._metadata, (COMPRESSION_METADATA_KEY, compression.name)]
 
     def _get_response(
         self,
         method: str,
         request: str,
         timeout: int = DEFAULT_GRPC_TIMEOUT,
+        compression: Optional[grpc.Compression] = None,
     ):
+        compression = compression if compression is not None else self._compression
         with self._channel() as channel:
             stub = DagsterApiStub(channel)
-            return getattr(stub, method)(request, metadata=self._metadata, timeout=timeout)
+            return getattr(stub, method)(
+                request,
+                metadata=self._call_metadata(compression),
+                timeout=timeout,
+                compression=compression,
+            )
 
     def _raise_grpc_exception(self, e: Exception, timeout, custom_timeout_message=None):
         if isinstance(e, grpc.RpcError):
@@ -149,10 +245,13 @@ def _query(
         request_type: GeneratedProtocolMessageType,
         timeout=DEFAULT_GRPC_TIMEOUT,
         custom_timeout_message=None,
+        compression: Optional[grpc.Compression] = None,
         **kwargs,
     ):
         try:
-            return self._get_response(method, request=request_type(**kwargs), timeout=timeout)
+            return self._get_response(
+                method, request=request_type(**kwargs), timeout=timeout, compression=compression
+            )
         except Exception as e:
             self._raise_grpc_exception(
                 e, timeout=timeout, custom_timeout_message=custom_timeout_message
@@ -163,10 +262,17 @@ def _get_streaming_response(
         method: str,
         request: str,
         timeout: int = DEFAULT_GRPC_TIMEOUT,
+        compression: Optional[grpc.Compression] = None,
     ) -> Iterator[Any]:
+        compression = compression if compression is not None else self._compression
         with self._channel() as channel:
             stub = DagsterApiStub(channel)
-            yield from getattr(stub, method)(request, metadata=self._metadata, timeout=timeout)
+            yield from getattr(stub, method)(
+                request,
+                metadata=self._call_metadata(compression),
+                timeout=timeout,
+                compression=compression,
+            )
 
     def _streaming_query(
         self,
@@ -174,11 +280,12 @@ def _streaming_query(
         request_type,
         timeout=DEFAULT_GRPC_TIMEOUT,
         custom_timeout_message=None,
+        compression: Optional[grpc.Compression] = None,
         **kwargs,
     ) -> Iterator[Any]:
         try:
             yield from self._get_streaming_response(
-                method, request=request_type(**kwargs), timeout=timeout
+                method, request=request_type(**kwargs), timeout=timeout, compression=compression
             )
         except Exception as e:
             self._raise_grpc_exception(
@@ -300,6 +407,7 @@ def external_repository(
         self,
         external_repository_origin: ExternalRepositoryOrigin,
         defer_snapshots: bool = False,
+        compression: Optional[grpc.Compression] = None,
     ):
         check.inst_param(
             external_repository_origin,
@@ -310,6 +418,7 @@ def external_repository(
         res = self._query(
             "ExternalRepository",
             api_pb2.ExternalRepositoryRequest,  # type: ignore
+            compression=compression,
             # rename this param name
             serialized_repository_python_origin=serialize_value(external_repository_origin),
             defer_snapshots=defer_snapshots,
@@ -321,6 +430,7 @@ def external_job(
         self,
         external_repository_origin: ExternalRepositoryOrigin,
         job_name: str,
+        compression: Optional[grpc.Compression] = None,
     ):
         check.inst_param(
             external_repository_origin,
@@ -331,6 +441,7 @@ def external_job(
         return self._query(
             "ExternalJob",
             api_pb2.ExternalJobRequest,  # type: ignore
+            compression=compression,
             serialized_repository_origin=serialize_value(external_repository_origin),
             job_name=job_name,
         )
@@ -339,10 +450,12 @@ def streaming_external_repository(
         self,
         external_repository_origin: ExternalRepositoryOrigin,
         defer_snapshots: bool = False,
+        compression: Optional[grpc.Compression] = None,
     ):
         for res in self._streaming_query(
             "StreamingExternalRepository",
             api_pb2.ExternalRepositoryRequest,  # type: ignore
+            compression=compression,
             # Rename parameter
             serialized_repository_python_origin=serialize_value(external_repository_origin),
             defer_snapshots=defer_snapshots,
@@ -352,6 +465,103 @@ def streaming_external_repository(
                 "serialized_external_repository_chunk": res.serialized_external_repository_chunk,
             }
 
+    def streaming_external_repository_pieces(
+        self,
+        external_repository_origin: ExternalRepositoryOrigin,
+        defer_snapshots: bool = False,
+        compression: Optional[grpc.Compression] = None,
+        timeout: int = DEFAULT_GRPC_TIMEOUT,
+    ) -> Iterator[str]:
+        """Yields each serialized piece of the repository's ExternalRepositoryData as soon as it
+        has arrived, see external_repository_data_pieces_from_def. Servers that can't send the
+        pieces separately send the whole ExternalRepositoryData as a single piece.
+        """
+        check.inst_param(
+            external_repository_origin,
+            "external_repository_origin",
+            ExternalRepositoryOrigin,
+        )
+        compression = compression if compression is not None else self._compression
+
+        unimplemented = False
+        try:
+            with self._channel() as channel:
+                responses = DagsterApiStub(channel).StreamingExternalRepositoryPieces(
+                    api_pb2.ExternalRepositoryRequest(
+                        serialized_repository_python_origin=serialize_value(
+                            external_repository_origin
+                        ),
+                        defer_snapshots=defer_snapshots,
+                    ),
+                    metadata=self._call_metadata(compression),
+                    timeout=timeout,
+                    compression=compression,
+                )
+                yield from _join_serialized_pieces(responses)
+        except grpc.RpcError as e:
+            if e.code() != grpc.StatusCode.UNIMPLEMENTED:  # type: ignore  # (bad stubs)
+                self._raise_grpc_exception(e, timeout=timeout)
+            unimplemented = True
+        except Exception as e:
+            self._raise_grpc_exception(e, timeout=timeout)
+
+        if unimplemented:
+            yield "".join(
+                res["serialized_external_repository_chunk"]
+                for res in self.streaming_external_repository(
+                    external_repository_origin,
+                    defer_snapshots=defer_snapshots,
+                    compression=compression,
+                )
+            )
+
+    def streaming_external_repository_changes(
+        self,
+        external_repository_changes_args: ExternalRepositoryChangesArgs,
+        compression: Optional[grpc.Compression] = None,
+        timeout: int = DEFAULT_GRPC_TIMEOUT,
+    ) -> Iterator[str]:
+        """Yields a serialized ExternalRepositoryPieceHashes with the hash of every piece of the
+        repository's ExternalRepositoryData, followed by each serialized piece whose hash differs
+        from the ones in the args. Servers that can't compare the pieces send all of them without
+        hashes instead, see streaming_external_repository_pieces.
+        """
+        check.inst_param(
+            external_repository_changes_args,
+            "external_repository_changes_args",
+            ExternalRepositoryChangesArgs,
+        )
+        compression = compression if compression is not None else self._compression
+
+        unimplemented = False
+        try:
+            with self._channel() as channel:
+                responses = DagsterApiStub(channel).StreamingExternalRepositoryChanges(
+                    api_pb2.ExternalRepositoryChangesRequest(
+                        serialized_external_repository_changes_args=serialize_value(
+                            external_repository_changes_args
+                        ),
+                    ),
+                    metadata=self._call_metadata(compression),
+                    timeout=timeout,
+                    compression=compression,
+                )
+                yield from _join_serialized_pieces(responses)
+        except grpc.RpcError as e:
+            if e.code() != grpc.StatusCode.UNIMPLEMENTED:  # type: ignore  # (bad stubs)
+                self._raise_grpc_exception(e, timeout=timeout)
+            unimplemented = True
+        except Exception as e:
+            self._raise_grpc_exception(e, timeout=timeout)
+
+        if unimplemented:
+            yield from self.streaming_external_repository_pieces(
+                external_repository_changes_args.repository_origin,
+                defer_snapshots=external_repository_changes_args.defer_snapshots,
+                compression=compression,
+                timeout=timeout,
+            )
+
     def external_schedule_execution(self, external_schedule_execution_args):
         check.inst_param(
             external_schedule_execution_args,
@@ -408,6 +618,7 @@ def external_notebook_data(self, notebook_path: str):
 
     def shutdown_server(self, timeout=15):
         res = self._query("ShutdownServer", api_pb2.Empty, timeout=timeout)
+        self._discard_channel()
         return res.serialized_shutdown_server_result
 
     def cancel_execution(self, cancel_execution_request):
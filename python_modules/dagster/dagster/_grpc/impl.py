@@ -502,6 +502,7 @@ def get_external_execution_plan_snapshot(
                 step_keys_to_execute=args.step_keys_to_execute,
                 known_state=args.known_state,
                 instance_ref=args.instance_ref,
+                tags=args.tags,
                 repository_load_data=repo_def.repository_load_data,
             ),
             args.job_snapshot_id,
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import math
 import multiprocessing
 import os
@@ -9,12 +10,28 @@
 import time
 import uuid
 import warnings
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor
 from multiprocessing.synchronize import Event as MPEvent
 from subprocess import Popen
 from threading import Event as ThreadingEventType
 from time import sleep
-from typing import Any, Dict, Iterator, List, Mapping, NamedTuple, Optional, Sequence, Tuple, cast
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    cast,
+)
 
 import grpc
 from grpc_health.v1 import health, health_pb2, health_pb2_grpc
@@ -33,11 +50,14 @@
     ExternalSensorExecutionErrorData,
     external_job_data_from_def,
     external_repository_data_from_def,
+    external_repository_data_piece_key,
+    external_repository_data_pieces_from_def,
 )
 from dagster._core.host_representation.origin import ExternalRepositoryOrigin
 from dagster._core.instance import DagsterInstance, InstanceRef
 from dagster._core.libraries import DagsterLibraryRegistry
 from dagster._core.origin import DEFAULT_DAGSTER_ENTRY_POINT, get_python_environment_entry_point
+from dagster._core.snap.execution_plan_snapshot import ExecutionPlanSnapshotErrorData
 from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
 from dagster._core.workspace.autodiscovery import LoadableTarget
 from dagster._serdes import deserialize_value, serialize_value, whitelist_for_serdes
@@ -72,6 +92,8 @@
     CancelExecutionResult,
     ExecuteExternalJobArgs,
     ExecutionPlanSnapshotArgs,
+    ExternalRepositoryChangesArgs,
+    ExternalRepositoryPieceHashes,
     ExternalScheduleExecutionArgs,
     GetCurrentImageResult,
     GetCurrentRunsResult,
@@ -85,7 +107,12 @@
     ShutdownServerResult,
     StartRunResult,
 )
-from .utils import get_loadable_targets, max_rx_bytes, max_send_bytes
+from .utils import (
+    COMPRESSION_METADATA_KEY,
+    get_loadable_targets,
+    max_rx_bytes,
+    max_send_bytes,
+)
 
 EVENT_QUEUE_POLL_INTERVAL = 0.1
 
@@ -93,11 +120,124 @@
 
 STREAMING_CHUNK_SIZE = 4000000
 
+# subset and execution plan snapshots are kept for this many distinct requests of each kind
+MAX_CACHED_SNAPSHOTS = 256
+
+T = TypeVar("T")
+
 
 class CouldNotBindGrpcServerToAddress(Exception):
     pass
 
 
+class SnapshotCache(Generic[T]):
+    """Snapshots that the server has already computed and serialized. The loaded code doesn't
+    change for the life of the server process, so they are kept until the least recently used
+    ones are evicted beyond max_entries.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None):
+        self._max_entries = check.opt_int_param(max_entries, "max_entries")
+        self._lock = threading.Lock()
+        self._values: OrderedDict[Hashable, T] = OrderedDict()
+        self._compute_locks: Dict[Hashable, threading.Lock] = {}
+
+    def get(self, key: Hashable) -> Optional[T]:
+        with self._lock:
+            if key not in self._values:
+                return None
+            self._values.move_to_end(key)
+            return self._values[key]
+
+    def set(self, key: Hashable, value: T) -> None:
+        with self._lock:
+            self._values[key] = value
+            self._values.move_to_end(key)
+            if self._max_entries is not None and len(self._values) > self._max_entries:
+                self._values.popitem(last=False)
+
+    def discard(self, key: Hashable) -> None:
+        with self._lock:
+            self._values.pop(key, None)
+
+    def get_or_compute(self, key: Hashable, compute_fn: Callable[[], T]) -> T:
+        """Callers that ask for the same missing key at once wait for the first one to compute it,
+        while missing values for other keys are computed concurrently.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        with self._lock:
+            compute_lock = self._compute_locks.setdefault(key, threading.Lock())
+        try:
+            with compute_lock:
+                value = self.get(key)
+                if value is None:
+                    value = compute_fn()
+                    self.set(key, value)
+                return value
+        finally:
+            with self._lock:
+                self._compute_locks.pop(key, None)
+
+
+class CachingIterator(Generic[T]):
+    """Keeps the items of an iterator as they are computed, so that any number of callers can
+    iterate over them, including while later items are still being computed. Whichever caller is
+    furthest along computes the next item. An error computing an item is raised to every caller
+    that reaches it.
+    """
+
+    def __init__(self, iterator: Iterator[T]):
+        self._iterator: Optional[Iterator[T]] = iterator
+        self._items: List[T] = []
+        self._error: Optional[Exception] = None
+        self._lock = threading.Lock()
+
+    def __iter__(self) -> Iterator[T]:
+        index = 0
+        while True:
+            # items are only ever appended, so computed ones can be read without the lock
+            if index >= len(self._items):
+                with self._lock:
+                    if index >= len(self._items) and not self._compute_next_item():
+                        return
+            yield self._items[index]
+            index += 1
+
+    def _compute_next_item(self) -> bool:
+        if self._error is not None:
+            raise self._error
+        if self._iterator is None:
+            return False
+
+        try:
+            self._items.append(next(self._iterator))
+            return True
+        except StopIteration:
+            self._iterator = None
+            return False
+        except Exception as e:
+            self._error = e
+            self._iterator = None
+            raise
+
+
+def _hash_serialized_args(serialized_args: str) -> str:
+    return hashlib.sha1(serialized_args.encode("utf-8")).hexdigest()
+
+
+class SerializedRepositoryDataPiece(NamedTuple):
+    """A serialized piece of an ExternalRepositoryData with its key and content hash, which clients
+    compare to the hashes of the pieces they already have.
+    """
+
+    key: str
+    content_hash: str
+    serialized: str
+
+
 class LoadedRepositories:
     def __init__(
         self,
@@ -190,6 +330,55 @@ def _get_code_pointer(
         check.failed("Invalid loadable target origin")
 
 
+def _split_serialized_pieces_into_events(
+    pieces: Iterator[str],
+) -> Iterator[api_pb2.StreamingExternalRepositoryEvent]:  # type: ignore
+    """Splits each serialized piece into chunks of at most STREAMING_CHUNK_SIZE, with end_of_piece
+    set on the last chunk of each piece. Only the piece that is being sent is held in memory.
+    """
+    sequence_number = 0
+    for piece in pieces:
+        for start_index in range(0, max(len(piece), 1), STREAMING_CHUNK_SIZE):
+            end_index = start_index + STREAMING_CHUNK_SIZE
+            yield api_pb2.StreamingExternalRepositoryEvent(
+                sequence_number=sequence_number,
+                serialized_external_repository_chunk=piece[start_index:end_index],
+                end_of_piece=end_index >= len(piece),
+            )
+            sequence_number += 1
+
+
+class ResponseCompressionInterceptor(grpc.ServerInterceptor):
+    """Compresses each response like the client compressed its request, as named in the request's
+    metadata. Responses to clients that don't name their compression use the server's default.
+    """
+
+    def intercept_service(self, continuation, handler_call_details):
+        handler = continuation(handler_call_details)
+        compression_name = dict(handler_call_details.invocation_metadata or []).get(
+            COMPRESSION_METADATA_KEY
+        )
+        if handler is None or compression_name not in grpc.Compression.__members__:
+            return handler
+
+        compression = grpc.Compression[compression_name]
+
+        def _with_compression(behavior):
+            if behavior is None:
+                return None
+
+            def _behavior(request, context):
+                context.set_compression(compression)
+                return behavior(request, context)
+
+            return _behavior
+
+        return handler._replace(
+            unary_unary=_with_compression(handler.unary_unary),
+            unary_stream=_with_compression(handler.unary_stream),
+        )
+
+
 class DagsterApiServer(DagsterApiServicer):
     # The loadable_target_origin is currently Noneable to support instaniating a server.
     # This helps us test the ping methods, and incrementally migrate each method to
@@ -240,6 +429,25 @@ def __init__(
 
         self._serializable_load_error = None
 
+        # Snapshots are only cached for repositories whose definitions are cached too, see
+        # _can_cache_snapshots. Clients that all reload at once wait for the first one to compute
+        # each snapshot rather than each computing it, see SnapshotCache.get_or_compute.
+        # Repository and job snapshots are keyed by repository name and defer_snapshots or job
+        # name, so they hold at most one entry for each of the loaded repositories and jobs, which
+        # don't change for the life of the process. Only subset and execution plan snapshots,
+        # which are keyed by arbitrary request arguments, need a bound.
+        self._serialized_external_repository_data_cache: SnapshotCache[str] = SnapshotCache()
+        self._serialized_external_repository_data_pieces_cache: SnapshotCache[
+            CachingIterator[SerializedRepositoryDataPiece]
+        ] = SnapshotCache()
+        self._serialized_job_data_cache: SnapshotCache[str] = SnapshotCache()
+        self._serialized_job_subset_result_cache: SnapshotCache[str] = SnapshotCache(
+            MAX_CACHED_SNAPSHOTS
+        )
+        self._serialized_execution_plan_snapshot_cache: SnapshotCache[str] = SnapshotCache(
+            MAX_CACHED_SNAPSHOTS
+        )
+
         self._entry_point = (
             check.sequence_param(entry_point, "entry_point", of_type=str)
             if entry_point is not None
@@ -366,6 +574,10 @@ def _get_repo_for_origin(
             )
         return loaded_repos.definitions_by_name[external_repo_origin.repository_name]
 
+    def _can_cache_snapshots(self, repository_def: RepositoryDefinition) -> bool:
+        # repositories with custom RepositoryData may return different definitions on each call
+        return repository_def.has_cached_definitions
+
     def Ping(self, request, _context) -> api_pb2.PingReply:  # type: ignore
         echo = request.echo
         return api_pb2.PingReply(echo=echo)  # type: ignore
@@ -389,14 +601,40 @@ def ExecutionPlanSnapshot(self, request, _context):
             request.serialized_execution_plan_snapshot_args,
             ExecutionPlanSnapshotArgs,
         )
-
-        execution_plan_snapshot_or_error = get_external_execution_plan_snapshot(
-            self._get_repo_for_origin(execution_plan_args.job_origin.external_repository_origin),
-            execution_plan_args.job_origin.job_name,
-            execution_plan_args,
+        repository_def = self._get_repo_for_origin(
+            execution_plan_args.job_origin.external_repository_origin
+        )
+        # The args include the selection, run config and known state that the plan is built from.
+        cache_key = _hash_serialized_args(request.serialized_execution_plan_snapshot_args)
+        serialized_execution_plan_snapshot = (
+            self._serialized_execution_plan_snapshot_cache.get(cache_key)
+            if self._can_cache_snapshots(repository_def)
+            else None
         )
+
+        if serialized_execution_plan_snapshot is None:
+            execution_plan_snapshot_or_error = get_external_execution_plan_snapshot(
+                repository_def,
+                execution_plan_args.job_origin.job_name,
+                execution_plan_args,
+            )
+            serialized_execution_plan_snapshot = serialize_value(execution_plan_snapshot_or_error)
+            if self._can_cache_snapshots(repository_def) and not isinstance(
+                execution_plan_snapshot_or_error, ExecutionPlanSnapshotErrorData
+            ):
+                job_def = repository_def.get_job(execution_plan_args.job_origin.job_name)
+                run_tags = execution_plan_args.tags
+                # memoized plans and plans that skip unchanged steps depend on the instance
+                depends_on_instance = job_def.is_using_memoization(
+                    run_tags
+                ) or job_def.is_skipping_unchanged_steps(run_tags)
+                if not depends_on_instance:
+                    self._serialized_execution_plan_snapshot_cache.set(
+                        cache_key, serialized_execution_plan_snapshot
+                    )
+
         return api_pb2.ExecutionPlanSnapshotReply(
-            serialized_execution_plan_snapshot=serialize_value(execution_plan_snapshot_or_error)
+            serialized_execution_plan_snapshot=serialized_execution_plan_snapshot
         )
 
     def ListRepositories(self, request, _context) -> api_pb2.ListRepositoriesReply:  # type: ignore
@@ -544,16 +782,33 @@ def ExternalPipelineSubsetSnapshot(
                 request.serialized_pipeline_subset_snapshot_args,
                 JobSubsetSnapshotArgs,
             )
-            serialized_external_pipeline_subset_result = serialize_value(
-                get_external_pipeline_subset_result(
-                    self._get_repo_for_origin(
-                        job_subset_snapshot_args.job_origin.external_repository_origin
-                    ),
+            repository_def = self._get_repo_for_origin(
+                job_subset_snapshot_args.job_origin.external_repository_origin
+            )
+            cache_key = _hash_serialized_args(request.serialized_pipeline_subset_snapshot_args)
+            serialized_external_pipeline_subset_result = (
+                self._serialized_job_subset_result_cache.get(cache_key)
+                if self._can_cache_snapshots(repository_def)
+                else None
+            )
+
+            if serialized_external_pipeline_subset_result is None:
+                external_pipeline_subset_result = get_external_pipeline_subset_result(
+                    repository_def,
                     job_subset_snapshot_args.job_origin.job_name,
                     job_subset_snapshot_args.solid_selection,
                     job_subset_snapshot_args.asset_selection,
                 )
-            )
+                serialized_external_pipeline_subset_result = serialize_value(
+                    external_pipeline_subset_result
+                )
+                if (
+                    self._can_cache_snapshots(repository_def)
+                    and external_pipeline_subset_result.success
+                ):
+                    self._serialized_job_subset_result_cache.set(
+                        cache_key, serialized_external_pipeline_subset_result
+                    )
         except Exception:
             serialized_external_pipeline_subset_result = serialize_value(
                 ExternalJobSubsetResult(
@@ -572,11 +827,23 @@ def _get_serialized_external_repository_data(self, request):
                 ExternalRepositoryOrigin,
             )
 
-            return serialize_value(
-                external_repository_data_from_def(
-                    self._get_repo_for_origin(repository_origin),
-                    defer_snapshots=request.defer_snapshots,
+            repository_def = self._get_repo_for_origin(repository_origin)
+            # Deferred job snapshots are fetched by name later, which is only consistent
+            # with this response if the repository returns the same job definitions.
+            defer_snapshots = request.defer_snapshots and repository_def.has_cached_definitions
+
+            def _serialize():
+                return serialize_value(
+                    external_repository_data_from_def(
+                        repository_def, defer_snapshots=defer_snapshots
+                    )
                 )
+
+            if not self._can_cache_snapshots(repository_def):
+                return _serialize()
+
+            return self._serialized_external_repository_data_cache.get_or_compute(
+                (repository_def.name, defer_snapshots), _serialize
             )
         except Exception:
             return serialize_value(
@@ -596,8 +863,20 @@ def ExternalJob(self, request, _context) -> api_pb2.ExternalJobReply:  # type: i
                 ExternalRepositoryOrigin,
             )
 
-            job_def = self._get_repo_for_origin(repository_origin).get_job(request.job_name)
-            ser_job_data = serialize_value(external_job_data_from_def(job_def))
+            repository_def = self._get_repo_for_origin(repository_origin)
+
+            def _serialize():
+                return serialize_value(
+                    external_job_data_from_def(repository_def.get_job(request.job_name))
+                )
+
+            ser_job_data = (
+                self._serialized_job_data_cache.get_or_compute(
+                    (repository_def.name, request.job_name), _serialize
+                )
+                if self._can_cache_snapshots(repository_def)
+                else _serialize()
+            )
             return api_pb2.ExternalJobReply(serialized_job_data=ser_job_data)  # type: ignore
         except Exception:
             return api_pb2.ExternalJobReply(  # type: ignore
@@ -606,6 +885,57 @@ def ExternalJob(self, request, _context) -> api_pb2.ExternalJobReply:  # type: i
                 )
             )
 
+    def _iterate_serialized_external_repository_data_pieces(
+        self, repository_def: RepositoryDefinition, defer_snapshots: bool
+    ) -> Iterator[SerializedRepositoryDataPiece]:
+        # Deferred job snapshots are fetched by name later, which is only consistent
+        # with this response if the repository returns the same job definitions.
+        defer_snapshots = defer_snapshots and repository_def.has_cached_definitions
+
+        def _serialize_pieces():
+            for piece in external_repository_data_pieces_from_def(
+                repository_def, defer_snapshots=defer_snapshots
+            ):
+                serialized_piece = serialize_value(piece)
+                yield SerializedRepositoryDataPiece(
+                    key=external_repository_data_piece_key(piece),
+                    content_hash=_hash_serialized_args(serialized_piece),
+                    serialized=serialized_piece,
+                )
+
+        if not self._can_cache_snapshots(repository_def):
+            yield from _serialize_pieces()
+            return
+
+        # each piece is sent as soon as it is computed, while it is also kept for later requests
+        cache_key = (repository_def.name, defer_snapshots)
+        pieces = self._serialized_external_repository_data_pieces_cache.get_or_compute(
+            cache_key, lambda: CachingIterator(_serialize_pieces())
+        )
+        try:
+            yield from pieces
+        except Exception:
+            # errors are never cached
+            self._serialized_external_repository_data_pieces_cache.discard(cache_key)
+            raise
+
+    def _get_serialized_external_repository_data_pieces(self, request) -> Iterator[str]:
+        try:
+            repository_origin = deserialize_value(
+                request.serialized_repository_python_origin,
+                ExternalRepositoryOrigin,
+            )
+
+            for piece in self._iterate_serialized_external_repository_data_pieces(
+                self._get_repo_for_origin(repository_origin), request.defer_snapshots
+            ):
+                yield piece.serialized
+        except Exception:
+            # the client discards any pieces that were already sent
+            yield serialize_value(
+                ExternalRepositoryErrorData(serializable_error_info_from_exc_info(sys.exc_info()))
+            )
+
     def StreamingExternalRepository(self, request, _context):
         serialized_external_repository_data = self._get_serialized_external_repository_data(request)
 
@@ -627,6 +957,42 @@ def StreamingExternalRepository(self, request, _context):
                 ],
             )
 
+    def StreamingExternalRepositoryPieces(self, request, _context):
+        yield from _split_serialized_pieces_into_events(
+            self._get_serialized_external_repository_data_pieces(request)
+        )
+
+    def _get_serialized_external_repository_data_changes(self, request) -> Iterator[str]:
+        try:
+            args = deserialize_value(
+                request.serialized_external_repository_changes_args,
+                ExternalRepositoryChangesArgs,
+            )
+
+            # all pieces are hashed before any are sent, so that the hashes can be sent first
+            pieces = list(
+                self._iterate_serialized_external_repository_data_pieces(
+                    self._get_repo_for_origin(args.repository_origin), args.defer_snapshots
+                )
+            )
+        except Exception:
+            yield serialize_value(
+                ExternalRepositoryErrorData(serializable_error_info_from_exc_info(sys.exc_info()))
+            )
+            return
+
+        yield serialize_value(
+            ExternalRepositoryPieceHashes([(piece.key, piece.content_hash) for piece in pieces])
+        )
+        for piece in pieces:
+            if args.piece_hashes.get(piece.key) != piece.content_hash:
+                yield piece.serialized
+
+    def StreamingExternalRepositoryChanges(self, request, _context):
+        yield from _split_serialized_pieces_into_events(
+            self._get_serialized_external_repository_data_changes(request)
+        )
+
     def _split_serialized_data_into_chunk_events(self, serialized_data):
         num_chunks = int(math.ceil(float(len(serialized_data)) / STREAMING_CHUNK_SIZE))
         for i in range(num_chunks):
@@ -980,6 +1346,7 @@ def __init__(
                 thread_name_prefix="grpc-server-rpc-handler",
             ),
             compression=grpc.Compression.Gzip,
+            interceptors=[ResponseCompressionInterceptor()],
             options=[
                 ("grpc.max_send_message_length", max_send_bytes()),
                 ("grpc.max_receive_message_length", max_rx_bytes()),
@@ -1,6 +1,6 @@
 import base64
 import zlib
-from typing import AbstractSet, Any, Mapping, NamedTuple, Optional, Sequence
+from typing import AbstractSet, Any, Mapping, NamedTuple, Optional, Sequence, Tuple
 
 import dagster._check as check
 from dagster._core.code_pointer import CodePointer
@@ -38,6 +38,7 @@ class ExecutionPlanSnapshotArgs(
             ("instance_ref", Optional[InstanceRef]),
             ("asset_selection", Optional[AbstractSet[AssetKey]]),
             ("mode", str),
+            ("tags", Mapping[str, str]),
         ],
     )
 ):
@@ -52,6 +53,7 @@ def __new__(
         instance_ref: Optional[InstanceRef] = None,
         asset_selection: Optional[AbstractSet[AssetKey]] = None,
         mode: str = DEFAULT_MODE_NAME,
+        tags: Optional[Mapping[str, str]] = None,
     ):
         return super(ExecutionPlanSnapshotArgs, cls).__new__(
             cls,
@@ -70,6 +72,7 @@ def __new__(
             asset_selection=check.opt_nullable_set_param(
                 asset_selection, "asset_selection", of_type=AssetKey
             ),
+            tags=check.opt_mapping_param(tags, "tags", key_type=str, value_type=str),
         )
 
 
@@ -616,6 +619,59 @@ def __new__(
         )
 
 
+@whitelist_for_serdes
+class ExternalRepositoryChangesArgs(
+    NamedTuple(
+        "_ExternalRepositoryChangesArgs",
+        [
+            ("repository_origin", ExternalRepositoryOrigin),
+            ("defer_snapshots", bool),
+            ("piece_hashes", Mapping[str, str]),
+        ],
+    )
+):
+    """Asks for the pieces of a repository's ExternalRepositoryData that changed since the client
+    last fetched them. piece_hashes holds the hashes the client already has, keyed by
+    external_repository_data_piece_key.
+    """
+
+    def __new__(
+        cls,
+        repository_origin: ExternalRepositoryOrigin,
+        defer_snapshots: bool = False,
+        piece_hashes: Optional[Mapping[str, str]] = None,
+    ):
+        return super(ExternalRepositoryChangesArgs, cls).__new__(
+            cls,
+            repository_origin=check.inst_param(
+                repository_origin, "repository_origin", ExternalRepositoryOrigin
+            ),
+            defer_snapshots=check.bool_param(defer_snapshots, "defer_snapshots"),
+            piece_hashes=check.opt_mapping_param(
+                piece_hashes, "piece_hashes", key_type=str, value_type=str
+            ),
+        )
+
+
+@whitelist_for_serdes
+class ExternalRepositoryPieceHashes(
+    NamedTuple("_ExternalRepositoryPieceHashes", [("piece_hashes", Sequence[Tuple[str, str]])])
+):
+    """The key and content hash of every piece of a repository's ExternalRepositoryData, in the
+    order that the pieces are built in. Keys come from external_repository_data_piece_key.
+    """
+
+    def __new__(cls, piece_hashes: Sequence[Tuple[str, str]]):
+        return super(ExternalRepositoryPieceHashes, cls).__new__(
+            cls,
+            # serialized as lists, which keep their order unlike mappings
+            piece_hashes=[
+                (check.str_param(key, "key"), check.str_param(content_hash, "content_hash"))
+                for key, content_hash in check.sequence_param(piece_hashes, "piece_hashes")
+            ],
+        )
+
+
 @whitelist_for_serdes
 class ShutdownServerResult(
     NamedTuple(
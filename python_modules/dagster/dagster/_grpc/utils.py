@@ -11,6 +11,10 @@
 if TYPE_CHECKING:
     from dagster._core.workspace.autodiscovery import LoadableTarget
 
+# Invocation metadata with the name of the grpc.Compression that the client used for its request,
+# which the server also uses for its response.
+COMPRESSION_METADATA_KEY = "dagster-compression"
+
 
 def get_loadable_targets(
     python_file: Optional[str],
@@ -734,14 +734,6 @@ def _create_scheduler_run(
     run_config = run_request.run_config
     schedule_tags = run_request.tags
 
-    external_execution_plan = code_location.get_external_execution_plan(
-        external_job,
-        run_config,
-        step_keys_to_execute=None,
-        known_state=None,
-    )
-    execution_plan_snapshot = external_execution_plan.execution_plan_snapshot
-
     tags = merge_dicts(
         validate_tags(external_job.tags, allow_reserved_tags=False) or {},
         schedule_tags,
@@ -751,6 +743,16 @@ def _create_scheduler_run(
     if run_request.run_key:
         tags[RUN_KEY_TAG] = run_request.run_key
 
+    external_execution_plan = code_location.get_external_execution_plan(
+        external_job,
+        run_config,
+        step_keys_to_execute=None,
+        known_state=None,
+        instance=instance,
+        tags=tags,
+    )
+    execution_plan_snapshot = external_execution_plan.execution_plan_snapshot
+
     log_action(
         instance,
         SCHEDULED_RUN_CREATED,
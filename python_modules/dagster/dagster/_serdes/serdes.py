@@ -439,6 +439,11 @@ def __init__(
         self.skip_when_empty_fields = skip_when_empty_fields or set()
         self.field_serializers = field_serializers or {}
 
+        # Resolve the per-field packing configuration once, at registration time, rather than
+        # looking it up for every field of every value packed.
+        self._pack_plan = self._build_pack_plan(klass._fields)
+        self._has_after_pack_hook = type(self).after_pack is not NamedTupleSerializer.after_pack
+
     def unpack(
         self,
         unpacked_dict: Dict[str, UnpackedValue],
@@ -453,7 +458,7 @@ def unpack(
                 # Naively implements backwards compatibility by filtering arguments that aren't present in
                 # the constructor. If a property is present in the serialized object, but doesn't exist in
                 # the version of the class loaded into memory, that property will be completely ignored.
-                if loaded_name in self.constructor_param_names:
+                if loaded_name in self._constructor_param_name_set:
                     # custom unpack regardless of hook vs recursive descent
                     custom = self.field_serializers.get(loaded_name)
                     if custom:
@@ -509,11 +514,15 @@ def pack(
     ) -> Dict[str, JsonSerializableValue]:
         packed: Dict[str, JsonSerializableValue] = {}
         packed["__class__"] = self.get_storage_name()
-        for key, inner_value in value._asdict().items():
-            if key in self.skip_when_empty_fields and inner_value in EMPTY_VALUES_TO_SKIP:
+        # values of subclasses that declare additional fields fall back to an uncached plan
+        plan = (
+            self._pack_plan
+            if value._fields is self.klass._fields
+            else self._build_pack_plan(value._fields)
+        )
+        for (key, storage_key, custom, skip_when_empty), inner_value in zip(plan, value):
+            if skip_when_empty and inner_value in EMPTY_VALUES_TO_SKIP:
                 continue
-            storage_key = self.storage_field_names.get(key, key)
-            custom = self.field_serializers.get(key)
             if custom:
                 packed[storage_key] = custom.pack(
                     inner_value,
@@ -528,9 +537,23 @@ def pack(
                 )
         for key, default in self.old_fields.items():
             packed[key] = default
-        packed = self.after_pack(**packed)
+        if self._has_after_pack_hook:
+            packed = self.after_pack(**packed)
         return packed
 
+    def _build_pack_plan(
+        self, fields: Sequence[str]
+    ) -> Sequence[Tuple[str, str, Optional["FieldSerializer"], bool]]:
+        return [
+            (
+                key,
+                self.storage_field_names.get(key, key),
+                self.field_serializers.get(key),
+                key in self.skip_when_empty_fields,
+            )
+            for key in fields
+        ]
+
     # Hook: Modify the contents of the packed, json-serializable dict before it is converted to a
     # string.
     def after_pack(self, **packed_dict: JsonSerializableValue) -> Dict[str, JsonSerializableValue]:
@@ -541,6 +564,11 @@ def after_pack(self, **packed_dict: JsonSerializableValue) -> Dict[str, JsonSeri
     def constructor_param_names(self) -> Sequence[str]:
         return list(signature(self.klass.__new__).parameters.keys())
 
+    @property
+    @cached_method
+    def _constructor_param_name_set(self) -> AbstractSet[str]:
+        return frozenset(self.constructor_param_names)
+
     def get_storage_name(self) -> str:
         return self.storage_name or self.klass.__name__
 
@@ -662,15 +690,14 @@ def _pack_value(
 
     # inlined is_named_tuple_instance
     if isinstance(val, tuple) and hasattr(val, "_fields"):
-        klass_name = val.__class__.__name__
-        if not whitelist_map.has_tuple_serializer(klass_name):
+        serializer = whitelist_map.tuple_serializers.get(val.__class__.__name__)
+        if serializer is None:
             raise SerializationError(
                 (
                     "Can only serialize whitelisted namedtuples, received"
                     f" {val}.\nDescent path: {descent_path}"
                 ),
             )
-        serializer = whitelist_map.get_tuple_serializer(klass_name)
         return serializer.pack(cast(NamedTuple, val), whitelist_map, descent_path)
     if isinstance(val, Enum):
         klass_name = val.__class__.__name__
@@ -800,7 +827,8 @@ def __init__(self, message: str, value: Mapping[str, UnpackedValue]):
 def _unpack_object(val: dict, whitelist_map: WhitelistMap, context: UnpackContext):
     if "__class__" in val:
         klass_name = cast(str, val["__class__"])
-        if not whitelist_map.has_tuple_deserializer(klass_name):
+        deserializer = whitelist_map.tuple_deserializers.get(klass_name)
+        if deserializer is None:
             return context.observe_unknown_value(
                 UnknownSerdesValue(
                     f'Attempted to deserialize class "{klass_name}" which is not in the whitelist.',
@@ -809,7 +837,6 @@ def _unpack_object(val: dict, whitelist_map: WhitelistMap, context: UnpackContex
             )
 
         val.pop("__class__")
-        deserializer = whitelist_map.get_tuple_deserializer(klass_name)
         return deserializer.unpack(val, whitelist_map, context)
 
     if "__enum__" in val:
@@ -1,5 +1,5 @@
 from collections import defaultdict
-from typing import TYPE_CHECKING, Any, Dict, Mapping, Sequence, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Sequence, Set, Tuple, Union
 
 from dagster import _check as check
 
@@ -50,6 +50,28 @@ def __init__(
         for item in in_progress_tagged_items:
             self.update_counters_with_launched_item(item)
 
+    @property
+    def tag_keys(self) -> Set[str]:
+        """The tag keys that have concurrency limits."""
+        return {
+            *self._key_limits.keys(),
+            *(key for key, _ in self._key_value_limits.keys()),
+            *self._unique_value_limits.keys(),
+        }
+
+    def update_counters_with_tag_counts(self, tag_counts: Mapping[Tuple[str, str], int]) -> None:
+        """Add the number of in progress items with each tag key and value to the counters."""
+        for tag_tuple, count in tag_counts.items():
+            key, _ = tag_tuple
+            if key in self._key_limits:
+                self._key_counts[key] += count
+
+            if tag_tuple in self._key_value_limits:
+                self._key_value_counts[tag_tuple] += count
+
+            if key in self._unique_value_limits:
+                self._unique_value_counts[tag_tuple] += count
+
     def is_blocked(self, item: Union["DagsterRun", "ExecutionStep"]) -> bool:
         """True if there are in progress item which are blocking this item based on tag limits."""
         for key, value in item.tags.items():
@@ -85,3 +107,18 @@ def update_counters_with_launched_item(
 
             if key in self._unique_value_limits:
                 self._unique_value_counts[tag_tuple] += 1
+
+    def update_counters_with_completed_item(
+        self, item: Union["DagsterRun", "ExecutionStep"]
+    ) -> None:
+        """Remove a previously launched item from the counters."""
+        for key, value in item.tags.items():
+            if key in self._key_limits:
+                self._key_counts[key] -= 1
+
+            tag_tuple = (key, value)
+            if tag_tuple in self._key_value_limits:
+                self._key_value_counts[tag_tuple] -= 1
+
+            if key in self._unique_value_limits:
+                self._unique_value_counts[tag_tuple] -= 1
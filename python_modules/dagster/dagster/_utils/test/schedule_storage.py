@@ -385,6 +385,24 @@ def test_get_instigator_state(self, storage):
 
         assert state.instigator_name == "my_sensor"
 
+    def test_get_batch_instigator_states(self, storage):
+        assert storage
+
+        state = self.build_sensor("my_sensor")
+        state_2 = self.build_sensor("my_sensor_2")
+        storage.add_instigator_state(state)
+        storage.add_instigator_state(state_2)
+        storage.add_instigator_state(self.build_sensor("my_sensor_3"))
+
+        states = storage.get_batch_instigator_states(
+            [state.selector_id, state_2.selector_id, "fake_selector"]
+        )
+        assert set(states.keys()) == {state.selector_id, state_2.selector_id}
+        assert states[state.selector_id].instigator_name == "my_sensor"
+        assert states[state_2.selector_id].instigator_name == "my_sensor_2"
+
+        assert storage.get_batch_instigator_states([]) == {}
+
     def test_get_instigator_state_not_found(self, storage):
         assert storage
 
@@ -84,6 +84,16 @@ def dynamic_asset():
     return 1
 
 
+@asset(code_version="1")
+def versioned_asset():
+    return 1
+
+
+@asset
+def unversioned_asset(versioned_asset):
+    return versioned_asset + 1
+
+
 def throw_error(_):
     raise Exception("womp womp")
 
@@ -183,6 +193,9 @@ def bar_repo():
             "fail": fail_job,
             "foo": foo_job,
             "forever": forever_job,
+            "versioned_job": define_asset_job(
+                "versioned_job", [versioned_asset, unversioned_asset]
+            ).resolve([versioned_asset, unversioned_asset], []),
         },
         "schedules": define_bar_schedules(),
         "sensors": {
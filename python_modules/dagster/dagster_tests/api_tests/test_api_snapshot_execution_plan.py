@@ -1,13 +1,16 @@
 import re
 
 import pytest
+from dagster import SKIP_UNCHANGED_STEPS_TAG, materialize
 from dagster._api.snapshot_execution_plan import sync_get_external_execution_plan_grpc
 from dagster._core.definitions.events import AssetKey
 from dagster._core.errors import DagsterUserCodeProcessError
+from dagster._core.execution.plan.plan import ExecutionPlan
 from dagster._core.host_representation.handle import JobHandle
 from dagster._core.instance import DagsterInstance
 from dagster._core.snap.execution_plan_snapshot import ExecutionPlanSnapshot
 
+from .api_tests_repo import unversioned_asset, versioned_asset
 from .utils import get_bar_repo_code_location
 
 
@@ -87,3 +90,64 @@ def test_execution_plan_with_subset_snapshot_api_grpc(instance: DagsterInstance)
             "do_input",
         ]
         assert len(execution_plan_snapshot.steps) == 1
+
+
+def test_execution_plan_skipping_unchanged_steps_snapshot_api_grpc(instance: DagsterInstance):
+    materialize([versioned_asset, unversioned_asset], instance=instance)
+
+    with get_bar_repo_code_location(instance) as code_location:
+        external_job = code_location.get_repository("bar_repo").get_full_external_job(
+            "versioned_job"
+        )
+
+        # the run tags are sent to the code server, which builds the plan without the step of the
+        # unchanged versioned asset
+        execution_plan = code_location.get_external_execution_plan(
+            external_job,
+            run_config={},
+            step_keys_to_execute=None,
+            known_state=None,
+            instance=instance,
+            tags={SKIP_UNCHANGED_STEPS_TAG: "true"},
+        )
+        execution_plan_snapshot = execution_plan.execution_plan_snapshot
+        assert execution_plan_snapshot.step_keys_to_execute == ["unversioned_asset"]
+
+        # the run worker rebuilds the same plan from the stored snapshot
+        rebuilt_plan = ExecutionPlan.rebuild_from_snapshot("versioned_job", execution_plan_snapshot)
+        assert rebuilt_plan.step_keys_to_execute == ["unversioned_asset"]
+
+        execution_plan = code_location.get_external_execution_plan(
+            external_job,
+            run_config={},
+            step_keys_to_execute=None,
+            known_state=None,
+            instance=instance,
+        )
+        assert execution_plan.execution_plan_snapshot.step_keys_to_execute == [
+            "versioned_asset",
+            "unversioned_asset",
+        ]
+
+
+def test_execution_plan_skipping_unchanged_steps_not_cached(instance: DagsterInstance):
+    with get_bar_repo_code_location(instance) as code_location:
+        external_job = code_location.get_repository("bar_repo").get_full_external_job(
+            "versioned_job"
+        )
+
+        def _get_step_keys_to_execute():
+            return code_location.get_external_execution_plan(
+                external_job,
+                run_config={},
+                step_keys_to_execute=None,
+                known_state=None,
+                instance=instance,
+                tags={SKIP_UNCHANGED_STEPS_TAG: "true"},
+            ).execution_plan_snapshot.step_keys_to_execute
+
+        assert _get_step_keys_to_execute() == ["versioned_asset", "unversioned_asset"]
+
+        # the same request is answered with a new plan once the versioned asset is materialized
+        materialize([versioned_asset, unversioned_asset], instance=instance)
+        assert _get_step_keys_to_execute() == ["unversioned_asset"]
@@ -1,9 +1,15 @@
 import sys
 
 import pytest
-from dagster._api.snapshot_job import sync_get_external_job_subset_grpc
+from dagster._api.snapshot_job import (
+    sync_get_external_job_grpc,
+    sync_get_external_job_subset_grpc,
+)
 from dagster._core.errors import DagsterUserCodeProcessError
-from dagster._core.host_representation.external_data import ExternalJobSubsetResult
+from dagster._core.host_representation.external_data import (
+    ExternalJobData,
+    ExternalJobSubsetResult,
+)
 from dagster._core.host_representation.handle import JobHandle
 from dagster._grpc.types import JobSubsetSnapshotArgs
 from dagster._serdes import deserialize_value
@@ -29,6 +35,20 @@ def test_job_snapshot_api_grpc(instance):
         assert external_job_subset_result.external_job_data.name == "foo"
 
 
+def test_job_data_api_grpc(instance):
+    with get_bar_repo_code_location(instance) as code_location:
+        repository_origin = code_location.get_repository("bar_repo").get_external_origin()
+
+        external_job_data = sync_get_external_job_grpc(
+            code_location.client, repository_origin, "foo"
+        )
+        assert isinstance(external_job_data, ExternalJobData)
+        assert external_job_data.name == "foo"
+
+        with pytest.raises(DagsterUserCodeProcessError):
+            sync_get_external_job_grpc(code_location.client, repository_origin, "does_not_exist")
+
+
 def test_job_snapshot_deserialize_error(instance):
     with get_bar_repo_code_location(instance) as code_location:
         job_handle = JobHandle("foo", code_location.get_repository("bar_repo").handle)
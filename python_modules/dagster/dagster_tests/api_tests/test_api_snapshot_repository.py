@@ -1,10 +1,12 @@
 import sys
 from contextlib import contextmanager
 
+import grpc
 import pytest
 from dagster import job, op, repository
 from dagster._api.snapshot_repository import (
     sync_get_streaming_external_repositories_data_grpc,
+    sync_get_streaming_external_repository_pieces_grpc,
 )
 from dagster._core.errors import DagsterUserCodeProcessError
 from dagster._core.host_representation import (
@@ -12,13 +14,25 @@
     ManagedGrpcPythonEnvCodeLocationOrigin,
 )
 from dagster._core.host_representation.external import ExternalRepository
-from dagster._core.host_representation.external_data import ExternalJobData
+from dagster._core.host_representation.external_data import (
+    ExternalJobData,
+    ExternalRepositoryErrorData,
+    external_repository_data_from_pieces,
+)
 from dagster._core.host_representation.handle import RepositoryHandle
 from dagster._core.host_representation.origin import ExternalRepositoryOrigin
 from dagster._core.instance import DagsterInstance
+from dagster._core.snap import create_job_snapshot_id
 from dagster._core.test_utils import instance_for_test
 from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
-from dagster._serdes.serdes import deserialize_value
+from dagster._grpc import (
+    client as grpc_client,
+    server as grpc_server,
+)
+from dagster._grpc.__generated__ import DagsterApiStub, api_pb2
+from dagster._grpc.client import _join_serialized_pieces
+from dagster._grpc.types import ExternalRepositoryChangesArgs, ExternalRepositoryPieceHashes
+from dagster._serdes.serdes import deserialize_value, serialize_value
 
 from .utils import get_bar_repo_code_location
 
@@ -49,6 +63,180 @@ def test_streaming_external_repositories_error(instance):
             sync_get_streaming_external_repositories_data_grpc(code_location.client, code_location)
 
 
+def test_streaming_external_repository_pieces(instance):
+    with get_bar_repo_code_location(instance) as code_location:
+        repo_origin = ExternalRepositoryOrigin(code_location.origin, "bar_repo")
+        expected = deserialize_value(
+            code_location.client.external_repository(repo_origin), ExternalRepositoryData
+        )
+
+        pieces = [
+            deserialize_value(piece)
+            for piece in code_location.client.streaming_external_repository_pieces(repo_origin)
+        ]
+        # the repository, then each of its schedules, asset nodes, sensors and jobs
+        assert len(pieces) == 1 + sum(
+            len(items)
+            for items in (
+                expected.external_schedule_datas,
+                expected.external_sensor_datas,
+                expected.external_asset_graph_data,
+                expected.external_job_datas,
+            )
+        )
+        assert external_repository_data_from_pieces(pieces) == expected
+
+        # clients that don't ask for pieces get the whole repository data in chunks
+        legacy_chunks = code_location.client.streaming_external_repository(repo_origin)
+        assert (
+            deserialize_value(
+                "".join(chunk["serialized_external_repository_chunk"] for chunk in legacy_chunks),
+                ExternalRepositoryData,
+            )
+            == expected
+        )
+
+
+def test_streaming_external_repository_changes(instance):
+    with get_bar_repo_code_location(instance) as code_location:
+        repo_origin = ExternalRepositoryOrigin(code_location.origin, "bar_repo")
+        pieces = sync_get_streaming_external_repository_pieces_grpc(
+            code_location.client, repo_origin, defer_snapshots=True
+        )
+        assert list(pieces)[0] == "repository"
+        assert all(hashed_piece.content_hash for hashed_piece in pieces.values())
+        assert external_repository_data_from_pieces(
+            hashed_piece.piece for hashed_piece in pieces.values()
+        ) == deserialize_value(
+            code_location.client.external_repository(repo_origin, defer_snapshots=True),
+            ExternalRepositoryData,
+        )
+
+        # only the hashes are sent when nothing changed
+        piece_hashes = {key: hashed_piece.content_hash for key, hashed_piece in pieces.items()}
+        unchanged = list(
+            code_location.client.streaming_external_repository_changes(
+                ExternalRepositoryChangesArgs(repo_origin, True, piece_hashes)
+            )
+        )
+        assert unchanged == [
+            serialize_value(ExternalRepositoryPieceHashes(list(piece_hashes.items())))
+        ]
+
+        changed = list(
+            code_location.client.streaming_external_repository_changes(
+                ExternalRepositoryChangesArgs(repo_origin, True, {**piece_hashes, "job:foo": "0"})
+            )
+        )
+        assert len(changed) == 2
+        assert deserialize_value(changed[1]) == pieces["job:foo"].piece
+
+        # pieces that didn't change are reused
+        refetched = sync_get_streaming_external_repository_pieces_grpc(
+            code_location.client, repo_origin, defer_snapshots=True, previous_pieces=pieces
+        )
+        assert list(refetched) == list(pieces)
+        assert all(refetched[key] is pieces[key] for key in pieces)
+
+        errors = list(
+            code_location.client.streaming_external_repository_changes(
+                ExternalRepositoryChangesArgs(
+                    ExternalRepositoryOrigin(code_location.origin, "does_not_exist")
+                )
+            )
+        )
+        assert len(errors) == 1
+        assert isinstance(deserialize_value(errors[0]), ExternalRepositoryErrorData)
+
+
+def test_streaming_external_repository_changes_unimplemented(instance, monkeypatch):
+    class OldServerStub(DagsterApiStub):
+        def __init__(self, channel):
+            super().__init__(channel)
+            # servers from before StreamingExternalRepositoryPieces don't have either method
+            self.StreamingExternalRepositoryPieces = channel.unary_stream(
+                "/api.DagsterApi/NotImplemented",
+                request_serializer=api_pb2.ExternalRepositoryRequest.SerializeToString,
+                response_deserializer=api_pb2.StreamingExternalRepositoryEvent.FromString,
+            )
+            self.StreamingExternalRepositoryChanges = channel.unary_stream(
+                "/api.DagsterApi/NotImplemented",
+                request_serializer=api_pb2.ExternalRepositoryChangesRequest.SerializeToString,
+                response_deserializer=api_pb2.StreamingExternalRepositoryEvent.FromString,
+            )
+
+    monkeypatch.setattr(grpc_client, "DagsterApiStub", OldServerStub)
+
+    with get_bar_repo_code_location(instance) as code_location:
+        repo_origin = ExternalRepositoryOrigin(code_location.origin, "bar_repo")
+        pieces = sync_get_streaming_external_repository_pieces_grpc(
+            code_location.client, repo_origin
+        )
+        # the whole repository data arrives as a single piece
+        assert list(pieces) == ["repository"]
+        assert all(hashed_piece.content_hash is None for hashed_piece in pieces.values())
+        assert external_repository_data_from_pieces(
+            hashed_piece.piece for hashed_piece in pieces.values()
+        ) == deserialize_value(
+            code_location.client.external_repository(repo_origin), ExternalRepositoryData
+        )
+
+
+def test_compression_override(instance, monkeypatch):
+    with get_bar_repo_code_location(instance) as code_location:
+        repo_origin = ExternalRepositoryOrigin(code_location.origin, "bar_repo")
+        gzip_client = grpc_client.DagsterGrpcClient(
+            port=code_location.client.port,
+            socket=code_location.client.socket,
+            host=code_location.client.host,
+            compression=grpc.Compression.Gzip,
+        )
+
+        call_compressions = []
+        call_metadata = gzip_client._call_metadata  # noqa: SLF001
+
+        def _call_metadata(compression):
+            call_compressions.append(compression)
+            return call_metadata(compression)
+
+        monkeypatch.setattr(gzip_client, "_call_metadata", _call_metadata)
+
+        gzip_client.external_repository(repo_origin)
+        assert call_compressions == [grpc.Compression.Gzip]
+
+        call_compressions.clear()
+        no_compression = grpc.Compression.NoCompression
+        gzip_client.external_repository(repo_origin, compression=no_compression)
+        list(gzip_client.streaming_external_repository(repo_origin, compression=no_compression))
+        list(
+            gzip_client.streaming_external_repository_pieces(
+                repo_origin, compression=no_compression
+            )
+        )
+        list(
+            gzip_client.streaming_external_repository_changes(
+                ExternalRepositoryChangesArgs(
+                    repository_origin=repo_origin,
+                    defer_snapshots=False,
+                    piece_hashes={},
+                ),
+                compression=no_compression,
+            )
+        )
+        assert call_compressions == [no_compression] * 4
+
+
+def test_split_chunked_pieces(monkeypatch):
+    monkeypatch.setattr(grpc_server, "STREAMING_CHUNK_SIZE", 7)
+    pieces = ["a", "bcdefghijklmnopqrstu", "vw", "", "xyz" * 5]
+
+    events = list(grpc_server._split_serialized_pieces_into_events(iter(pieces)))  # noqa: SLF001
+    assert [event.sequence_number for event in events] == list(range(len(events)))
+    assert all(len(event.serialized_external_repository_chunk) <= 7 for event in events)
+    assert sum(event.end_of_piece for event in events) == len(pieces)
+    assert list(_join_serialized_pieces(events)) == pieces
+
+
 @op
 def do_something():
     return 1
@@ -126,7 +314,7 @@ def _ref_to_data(ref):
         external_repository_data = deserialize_value(ser_repo_data, ExternalRepositoryData)
         assert (
             external_repository_data.external_job_refs
-            and len(external_repository_data.external_job_refs) == 6
+            and len(external_repository_data.external_job_refs) == 7
         )
         assert external_repository_data.external_job_datas is None
 
@@ -136,7 +324,7 @@ def _ref_to_data(ref):
             ref_to_data_fn=_ref_to_data,
         )
         jobs = repo.get_all_external_jobs()
-        assert len(jobs) == 6
+        assert len(jobs) == 7
         assert _state.get("cnt", 0) == 0
 
         job = jobs[0]
@@ -162,3 +350,16 @@ def _ref_to_data(ref):
         job = repo.get_all_external_jobs()[0]
         _ = job.job_snapshot
         assert _state.get("cnt", 0) == 1
+
+
+def test_code_location_defers_snapshots(instance: DagsterInstance):
+    with get_bar_repo_code_location(instance) as code_location:
+        repo = code_location.get_repository("bar_repo")
+        assert repo.external_repository_data.external_job_datas is None
+        assert repo.external_repository_data.external_job_refs
+
+        external_job = repo.get_full_external_job("foo")
+        assert external_job.job_snapshot.name == "foo"
+        assert external_job.computed_job_snapshot_id == create_job_snapshot_id(
+            external_job.job_snapshot
+        )
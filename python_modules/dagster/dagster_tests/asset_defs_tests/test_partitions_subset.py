@@ -1,3 +1,5 @@
+from datetime import datetime
+
 import pytest
 from dagster import DailyPartitionsDefinition, MultiPartitionsDefinition, StaticPartitionsDefinition
 from dagster._core.definitions.multi_dimensional_partitions import MultiPartitionsSubset
@@ -78,3 +80,43 @@ def test_empty_subsets():
     assert type(composite.empty_subset()) is MultiPartitionsSubset
     assert type(static_partitions.empty_subset()) is DefaultPartitionsSubset
     assert type(time_window_partitions.empty_subset()) is TimeWindowPartitionsSubset
+
+
+@pytest.mark.parametrize(
+    "partitions_def",
+    [
+        DailyPartitionsDefinition(start_date="2015-01-01"),
+        # windows are not of fixed length across daylight savings transitions
+        DailyPartitionsDefinition(start_date="2015-01-01", timezone="US/Central"),
+    ],
+)
+def test_time_window_subset_operations(partitions_def: DailyPartitionsDefinition):
+    keys = partitions_def.get_partition_keys(current_time=datetime(2016, 1, 1))
+    left_keys = set(keys[10:200] + keys[300:310])
+    right_keys = set(keys[100:250] + keys[305:306])
+
+    left = partitions_def.empty_subset().with_partition_keys(left_keys)
+    right = partitions_def.empty_subset().with_partition_keys(right_keys)
+
+    assert isinstance(left, TimeWindowPartitionsSubset)
+    assert set((left | right).get_partition_keys()) == left_keys | right_keys
+    assert set((left & right).get_partition_keys()) == left_keys & right_keys
+    assert set((left - right).get_partition_keys()) == left_keys - right_keys
+    assert len(left - right) == len(left_keys - right_keys)
+    assert len((left | right).get_partition_key_ranges()) == 2
+
+    assert all(key in left for key in left_keys)
+    assert not any(key in left for key in set(keys) - left_keys)
+
+    deserialized = partitions_def.deserialize_subset(left.serialize())
+    assert deserialized == left
+    assert set(deserialized.get_partition_keys()) == left_keys
+
+
+def test_time_window_subset_contains_key_before_start():
+    partitions_def = DailyPartitionsDefinition(start_date="2021-07-01")
+    subset = partitions_def.empty_subset().with_partition_keys(["2021-07-01", "2021-07-02"])
+
+    assert "2021-07-01" in subset
+    assert "2021-06-30" not in subset
+    assert "2021-06-01" not in subset
@@ -0,0 +1,40 @@
+import os
+from gzip import GzipFile
+
+from dagster import job, op
+from dagster._cli.debug import export_run
+from dagster._core.debug import DebugRunPayload
+from dagster._core.test_utils import instance_for_test
+from dagster._serdes import deserialize_value
+from dagster._utils.test import get_temp_dir
+
+
+@op
+def noop_op(context):
+    context.log.info("hello")
+
+
+@job
+def noop_job():
+    noop_op()
+
+
+def test_export_run():
+    with instance_for_test() as instance, get_temp_dir() as temp_dir:
+        result = noop_job.execute_in_process(instance=instance)
+        run = instance.get_run_by_id(result.run_id)
+
+        output_file = os.path.join(temp_dir, "debug.gzip")
+        export_run(instance, run, output_file)
+
+        with GzipFile(output_file, "rb") as file:
+            debug_payload = deserialize_value(file.read().decode("utf-8"), DebugRunPayload)
+
+        expected_payload = DebugRunPayload.build(instance, run)
+        assert debug_payload.dagster_run == expected_payload.dagster_run
+        assert debug_payload.job_snapshot == expected_payload.job_snapshot
+        assert debug_payload.execution_plan_snapshot == expected_payload.execution_plan_snapshot
+        assert len(debug_payload.event_list) == len(expected_payload.event_list)
+        assert [event.message for event in debug_payload.event_list] == [
+            event.message for event in expected_payload.event_list
+        ]
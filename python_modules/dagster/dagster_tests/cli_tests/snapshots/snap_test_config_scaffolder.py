@@ -36,7 +36,11 @@
                     }
                 },
                 'tag_concurrency_limits': [
-                ]
+                ],
+                'worker_pool': {
+                    'max_memory_growth_mb': 0,
+                    'max_steps_per_worker': 0
+                }
             }
         }
     },
@@ -61,123 +65,3 @@
         }
     }
 }
-
-snapshots['test_two_modes 1'] = {
-}
-
-snapshots['test_two_modes 2'] = {
-    'execution': {
-        'in_process': {
-            'config': {
-                'marker_to_close': '',
-                'retries': {
-                    'disabled': {
-                    },
-                    'enabled': {
-                    }
-                }
-            }
-        },
-        'multiprocess': {
-            'config': {
-                'max_concurrent': 0,
-                'retries': {
-                    'disabled': {
-                    },
-                    'enabled': {
-                    }
-                },
-                'start_method': {
-                    'forkserver': {
-                        'preload_modules': [
-                        ]
-                    },
-                    'spawn': {
-                    }
-                },
-                'tag_concurrency_limits': [
-                ]
-            }
-        }
-    },
-    'loggers': {
-        'console': {
-            'config': {
-                'log_level': '',
-                'name': ''
-            }
-        }
-    },
-    'resources': {
-        'io_manager': {
-            'config': 'AnyType'
-        },
-        'value': {
-            'config': {
-                'mode_one_field': ''
-            }
-        }
-    },
-    'solids': {
-    }
-}
-
-snapshots['test_two_modes 3'] = {
-}
-
-snapshots['test_two_modes 4'] = {
-    'execution': {
-        'in_process': {
-            'config': {
-                'marker_to_close': '',
-                'retries': {
-                    'disabled': {
-                    },
-                    'enabled': {
-                    }
-                }
-            }
-        },
-        'multiprocess': {
-            'config': {
-                'max_concurrent': 0,
-                'retries': {
-                    'disabled': {
-                    },
-                    'enabled': {
-                    }
-                },
-                'start_method': {
-                    'forkserver': {
-                        'preload_modules': [
-                        ]
-                    },
-                    'spawn': {
-                    }
-                },
-                'tag_concurrency_limits': [
-                ]
-            }
-        }
-    },
-    'loggers': {
-        'console': {
-            'config': {
-                'log_level': '',
-                'name': ''
-            }
-        }
-    },
-    'resources': {
-        'io_manager': {
-            'config': 'AnyType'
-        },
-        'value': {
-            'config': {
-                'mode_two_field': 0
-            }
-        }
-    },
-    'solids': {
-    }
-}
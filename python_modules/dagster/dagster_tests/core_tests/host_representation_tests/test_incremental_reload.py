@@ -0,0 +1,114 @@
+import os
+from typing import Iterator
+
+import pytest
+from dagster import AssetKey
+from dagster._core.host_representation import code_location as code_location_module
+from dagster._core.host_representation.code_location import GrpcServerCodeLocation
+from dagster._core.instance import DagsterInstance
+from dagster._core.test_utils import instance_for_test
+from dagster._core.workspace.context import WorkspaceProcessContext
+from dagster._core.workspace.load_target import PythonFileTarget
+
+REPOSITORY_SOURCE = """
+from dagster import ScheduleDefinition, asset, job, op, repository, sensor
+
+
+@asset
+def upstream():
+    return 1
+
+
+@asset(description="{description}")
+def downstream(upstream):
+    return upstream + 1
+
+
+@op
+def do_something():
+    return 1
+
+
+@job
+def foo_job():
+    do_something()
+
+
+@sensor(job=foo_job)
+def foo_sensor():
+    pass
+
+
+@repository
+def bar_repo():
+    return [
+        upstream,
+        downstream,
+        foo_job,
+        foo_sensor,
+        ScheduleDefinition(job=foo_job, cron_schedule="@daily"),
+    ]
+"""
+
+
+def _write_repository(python_file: str, description: str) -> None:
+    with open(python_file, "w") as f:
+        f.write(REPOSITORY_SOURCE.format(description=description))
+
+
+@pytest.fixture(name="instance")
+def instance_fixture() -> Iterator[DagsterInstance]:
+    with instance_for_test() as instance:
+        yield instance
+
+
+def test_reload_only_replaces_changed_pieces(instance, tmp_path, monkeypatch):
+    python_file = os.path.join(str(tmp_path), "repo.py")
+    _write_repository(python_file, "before")
+
+    job_fetches = []
+    sync_get_external_job_grpc = code_location_module.sync_get_external_job_grpc
+
+    def _counted_sync_get_external_job_grpc(*args, **kwargs):
+        job_fetches.append(args)
+        return sync_get_external_job_grpc(*args, **kwargs)
+
+    monkeypatch.setattr(
+        code_location_module, "sync_get_external_job_grpc", _counted_sync_get_external_job_grpc
+    )
+
+    with WorkspaceProcessContext(
+        instance,
+        PythonFileTarget(
+            python_file=python_file,
+            attribute="bar_repo",
+            working_directory=None,
+            location_name="test",
+        ),
+    ) as workspace_process_context:
+        code_location = workspace_process_context.create_request_context().get_code_location("test")
+        assert isinstance(code_location, GrpcServerCodeLocation)
+        code_location.get_repository("bar_repo").get_full_external_job("foo_job").job_snapshot
+        assert len(job_fetches) == 1
+        pieces = code_location._external_repository_pieces["bar_repo"]  # noqa: SLF001
+
+        _write_repository(python_file, "after")
+        workspace_process_context.reload_code_location("test")
+
+        reloaded_location = workspace_process_context.create_request_context().get_code_location(
+            "test"
+        )
+        assert reloaded_location is not code_location
+        reloaded_pieces = reloaded_location._external_repository_pieces["bar_repo"]  # noqa: SLF001
+        assert list(reloaded_pieces) == list(pieces)
+
+        # the asset's description is also part of the snapshot of the asset job
+        changed_keys = [key for key in pieces if reloaded_pieces[key] is not pieces[key]]
+        assert changed_keys == ['asset:["downstream"]', "job:__ASSET_JOB"]
+        reloaded_repo = reloaded_location.get_repository("bar_repo")
+        asset_node = reloaded_repo.get_external_asset_node(AssetKey("downstream"))
+        assert asset_node and asset_node.op_description == "after"
+
+        # foo_job didn't change, so its snapshot isn't fetched again
+        assert reloaded_repo.get_full_external_job("foo_job").job_snapshot
+        assert len(job_fetches) == 1
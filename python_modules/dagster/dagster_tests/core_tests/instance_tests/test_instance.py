@@ -1,4 +1,7 @@
+import logging
 import re
+import threading
+import time
 from typing import Any, Mapping, Optional
 
 import pytest
@@ -8,6 +11,7 @@
     _seven,
     asset,
     execute_job,
+    in_process_executor,
     job,
     op,
     reconstructable,
@@ -20,10 +24,13 @@
     DagsterInvalidConfigError,
     DagsterInvariantViolationError,
 )
+from dagster._core.events import DagsterEvent, DagsterEventType, EngineEventData
 from dagster._core.execution.api import create_execution_plan
-from dagster._core.instance import DagsterInstance, InstanceRef
+from dagster._core.execution.plan.objects import StepSuccessData
+from dagster._core.instance import EVENT_BUFFER_MAX_LATENCY, DagsterInstance, InstanceRef
 from dagster._core.instance.config import DEFAULT_LOCAL_CODE_SERVER_STARTUP_TIMEOUT
 from dagster._core.launcher import LaunchRunContext, RunLauncher
+from dagster._core.log_manager import DagsterLogManager
 from dagster._core.run_coordinator.queued_run_coordinator import QueuedRunCoordinator
 from dagster._core.secrets.env_file import EnvFileLoader
 from dagster._core.snap import (
@@ -675,3 +682,202 @@ def test_configurable_class_missing_methods():
             }
         ) as instance:
             print(instance.run_launcher)  # noqa: T201
+
+
+def test_buffered_log_events():
+    with instance_for_test() as instance:
+        run = create_run_for_test(instance, job_name="foo_job")
+        log_manager = DagsterLogManager.create(loggers=[], instance=instance, dagster_run=run)
+
+        store_events_calls = []
+        store_events = instance.event_log_storage.store_events
+
+        def _store_events(events):
+            store_events_calls.append(len(events))
+            store_events(events)
+
+        instance.event_log_storage.store_events = _store_events  # type: ignore
+
+        for i in range(5):
+            log_manager.info(f"message {i}")
+
+        # log messages are written to the event log in a single batch, within the latency window
+        attempts = 20
+        while not store_events_calls and attempts > 0:
+            time.sleep(EVENT_BUFFER_MAX_LATENCY)
+            attempts -= 1
+        assert store_events_calls == [5]
+        assert [event.user_message for event in instance.all_logs(run.run_id)] == [
+            f"message {i}" for i in range(5)
+        ]
+
+        # other events flush the buffer before they are written, preserving order
+        log_manager.info("buffered")
+        log_manager.log_dagster_event(
+            logging.INFO,
+            "engine event",
+            DagsterEvent(
+                DagsterEventType.ENGINE_EVENT.value,
+                job_name="foo_job",
+                event_specific_data=EngineEventData(),
+            ),
+        )
+        assert store_events_calls == [5, 1]
+        assert [event.user_message for event in instance.all_logs(run.run_id)][-2:] == [
+            "buffered",
+            "engine event",
+        ]
+
+        # so do events written directly to the instance
+        log_manager.info("buffered again")
+        instance.report_engine_event("direct engine event", run)
+        assert store_events_calls == [5, 1, 1]
+        assert [
+            event.user_message or event.get_dagster_event().message
+            for event in instance.all_logs(run.run_id)
+        ][-2:] == ["buffered again", "direct engine event"]
+
+
+def test_batched_event_writes():
+    with instance_for_test() as instance:
+        run = create_run_for_test(instance, job_name="foo_job")
+        log_manager = DagsterLogManager.create(loggers=[], instance=instance, dagster_run=run)
+
+        store_events_calls = []
+        store_events = instance.event_log_storage.store_events
+
+        def _store_events(events):
+            store_events_calls.append(len(events))
+            store_events(events)
+
+        instance.event_log_storage.store_events = _store_events  # type: ignore
+
+        def _log_dagster_event(event_type, message, **kwargs):
+            log_manager.log_dagster_event(
+                logging.INFO,
+                message,
+                DagsterEvent(event_type.value, job_name="foo_job", step_key="foo", **kwargs),
+            )
+
+        with instance.batch_event_writes():
+            assert instance.is_batching_event_writes
+
+            _log_dagster_event(DagsterEventType.STEP_START, "step start")
+            log_manager.info("buffered")
+            assert store_events_calls == []
+
+            # events that end a step flush the buffer
+            _log_dagster_event(
+                DagsterEventType.STEP_SUCCESS,
+                "step success",
+                event_specific_data=StepSuccessData(duration_ms=1.0),
+            )
+            assert store_events_calls == [3]
+
+            # events written directly to the instance flush the buffer first, preserving order
+            _log_dagster_event(
+                DagsterEventType.ENGINE_EVENT, "engine event", event_specific_data=EngineEventData()
+            )
+            instance.report_engine_event("direct engine event", run)
+            assert store_events_calls == [3, 1]
+
+            log_manager.info("flushed on exit")
+
+        assert not instance.is_batching_event_writes
+        assert store_events_calls == [3, 1, 1]
+        assert [
+            event.user_message or event.get_dagster_event().message
+            for event in instance.all_logs(run.run_id)
+        ] == [
+            "step start",
+            "buffered",
+            "step success",
+            "engine event",
+            "direct engine event",
+            "flushed on exit",
+        ]
+
+
+@op
+def chatty_op(context):
+    for i in range(20):
+        context.log.info(f"message {i}")
+    return 1
+
+
+@job
+def chatty_job():
+    chatty_op()
+
+
+def test_concurrent_runs_with_buffered_events():
+    with instance_for_test() as instance:
+        # store the job snapshot first, since concurrent runs would each try to insert it
+        assert chatty_job.execute_in_process(instance=instance).success
+        results = []
+
+        def _execute():
+            results.append(chatty_job.execute_in_process(instance=instance).success)
+
+        # each run logs through its own handler, which must not wait on the other handlers' locks
+        threads = [threading.Thread(target=_execute, daemon=True) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=60)
+
+        assert results == [True] * 4
+
+
+@op
+def slow_op():
+    # long enough for buffered events to be flushed by the flush timer
+    time.sleep(EVENT_BUFFER_MAX_LATENCY * 4)
+    return 1
+
+
+@job(executor_def=in_process_executor)
+def slow_job():
+    slow_op()
+
+
+def test_batched_event_write_failure_fails_run():
+    with instance_for_test() as instance:
+        store_events = instance.event_log_storage.store_events
+
+        def _store_events(events):
+            if any(event.dagster_event_type == DagsterEventType.STEP_START for event in events):
+                raise Exception("failed to write step start")
+            store_events(events)
+
+        instance.event_log_storage.store_events = _store_events  # type: ignore
+
+        with instance.batch_event_writes():
+            result = execute_job(reconstructable(slow_job), instance, raise_on_error=False)
+
+        assert not result.success
+        assert "failed to write step start" in str(
+            result.get_step_failure_events()[0].step_failure_data.error
+        )
+
+
+def test_batched_event_write_failure_raised_on_exit():
+    with instance_for_test() as instance:
+        run = create_run_for_test(instance, job_name="foo_job")
+        log_manager = DagsterLogManager.create(loggers=[], instance=instance, dagster_run=run)
+
+        def _store_events(_events):
+            raise Exception("failed to write")
+
+        instance.event_log_storage.store_events = _store_events  # type: ignore
+
+        with pytest.raises(Exception, match="failed to write"):
+            with instance.batch_event_writes():
+                log_manager.log_dagster_event(
+                    logging.INFO,
+                    "step start",
+                    DagsterEvent(
+                        DagsterEventType.STEP_START.value, job_name="foo_job", step_key="foo"
+                    ),
+                )
+                time.sleep(EVENT_BUFFER_MAX_LATENCY * 4)
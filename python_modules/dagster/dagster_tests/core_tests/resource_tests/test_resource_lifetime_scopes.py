@@ -0,0 +1,288 @@
+import os
+import tempfile
+
+import pytest
+from dagster import (
+    DagsterEventType,
+    Out,
+    ResourceLifetimeScope,
+    job,
+    op,
+    reconstructable,
+    resource,
+)
+from dagster._core.errors import DagsterInvalidDefinitionError
+from dagster._core.execution.api import execute_job
+from dagster._core.execution.resources_init import teardown_process_scoped_resources
+from dagster._core.test_utils import instance_for_test
+
+
+@pytest.fixture(autouse=True)
+def teardown_process_scoped_resources_after_test():
+    yield
+    teardown_process_scoped_resources()
+
+
+def _resource_init_events(result):
+    return [
+        event
+        for event in result.all_events
+        if event.event_type == DagsterEventType.RESOURCE_INIT_SUCCESS
+    ]
+
+
+def test_step_scoped_resource():
+    called = []
+
+    @resource(lifetime_scope=ResourceLifetimeScope.STEP)
+    def connection():
+        called.append("init")
+        yield "connection"
+        called.append("teardown")
+
+    @op(required_resource_keys={"connection"})
+    def first(context):
+        assert context.resources.connection == "connection"
+        assert called[-1] == "init"
+        return 1
+
+    @op(required_resource_keys={"connection"})
+    def second(context, _value):
+        assert called[-1] == "init"
+
+    @op
+    def no_resources(_value):
+        pass
+
+    @job(resource_defs={"connection": connection})
+    def step_scoped_job():
+        value = first()
+        second(value)
+        no_resources(value)
+
+    result = step_scoped_job.execute_in_process()
+    assert result.success
+    assert called == ["init", "teardown", "init", "teardown"]
+
+    # the io manager is initialized once for the run, the step-scoped resource once per step
+    init_events = _resource_init_events(result)
+    assert [event.step_key for event in init_events] == [None, "first", "second"]
+    for event in init_events[1:]:
+        assert "connection:init_time" in event.event_specific_data.metadata
+
+
+def test_step_scoped_resource_init_failure():
+    @resource(lifetime_scope=ResourceLifetimeScope.STEP)
+    def broken():
+        raise Exception("failed to connect")
+
+    @op(required_resource_keys={"broken"})
+    def uses_broken():
+        return 1
+
+    @op
+    def downstream(_value):
+        pass
+
+    @op
+    def independent():
+        pass
+
+    @job(resource_defs={"broken": broken})
+    def broken_job():
+        downstream(uses_broken())
+        independent()
+
+    result = broken_job.execute_in_process(raise_on_error=False)
+    assert not result.success
+    assert [event.step_key for event in result.get_step_failure_events()] == ["uses_broken"]
+    assert [event.step_key for event in result.get_step_success_events()] == ["independent"]
+    assert any(
+        event.event_type == DagsterEventType.RESOURCE_INIT_FAILURE
+        and event.step_key == "uses_broken"
+        for event in result.all_events
+    )
+
+
+def test_process_scoped_resource():
+    called = []
+
+    @resource(lifetime_scope=ResourceLifetimeScope.PROCESS, config_schema={"name": str})
+    def model(init_context):
+        called.append(f"init {init_context.resource_config['name']}")
+        yield init_context.resource_config["name"]
+        called.append(f"teardown {init_context.resource_config['name']}")
+
+    @resource(lifetime_scope=ResourceLifetimeScope.STEP, required_resource_keys={"model"})
+    def predictor(init_context):
+        return f"predictor for {init_context.resources.model}"
+
+    @op(required_resource_keys={"model", "predictor"})
+    def predict(context):
+        assert context.resources.predictor == f"predictor for {context.resources.model}"
+
+    @job(resource_defs={"model": model, "predictor": predictor})
+    def process_scoped_job():
+        predict()
+
+    def _run_config(name):
+        return {"resources": {"model": {"config": {"name": name}}}}
+
+    first = process_scoped_job.execute_in_process(run_config=_run_config("small"))
+    assert first.success
+    second = process_scoped_job.execute_in_process(run_config=_run_config("small"))
+    assert second.success
+    assert called == ["init small"]
+
+    metadata = _resource_init_events(second)[0].event_specific_data.metadata
+    assert metadata["model:reused"].value is True
+    assert "model:init_time" not in metadata
+
+    # changing the config of a process-scoped resource initializes a new instance
+    assert process_scoped_job.execute_in_process(run_config=_run_config("large")).success
+    assert called == ["init small", "init large"]
+
+    teardown_process_scoped_resources()
+    assert called == ["init small", "init large", "teardown large", "teardown small"]
+
+
+def test_process_scoped_resource_does_not_log_to_run():
+    @resource(lifetime_scope=ResourceLifetimeScope.PROCESS)
+    def model(init_context):
+        assert init_context.run_id is None
+        init_context.log.info("loading model")
+        yield "model"
+        init_context.log.info("unloading model")
+
+    @op(required_resource_keys={"model"})
+    def predict(context):
+        context.log.info(f"predicting with {context.resources.model}")
+
+    @job(resource_defs={"model": model})
+    def process_scoped_job():
+        predict()
+
+    with instance_for_test() as instance:
+        result = process_scoped_job.execute_in_process(instance=instance)
+        assert result.success
+        teardown_process_scoped_resources()
+
+        messages = [record.user_message for record in instance.all_logs(result.run_id)]
+        assert "predicting with model" in messages
+        assert "loading model" not in messages
+        assert "unloading model" not in messages
+
+
+def test_lifetime_scope_survives_configured():
+    @resource(lifetime_scope=ResourceLifetimeScope.PROCESS, config_schema={"name": str})
+    def model(_):
+        return None
+
+    assert model.lifetime_scope == ResourceLifetimeScope.PROCESS
+    assert model.configured({"name": "a"}).lifetime_scope == ResourceLifetimeScope.PROCESS
+
+
+def test_resource_requires_shorter_lifetime_scope():
+    @resource(lifetime_scope=ResourceLifetimeScope.STEP)
+    def connection():
+        return None
+
+    @resource(required_resource_keys={"connection"})
+    def client(_):
+        return None
+
+    @op(required_resource_keys={"client"})
+    def uses_client():
+        pass
+
+    with pytest.raises(
+        DagsterInvalidDefinitionError,
+        match=(
+            "Resource with key 'client' has lifetime scope RUN, but requires resource with key"
+            " 'connection', which has the shorter lifetime scope STEP"
+        ),
+    ):
+
+        @job(resource_defs={"connection": connection, "client": client})
+        def _invalid_job():
+            uses_client()
+
+
+def test_unused_resource_with_shorter_lifetime_scope():
+    @resource(lifetime_scope=ResourceLifetimeScope.STEP)
+    def connection():
+        return None
+
+    @resource(required_resource_keys={"connection"})
+    def client(_):
+        return None
+
+    @op(required_resource_keys={"connection"})
+    def uses_connection():
+        pass
+
+    # client is never initialized, so its scope is not checked against the one of connection
+    @job(resource_defs={"connection": connection, "client": client})
+    def valid_job():
+        uses_connection()
+
+    assert valid_job.execute_in_process().success
+
+
+@resource(lifetime_scope=ResourceLifetimeScope.PROCESS)
+def pid_resource():
+    log_dir = os.environ["RESOURCE_LIFETIME_TEST_DIR"]
+    with open(os.path.join(log_dir, f"init_{os.getpid()}"), "a") as f:
+        f.write("init\n")
+    yield os.getpid()
+    with open(os.path.join(log_dir, f"teardown_{os.getpid()}"), "a") as f:
+        f.write("teardown\n")
+
+
+@op(required_resource_keys={"pid"}, out=Out(int))
+def record_pid(context, _previous):
+    return context.resources.pid
+
+
+@op(required_resource_keys={"pid"}, out=Out(int))
+def first_pid(context):
+    return context.resources.pid
+
+
+@job(resource_defs={"pid": pid_resource})
+def worker_pool_job():
+    record_pid(record_pid(first_pid()))
+
+
+def test_process_scoped_resource_in_worker_pool(monkeypatch):
+    with tempfile.TemporaryDirectory() as log_dir, instance_for_test() as instance:
+        monkeypatch.setenv("RESOURCE_LIFETIME_TEST_DIR", log_dir)
+        with execute_job(
+            reconstructable(worker_pool_job),
+            instance=instance,
+            run_config={
+                "execution": {"config": {"multiprocess": {"max_concurrent": 1, "worker_pool": {}}}}
+            },
+        ) as result:
+            assert result.success
+
+            init_events = [event for event in _resource_init_events(result) if event.step_key]
+            assert len(init_events) == 3
+            assert "pid:init_time" in init_events[0].event_specific_data.metadata
+            assert all(
+                event.event_specific_data.metadata["pid:reused"].value is True
+                for event in init_events[1:]
+            )
+
+        # a single worker executed every step, initializing the resource once and tearing it
+        # down when the worker exited. The orchestrator initializes resources in this process to
+        # load outputs for the result.
+        worker_files = [
+            name for name in os.listdir(log_dir) if not name.endswith(f"_{os.getpid()}")
+        ]
+        init_files = [name for name in worker_files if name.startswith("init_")]
+        assert len(init_files) == 1
+        pid = init_files[0][len("init_") :]
+        assert sorted(worker_files) == [f"init_{pid}", f"teardown_{pid}"]
+        with open(os.path.join(log_dir, f"init_{pid}")) as f:
+            assert f.read() == "init\n"
@@ -21,7 +21,7 @@
     },
     "step_output_versions": []
   },
-  "pipeline_snapshot_id": "ee8de04ca32fa0656a0c040f0e503a5851dc8b8c",
+  "pipeline_snapshot_id": "a035ff3171f1ec4f56cb925b41c7ad2e29ba6d0a",
   "snapshot_version": 1,
   "step_keys_to_execute": [
     "op_one",
@@ -157,7 +157,7 @@
     },
     "step_output_versions": []
   },
-  "pipeline_snapshot_id": "0b967d368d23e3e2d71555cf3afa343548a291fd",
+  "pipeline_snapshot_id": "614bd740127af2815a85218e9fd0858cdf6125cd",
   "snapshot_version": 1,
   "step_keys_to_execute": [
     "noop_op"
@@ -221,7 +221,7 @@
     },
     "step_output_versions": []
   },
-  "pipeline_snapshot_id": "25ab027dd42414ee540dfba3020f90ff4c0c6196",
+  "pipeline_snapshot_id": "8359bdfcc3934b481e7d5a50cdc33b713ad49775",
   "snapshot_version": 1,
   "step_keys_to_execute": [
     "noop_op"
@@ -299,7 +299,7 @@
     },
     "step_output_versions": []
   },
-  "pipeline_snapshot_id": "10446802a7b75c5c4da33361665a159f9a70215b",
+  "pipeline_snapshot_id": "b5807e6d7394949596a1acc9c423304e5017b58d",
   "snapshot_version": 1,
   "step_keys_to_execute": [
     "comp_1.return_one",
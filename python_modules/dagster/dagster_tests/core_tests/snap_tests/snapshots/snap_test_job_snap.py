@@ -180,7 +180,7 @@
           "Shape.24ddf8da2b4484ca9c900e229e17286c1e1f6e85"
         ]
       },
-      "Selector.00371ab72ca40393148a9c985b86e3fba193b4e2": {
+      "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -188,31 +188,31 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
-            "description": "Execute all steps in a single process.",
+            "default_value_as_json_str": "{}",
+            "description": null,
             "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c"
+            "name": "disabled",
+            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-            "description": "Execute each step in an individual process.",
+            "default_value_as_json_str": "{}",
+            "description": null,
             "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.60acefe08e1243b47034a632522b12985eb4acd1"
+            "name": "enabled",
+            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
           }
         ],
         "given_name": null,
-        "key": "Selector.00371ab72ca40393148a9c985b86e3fba193b4e2",
+        "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
+      "Selector.3d6f76ba9b364d86e63abcf7bbec3b5bbddd8721": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -220,24 +220,24 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
+            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+            "description": "Execute all steps in a single process.",
             "is_required": false,
-            "name": "disabled",
-            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+            "name": "in_process",
+            "type_key": "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "description": "Execute each step in an individual process.",
             "is_required": false,
-            "name": "enabled",
-            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+            "name": "multiprocess",
+            "type_key": "Shape.0b55c45650289aad63aeba491d358960a96ae180"
           }
         ],
         "given_name": null,
-        "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
+        "key": "Selector.3d6f76ba9b364d86e63abcf7bbec3b5bbddd8721",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
@@ -513,6 +513,65 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.0b55c45650289aad63aeba491d358960a96ae180": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "0",
+            "description": "The number of processes that may run concurrently. By default, this is set to be the return value of `multiprocessing.cpu_count()`.",
+            "is_required": false,
+            "name": "max_concurrent",
+            "type_key": "Int"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": "Whether retries are enabled or not. By default, retries are enabled.",
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. By default, `spawn` is selected. See https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods.",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.8318f5aff6cd0698a5c7fedfb9bdc75fd8006db8"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "A set of limits that are applied to steps with particular tags. If a value is set, the limit is applied to only that key-value pair. If no value is set, the limit is applied across all values of that key. If the value is set to a dict with `applyLimitPerUniqueValue: true`, the limit will apply to the number of unique values for that key. Note that these limits are per run, not global.",
+            "is_required": false,
+            "name": "tag_concurrency_limits",
+            "type_key": "Array.Shape.0c1ec89f38a496d79fd06df0e76cb61d9c5b7a8d"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Execute steps in a pool of up to `max_concurrent` long-lived worker processes instead of starting a new process for each step. Workers keep the code they have loaded between steps, which avoids reloading the job for every step.",
+            "is_required": false,
+            "name": "worker_pool",
+            "type_key": "Shape.eaa9f8e0df9f7b3f43faa99c993c328ff44f4a2e"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.0b55c45650289aad63aeba491d358960a96ae180",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.0c1ec89f38a496d79fd06df0e76cb61d9c5b7a8d": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -701,7 +760,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.60acefe08e1243b47034a632522b12985eb4acd1": {
+      "Shape.69bcac14300b00cfe72eb59951466f7671338a72": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -709,42 +768,42 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": "The number of processes that may run concurrently. By default, this is set to be the return value of `multiprocessing.cpu_count()`.",
+            "default_value_as_json_str": "{\\"config\\": {\\"multiprocess\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}}",
+            "description": "Configure how steps are executed within a run.",
             "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
+            "name": "execution",
+            "type_key": "Shape.aa1030c958bb94a5ff6973883cd1055c26d309e3"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": "Whether retries are enabled or not. By default, retries are enabled.",
+            "default_value_as_json_str": "{}",
+            "description": "Configure how loggers emit messages within a run.",
             "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+            "name": "loggers",
+            "type_key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. By default, `spawn` is selected. See https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods.",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"passone\\": {}, \\"passtwo\\": {}, \\"return_one\\": {}}",
+            "description": "Configure runtime parameters for ops or assets.",
             "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.8318f5aff6cd0698a5c7fedfb9bdc75fd8006db8"
+            "name": "ops",
+            "type_key": "Shape.952e35310efb5b26c78231361f00461e9a3cacd1"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "A set of limits that are applied to steps with particular tags. If a value is set, the limit is applied to only that key-value pair. If no value is set, the limit is applied across all values of that key. If the value is set to a dict with `applyLimitPerUniqueValue: true`, the limit will apply to the number of unique values for that key. Note that these limits are per run, not global.",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"io_manager\\": {}}",
+            "description": "Configure how shared resources are implemented within a run.",
             "is_required": false,
-            "name": "tag_concurrency_limits",
-            "type_key": "Array.Shape.0c1ec89f38a496d79fd06df0e76cb61d9c5b7a8d"
+            "name": "resources",
+            "type_key": "Shape.1578133c1c71e8e3c9cf3ad46c216eb51b48c778"
           }
         ],
         "given_name": null,
-        "key": "Shape.60acefe08e1243b47034a632522b12985eb4acd1",
+        "key": "Shape.69bcac14300b00cfe72eb59951466f7671338a72",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -774,57 +833,48 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.8e365c9c613acebd35b89385172f1d8b2c3dafa8": {
+      "Shape.952e35310efb5b26c78231361f00461e9a3cacd1": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"multiprocess\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}}",
-            "description": "Configure how steps are executed within a run.",
-            "is_required": false,
-            "name": "execution",
-            "type_key": "Shape.f74882eed6db21825b8461f675d1a11e200f2f1b"
-          },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
             "default_value_as_json_str": "{}",
-            "description": "Configure how loggers emit messages within a run.",
+            "description": null,
             "is_required": false,
-            "name": "loggers",
-            "type_key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b"
+            "name": "passone",
+            "type_key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"passone\\": {}, \\"passtwo\\": {}, \\"return_one\\": {}}",
-            "description": "Configure runtime parameters for ops or assets.",
+            "default_value_as_json_str": "{}",
+            "description": null,
             "is_required": false,
-            "name": "ops",
-            "type_key": "Shape.952e35310efb5b26c78231361f00461e9a3cacd1"
+            "name": "passtwo",
+            "type_key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"io_manager\\": {}}",
-            "description": "Configure how shared resources are implemented within a run.",
+            "default_value_as_json_str": "{}",
+            "description": null,
             "is_required": false,
-            "name": "resources",
-            "type_key": "Shape.1578133c1c71e8e3c9cf3ad46c216eb51b48c778"
+            "name": "return_one",
+            "type_key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7"
           }
         ],
         "given_name": null,
-        "key": "Shape.8e365c9c613acebd35b89385172f1d8b2c3dafa8",
+        "key": "Shape.952e35310efb5b26c78231361f00461e9a3cacd1",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.952e35310efb5b26c78231361f00461e9a3cacd1": {
+      "Shape.aa1030c958bb94a5ff6973883cd1055c26d309e3": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -832,33 +882,15 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
-            "is_required": false,
-            "name": "passone",
-            "type_key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
-            "is_required": false,
-            "name": "passtwo",
-            "type_key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
+            "default_value_as_json_str": "{\\"multiprocess\\": {}}",
             "description": null,
             "is_required": false,
-            "name": "return_one",
-            "type_key": "Shape.743e47901855cb245064dd633e217bfcb49a11a7"
+            "name": "config",
+            "type_key": "Selector.3d6f76ba9b364d86e63abcf7bbec3b5bbddd8721"
           }
         ],
         "given_name": null,
-        "key": "Shape.952e35310efb5b26c78231361f00461e9a3cacd1",
+        "key": "Shape.aa1030c958bb94a5ff6973883cd1055c26d309e3",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -901,23 +933,32 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.f74882eed6db21825b8461f675d1a11e200f2f1b": {
+      "Shape.eaa9f8e0df9f7b3f43faa99c993c328ff44f4a2e": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Replace a worker process after the step during which its memory usage grew by more than this many megabytes since it started.",
+            "is_required": false,
+            "name": "max_memory_growth_mb",
+            "type_key": "Int"
+          },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"multiprocess\\": {}}",
-            "description": null,
+            "default_value_as_json_str": "100",
+            "description": "The number of steps a worker process executes before it is replaced by a new one.",
             "is_required": false,
-            "name": "config",
-            "type_key": "Selector.00371ab72ca40393148a9c985b86e3fba193b4e2"
+            "name": "max_steps_per_worker",
+            "type_key": "Int"
           }
         ],
         "given_name": null,
-        "key": "Shape.f74882eed6db21825b8461f675d1a11e200f2f1b",
+        "key": "Shape.eaa9f8e0df9f7b3f43faa99c993c328ff44f4a2e",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -1125,7 +1166,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.8e365c9c613acebd35b89385172f1d8b2c3dafa8"
+      "root_config_key": "Shape.69bcac14300b00cfe72eb59951466f7671338a72"
     }
   ],
   "name": "single_dep_job",
@@ -1199,7 +1240,7 @@
   "tags": {}
 }'''
 
-snapshots['test_basic_dep_fan_out 2'] = 'e62cb2139a840cbbab80c98e59fab64e3c383cbf'
+snapshots['test_basic_dep_fan_out 2'] = 'fa2492af2dc7930c9a0dbbb345f7d66534f54504'
 
 snapshots['test_basic_fan_in 1'] = '''{
   "__class__": "PipelineSnapshot",
@@ -1374,7 +1415,7 @@
           "Shape.24ddf8da2b4484ca9c900e229e17286c1e1f6e85"
         ]
       },
-      "Selector.00371ab72ca40393148a9c985b86e3fba193b4e2": {
+      "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -1382,31 +1423,31 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
-            "description": "Execute all steps in a single process.",
+            "default_value_as_json_str": "{}",
+            "description": null,
             "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c"
+            "name": "disabled",
+            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-            "description": "Execute each step in an individual process.",
+            "default_value_as_json_str": "{}",
+            "description": null,
             "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.60acefe08e1243b47034a632522b12985eb4acd1"
+            "name": "enabled",
+            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
           }
         ],
         "given_name": null,
-        "key": "Selector.00371ab72ca40393148a9c985b86e3fba193b4e2",
+        "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
+      "Selector.3d6f76ba9b364d86e63abcf7bbec3b5bbddd8721": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -1414,24 +1455,24 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
+            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+            "description": "Execute all steps in a single process.",
             "is_required": false,
-            "name": "disabled",
-            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+            "name": "in_process",
+            "type_key": "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "description": "Execute each step in an individual process.",
             "is_required": false,
-            "name": "enabled",
-            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+            "name": "multiprocess",
+            "type_key": "Shape.0b55c45650289aad63aeba491d358960a96ae180"
           }
         ],
         "given_name": null,
-        "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
+        "key": "Selector.3d6f76ba9b364d86e63abcf7bbec3b5bbddd8721",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
@@ -1707,34 +1748,93 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.0c1ec89f38a496d79fd06df0e76cb61d9c5b7a8d": {
+      "Shape.0b55c45650289aad63aeba491d358960a96ae180": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": null,
-            "is_required": true,
-            "name": "key",
-            "type_key": "String"
+            "default_provided": true,
+            "default_value_as_json_str": "0",
+            "description": "The number of processes that may run concurrently. By default, this is set to be the return value of `multiprocessing.cpu_count()`.",
+            "is_required": false,
+            "name": "max_concurrent",
+            "type_key": "Int"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": "Whether retries are enabled or not. By default, retries are enabled.",
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": false,
             "default_value_as_json_str": null,
-            "description": null,
-            "is_required": true,
-            "name": "limit",
-            "type_key": "Int"
+            "description": "Select how subprocesses are created. By default, `spawn` is selected. See https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods.",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.8318f5aff6cd0698a5c7fedfb9bdc75fd8006db8"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": false,
             "default_value_as_json_str": null,
-            "description": null,
+            "description": "A set of limits that are applied to steps with particular tags. If a value is set, the limit is applied to only that key-value pair. If no value is set, the limit is applied across all values of that key. If the value is set to a dict with `applyLimitPerUniqueValue: true`, the limit will apply to the number of unique values for that key. Note that these limits are per run, not global.",
+            "is_required": false,
+            "name": "tag_concurrency_limits",
+            "type_key": "Array.Shape.0c1ec89f38a496d79fd06df0e76cb61d9c5b7a8d"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Execute steps in a pool of up to `max_concurrent` long-lived worker processes instead of starting a new process for each step. Workers keep the code they have loaded between steps, which avoids reloading the job for every step.",
+            "is_required": false,
+            "name": "worker_pool",
+            "type_key": "Shape.eaa9f8e0df9f7b3f43faa99c993c328ff44f4a2e"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.0b55c45650289aad63aeba491d358960a96ae180",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Shape.0c1ec89f38a496d79fd06df0e76cb61d9c5b7a8d": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": true,
+            "name": "key",
+            "type_key": "String"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
+            "is_required": true,
+            "name": "limit",
+            "type_key": "Int"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": null,
             "is_required": false,
             "name": "value",
             "type_key": "ScalarUnion.String-Shape.24ddf8da2b4484ca9c900e229e17286c1e1f6e85"
@@ -1895,7 +1995,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.60acefe08e1243b47034a632522b12985eb4acd1": {
+      "Shape.64386ffba5d4b77fc771ed993dc08bfc8ca95ae6": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -1903,42 +2003,42 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": "The number of processes that may run concurrently. By default, this is set to be the return value of `multiprocessing.cpu_count()`.",
+            "default_value_as_json_str": "{\\"config\\": {\\"multiprocess\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}}",
+            "description": "Configure how steps are executed within a run.",
             "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
+            "name": "execution",
+            "type_key": "Shape.aa1030c958bb94a5ff6973883cd1055c26d309e3"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": "Whether retries are enabled or not. By default, retries are enabled.",
+            "default_value_as_json_str": "{}",
+            "description": "Configure how loggers emit messages within a run.",
             "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+            "name": "loggers",
+            "type_key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. By default, `spawn` is selected. See https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods.",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"nothing_one\\": {}, \\"nothing_two\\": {}, \\"take_nothings\\": {}}",
+            "description": "Configure runtime parameters for ops or assets.",
             "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.8318f5aff6cd0698a5c7fedfb9bdc75fd8006db8"
+            "name": "ops",
+            "type_key": "Shape.73489027a6f87769531860a5561ac0407d5dbb51"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "A set of limits that are applied to steps with particular tags. If a value is set, the limit is applied to only that key-value pair. If no value is set, the limit is applied across all values of that key. If the value is set to a dict with `applyLimitPerUniqueValue: true`, the limit will apply to the number of unique values for that key. Note that these limits are per run, not global.",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"io_manager\\": {}}",
+            "description": "Configure how shared resources are implemented within a run.",
             "is_required": false,
-            "name": "tag_concurrency_limits",
-            "type_key": "Array.Shape.0c1ec89f38a496d79fd06df0e76cb61d9c5b7a8d"
+            "name": "resources",
+            "type_key": "Shape.1578133c1c71e8e3c9cf3ad46c216eb51b48c778"
           }
         ],
         "given_name": null,
-        "key": "Shape.60acefe08e1243b47034a632522b12985eb4acd1",
+        "key": "Shape.64386ffba5d4b77fc771ed993dc08bfc8ca95ae6",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -2009,7 +2109,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.d3e8f70cd06d35bfe63e246f97b25cc8231dfe5a": {
+      "Shape.aa1030c958bb94a5ff6973883cd1055c26d309e3": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -2017,42 +2117,15 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"multiprocess\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}}",
-            "description": "Configure how steps are executed within a run.",
-            "is_required": false,
-            "name": "execution",
-            "type_key": "Shape.f74882eed6db21825b8461f675d1a11e200f2f1b"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": "Configure how loggers emit messages within a run.",
-            "is_required": false,
-            "name": "loggers",
-            "type_key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"nothing_one\\": {}, \\"nothing_two\\": {}, \\"take_nothings\\": {}}",
-            "description": "Configure runtime parameters for ops or assets.",
-            "is_required": false,
-            "name": "ops",
-            "type_key": "Shape.73489027a6f87769531860a5561ac0407d5dbb51"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"io_manager\\": {}}",
-            "description": "Configure how shared resources are implemented within a run.",
+            "default_value_as_json_str": "{\\"multiprocess\\": {}}",
+            "description": null,
             "is_required": false,
-            "name": "resources",
-            "type_key": "Shape.1578133c1c71e8e3c9cf3ad46c216eb51b48c778"
+            "name": "config",
+            "type_key": "Selector.3d6f76ba9b364d86e63abcf7bbec3b5bbddd8721"
           }
         ],
         "given_name": null,
-        "key": "Shape.d3e8f70cd06d35bfe63e246f97b25cc8231dfe5a",
+        "key": "Shape.aa1030c958bb94a5ff6973883cd1055c26d309e3",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -2095,23 +2168,32 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.f74882eed6db21825b8461f675d1a11e200f2f1b": {
+      "Shape.eaa9f8e0df9f7b3f43faa99c993c328ff44f4a2e": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Replace a worker process after the step during which its memory usage grew by more than this many megabytes since it started.",
+            "is_required": false,
+            "name": "max_memory_growth_mb",
+            "type_key": "Int"
+          },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"multiprocess\\": {}}",
-            "description": null,
+            "default_value_as_json_str": "100",
+            "description": "The number of steps a worker process executes before it is replaced by a new one.",
             "is_required": false,
-            "name": "config",
-            "type_key": "Selector.00371ab72ca40393148a9c985b86e3fba193b4e2"
+            "name": "max_steps_per_worker",
+            "type_key": "Int"
           }
         ],
         "given_name": null,
-        "key": "Shape.f74882eed6db21825b8461f675d1a11e200f2f1b",
+        "key": "Shape.eaa9f8e0df9f7b3f43faa99c993c328ff44f4a2e",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -2311,7 +2393,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.d3e8f70cd06d35bfe63e246f97b25cc8231dfe5a"
+      "root_config_key": "Shape.64386ffba5d4b77fc771ed993dc08bfc8ca95ae6"
     }
   ],
   "name": "fan_in_test",
@@ -2385,7 +2467,7 @@
   "tags": {}
 }'''
 
-snapshots['test_basic_fan_in 2'] = '5c617079c2edfa51b72be2fe78ae9bcda99fce41'
+snapshots['test_basic_fan_in 2'] = '8635cb11b8719378c188436f2c162dc988c29eb4'
 
 snapshots['test_deserialize_node_def_snaps_multi_type_config 1'] = '''{
   "__class__": "ConfigTypeSnap",
@@ -2593,7 +2675,7 @@
           "Shape.24ddf8da2b4484ca9c900e229e17286c1e1f6e85"
         ]
       },
-      "Selector.00371ab72ca40393148a9c985b86e3fba193b4e2": {
+      "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -2601,31 +2683,31 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
-            "description": "Execute all steps in a single process.",
+            "default_value_as_json_str": "{}",
+            "description": null,
             "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c"
+            "name": "disabled",
+            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-            "description": "Execute each step in an individual process.",
+            "default_value_as_json_str": "{}",
+            "description": null,
             "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.60acefe08e1243b47034a632522b12985eb4acd1"
+            "name": "enabled",
+            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
           }
         ],
         "given_name": null,
-        "key": "Selector.00371ab72ca40393148a9c985b86e3fba193b4e2",
+        "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
+      "Selector.3d6f76ba9b364d86e63abcf7bbec3b5bbddd8721": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -2633,24 +2715,24 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
+            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+            "description": "Execute all steps in a single process.",
             "is_required": false,
-            "name": "disabled",
-            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+            "name": "in_process",
+            "type_key": "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "description": "Execute each step in an individual process.",
             "is_required": false,
-            "name": "enabled",
-            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+            "name": "multiprocess",
+            "type_key": "Shape.0b55c45650289aad63aeba491d358960a96ae180"
           }
         ],
         "given_name": null,
-        "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
+        "key": "Selector.3d6f76ba9b364d86e63abcf7bbec3b5bbddd8721",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
@@ -2926,6 +3008,65 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.0b55c45650289aad63aeba491d358960a96ae180": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "0",
+            "description": "The number of processes that may run concurrently. By default, this is set to be the return value of `multiprocessing.cpu_count()`.",
+            "is_required": false,
+            "name": "max_concurrent",
+            "type_key": "Int"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": "Whether retries are enabled or not. By default, retries are enabled.",
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. By default, `spawn` is selected. See https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods.",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.8318f5aff6cd0698a5c7fedfb9bdc75fd8006db8"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "A set of limits that are applied to steps with particular tags. If a value is set, the limit is applied to only that key-value pair. If no value is set, the limit is applied across all values of that key. If the value is set to a dict with `applyLimitPerUniqueValue: true`, the limit will apply to the number of unique values for that key. Note that these limits are per run, not global.",
+            "is_required": false,
+            "name": "tag_concurrency_limits",
+            "type_key": "Array.Shape.0c1ec89f38a496d79fd06df0e76cb61d9c5b7a8d"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Execute steps in a pool of up to `max_concurrent` long-lived worker processes instead of starting a new process for each step. Workers keep the code they have loaded between steps, which avoids reloading the job for every step.",
+            "is_required": false,
+            "name": "worker_pool",
+            "type_key": "Shape.eaa9f8e0df9f7b3f43faa99c993c328ff44f4a2e"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.0b55c45650289aad63aeba491d358960a96ae180",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.0c1ec89f38a496d79fd06df0e76cb61d9c5b7a8d": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -3137,7 +3278,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.60acefe08e1243b47034a632522b12985eb4acd1": {
+      "Shape.516b68de4b3302b08eea7b4f19b7c39602a40a8d": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -3145,42 +3286,42 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": "The number of processes that may run concurrently. By default, this is set to be the return value of `multiprocessing.cpu_count()`.",
+            "default_value_as_json_str": "{\\"config\\": {\\"multiprocess\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}}",
+            "description": "Configure how steps are executed within a run.",
             "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
+            "name": "execution",
+            "type_key": "Shape.aa1030c958bb94a5ff6973883cd1055c26d309e3"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": "Whether retries are enabled or not. By default, retries are enabled.",
+            "default_value_as_json_str": "{}",
+            "description": "Configure how loggers emit messages within a run.",
             "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+            "name": "loggers",
+            "type_key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. By default, `spawn` is selected. See https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods.",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"noop_op\\": {}}",
+            "description": "Configure runtime parameters for ops or assets.",
             "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.8318f5aff6cd0698a5c7fedfb9bdc75fd8006db8"
+            "name": "ops",
+            "type_key": "Shape.242592fa9f0be8d5908506e918e119be06358618"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "A set of limits that are applied to steps with particular tags. If a value is set, the limit is applied to only that key-value pair. If no value is set, the limit is applied across all values of that key. If the value is set to a dict with `applyLimitPerUniqueValue: true`, the limit will apply to the number of unique values for that key. Note that these limits are per run, not global.",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"io_manager\\": {}}",
+            "description": "Configure how shared resources are implemented within a run.",
             "is_required": false,
-            "name": "tag_concurrency_limits",
-            "type_key": "Array.Shape.0c1ec89f38a496d79fd06df0e76cb61d9c5b7a8d"
+            "name": "resources",
+            "type_key": "Shape.1578133c1c71e8e3c9cf3ad46c216eb51b48c778"
           }
         ],
         "given_name": null,
-        "key": "Shape.60acefe08e1243b47034a632522b12985eb4acd1",
+        "key": "Shape.516b68de4b3302b08eea7b4f19b7c39602a40a8d",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -3210,7 +3351,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.ba51206ea43d22347f91c6a5da765403a6eee445": {
+      "Shape.aa1030c958bb94a5ff6973883cd1055c26d309e3": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -3218,42 +3359,15 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"multiprocess\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}}",
-            "description": "Configure how steps are executed within a run.",
+            "default_value_as_json_str": "{\\"multiprocess\\": {}}",
+            "description": null,
             "is_required": false,
-            "name": "execution",
-            "type_key": "Shape.f74882eed6db21825b8461f675d1a11e200f2f1b"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": "Configure how loggers emit messages within a run.",
-            "is_required": false,
-            "name": "loggers",
-            "type_key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"noop_op\\": {}}",
-            "description": "Configure runtime parameters for ops or assets.",
-            "is_required": false,
-            "name": "ops",
-            "type_key": "Shape.242592fa9f0be8d5908506e918e119be06358618"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"io_manager\\": {}}",
-            "description": "Configure how shared resources are implemented within a run.",
-            "is_required": false,
-            "name": "resources",
-            "type_key": "Shape.1578133c1c71e8e3c9cf3ad46c216eb51b48c778"
+            "name": "config",
+            "type_key": "Selector.3d6f76ba9b364d86e63abcf7bbec3b5bbddd8721"
           }
         ],
         "given_name": null,
-        "key": "Shape.ba51206ea43d22347f91c6a5da765403a6eee445",
+        "key": "Shape.aa1030c958bb94a5ff6973883cd1055c26d309e3",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -3296,23 +3410,32 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.f74882eed6db21825b8461f675d1a11e200f2f1b": {
+      "Shape.eaa9f8e0df9f7b3f43faa99c993c328ff44f4a2e": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Replace a worker process after the step during which its memory usage grew by more than this many megabytes since it started.",
+            "is_required": false,
+            "name": "max_memory_growth_mb",
+            "type_key": "Int"
+          },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"multiprocess\\": {}}",
-            "description": null,
+            "default_value_as_json_str": "100",
+            "description": "The number of steps a worker process executes before it is replaced by a new one.",
             "is_required": false,
-            "name": "config",
-            "type_key": "Selector.00371ab72ca40393148a9c985b86e3fba193b4e2"
+            "name": "max_steps_per_worker",
+            "type_key": "Int"
           }
         ],
         "given_name": null,
-        "key": "Shape.f74882eed6db21825b8461f675d1a11e200f2f1b",
+        "key": "Shape.eaa9f8e0df9f7b3f43faa99c993c328ff44f4a2e",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -3478,7 +3601,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.ba51206ea43d22347f91c6a5da765403a6eee445"
+      "root_config_key": "Shape.516b68de4b3302b08eea7b4f19b7c39602a40a8d"
     }
   ],
   "name": "noop_job",
@@ -3518,7 +3641,7 @@
   "tags": {}
 }'''
 
-snapshots['test_empty_job_snap_props 2'] = '0b967d368d23e3e2d71555cf3afa343548a291fd'
+snapshots['test_empty_job_snap_props 2'] = '614bd740127af2815a85218e9fd0858cdf6125cd'
 
 snapshots['test_empty_job_snap_snapshot 1'] = '''{
   "__class__": "PipelineSnapshot",
@@ -3693,7 +3816,7 @@
           "Shape.24ddf8da2b4484ca9c900e229e17286c1e1f6e85"
         ]
       },
-      "Selector.00371ab72ca40393148a9c985b86e3fba193b4e2": {
+      "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -3701,31 +3824,31 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
-            "description": "Execute all steps in a single process.",
+            "default_value_as_json_str": "{}",
+            "description": null,
             "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c"
+            "name": "disabled",
+            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-            "description": "Execute each step in an individual process.",
+            "default_value_as_json_str": "{}",
+            "description": null,
             "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.60acefe08e1243b47034a632522b12985eb4acd1"
+            "name": "enabled",
+            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
           }
         ],
         "given_name": null,
-        "key": "Selector.00371ab72ca40393148a9c985b86e3fba193b4e2",
+        "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
+      "Selector.3d6f76ba9b364d86e63abcf7bbec3b5bbddd8721": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -3733,24 +3856,24 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
+            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+            "description": "Execute all steps in a single process.",
             "is_required": false,
-            "name": "disabled",
-            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+            "name": "in_process",
+            "type_key": "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "description": "Execute each step in an individual process.",
             "is_required": false,
-            "name": "enabled",
-            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+            "name": "multiprocess",
+            "type_key": "Shape.0b55c45650289aad63aeba491d358960a96ae180"
           }
         ],
         "given_name": null,
-        "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
+        "key": "Selector.3d6f76ba9b364d86e63abcf7bbec3b5bbddd8721",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
@@ -4026,6 +4149,65 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.0b55c45650289aad63aeba491d358960a96ae180": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "0",
+            "description": "The number of processes that may run concurrently. By default, this is set to be the return value of `multiprocessing.cpu_count()`.",
+            "is_required": false,
+            "name": "max_concurrent",
+            "type_key": "Int"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": "Whether retries are enabled or not. By default, retries are enabled.",
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. By default, `spawn` is selected. See https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods.",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.8318f5aff6cd0698a5c7fedfb9bdc75fd8006db8"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "A set of limits that are applied to steps with particular tags. If a value is set, the limit is applied to only that key-value pair. If no value is set, the limit is applied across all values of that key. If the value is set to a dict with `applyLimitPerUniqueValue: true`, the limit will apply to the number of unique values for that key. Note that these limits are per run, not global.",
+            "is_required": false,
+            "name": "tag_concurrency_limits",
+            "type_key": "Array.Shape.0c1ec89f38a496d79fd06df0e76cb61d9c5b7a8d"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Execute steps in a pool of up to `max_concurrent` long-lived worker processes instead of starting a new process for each step. Workers keep the code they have loaded between steps, which avoids reloading the job for every step.",
+            "is_required": false,
+            "name": "worker_pool",
+            "type_key": "Shape.eaa9f8e0df9f7b3f43faa99c993c328ff44f4a2e"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.0b55c45650289aad63aeba491d358960a96ae180",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.0c1ec89f38a496d79fd06df0e76cb61d9c5b7a8d": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -4237,7 +4419,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.60acefe08e1243b47034a632522b12985eb4acd1": {
+      "Shape.516b68de4b3302b08eea7b4f19b7c39602a40a8d": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -4245,42 +4427,42 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": "The number of processes that may run concurrently. By default, this is set to be the return value of `multiprocessing.cpu_count()`.",
+            "default_value_as_json_str": "{\\"config\\": {\\"multiprocess\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}}",
+            "description": "Configure how steps are executed within a run.",
             "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
+            "name": "execution",
+            "type_key": "Shape.aa1030c958bb94a5ff6973883cd1055c26d309e3"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": "Whether retries are enabled or not. By default, retries are enabled.",
+            "default_value_as_json_str": "{}",
+            "description": "Configure how loggers emit messages within a run.",
             "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+            "name": "loggers",
+            "type_key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. By default, `spawn` is selected. See https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods.",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"noop_op\\": {}}",
+            "description": "Configure runtime parameters for ops or assets.",
             "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.8318f5aff6cd0698a5c7fedfb9bdc75fd8006db8"
+            "name": "ops",
+            "type_key": "Shape.242592fa9f0be8d5908506e918e119be06358618"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "A set of limits that are applied to steps with particular tags. If a value is set, the limit is applied to only that key-value pair. If no value is set, the limit is applied across all values of that key. If the value is set to a dict with `applyLimitPerUniqueValue: true`, the limit will apply to the number of unique values for that key. Note that these limits are per run, not global.",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"io_manager\\": {}}",
+            "description": "Configure how shared resources are implemented within a run.",
             "is_required": false,
-            "name": "tag_concurrency_limits",
-            "type_key": "Array.Shape.0c1ec89f38a496d79fd06df0e76cb61d9c5b7a8d"
+            "name": "resources",
+            "type_key": "Shape.1578133c1c71e8e3c9cf3ad46c216eb51b48c778"
           }
         ],
         "given_name": null,
-        "key": "Shape.60acefe08e1243b47034a632522b12985eb4acd1",
+        "key": "Shape.516b68de4b3302b08eea7b4f19b7c39602a40a8d",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -4310,7 +4492,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.ba51206ea43d22347f91c6a5da765403a6eee445": {
+      "Shape.aa1030c958bb94a5ff6973883cd1055c26d309e3": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -4318,42 +4500,15 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"multiprocess\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}}",
-            "description": "Configure how steps are executed within a run.",
-            "is_required": false,
-            "name": "execution",
-            "type_key": "Shape.f74882eed6db21825b8461f675d1a11e200f2f1b"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": "Configure how loggers emit messages within a run.",
-            "is_required": false,
-            "name": "loggers",
-            "type_key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"noop_op\\": {}}",
-            "description": "Configure runtime parameters for ops or assets.",
-            "is_required": false,
-            "name": "ops",
-            "type_key": "Shape.242592fa9f0be8d5908506e918e119be06358618"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"io_manager\\": {}}",
-            "description": "Configure how shared resources are implemented within a run.",
+            "default_value_as_json_str": "{\\"multiprocess\\": {}}",
+            "description": null,
             "is_required": false,
-            "name": "resources",
-            "type_key": "Shape.1578133c1c71e8e3c9cf3ad46c216eb51b48c778"
+            "name": "config",
+            "type_key": "Selector.3d6f76ba9b364d86e63abcf7bbec3b5bbddd8721"
           }
         ],
         "given_name": null,
-        "key": "Shape.ba51206ea43d22347f91c6a5da765403a6eee445",
+        "key": "Shape.aa1030c958bb94a5ff6973883cd1055c26d309e3",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -4396,23 +4551,32 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.f74882eed6db21825b8461f675d1a11e200f2f1b": {
+      "Shape.eaa9f8e0df9f7b3f43faa99c993c328ff44f4a2e": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Replace a worker process after the step during which its memory usage grew by more than this many megabytes since it started.",
+            "is_required": false,
+            "name": "max_memory_growth_mb",
+            "type_key": "Int"
+          },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"multiprocess\\": {}}",
-            "description": null,
+            "default_value_as_json_str": "100",
+            "description": "The number of steps a worker process executes before it is replaced by a new one.",
             "is_required": false,
-            "name": "config",
-            "type_key": "Selector.00371ab72ca40393148a9c985b86e3fba193b4e2"
+            "name": "max_steps_per_worker",
+            "type_key": "Int"
           }
         ],
         "given_name": null,
-        "key": "Shape.f74882eed6db21825b8461f675d1a11e200f2f1b",
+        "key": "Shape.eaa9f8e0df9f7b3f43faa99c993c328ff44f4a2e",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -4578,7 +4742,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.ba51206ea43d22347f91c6a5da765403a6eee445"
+      "root_config_key": "Shape.516b68de4b3302b08eea7b4f19b7c39602a40a8d"
     }
   ],
   "name": "noop_job",
@@ -4791,7 +4955,7 @@
           "Shape.24ddf8da2b4484ca9c900e229e17286c1e1f6e85"
         ]
       },
-      "Selector.00371ab72ca40393148a9c985b86e3fba193b4e2": {
+      "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -4799,31 +4963,31 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
-            "description": "Execute all steps in a single process.",
+            "default_value_as_json_str": "{}",
+            "description": null,
             "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c"
+            "name": "disabled",
+            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-            "description": "Execute each step in an individual process.",
+            "default_value_as_json_str": "{}",
+            "description": null,
             "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.60acefe08e1243b47034a632522b12985eb4acd1"
+            "name": "enabled",
+            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
           }
         ],
         "given_name": null,
-        "key": "Selector.00371ab72ca40393148a9c985b86e3fba193b4e2",
+        "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
+      "Selector.3d6f76ba9b364d86e63abcf7bbec3b5bbddd8721": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -4831,24 +4995,24 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
+            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+            "description": "Execute all steps in a single process.",
             "is_required": false,
-            "name": "disabled",
-            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+            "name": "in_process",
+            "type_key": "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "description": "Execute each step in an individual process.",
             "is_required": false,
-            "name": "enabled",
-            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+            "name": "multiprocess",
+            "type_key": "Shape.0b55c45650289aad63aeba491d358960a96ae180"
           }
         ],
         "given_name": null,
-        "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
+        "key": "Selector.3d6f76ba9b364d86e63abcf7bbec3b5bbddd8721",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
@@ -5108,16 +5272,75 @@
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "\\"dagster\\"",
-            "description": "The name of your logger.",
+            "default_provided": true,
+            "default_value_as_json_str": "\\"dagster\\"",
+            "description": "The name of your logger.",
+            "is_required": false,
+            "name": "name",
+            "type_key": "String"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.081354663b9d4b8fbfd1cb8e358763912953913f",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
+      "Shape.0b55c45650289aad63aeba491d358960a96ae180": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "0",
+            "description": "The number of processes that may run concurrently. By default, this is set to be the return value of `multiprocessing.cpu_count()`.",
+            "is_required": false,
+            "name": "max_concurrent",
+            "type_key": "Int"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": "Whether retries are enabled or not. By default, retries are enabled.",
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. By default, `spawn` is selected. See https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods.",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.8318f5aff6cd0698a5c7fedfb9bdc75fd8006db8"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "A set of limits that are applied to steps with particular tags. If a value is set, the limit is applied to only that key-value pair. If no value is set, the limit is applied across all values of that key. If the value is set to a dict with `applyLimitPerUniqueValue: true`, the limit will apply to the number of unique values for that key. Note that these limits are per run, not global.",
+            "is_required": false,
+            "name": "tag_concurrency_limits",
+            "type_key": "Array.Shape.0c1ec89f38a496d79fd06df0e76cb61d9c5b7a8d"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Execute steps in a pool of up to `max_concurrent` long-lived worker processes instead of starting a new process for each step. Workers keep the code they have loaded between steps, which avoids reloading the job for every step.",
             "is_required": false,
-            "name": "name",
-            "type_key": "String"
+            "name": "worker_pool",
+            "type_key": "Shape.eaa9f8e0df9f7b3f43faa99c993c328ff44f4a2e"
           }
         ],
         "given_name": null,
-        "key": "Shape.081354663b9d4b8fbfd1cb8e358763912953913f",
+        "key": "Shape.0b55c45650289aad63aeba491d358960a96ae180",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -5335,7 +5558,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.60acefe08e1243b47034a632522b12985eb4acd1": {
+      "Shape.516b68de4b3302b08eea7b4f19b7c39602a40a8d": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -5343,42 +5566,42 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": "The number of processes that may run concurrently. By default, this is set to be the return value of `multiprocessing.cpu_count()`.",
+            "default_value_as_json_str": "{\\"config\\": {\\"multiprocess\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}}",
+            "description": "Configure how steps are executed within a run.",
             "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
+            "name": "execution",
+            "type_key": "Shape.aa1030c958bb94a5ff6973883cd1055c26d309e3"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": "Whether retries are enabled or not. By default, retries are enabled.",
+            "default_value_as_json_str": "{}",
+            "description": "Configure how loggers emit messages within a run.",
             "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+            "name": "loggers",
+            "type_key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. By default, `spawn` is selected. See https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods.",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"noop_op\\": {}}",
+            "description": "Configure runtime parameters for ops or assets.",
             "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.8318f5aff6cd0698a5c7fedfb9bdc75fd8006db8"
+            "name": "ops",
+            "type_key": "Shape.242592fa9f0be8d5908506e918e119be06358618"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "A set of limits that are applied to steps with particular tags. If a value is set, the limit is applied to only that key-value pair. If no value is set, the limit is applied across all values of that key. If the value is set to a dict with `applyLimitPerUniqueValue: true`, the limit will apply to the number of unique values for that key. Note that these limits are per run, not global.",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"io_manager\\": {}}",
+            "description": "Configure how shared resources are implemented within a run.",
             "is_required": false,
-            "name": "tag_concurrency_limits",
-            "type_key": "Array.Shape.0c1ec89f38a496d79fd06df0e76cb61d9c5b7a8d"
+            "name": "resources",
+            "type_key": "Shape.1578133c1c71e8e3c9cf3ad46c216eb51b48c778"
           }
         ],
         "given_name": null,
-        "key": "Shape.60acefe08e1243b47034a632522b12985eb4acd1",
+        "key": "Shape.516b68de4b3302b08eea7b4f19b7c39602a40a8d",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -5408,7 +5631,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.ba51206ea43d22347f91c6a5da765403a6eee445": {
+      "Shape.aa1030c958bb94a5ff6973883cd1055c26d309e3": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -5416,42 +5639,15 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"multiprocess\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}}",
-            "description": "Configure how steps are executed within a run.",
-            "is_required": false,
-            "name": "execution",
-            "type_key": "Shape.f74882eed6db21825b8461f675d1a11e200f2f1b"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": "Configure how loggers emit messages within a run.",
-            "is_required": false,
-            "name": "loggers",
-            "type_key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"noop_op\\": {}}",
-            "description": "Configure runtime parameters for ops or assets.",
-            "is_required": false,
-            "name": "ops",
-            "type_key": "Shape.242592fa9f0be8d5908506e918e119be06358618"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"io_manager\\": {}}",
-            "description": "Configure how shared resources are implemented within a run.",
+            "default_value_as_json_str": "{\\"multiprocess\\": {}}",
+            "description": null,
             "is_required": false,
-            "name": "resources",
-            "type_key": "Shape.1578133c1c71e8e3c9cf3ad46c216eb51b48c778"
+            "name": "config",
+            "type_key": "Selector.3d6f76ba9b364d86e63abcf7bbec3b5bbddd8721"
           }
         ],
         "given_name": null,
-        "key": "Shape.ba51206ea43d22347f91c6a5da765403a6eee445",
+        "key": "Shape.aa1030c958bb94a5ff6973883cd1055c26d309e3",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -5494,23 +5690,32 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.f74882eed6db21825b8461f675d1a11e200f2f1b": {
+      "Shape.eaa9f8e0df9f7b3f43faa99c993c328ff44f4a2e": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Replace a worker process after the step during which its memory usage grew by more than this many megabytes since it started.",
+            "is_required": false,
+            "name": "max_memory_growth_mb",
+            "type_key": "Int"
+          },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"multiprocess\\": {}}",
-            "description": null,
+            "default_value_as_json_str": "100",
+            "description": "The number of steps a worker process executes before it is replaced by a new one.",
             "is_required": false,
-            "name": "config",
-            "type_key": "Selector.00371ab72ca40393148a9c985b86e3fba193b4e2"
+            "name": "max_steps_per_worker",
+            "type_key": "Int"
           }
         ],
         "given_name": null,
-        "key": "Shape.f74882eed6db21825b8461f675d1a11e200f2f1b",
+        "key": "Shape.eaa9f8e0df9f7b3f43faa99c993c328ff44f4a2e",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -5676,7 +5881,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.ba51206ea43d22347f91c6a5da765403a6eee445"
+      "root_config_key": "Shape.516b68de4b3302b08eea7b4f19b7c39602a40a8d"
     }
   ],
   "name": "noop_job",
@@ -5718,7 +5923,7 @@
   }
 }'''
 
-snapshots['test_job_snap_all_props 2'] = '51b4a064c71fdf1a2efdba2c8fae3930c1067d55'
+snapshots['test_job_snap_all_props 2'] = '3767cfe72a93e6e0adf9376c2d02b26862f24508'
 
 snapshots['test_multi_type_config_array_dict_fields[Permissive] 1'] = '''{
   "__class__": "ConfigTypeSnap",
@@ -6101,7 +6306,7 @@
           "Shape.24ddf8da2b4484ca9c900e229e17286c1e1f6e85"
         ]
       },
-      "Selector.00371ab72ca40393148a9c985b86e3fba193b4e2": {
+      "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -6109,31 +6314,31 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
-            "description": "Execute all steps in a single process.",
+            "default_value_as_json_str": "{}",
+            "description": null,
             "is_required": false,
-            "name": "in_process",
-            "type_key": "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c"
+            "name": "disabled",
+            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
-            "description": "Execute each step in an individual process.",
+            "default_value_as_json_str": "{}",
+            "description": null,
             "is_required": false,
-            "name": "multiprocess",
-            "type_key": "Shape.60acefe08e1243b47034a632522b12985eb4acd1"
+            "name": "enabled",
+            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
           }
         ],
         "given_name": null,
-        "key": "Selector.00371ab72ca40393148a9c985b86e3fba193b4e2",
+        "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2": {
+      "Selector.3d6f76ba9b364d86e63abcf7bbec3b5bbddd8721": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -6141,24 +6346,24 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
+            "default_value_as_json_str": "{\\"retries\\": {\\"enabled\\": {}}}",
+            "description": "Execute all steps in a single process.",
             "is_required": false,
-            "name": "disabled",
-            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+            "name": "in_process",
+            "type_key": "Shape.44f24ac55059da1634e84af6c1bf7e0ed332251c"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": null,
+            "default_value_as_json_str": "{\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}",
+            "description": "Execute each step in an individual process.",
             "is_required": false,
-            "name": "enabled",
-            "type_key": "Shape.da39a3ee5e6b4b0d3255bfef95601890afd80709"
+            "name": "multiprocess",
+            "type_key": "Shape.0b55c45650289aad63aeba491d358960a96ae180"
           }
         ],
         "given_name": null,
-        "key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2",
+        "key": "Selector.3d6f76ba9b364d86e63abcf7bbec3b5bbddd8721",
         "kind": {
           "__enum__": "ConfigTypeKind.SELECTOR"
         },
@@ -6434,6 +6639,65 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
+      "Shape.0b55c45650289aad63aeba491d358960a96ae180": {
+        "__class__": "ConfigTypeSnap",
+        "description": null,
+        "enum_values": null,
+        "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "0",
+            "description": "The number of processes that may run concurrently. By default, this is set to be the return value of `multiprocessing.cpu_count()`.",
+            "is_required": false,
+            "name": "max_concurrent",
+            "type_key": "Int"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"enabled\\": {}}",
+            "description": "Whether retries are enabled or not. By default, retries are enabled.",
+            "is_required": false,
+            "name": "retries",
+            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Select how subprocesses are created. By default, `spawn` is selected. See https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods.",
+            "is_required": false,
+            "name": "start_method",
+            "type_key": "Selector.8318f5aff6cd0698a5c7fedfb9bdc75fd8006db8"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "A set of limits that are applied to steps with particular tags. If a value is set, the limit is applied to only that key-value pair. If no value is set, the limit is applied across all values of that key. If the value is set to a dict with `applyLimitPerUniqueValue: true`, the limit will apply to the number of unique values for that key. Note that these limits are per run, not global.",
+            "is_required": false,
+            "name": "tag_concurrency_limits",
+            "type_key": "Array.Shape.0c1ec89f38a496d79fd06df0e76cb61d9c5b7a8d"
+          },
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Execute steps in a pool of up to `max_concurrent` long-lived worker processes instead of starting a new process for each step. Workers keep the code they have loaded between steps, which avoids reloading the job for every step.",
+            "is_required": false,
+            "name": "worker_pool",
+            "type_key": "Shape.eaa9f8e0df9f7b3f43faa99c993c328ff44f4a2e"
+          }
+        ],
+        "given_name": null,
+        "key": "Shape.0b55c45650289aad63aeba491d358960a96ae180",
+        "kind": {
+          "__enum__": "ConfigTypeKind.STRICT_SHAPE"
+        },
+        "scalar_kind": null,
+        "type_param_keys": null
+      },
       "Shape.0c1ec89f38a496d79fd06df0e76cb61d9c5b7a8d": {
         "__class__": "ConfigTypeSnap",
         "description": null,
@@ -6622,7 +6886,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.60acefe08e1243b47034a632522b12985eb4acd1": {
+      "Shape.5c66b9c0b01c0be1a8b62e8f4acb7858674c2dcd": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -6630,42 +6894,42 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "0",
-            "description": "The number of processes that may run concurrently. By default, this is set to be the return value of `multiprocessing.cpu_count()`.",
+            "default_value_as_json_str": "{\\"config\\": {\\"multiprocess\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}}",
+            "description": "Configure how steps are executed within a run.",
             "is_required": false,
-            "name": "max_concurrent",
-            "type_key": "Int"
+            "name": "execution",
+            "type_key": "Shape.aa1030c958bb94a5ff6973883cd1055c26d309e3"
           },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"enabled\\": {}}",
-            "description": "Whether retries are enabled or not. By default, retries are enabled.",
+            "default_value_as_json_str": "{}",
+            "description": "Configure how loggers emit messages within a run.",
             "is_required": false,
-            "name": "retries",
-            "type_key": "Selector.1bfb167aea90780aa679597800c71bd8c65ed0b2"
+            "name": "loggers",
+            "type_key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "Select how subprocesses are created. By default, `spawn` is selected. See https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods.",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"one\\": {}, \\"two\\": {}}",
+            "description": "Configure runtime parameters for ops or assets.",
             "is_required": false,
-            "name": "start_method",
-            "type_key": "Selector.8318f5aff6cd0698a5c7fedfb9bdc75fd8006db8"
+            "name": "ops",
+            "type_key": "Shape.a5a68088e42f4b99cc993bae2b87b445310de808"
           },
           {
             "__class__": "ConfigFieldSnap",
-            "default_provided": false,
-            "default_value_as_json_str": null,
-            "description": "A set of limits that are applied to steps with particular tags. If a value is set, the limit is applied to only that key-value pair. If no value is set, the limit is applied across all values of that key. If the value is set to a dict with `applyLimitPerUniqueValue: true`, the limit will apply to the number of unique values for that key. Note that these limits are per run, not global.",
+            "default_provided": true,
+            "default_value_as_json_str": "{\\"io_manager\\": {}}",
+            "description": "Configure how shared resources are implemented within a run.",
             "is_required": false,
-            "name": "tag_concurrency_limits",
-            "type_key": "Array.Shape.0c1ec89f38a496d79fd06df0e76cb61d9c5b7a8d"
+            "name": "resources",
+            "type_key": "Shape.1578133c1c71e8e3c9cf3ad46c216eb51b48c778"
           }
         ],
         "given_name": null,
-        "key": "Shape.60acefe08e1243b47034a632522b12985eb4acd1",
+        "key": "Shape.5c66b9c0b01c0be1a8b62e8f4acb7858674c2dcd",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -6727,7 +6991,7 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.d57a1ccc1c9dc433e9c44c202b06fdca8c0a8655": {
+      "Shape.aa1030c958bb94a5ff6973883cd1055c26d309e3": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
@@ -6735,42 +6999,15 @@
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"config\\": {\\"multiprocess\\": {\\"max_concurrent\\": 0, \\"retries\\": {\\"enabled\\": {}}}}}",
-            "description": "Configure how steps are executed within a run.",
-            "is_required": false,
-            "name": "execution",
-            "type_key": "Shape.f74882eed6db21825b8461f675d1a11e200f2f1b"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{}",
-            "description": "Configure how loggers emit messages within a run.",
-            "is_required": false,
-            "name": "loggers",
-            "type_key": "Shape.e895d95ee6d0eff1b884c76f44a2ab7089f0c49b"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"one\\": {}, \\"two\\": {}}",
-            "description": "Configure runtime parameters for ops or assets.",
-            "is_required": false,
-            "name": "ops",
-            "type_key": "Shape.a5a68088e42f4b99cc993bae2b87b445310de808"
-          },
-          {
-            "__class__": "ConfigFieldSnap",
-            "default_provided": true,
-            "default_value_as_json_str": "{\\"io_manager\\": {}}",
-            "description": "Configure how shared resources are implemented within a run.",
+            "default_value_as_json_str": "{\\"multiprocess\\": {}}",
+            "description": null,
             "is_required": false,
-            "name": "resources",
-            "type_key": "Shape.1578133c1c71e8e3c9cf3ad46c216eb51b48c778"
+            "name": "config",
+            "type_key": "Selector.3d6f76ba9b364d86e63abcf7bbec3b5bbddd8721"
           }
         ],
         "given_name": null,
-        "key": "Shape.d57a1ccc1c9dc433e9c44c202b06fdca8c0a8655",
+        "key": "Shape.aa1030c958bb94a5ff6973883cd1055c26d309e3",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -6813,23 +7050,32 @@
         "scalar_kind": null,
         "type_param_keys": null
       },
-      "Shape.f74882eed6db21825b8461f675d1a11e200f2f1b": {
+      "Shape.eaa9f8e0df9f7b3f43faa99c993c328ff44f4a2e": {
         "__class__": "ConfigTypeSnap",
         "description": null,
         "enum_values": null,
         "fields": [
+          {
+            "__class__": "ConfigFieldSnap",
+            "default_provided": false,
+            "default_value_as_json_str": null,
+            "description": "Replace a worker process after the step during which its memory usage grew by more than this many megabytes since it started.",
+            "is_required": false,
+            "name": "max_memory_growth_mb",
+            "type_key": "Int"
+          },
           {
             "__class__": "ConfigFieldSnap",
             "default_provided": true,
-            "default_value_as_json_str": "{\\"multiprocess\\": {}}",
-            "description": null,
+            "default_value_as_json_str": "100",
+            "description": "The number of steps a worker process executes before it is replaced by a new one.",
             "is_required": false,
-            "name": "config",
-            "type_key": "Selector.00371ab72ca40393148a9c985b86e3fba193b4e2"
+            "name": "max_steps_per_worker",
+            "type_key": "Int"
           }
         ],
         "given_name": null,
-        "key": "Shape.f74882eed6db21825b8461f675d1a11e200f2f1b",
+        "key": "Shape.eaa9f8e0df9f7b3f43faa99c993c328ff44f4a2e",
         "kind": {
           "__enum__": "ConfigTypeKind.STRICT_SHAPE"
         },
@@ -7003,7 +7249,7 @@
           "name": "io_manager"
         }
       ],
-      "root_config_key": "Shape.d57a1ccc1c9dc433e9c44c202b06fdca8c0a8655"
+      "root_config_key": "Shape.5c66b9c0b01c0be1a8b62e8f4acb7858674c2dcd"
     }
   ],
   "name": "two_op_job",
@@ -7043,4 +7289,4 @@
   "tags": {}
 }'''
 
-snapshots['test_two_invocations_deps_snap 2'] = 'cdc7278950da2eb13fa513c53731694be0b4704b'
+snapshots['test_two_invocations_deps_snap 2'] = 'ae91164fa313e96f0b9a1b27f18841c0c69d6f31'
@@ -63,9 +63,18 @@
     wait_for_futures,
 )
 from dagster._core.workspace.context import WorkspaceProcessContext
-from dagster._daemon import get_default_daemon_logger
-from dagster._daemon.sensor import execute_sensor_iteration, execute_sensor_iteration_loop
+from dagster._daemon import (
+    get_default_daemon_logger,
+    sensor as sensor_module,
+)
+from dagster._daemon.sensor import (
+    SensorEvaluationQueue,
+    SensorTickLateness,
+    execute_sensor_iteration,
+    execute_sensor_iteration_loop,
+)
 from dagster._seven.compat.pendulum import create_pendulum_time, to_timezone
+from dagster._utils import Counter, traced_counter
 
 from .conftest import create_workspace_load_target
 
@@ -1624,6 +1633,129 @@ def fake_sleep(s):
         assert sum(sleeps) == 65
 
 
+def test_sensor_iteration_loop_reads_only_due_sensor_states(
+    monkeypatch, instance, workspace_context, external_repo
+):
+    freeze_datetime = to_timezone(
+        create_pendulum_time(year=2019, month=2, day=28, tz="UTC"), "US/Central"
+    )
+
+    def fake_sleep(s):
+        pendulum.set_test_now(pendulum.now().add(seconds=s))
+
+    shutdown_event = mock.MagicMock()
+    shutdown_event.wait.side_effect = fake_sleep
+
+    with pendulum.test(freeze_datetime):
+        # 60 second custom interval
+        external_sensor = external_repo.get_external_sensor("custom_interval_sensor")
+        instance.start_sensor(external_sensor)
+
+        traced_counter.set(Counter())
+        list(
+            execute_sensor_iteration_loop(
+                workspace_context,
+                get_default_daemon_logger("dagster.daemon.SensorDaemon"),
+                shutdown_event=shutdown_event,
+                until=freeze_datetime.add(seconds=65).timestamp(),
+            )
+        )
+
+        ticks = instance.get_ticks(
+            external_sensor.get_external_origin_id(), external_sensor.selector_id
+        )
+        assert len(ticks) == 2
+
+        # the loop woke up every 5 seconds, but only read every sensor state when it started and
+        # then every 30 seconds, and only read sensor states when the sensor was due
+        counts = traced_counter.get().counts()
+        assert counts.get("DagsterInstance.all_instigator_state") == 3
+        assert counts.get("DagsterInstance.get_batch_instigator_states") == 2
+
+
+def test_sensor_iteration_loop_slow_tick_start(
+    monkeypatch, instance, workspace_context, external_repo
+):
+    freeze_datetime = to_timezone(
+        create_pendulum_time(year=2019, month=2, day=28, tz="UTC"), "US/Central"
+    )
+
+    def fake_sleep(s):
+        pendulum.set_test_now(pendulum.now().add(seconds=s))
+
+    shutdown_event = mock.MagicMock()
+    shutdown_event.wait.side_effect = fake_sleep
+
+    # each tick starts a second after the loop submits it
+    process_tick_generator = sensor_module._process_tick_generator  # noqa: SLF001
+
+    def _slow_process_tick_generator(*args, **kwargs):
+        fake_sleep(1)
+        yield from process_tick_generator(*args, **kwargs)
+
+    monkeypatch.setattr(sensor_module, "_process_tick_generator", _slow_process_tick_generator)
+    # the queue is not rebuilt from the sensor states, which would correct the next due time
+    monkeypatch.setattr(sensor_module, "SENSOR_STATE_REFRESH_INTERVAL", 3600)
+
+    with pendulum.test(freeze_datetime):
+        # 60 second custom interval
+        external_sensor = external_repo.get_external_sensor("custom_interval_sensor")
+        instance.start_sensor(external_sensor)
+
+        traced_counter.set(Counter())
+        list(
+            execute_sensor_iteration_loop(
+                workspace_context,
+                get_default_daemon_logger("dagster.daemon.SensorDaemon"),
+                shutdown_event=shutdown_event,
+                until=freeze_datetime.add(seconds=70).timestamp(),
+            )
+        )
+
+        ticks = instance.get_ticks(
+            external_sensor.get_external_origin_id(), external_sensor.selector_id
+        )
+        assert len(ticks) == 2
+
+        # the sensor was not popped before its min_interval had passed since the first tick
+        counts = traced_counter.get().counts()
+        assert counts.get("DagsterInstance.all_instigator_state") == 1
+        assert counts.get("DagsterInstance.get_batch_instigator_states") == 2
+
+
+def test_sensor_evaluation_queue(external_repo):
+    simple_sensor = external_repo.get_external_sensor("simple_sensor")
+    custom_interval_sensor = external_repo.get_external_sensor("custom_interval_sensor")
+    always_on_sensor = external_repo.get_external_sensor("always_on_sensor")
+
+    queue = SensorEvaluationQueue()
+    assert queue.next_due_timestamp() is None
+
+    queue.push(simple_sensor, 30)
+    queue.push(custom_interval_sensor, 10)
+    queue.push(always_on_sensor, 20)
+    # pushing a sensor again replaces its due time
+    queue.push(simple_sensor, 5)
+    assert len(queue) == 3
+    assert queue.next_due_timestamp() == 5
+
+    assert queue.pop_due(4) == []
+    assert [(sensor.name, due) for sensor, due in queue.pop_due(15)] == [
+        ("simple_sensor", 5),
+        ("custom_interval_sensor", 10),
+    ]
+    assert len(queue) == 1
+    assert queue.next_due_timestamp() == 20
+
+    assert queue.report_tick_lateness() is None
+    queue.record_tick_lateness(1.0)
+    queue.record_tick_lateness(3.0)
+    assert queue.report_tick_lateness() == SensorTickLateness(
+        num_ticks=2, mean_seconds=2.0, max_seconds=3.0
+    )
+    assert queue.report_tick_lateness() is None
+
+
 def test_sensor_start_stop(executor, instance, workspace_context, external_repo):
     freeze_datetime = to_timezone(
         create_pendulum_time(year=2019, month=2, day=27, tz="UTC"),
@@ -834,3 +834,64 @@ def test_key_limit_with_extra_tags(use_threads, workspace_context, daemon, job_h
 
         list(daemon.run_iteration(bounded_ctx))
         assert get_run_ids(instance.run_launcher.queue()) == ["run-1"]
+
+
+def test_tag_limits_past_first_page(monkeypatch, workspace_context, daemon, job_handle):
+    monkeypatch.setattr(
+        "dagster._daemon.run_coordinator.queued_run_coordinator_daemon.QUEUED_RUNS_PAGE_SIZE", 2
+    )
+    with instance_for_queued_run_coordinator(
+        max_concurrent_runs=2,
+        tag_concurrency_limits=[{"key": "database", "value": "tiny", "limit": 1}],
+    ) as instance:
+        bounded_ctx = workspace_context.copy_for_test_instance(instance)
+
+        create_run(
+            instance,
+            job_handle,
+            run_id="in-progress-tiny",
+            status=DagsterRunStatus.STARTED,
+            tags={"database": "tiny"},
+        )
+        for i in range(5):
+            create_queued_run(instance, job_handle, run_id=f"tiny-{i}", tags={"database": "tiny"})
+        create_queued_run(instance, job_handle, run_id="large", tags={"database": "large"})
+
+        # the head of the queue is blocked by the in progress run, so later pages are checked
+        list(daemon.run_iteration(bounded_ctx))
+        assert get_run_ids(instance.run_launcher.queue()) == ["large"]
+
+
+def test_queued_runs_scanned_per_iteration(monkeypatch, workspace_context, daemon, job_handle):
+    monkeypatch.setattr(
+        "dagster._daemon.run_coordinator.queued_run_coordinator_daemon.QUEUED_RUNS_PAGE_SIZE", 2
+    )
+    monkeypatch.setattr(
+        "dagster._daemon.run_coordinator.queued_run_coordinator_daemon.QUEUED_RUNS_SCAN_MULTIPLIER",
+        2,
+    )
+    with instance_for_queued_run_coordinator(
+        max_concurrent_runs=4,
+        tag_concurrency_limits=[{"key": "database", "value": "tiny", "limit": 1}],
+    ) as instance:
+        bounded_ctx = workspace_context.copy_for_test_instance(instance)
+
+        create_run(
+            instance,
+            job_handle,
+            run_id="in-progress-tiny",
+            status=DagsterRunStatus.STARTED,
+            tags={"database": "tiny"},
+        )
+        for i in range(6):
+            create_queued_run(instance, job_handle, run_id=f"tiny-{i}", tags={"database": "tiny"})
+        create_queued_run(instance, job_handle, run_id="large", tags={"database": "large"})
+
+        # 3 runs can be launched, so only the 6 blocked runs at the head of the queue are checked
+        list(daemon.run_iteration(bounded_ctx))
+        assert get_run_ids(instance.run_launcher.queue()) == []
+
+        # 4 runs can be launched, so 8 runs are checked
+        instance.delete_run("in-progress-tiny")
+        list(daemon.run_iteration(bounded_ctx))
+        assert get_run_ids(instance.run_launcher.queue()) == ["tiny-0", "large"]
@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import cast
 
 import pendulum
 import pytest
@@ -16,7 +17,11 @@
     materialize,
     repository,
 )
-from dagster._core.definitions.multi_dimensional_partitions import MultiPartitionsDefinition
+from dagster._core.definitions.multi_dimensional_partitions import (
+    MultiPartitionsDefinition,
+    MultiPartitionsSubset,
+)
+from dagster._core.definitions.partition import DefaultPartitionsSubset
 from dagster._core.definitions.time_window_partitions import TimeWindow
 from dagster._core.errors import DagsterInvalidDefinitionError, DagsterInvariantViolationError
 from dagster._core.storage.tags import get_multidimensional_partition_tag
@@ -320,6 +325,69 @@ def test_multipartitions_subset_addition(initial, added):
     )
 
 
+def test_multipartitions_subset_is_stored_by_dimension():
+    static_keys = [f"customer_{i}" for i in range(50)]
+    daily_partitions_def = DailyPartitionsDefinition(start_date="2020-01-01")
+    multipartitions_def = MultiPartitionsDefinition(
+        {"date": daily_partitions_def, "static": StaticPartitionsDefinition(static_keys)}
+    )
+    current_time = datetime(year=2021, month=1, day=1)
+    date_keys = daily_partitions_def.get_partition_keys(current_time=current_time)
+
+    all_keys = multipartitions_def.get_partition_keys(current_time=current_time)
+    full_subset = cast(
+        MultiPartitionsSubset, multipartitions_def.empty_subset().with_partition_keys(all_keys)
+    )
+    assert len(full_subset) == len(all_keys) == len(date_keys) * len(static_keys)
+    # every date is paired with the same customers, so they share a single key set
+    assert len({id(keys) for keys in full_subset.secondary_keys_by_primary_key.values()}) == 1
+    assert "2020-06-01|customer_3" in full_subset
+    assert MultiPartitionKey({"date": "2020-06-01", "static": "customer_3"}) in full_subset
+    assert "2021-06-01|customer_3" not in full_subset
+    assert "2020-06-01" not in full_subset
+    assert full_subset.get_partition_keys(current_time=current_time) == set(all_keys)
+    assert multipartitions_def.deserialize_subset(full_subset.serialize()) == full_subset
+
+    assert full_subset.get_multipartition_keys_with_dimension_value("static", "customer_3") == {
+        MultiPartitionKey({"date": date_key, "static": "customer_3"}) for date_key in date_keys
+    }
+    assert full_subset.get_multipartition_keys_with_dimension_value("date", "2020-06-01") == {
+        MultiPartitionKey({"date": "2020-06-01", "static": static_key})
+        for static_key in static_keys
+    }
+
+    partial_keys = [key for key in all_keys if key.keys_by_dimension["static"] != "customer_3"]
+    partial_subset = multipartitions_def.empty_subset().with_partition_keys(partial_keys)
+    assert len(partial_subset) == len(partial_keys)
+    assert (full_subset - partial_subset).get_partition_keys() == set(
+        full_subset.get_multipartition_keys_with_dimension_value("static", "customer_3")
+    )
+    assert (full_subset & partial_subset) == partial_subset
+    assert (partial_subset | full_subset) == full_subset
+    assert set(partial_subset.get_partition_keys_not_in_subset(current_time=current_time)) == set(
+        all_keys
+    ) - set(partial_keys)
+
+
+def test_multipartitions_subset_inherited_default_subset_methods():
+    keys = [
+        MultiPartitionKey({"static": "a", "date": "2015-01-01"}),
+        MultiPartitionKey({"static": "b", "date": "2015-01-05"}),
+    ]
+    multi_subset = multipartitions_def.empty_subset().with_partition_keys(keys)
+    default_subset = DefaultPartitionsSubset(multipartitions_def, set(keys))
+
+    # methods inherited from DefaultPartitionsSubset read the keys from _subset
+    assert DefaultPartitionsSubset.get_partition_keys(multi_subset) == set(keys)
+    assert (
+        multipartitions_def.deserialize_subset(DefaultPartitionsSubset.serialize(multi_subset))
+        == multi_subset
+    )
+    assert default_subset == multi_subset
+    assert multi_subset == default_subset
+    assert DefaultPartitionsSubset.__eq__(default_subset, multi_subset)
+
+
 def test_asset_partition_key_is_multipartition_key():
     class MyIOManager(IOManager):
         def handle_output(self, context, obj):
@@ -1188,3 +1188,85 @@ def test_has_partition_key():
     )
     assert partitions_def.has_partition_key("2020-01-01")
     assert partitions_def.has_partition_key("2020-03-15")
+
+
+@pytest.mark.parametrize(
+    "partitions_def",
+    [
+        HourlyPartitionsDefinition(start_date="2020-01-01-00:00", timezone="US/Central"),
+        DailyPartitionsDefinition(start_date="2020-01-01", timezone="US/Central"),
+        WeeklyPartitionsDefinition(start_date="2020-01-01", timezone="Europe/Berlin"),
+        MonthlyPartitionsDefinition(start_date="2020-01-01", timezone="US/Central"),
+        TimeWindowPartitionsDefinition(
+            start="2020-01-01-00:00", cron_schedule="*/15 * * * *", fmt="%Y-%m-%d-%H:%M"
+        ),
+    ],
+)
+def test_fixed_cadence_partition_keys_match_cron_iteration(partitions_def):
+    current_time = create_pendulum_time(2022, 1, 1, tz="US/Central")
+    if partitions_def.cron_schedule == "*/15 * * * *":
+        current_time = create_pendulum_time(2020, 3, 1, tz="UTC")
+
+    expected_windows = []
+    for time_window in partitions_def._iterate_cron_time_windows(  # noqa: SLF001
+        partitions_def.start
+    ):
+        if time_window.end.timestamp() > current_time.timestamp():
+            break
+        expected_windows.append(time_window)
+    expected_keys = [window.start.strftime(partitions_def.fmt) for window in expected_windows]
+
+    partition_keys = partitions_def.get_partition_keys(current_time=current_time)
+    assert partition_keys == expected_keys
+    assert partitions_def.get_num_partitions(current_time=current_time) == len(expected_keys)
+    assert (
+        partitions_def.time_windows_for_partition_keys(partition_keys[::97])
+        == expected_windows[::97]
+    )
+
+
+@pytest.mark.parametrize(
+    "partitions_def",
+    [
+        DailyPartitionsDefinition(start_date="2022-01-01", hour_offset=2),
+        DailyPartitionsDefinition(
+            start_date="2022-01-01", hour_offset=2, timezone="America/Chicago"
+        ),
+        DailyPartitionsDefinition(
+            start_date="2022-01-01", hour_offset=2, timezone="Australia/Sydney"
+        ),
+        WeeklyPartitionsDefinition(start_date="2021-01-01", day_offset=2, hour_offset=3),
+        MonthlyPartitionsDefinition(
+            start_date="2021-01-01", day_offset=5, hour_offset=1, timezone="Australia/Sydney"
+        ),
+        TimeWindowPartitionsDefinition(
+            start="2021-01-01", cron_schedule="30 2 */2 * *", fmt="%Y-%m-%d"
+        ),
+    ],
+)
+def test_partition_keys_with_offsets_in_subsets(partitions_def):
+    # the partition keys leave out the offsets, so they are earlier than the windows' starts
+    partition_keys = partitions_def.get_partition_keys(
+        current_time=create_pendulum_time(2022, 6, 1, tz="UTC")
+    )
+    subset = partitions_def.empty_subset().with_partition_keys(partition_keys[:3])
+
+    assert partition_keys[0] in subset
+    assert "2020-01-01" not in subset
+    assert list(subset.get_partition_keys()) == partition_keys[:3]
+    assert len(subset.included_time_windows) == 1
+    assert subset.included_time_windows[0].start == partitions_def.start_time_for_partition_key(
+        partition_keys[0]
+    )
+    assert (
+        list(partitions_def.deserialize_subset(subset.serialize()).get_partition_keys())
+        == partition_keys[:3]
+    )
+    assert (
+        list(
+            subset.get_partition_keys_not_in_subset(
+                current_time=create_pendulum_time(2022, 6, 1, tz="UTC")
+            )
+        )
+        == partition_keys[3:]
+    )
@@ -45,9 +45,7 @@ def resource_for_dynamic_step(init_context):
 
         # We have not yet reached the allowed initializaton number, allow
         # initialization to complete and add to total init number.
-        with open(os.path.join(init_context.resource_config["path"], "count.pkl"), "wb") as f:
-            init_count += 1
-            pickle.dump(init_count, f)
+        _write_count(init_context.resource_config["path"], init_count + 1)
         return None
 
     @op(required_resource_keys={"foo"})
@@ -99,9 +97,7 @@ def mapped_op(context, x):
 
         # We have not yet reached the allowed initializaton number, allow
         # initialization to complete and add to total init number.
-        with open(os.path.join(context.op_config["path"], "count.pkl"), "wb") as f:
-            run_count += 1
-            pickle.dump(run_count, f)
+        _write_count(context.op_config["path"], run_count + 1)
 
     @op
     def consumer(x):
@@ -126,9 +122,16 @@ def _regexes_match(regexes, the_list):
     return all([re.match(regex, item) for regex, item in zip(regexes, the_list)])
 
 
+def _write_count(path, count):
+    # replace the file atomically, so that steps running concurrently never read a partial write
+    tmp_path = os.path.join(path, f"count.pkl.{os.getpid()}")
+    with open(tmp_path, "wb") as f:
+        pickle.dump(count, f)
+    os.replace(tmp_path, os.path.join(path, "count.pkl"))
+
+
 def _write_blank_count(path):
-    with open(os.path.join(path, "count.pkl"), "wb") as f:
-        pickle.dump(0, f)
+    _write_count(path, 0)
 
 
 def assert_expected_failure_behavior(job_fn, config_fn):
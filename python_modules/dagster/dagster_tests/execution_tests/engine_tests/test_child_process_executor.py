@@ -8,8 +8,10 @@
     ChildProcessCrashException,
     ChildProcessDoneEvent,
     ChildProcessEvent,
+    ChildProcessEventSelector,
     ChildProcessStartEvent,
     ChildProcessSystemErrorEvent,
+    ChildProcessWorkerPool,
     execute_child_process_command,
 )
 from dagster._utils import segfault
@@ -44,6 +46,11 @@ def execute(self):
         segfault()
 
 
+class PidCommand(ChildProcessCommand):
+    def execute(self):
+        yield os.getpid()
+
+
 class LongRunningCommand(ChildProcessCommand):
     def execute(self):
         time.sleep(0.5)
@@ -102,6 +109,91 @@ def test_child_process_segfault():
     assert exc.value.exit_code == -11
 
 
+def test_child_process_commands_with_selector():
+    selector = ChildProcessEventSelector()
+    iters = {
+        a_str: execute_child_process_command(
+            multiprocessing, DoubleAStringChildProcessCommand(a_str), selector
+        )
+        for a_str in ["a", "b"]
+    }
+
+    results = []
+    while iters:
+        for key in list(iters):
+            try:
+                while True:
+                    event = next(iters[key])
+                    if event is None:
+                        break
+                    if not isinstance(event, ChildProcessEvent):
+                        results.append(event)
+            except StopIteration:
+                del iters[key]
+        selector.wait(1)
+
+    assert sorted(results) == ["aa", "bb"]
+    # a start, value, and done event from each child process
+    assert selector.num_events_delivered == 6
+    assert selector.mean_delivery_latency is not None
+    assert 0 <= selector.mean_delivery_latency <= selector.max_delivery_latency
+
+
+def _execute_in_pool(pool, command):
+    worker = pool.acquire()
+    try:
+        return [
+            event
+            for event in worker.execute(command)
+            if event is not None and not isinstance(event, ChildProcessEvent)
+        ]
+    finally:
+        pool.release(worker)
+
+
+def test_worker_pool_reuses_workers():
+    with ChildProcessWorkerPool(multiprocessing) as pool:
+        assert _execute_in_pool(pool, DoubleAStringChildProcessCommand("aa")) == ["aaaa"]
+        first_pid = _execute_in_pool(pool, PidCommand())[0]
+        assert first_pid != os.getpid()
+        assert _execute_in_pool(pool, PidCommand()) == [first_pid]
+
+
+def test_worker_pool_retires_workers():
+    with ChildProcessWorkerPool(multiprocessing, max_commands_per_worker=2) as pool:
+        pids = [_execute_in_pool(pool, PidCommand())[0] for _ in range(4)]
+    assert pids[0] == pids[1]
+    assert pids[2] == pids[3]
+    assert pids[1] != pids[2]
+
+
+def test_worker_pool_uncaught_exception():
+    with ChildProcessWorkerPool(multiprocessing) as pool:
+        worker = pool.acquire()
+        results = [
+            event
+            for event in worker.execute(ThrowAnErrorCommand())
+            if isinstance(event, ChildProcessSystemErrorEvent)
+        ]
+        pool.release(worker)
+        assert len(results) == 1
+        assert "AnError" in str(results[0].error_info.message)
+
+        # the worker survives errors raised by commands
+        assert _execute_in_pool(pool, DoubleAStringChildProcessCommand("aa")) == ["aaaa"]
+
+
+def test_worker_pool_crashy_process():
+    with ChildProcessWorkerPool(multiprocessing) as pool:
+        worker = pool.acquire()
+        with pytest.raises(ChildProcessCrashException) as exc:
+            list(worker.execute(CrashyCommand()))
+        assert exc.value.exit_code == 1
+        pool.release(worker)
+
+        assert _execute_in_pool(pool, DoubleAStringChildProcessCommand("aa")) == ["aaaa"]
+
+
 @pytest.mark.skip("too long")
 def test_long_running_command():
     list(execute_child_process_command(multiprocessing, LongRunningCommand()))
@@ -76,6 +76,35 @@ def test_explicit_spawn():
             assert result.output_for_node("adder") == 11
 
 
+def test_worker_pool_execution():
+    with instance_for_test() as instance:
+        recon_job = reconstructable(define_diamond_job)
+        with execute_job(
+            recon_job,
+            run_config={
+                "execution": {
+                    "config": {
+                        "multiprocess": {
+                            "max_concurrent": 2,
+                            "worker_pool": {"max_steps_per_worker": 2},
+                        }
+                    }
+                },
+            },
+            instance=instance,
+        ) as result:
+            assert result.success
+            assert result.output_for_node("adder") == 11
+
+            worker_pids = {
+                event.event_specific_data.metadata["pid"].text
+                for event in result.all_events
+                if event.event_type == DagsterEventType.STEP_WORKER_STARTED
+            }
+            # four steps executed by at most two workers at a time, each retired after two steps
+            assert 2 <= len(worker_pids) < 4
+
+
 @pytest.mark.skipif(os.name == "nt", reason="No forkserver on windows")
 def test_forkserver_execution():
     with instance_for_test() as instance:
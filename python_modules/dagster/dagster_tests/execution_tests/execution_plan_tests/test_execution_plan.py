@@ -402,6 +402,57 @@ def tag_concurrency_limits_job():
             active_execution.mark_skipped(step_key)
 
 
+def test_tag_concurrency_limits_released_on_completion():
+    @op(tags={"database": "tiny"})
+    def tiny_op(_):
+        return 1
+
+    @op(tags={"database": "tiny"})
+    def downstream_tiny_op(_, _x):
+        pass
+
+    @op
+    def untagged_op(_):
+        pass
+
+    @job
+    def tag_concurrency_limits_job():
+        downstream_tiny_op(tiny_op.alias("tiny_1")())
+        tiny_op.alias("tiny_2")()
+        tiny_op.alias("tiny_3")()
+        untagged_op()
+
+    plan = create_execution_plan(tag_concurrency_limits_job)
+    tag_concurrency_limits = [{"key": "database", "value": "tiny", "limit": 1}]
+
+    with plan.start(
+        RetryMode.DISABLED, tag_concurrency_limits=tag_concurrency_limits
+    ) as active_execution:
+        assert [step.key for step in active_execution.get_steps_to_execute()] == [
+            "tiny_1",
+            "untagged_op",
+        ]
+        assert active_execution.get_steps_to_execute() == []
+
+        active_execution.mark_success("untagged_op")
+        assert active_execution.get_steps_to_execute() == []
+
+        active_execution.mark_step_produced_output(StepOutputHandle("tiny_1", "result"))
+        active_execution.mark_success("tiny_1")
+        assert [step.key for step in active_execution.get_steps_to_execute()] == ["tiny_2"]
+
+        active_execution.mark_failed("tiny_2")
+        assert [step.key for step in active_execution.get_steps_to_execute()] == ["tiny_3"]
+
+        active_execution.mark_success("tiny_3")
+        assert [step.key for step in active_execution.get_steps_to_execute()] == [
+            "downstream_tiny_op"
+        ]
+        active_execution.mark_success("downstream_tiny_op")
+
+        assert active_execution.is_complete
+
+
 def test_executor_not_created_for_execute_plan():
     instance = DagsterInstance.ephemeral()
     pipe = define_diamond_job()
@@ -1,6 +1,26 @@
-from dagster import DependencyDefinition, GraphDefinition, In, Int, Out, Output, op
+from unittest import mock
+
+from dagster import (
+    DependencyDefinition,
+    DynamicOut,
+    DynamicOutput,
+    GraphDefinition,
+    In,
+    Int,
+    Out,
+    Output,
+    job,
+    op,
+)
 from dagster._core.definitions.job_base import InMemoryJob
-from dagster._core.execution.api import create_execution_plan, execute_plan
+from dagster._core.execution.api import (
+    create_execution_plan,
+    create_execution_plan_for_steps,
+    execute_plan,
+)
+from dagster._core.execution.plan.outputs import StepOutputHandle
+from dagster._core.execution.plan.plan import ExecutionPlan
+from dagster._core.execution.plan.state import KnownExecutionState
 from dagster._core.instance import DagsterInstance
 
 
@@ -114,3 +134,93 @@ def has_tag(context):
     )
 
     assert called["yup"]
+
+
+def test_create_execution_plan_for_steps_from_snapshot():
+    job_def = define_two_int_pipeline()
+    instance = DagsterInstance.ephemeral()
+    execution_plan = create_execution_plan(job_def)
+    dagster_run = instance.create_run_for_job(job_def=job_def, execution_plan=execution_plan)
+
+    with mock.patch.object(ExecutionPlan, "build", side_effect=Exception("Plan was rebuilt")):
+        step_plan = create_execution_plan_for_steps(
+            InMemoryJob(job_def),
+            dagster_run,
+            instance.get_execution_plan_snapshot(dagster_run.execution_plan_snapshot_id),
+            step_keys_to_execute=["add_one"],
+            known_state=KnownExecutionState(
+                ready_outputs={StepOutputHandle("return_one", "result")}
+            ),
+        )
+
+    assert step_plan.step_keys_to_execute == ["add_one"]
+    assert step_plan.artifacts_persisted == execution_plan.artifacts_persisted
+
+    events = execute_plan(
+        create_execution_plan(job_def, step_keys_to_execute=["return_one"]),
+        InMemoryJob(job_def),
+        dagster_run=dagster_run,
+        instance=instance,
+    )
+    events += execute_plan(
+        step_plan, InMemoryJob(job_def), dagster_run=dagster_run, instance=instance
+    )
+    assert len(find_events(events, event_type="STEP_SUCCESS")) == 2
+
+
+def test_create_execution_plan_for_steps_without_snapshot():
+    job_def = define_two_int_pipeline()
+    instance = DagsterInstance.ephemeral()
+    execution_plan = create_execution_plan(job_def)
+    dagster_run = instance.create_run_for_job(job_def=job_def, execution_plan=execution_plan)
+
+    with mock.patch.object(
+        DagsterInstance,
+        "get_execution_plan_snapshot",
+        side_effect=Exception("Snapshot was fetched"),
+    ):
+        step_plan = create_execution_plan_for_steps(
+            InMemoryJob(job_def),
+            dagster_run,
+            None,
+            step_keys_to_execute=["add_one"],
+            known_state=KnownExecutionState(
+                ready_outputs={StepOutputHandle("return_one", "result")}
+            ),
+        )
+
+    assert step_plan.step_keys_to_execute == ["add_one"]
+
+
+def test_create_execution_plan_for_dynamic_steps_from_snapshot():
+    @op(out=DynamicOut())
+    def emit():
+        for i in range(3):
+            yield DynamicOutput(i, mapping_key=str(i))
+
+    @op
+    def double(x):
+        return x * 2
+
+    @job
+    def dynamic_job():
+        emit().map(double)
+
+    instance = DagsterInstance.ephemeral()
+    execution_plan = create_execution_plan(dynamic_job)
+    dagster_run = instance.create_run_for_job(job_def=dynamic_job, execution_plan=execution_plan)
+
+    with mock.patch.object(ExecutionPlan, "build", side_effect=Exception("Plan was rebuilt")):
+        step_plan = create_execution_plan_for_steps(
+            InMemoryJob(dynamic_job),
+            dagster_run,
+            instance.get_execution_plan_snapshot(dagster_run.execution_plan_snapshot_id),
+            step_keys_to_execute=["double[1]"],
+            known_state=KnownExecutionState(
+                dynamic_mappings={"emit": {"result": ["0", "1", "2"]}},
+                ready_outputs={StepOutputHandle("emit", "result", str(i)) for i in range(3)},
+            ),
+        )
+
+    assert step_plan.step_keys_to_execute == ["double[1]"]
+    assert step_plan.get_step_by_key("double[1]")
@@ -1,15 +1,19 @@
 from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union, cast, overload
 from unittest import mock
 
+import pytest
 from dagster import (
+    SKIP_UNCHANGED_STEPS_TAG,
     AssetMaterialization,
     AssetsDefinition,
     DagsterInstance,
+    DagsterInvariantViolationError,
     IOManager,
     SourceAsset,
     asset,
     io_manager,
     materialize,
+    mem_io_manager,
     observable_source_asset,
 )
 from dagster._config.field import Field
@@ -941,3 +945,87 @@ def test_stale_cause_comparison():
     cause_2 = StaleCause(key=AssetKey(["foo"]), category=StaleCauseCategory.DATA, reason="ok")
 
     assert cause_1 < cause_2
+
+
+def test_skip_unchanged_steps():
+    def get_assets(alpha_code_version: str):
+        @asset(code_version=alpha_code_version)
+        def alpha():
+            return 1
+
+        @asset(code_version="1")
+        def beta(alpha):
+            return alpha + 1
+
+        @asset
+        def gamma(beta):
+            return beta + 1
+
+        return [alpha, beta, gamma]
+
+    def get_executed_step_keys(result: ExecuteInProcessResult) -> Sequence[str]:
+        return sorted(event.step_key for event in result.get_step_success_events())
+
+    tags = {SKIP_UNCHANGED_STEPS_TAG: "true"}
+    with instance_for_test() as instance:
+        result = materialize(get_assets("1"), instance=instance, tags=tags)
+        assert get_executed_step_keys(result) == ["alpha", "beta", "gamma"]
+
+        # alpha and beta are unchanged, gamma has no code version and is always executed
+        result = materialize(get_assets("1"), instance=instance, tags=tags)
+        assert get_executed_step_keys(result) == ["gamma"]
+        assert result.output_for_node("gamma") == 3
+
+        # a new code version for alpha changes the data version beta depends on
+        result = materialize(get_assets("2"), instance=instance, tags=tags)
+        assert get_executed_step_keys(result) == ["alpha", "beta", "gamma"]
+
+        # only steps with new code versions or changed upstream data versions are executed
+        result = materialize(get_assets("2"), instance=instance, tags=tags)
+        assert get_executed_step_keys(result) == ["gamma"]
+
+        # without the tag, all steps are executed
+        result = materialize(get_assets("2"), instance=instance)
+        assert get_executed_step_keys(result) == ["alpha", "beta", "gamma"]
+
+
+def test_skip_unchanged_steps_all_unchanged():
+    @asset(code_version="1")
+    def alpha():
+        return 1
+
+    @asset(code_version="1")
+    def beta(alpha):
+        return alpha + 1
+
+    tags = {SKIP_UNCHANGED_STEPS_TAG: "true"}
+    with instance_for_test() as instance:
+        materialize([alpha, beta], instance=instance, tags=tags)
+
+        # materializing alpha again without a code change does not change its data version
+        materialize([alpha], instance=instance)
+        result = materialize([alpha, beta], instance=instance, tags=tags)
+        assert result.success
+        assert result.get_step_success_events() == []
+
+
+def test_skip_unchanged_steps_requires_persisted_outputs():
+    def get_assets(beta_code_version: str):
+        @asset(code_version="1")
+        def alpha():
+            return 1
+
+        @asset(code_version=beta_code_version)
+        def beta(alpha):
+            return alpha + 1
+
+        return [alpha, beta]
+
+    tags = {SKIP_UNCHANGED_STEPS_TAG: "true"}
+    resources = {"io_manager": mem_io_manager}
+    with instance_for_test() as instance:
+        materialize(get_assets("1"), instance=instance, tags=tags, resources=resources)
+
+        # beta would have to load the output of the skipped alpha, which was only kept in memory
+        with pytest.raises(DagsterInvariantViolationError, match="does not persist its outputs"):
+            materialize(get_assets("2"), instance=instance, tags=tags, resources=resources)
@@ -4,6 +4,7 @@
 
 import dagster._check as check
 import dagster._seven as seven
+import grpc
 import pytest
 from dagster._core.errors import DagsterUserCodeUnreachableError
 from dagster._core.test_utils import instance_for_test
@@ -211,3 +212,59 @@ def test_detect_server_restart():
         server_process.wait()
 
     assert server_id_one != server_id_two
+
+
+def test_channel_shared_between_clients():
+    with ephemeral_grpc_api_client() as api_client:
+        assert api_client.ping("foo") == "foo"
+        other_client = DagsterGrpcClient(socket=api_client.socket, port=api_client.port)
+        assert other_client._get_channel() is api_client._get_channel()  # noqa: SLF001
+        assert other_client.ping("bar") == "bar"
+
+
+def test_reconnect_after_server_restart():
+    port, server_process = create_server_process()
+    api_client = DagsterGrpcClient(port=port)
+    try:
+        server_id_one = api_client.get_server_id()
+    finally:
+        interrupt_ipc_subprocess_pid(server_process.pid)
+        server_process.terminate()
+        server_process.wait()
+
+    with pytest.raises(DagsterUserCodeUnreachableError):
+        api_client.get_server_id()
+
+    # the same client reaches a new server on the same port
+    with instance_for_test() as instance:
+        server_process = open_server_process(instance.get_ref(), port=port, socket=None)
+    try:
+        server_id_two = api_client.get_server_id()
+    finally:
+        interrupt_ipc_subprocess_pid(server_process.pid)
+        server_process.terminate()
+        server_process.wait()
+
+    assert server_id_one != server_id_two
+
+
+@pytest.mark.parametrize(
+    "compression",
+    [grpc.Compression.NoCompression, grpc.Compression.Gzip, grpc.Compression.Deflate],
+)
+def test_compression(compression):
+    with ephemeral_grpc_api_client() as api_client:
+        assert api_client.compression == grpc.Compression.NoCompression
+        assert api_client.ping("foo") == "foo"
+
+        compressed_client = DagsterGrpcClient(
+            socket=api_client.socket, port=api_client.port, compression=compression
+        )
+        assert compressed_client.ping("foo") == "foo"
+        results = list(compressed_client.streaming_ping(sequence_length=10, echo="foo"))
+        assert len(results) == 10
+
+
+def test_default_compression():
+    assert DagsterGrpcClient(port=8080).compression == grpc.Compression.NoCompression
+    assert DagsterGrpcClient(port=8080, host="example.com").compression == grpc.Compression.Gzip
@@ -0,0 +1,300 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+import pytest
+from dagster import file_relative_path
+from dagster._core.host_representation.external_data import (
+    ExternalJobSubsetResult,
+    ExternalRepositoryErrorData,
+)
+from dagster._core.host_representation.origin import (
+    ExternalJobOrigin,
+    ExternalRepositoryOrigin,
+    InProcessCodeLocationOrigin,
+)
+from dagster._core.snap import create_job_snapshot_id
+from dagster._core.snap.execution_plan_snapshot import ExecutionPlanSnapshot
+from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
+from dagster._grpc import server as grpc_server
+from dagster._grpc.__generated__ import api_pb2
+from dagster._grpc.server import CachingIterator, DagsterApiServer, SnapshotCache
+from dagster._grpc.types import ExecutionPlanSnapshotArgs, JobSubsetSnapshotArgs
+from dagster._serdes import deserialize_value, serialize_value
+
+LOADABLE_TARGET_ORIGIN = LoadableTargetOrigin(
+    python_file=file_relative_path(__file__, "grpc_repo.py"), attribute="bar_repo"
+)
+
+REPOSITORY_ORIGIN = ExternalRepositoryOrigin(
+    InProcessCodeLocationOrigin(LOADABLE_TARGET_ORIGIN), "bar_repo"
+)
+
+
+@contextmanager
+def _api_server() -> Iterator[DagsterApiServer]:
+    termination_event = threading.Event()
+    server = DagsterApiServer(
+        server_termination_event=termination_event,
+        loadable_target_origin=LOADABLE_TARGET_ORIGIN,
+    )
+    try:
+        yield server
+    finally:
+        termination_event.set()
+        server.cleanup()
+
+
+def _count_calls(monkeypatch, name: str):
+    calls = []
+    fn = getattr(grpc_server, name)
+
+    def _counted(*args, **kwargs):
+        calls.append(args)
+        return fn(*args, **kwargs)
+
+    monkeypatch.setattr(grpc_server, name, _counted)
+    return calls
+
+
+def _serialized_pieces(server: DagsterApiServer, request) -> Iterator[str]:
+    return server._get_serialized_external_repository_data_pieces(request)  # noqa: SLF001
+
+
+def test_snapshot_cache_evicts_least_recently_used():
+    cache = SnapshotCache(max_entries=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    assert cache.get("a") == "1"
+
+    cache.set("c", "3")
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.get_or_compute("c", lambda: "computed") == "3"
+    assert cache.get_or_compute("d", lambda: "4") == "4"
+    assert cache.get("a") is None
+
+
+def test_snapshot_cache_computes_each_key_once():
+    cache = SnapshotCache()
+    calls = []
+    computing_a = threading.Event()
+    finish_a = threading.Event()
+
+    def _compute_a():
+        calls.append("a")
+        computing_a.set()
+        finish_a.wait()
+        return "1"
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_compute("a", _compute_a)))
+        for _ in range(3)
+    ]
+    threads[0].start()
+    computing_a.wait()
+    for thread in threads[1:]:
+        thread.start()
+
+    # other keys aren't blocked by the computation of "a"
+    assert cache.get_or_compute("b", lambda: "2") == "2"
+
+    # wait for the other threads to block on the computation of "a"
+    time.sleep(0.1)
+    finish_a.set()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["1", "1", "1"]
+    assert calls == ["a"]
+
+
+def test_caching_iterator():
+    computed = []
+
+    def _items():
+        for i in range(3):
+            computed.append(i)
+            yield i
+
+    items = CachingIterator(_items())
+    first = iter(items)
+    assert next(first) == 0
+    assert computed == [0]
+
+    assert list(items) == [0, 1, 2]
+    assert list(first) == [1, 2]
+    assert list(items) == [0, 1, 2]
+    assert computed == [0, 1, 2]
+
+    def _failing_items():
+        yield 0
+        raise Exception("failed")
+
+    failing = CachingIterator(_failing_items())
+    for _ in range(2):
+        iterator = iter(failing)
+        assert next(iterator) == 0
+        with pytest.raises(Exception, match="failed"):
+            next(iterator)
+
+
+def test_repository_snapshot_cached(monkeypatch):
+    calls = _count_calls(monkeypatch, "external_repository_data_from_def")
+    request = api_pb2.ExternalRepositoryRequest(
+        serialized_repository_python_origin=serialize_value(REPOSITORY_ORIGIN)
+    )
+
+    with _api_server() as server:
+        first = server.ExternalRepository(request, None).serialized_external_repository_data
+        second = server.ExternalRepository(request, None).serialized_external_repository_data
+        assert first == second
+        assert len(calls) == 1
+
+        deferred = server.ExternalRepository(
+            api_pb2.ExternalRepositoryRequest(
+                serialized_repository_python_origin=serialize_value(REPOSITORY_ORIGIN),
+                defer_snapshots=True,
+            ),
+            None,
+        ).serialized_external_repository_data
+        assert deferred != first
+        assert len(calls) == 2
+
+
+def test_job_snapshots_cached(monkeypatch):
+    job_calls = _count_calls(monkeypatch, "external_job_data_from_def")
+    subset_calls = _count_calls(monkeypatch, "get_external_pipeline_subset_result")
+    plan_calls = _count_calls(monkeypatch, "get_external_execution_plan_snapshot")
+    job_origin = ExternalJobOrigin(REPOSITORY_ORIGIN, "foo")
+
+    with _api_server() as server:
+        for _ in range(2):
+            server.ExternalJob(
+                api_pb2.ExternalJobRequest(
+                    serialized_repository_origin=serialize_value(REPOSITORY_ORIGIN),
+                    job_name="foo",
+                ),
+                None,
+            )
+        assert len(job_calls) == 1
+
+        for solid_selection in [["do_something"], ["do_something"], ["do_input"]]:
+            reply = server.ExternalPipelineSubsetSnapshot(
+                api_pb2.ExternalPipelineSubsetSnapshotRequest(
+                    serialized_pipeline_subset_snapshot_args=serialize_value(
+                        JobSubsetSnapshotArgs(job_origin, solid_selection)
+                    )
+                ),
+                None,
+            )
+            result = deserialize_value(
+                reply.serialized_external_pipeline_subset_result, ExternalJobSubsetResult
+            )
+            assert result.success
+        assert len(subset_calls) == 2
+
+        # failed subsets are computed again on each request
+        for _ in range(2):
+            server.ExternalPipelineSubsetSnapshot(
+                api_pb2.ExternalPipelineSubsetSnapshotRequest(
+                    serialized_pipeline_subset_snapshot_args=serialize_value(
+                        JobSubsetSnapshotArgs(job_origin, ["does_not_exist"])
+                    )
+                ),
+                None,
+            )
+        assert len(subset_calls) == 4
+
+        job_snapshot_id = create_job_snapshot_id(
+            deserialize_value(
+                server.ExternalJob(
+                    api_pb2.ExternalJobRequest(
+                        serialized_repository_origin=serialize_value(REPOSITORY_ORIGIN),
+                        job_name="foo",
+                    ),
+                    None,
+                ).serialized_job_data
+            ).job_snapshot
+        )
+
+        for step_keys_to_execute in [None, None, ["do_something"]]:
+            reply = server.ExecutionPlanSnapshot(
+                api_pb2.ExecutionPlanSnapshotRequest(
+                    serialized_execution_plan_snapshot_args=serialize_value(
+                        ExecutionPlanSnapshotArgs(
+                            job_origin=job_origin,
+                            solid_selection=[],
+                            run_config={},
+                            step_keys_to_execute=step_keys_to_execute,
+                            job_snapshot_id=job_snapshot_id,
+                        )
+                    )
+                ),
+                None,
+            )
+            assert isinstance(
+                deserialize_value(reply.serialized_execution_plan_snapshot),
+                ExecutionPlanSnapshot,
+            )
+        assert len(plan_calls) == 2
+
+
+def test_repository_pieces_streamed_while_cached(monkeypatch):
+    pieces_from_def = grpc_server.external_repository_data_pieces_from_def
+    computed = []
+
+    def _counted_pieces_from_def(*args, **kwargs):
+        for piece in pieces_from_def(*args, **kwargs):
+            computed.append(piece)
+            yield piece
+
+    monkeypatch.setattr(
+        grpc_server, "external_repository_data_pieces_from_def", _counted_pieces_from_def
+    )
+    request = api_pb2.ExternalRepositoryRequest(
+        serialized_repository_python_origin=serialize_value(REPOSITORY_ORIGIN)
+    )
+
+    with _api_server() as server:
+        first = _serialized_pieces(server, request)
+        first_piece = next(first)
+        assert len(computed) == 1
+
+        # a concurrent request shares the pieces that are still being computed
+        second = list(_serialized_pieces(server, request))
+        assert [first_piece, *first] == second
+        assert list(_serialized_pieces(server, request)) == second
+        assert len(computed) == len(second)
+
+
+def test_repository_pieces_errors_not_cached(monkeypatch):
+    pieces_from_def = grpc_server.external_repository_data_pieces_from_def
+    fail = [True]
+
+    def _failing_pieces_from_def(*args, **kwargs):
+        for piece in pieces_from_def(*args, **kwargs):
+            if fail[0]:
+                raise Exception("failed")
+            yield piece
+
+    monkeypatch.setattr(
+        grpc_server, "external_repository_data_pieces_from_def", _failing_pieces_from_def
+    )
+    request = api_pb2.ExternalRepositoryRequest(
+        serialized_repository_python_origin=serialize_value(REPOSITORY_ORIGIN)
+    )
+
+    with _api_server() as server:
+        failed = list(_serialized_pieces(server, request))
+        assert len(failed) == 1
+        assert isinstance(deserialize_value(failed[0]), ExternalRepositoryErrorData)
+
+        fail[0] = False
+        pieces = list(_serialized_pieces(server, request))
+        assert len(pieces) > 1
+        assert not any(
+            isinstance(deserialize_value(piece), ExternalRepositoryErrorData) for piece in pieces
+        )
@@ -410,7 +410,18 @@ def _fake_handle_new_event(event):
 
             return orig_handle_new_event(event)
 
-        with mock.patch.object(instance, "handle_new_event", _fake_handle_new_event):
+        orig_handle_new_events = instance.handle_new_events
+
+        # user-generated log calls are buffered and written in batches
+        def _fake_handle_new_events(events):
+            if any(not event.dagster_event for event in events):
+                raise Exception("failed writing user-generated event")
+
+            return orig_handle_new_events(events)
+
+        with mock.patch.object(
+            instance, "handle_new_event", _fake_handle_new_event
+        ), mock.patch.object(instance, "handle_new_events", _fake_handle_new_events):
             result = execute_job(
                 reconstructable(define_logging_job),
                 run_config={"execution": {"config": {"in_process": {}}}},
@@ -0,0 +1,226 @@
+import os
+import shutil
+import sys
+import tempfile
+import time
+from typing import Optional, Sequence
+
+import pytest
+from dagster._core.execution.compute_logs import should_disable_io_stream_redirect
+from dagster._core.storage.cloud_storage_compute_log_manager import (
+    CHUNKED_UPLOAD_POLLING_INTERVAL,
+    CloudStorageComputeLogManager,
+)
+from dagster._core.storage.compute_log_manager import ComputeIOType
+from dagster._core.storage.local_compute_log_manager import (
+    IO_TYPE_EXTENSION,
+    LocalComputeLogManager,
+)
+from dagster._utils import ensure_dir, ensure_file
+
+from .utils.captured_log_manager import TestCapturedLogManager
+
+
+class LocalDirectoryComputeLogManager(CloudStorageComputeLogManager):
+    """Uses a second local directory as its cloud storage, storing chunked uploads as one file
+    per chunk until they are completed.
+    """
+
+    def __init__(
+        self,
+        local_dir: str,
+        storage_dir: str,
+        upload_interval: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        fail_chunk_number: Optional[int] = None,
+    ):
+        self._local_manager = LocalComputeLogManager(local_dir)
+        self._storage_dir = storage_dir
+        self._storage_manager = LocalComputeLogManager(storage_dir)
+        self._upload_interval = upload_interval
+        self._chunk_size = chunk_size
+        self._fail_chunk_number = fail_chunk_number
+        self.uploaded_chunks = []
+        self.whole_uploads = []
+        self.aborted_uploads = []
+
+    @property
+    def local_manager(self) -> LocalComputeLogManager:
+        return self._local_manager
+
+    @property
+    def upload_interval(self) -> Optional[int]:
+        return self._upload_interval
+
+    @property
+    def supports_chunked_upload(self) -> bool:
+        return self._chunk_size is not None
+
+    @property
+    def upload_chunk_size(self) -> int:
+        assert self._chunk_size
+        return self._chunk_size
+
+    def _storage_path(self, log_key: Sequence[str], io_type: ComputeIOType, partial=False) -> str:
+        # lay out the storage directory like the local directory, which shortens long keys
+        return self._storage_manager.get_captured_local_path(
+            log_key, IO_TYPE_EXTENSION[io_type], partial=partial
+        )
+
+    def delete_logs(
+        self, log_key: Optional[Sequence[str]] = None, prefix: Optional[Sequence[str]] = None
+    ) -> None:
+        self.local_manager.delete_logs(log_key=log_key, prefix=prefix)
+        if log_key:
+            for io_type in ComputeIOType:
+                for partial in [True, False]:
+                    path = self._storage_path(log_key, io_type, partial)
+                    if os.path.exists(path):
+                        os.remove(path)
+        else:
+            shutil.rmtree(os.path.join(self._storage_dir, *(prefix or [])), ignore_errors=True)
+
+    def download_url_for_type(self, log_key: Sequence[str], io_type: ComputeIOType) -> str:
+        return self._storage_path(log_key, io_type)
+
+    def display_path_for_type(self, log_key: Sequence[str], io_type: ComputeIOType) -> str:
+        return self._storage_path(log_key, io_type)
+
+    def cloud_storage_has_logs(
+        self, log_key: Sequence[str], io_type: ComputeIOType, partial: bool = False
+    ) -> bool:
+        return os.path.exists(self._storage_path(log_key, io_type, partial))
+
+    def upload_to_cloud_storage(
+        self, log_key: Sequence[str], io_type: ComputeIOType, partial: bool = False
+    ) -> None:
+        path = self.local_manager.get_captured_local_path(log_key, IO_TYPE_EXTENSION[io_type])
+        ensure_file(path)
+        if not partial:
+            self.whole_uploads.append(io_type)
+        storage_path = self._storage_path(log_key, io_type, partial)
+        ensure_dir(os.path.dirname(storage_path))
+        shutil.copyfile(path, storage_path)
+
+    def download_from_cloud_storage(
+        self, log_key: Sequence[str], io_type: ComputeIOType, partial: bool = False
+    ) -> None:
+        path = self.local_manager.get_captured_local_path(
+            log_key, IO_TYPE_EXTENSION[io_type], partial=partial
+        )
+        ensure_dir(os.path.dirname(path))
+        shutil.copyfile(self._storage_path(log_key, io_type, partial), path)
+
+    def start_chunked_upload(self, log_key: Sequence[str], io_type: ComputeIOType):
+        storage_path = self._storage_path(log_key, io_type)
+        ensure_dir(os.path.dirname(storage_path))
+        return storage_path
+
+    def upload_chunk(self, upload, chunk_number: int, data: bytes):
+        if chunk_number == self._fail_chunk_number:
+            raise Exception("failed to upload chunk")
+        chunk_path = f"{upload}.part{chunk_number}"
+        with open(chunk_path, "wb") as f:
+            f.write(data)
+        self.uploaded_chunks.append((chunk_number, len(data)))
+        return chunk_path
+
+    def complete_chunked_upload(self, upload, chunks):
+        with open(upload, "wb") as f:
+            for chunk_path in chunks:
+                with open(chunk_path, "rb") as chunk:
+                    shutil.copyfileobj(chunk, f)
+                os.remove(chunk_path)
+
+    def abort_chunked_upload(self, upload):
+        self.aborted_uploads.append(upload)
+
+
+class TestLocalDirectoryComputeLogManager(TestCapturedLogManager):
+    __test__ = True
+
+    @pytest.fixture(name="storage_dir")
+    def storage_dir(self):
+        with tempfile.TemporaryDirectory() as storage_dir:
+            yield storage_dir
+
+    @pytest.fixture(name="captured_log_manager")
+    def captured_log_manager(self, storage_dir):
+        with tempfile.TemporaryDirectory() as local_dir:
+            yield LocalDirectoryComputeLogManager(local_dir, storage_dir, chunk_size=4)
+
+    @pytest.fixture(name="write_manager")
+    def write_manager(self, storage_dir):
+        with tempfile.TemporaryDirectory() as local_dir:
+            yield LocalDirectoryComputeLogManager(
+                local_dir, storage_dir, upload_interval=1, chunk_size=4
+            )
+
+    @pytest.fixture(name="read_manager")
+    def read_manager(self, storage_dir):
+        with tempfile.TemporaryDirectory() as local_dir:
+            yield LocalDirectoryComputeLogManager(local_dir, storage_dir)
+
+
+CHUNK_SIZE = 1024
+
+
+def _wait_for_chunks(manager, num_chunks):
+    attempts = 20
+    while len(manager.uploaded_chunks) < num_chunks and attempts > 0:
+        time.sleep(CHUNKED_UPLOAD_POLLING_INTERVAL)
+        attempts -= 1
+
+
+@pytest.mark.skipif(
+    should_disable_io_stream_redirect(), reason="compute logs disabled for win / py3.6+"
+)
+def test_chunked_upload_during_capture():
+    with tempfile.TemporaryDirectory() as local_dir, tempfile.TemporaryDirectory() as storage_dir:
+        write_manager = LocalDirectoryComputeLogManager(
+            local_dir, storage_dir, chunk_size=CHUNK_SIZE
+        )
+        log_key = ["chunked", "log", "key"]
+        stdout = "x" * (CHUNK_SIZE * 3 - 1) + "\n" + "tail\n"
+        with write_manager.capture_logs(log_key):
+            print(stdout, end="")  # noqa: T201
+            sys.stdout.flush()
+
+            # complete chunks are uploaded while the logs are captured
+            _wait_for_chunks(write_manager, 3)
+            assert sorted(write_manager.uploaded_chunks) == [(i, CHUNK_SIZE) for i in range(1, 4)]
+            assert not write_manager.cloud_storage_has_logs(log_key, ComputeIOType.STDOUT)
+
+        # only the tail is uploaded when the capture completes, stderr is smaller than a chunk and
+        # is uploaded whole
+        assert write_manager.uploaded_chunks[3:] == [(4, len("tail\n"))]
+        assert write_manager.whole_uploads == [ComputeIOType.STDERR]
+        assert write_manager.is_capture_complete(log_key)
+
+        with tempfile.TemporaryDirectory() as read_dir:
+            read_manager = LocalDirectoryComputeLogManager(read_dir, storage_dir)
+            log_data = read_manager.get_log_data(log_key)
+            assert log_data.stdout == stdout.encode()
+            assert log_data.stderr == b""
+
+
+@pytest.mark.skipif(
+    should_disable_io_stream_redirect(), reason="compute logs disabled for win / py3.6+"
+)
+def test_chunked_upload_failure():
+    with tempfile.TemporaryDirectory() as local_dir, tempfile.TemporaryDirectory() as storage_dir:
+        write_manager = LocalDirectoryComputeLogManager(
+            local_dir, storage_dir, chunk_size=CHUNK_SIZE, fail_chunk_number=2
+        )
+        log_key = ["failed", "log", "key"]
+        stdout = "x" * (CHUNK_SIZE * 3)
+        with write_manager.capture_logs(log_key):
+            print(stdout, end="")  # noqa: T201
+
+        # the failed upload is discarded and the logs are uploaded whole instead
+        assert len(write_manager.aborted_uploads) == 1
+        assert write_manager.whole_uploads == [ComputeIOType.STDOUT, ComputeIOType.STDERR]
+
+        with tempfile.TemporaryDirectory() as read_dir:
+            read_manager = LocalDirectoryComputeLogManager(read_dir, storage_dir)
+            assert read_manager.get_log_data(log_key).stdout == stdout.encode()
@@ -27,6 +27,7 @@
     get_and_update_asset_status_cache_value,
 )
 from dagster._core.test_utils import create_run_for_test, instance_for_test
+from dagster._serdes import serialize_value
 from dagster._utils import Counter, traced_counter
 
 
@@ -785,3 +786,57 @@ def my_asset():
             asset_graph.get_partitions_def(asset_key)
         )
         assert failed_subset.get_partition_keys() == set()
+
+
+def test_incremental_status_cache_update():
+    partitions_def = DailyPartitionsDefinition(start_date="2022-01-01")
+
+    @asset(partitions_def=partitions_def)
+    def asset1():
+        return 1
+
+    asset_key = AssetKey("asset1")
+    asset_graph = AssetGraph.from_assets([asset1])
+    asset_job = define_asset_job("asset_job").resolve([asset1], [])
+
+    with instance_for_test() as instance:
+        asset_job.execute_in_process(instance=instance, partition_key="2022-02-01")
+        cached_status = get_and_update_asset_status_cache_value(
+            instance, asset_key, asset_graph.get_partitions_def(asset_key)
+        )
+        assert cached_status
+
+        traced_counter.set(Counter())
+
+        # nothing new was stored, so the stored value is neither recomputed nor rewritten
+        assert (
+            get_and_update_asset_status_cache_value(
+                instance, asset_key, asset_graph.get_partitions_def(asset_key)
+            )
+            == cached_status
+        )
+        counts = traced_counter.get().counts()
+        assert counts.get("DagsterInstance.update_asset_cached_status_data") is None
+
+        # new materializations are folded into the stored subsets without recounting
+        asset_job.execute_in_process(instance=instance, partition_key="2022-02-02")
+        cached_status = get_and_update_asset_status_cache_value(
+            instance, asset_key, asset_graph.get_partitions_def(asset_key)
+        )
+        assert cached_status
+        counts = traced_counter.get().counts()
+        assert counts.get("DagsterInstance.get_materialization_count_by_partition") is None
+        assert counts.get("DagsterInstance.update_asset_cached_status_data") == 1
+
+        materialized_subset = cached_status.deserialize_materialized_partition_subsets(
+            partitions_def
+        )
+        assert set(materialized_subset.get_partition_keys()) == {"2022-02-01", "2022-02-02"}
+
+        # deserialized subsets are shared across reads of the same cache value
+        assert (
+            AssetStatusCacheValue.from_db_string(
+                serialize_value(cached_status)
+            ).deserialize_materialized_partition_subsets(partitions_def)
+            is materialized_subset
+        )
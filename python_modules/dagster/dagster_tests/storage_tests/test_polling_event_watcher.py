@@ -1,12 +1,20 @@
 import tempfile
+import threading
 import time
+from collections import defaultdict
 from contextlib import contextmanager
 from typing import Any, Callable, Mapping, Union
 
 import dagster._check as check
 from dagster._core.events import DagsterEvent, DagsterEventType, EngineEventData
 from dagster._core.events.log import EventLogEntry
-from dagster._core.storage.event_log import SqliteEventLogStorage, SqlPollingEventWatcher
+from dagster._core.storage.dagster_run import DagsterRunStatus
+from dagster._core.storage.event_log import (
+    ConsolidatedSqliteEventLogStorage,
+    SqliteEventLogStorage,
+    SqlPollingEventWatcher,
+    polling_event_watcher,
+)
 from dagster._core.storage.event_log.base import EventLogCursor
 from dagster._serdes.config_class import ConfigurableClassData
 from typing_extensions import Self
@@ -138,3 +146,120 @@ def watch_two(event, _cursor):
 
     # calling end_watch after dispose does not error
     storage.end_watch(RUN_ID, watch_two)
+
+
+def test_multiplexed_watch():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        storage = ConsolidatedSqliteEventLogStorage(tmpdir_path)
+        watcher = SqlPollingEventWatcher(storage)
+        try:
+            watched = defaultdict(list)
+
+            def _callback(run_id):
+                return lambda event, _cursor: watched[run_id].append(event)
+
+            run_ids = [f"run_{i}" for i in range(5)]
+            for run_id in run_ids:
+                storage.store_event(create_event(0, run_id))
+                watcher.watch_run(run_id, None, _callback(run_id))
+
+            for count in range(1, 4):
+                for run_id in run_ids:
+                    storage.store_event(create_event(count, run_id))
+            storage.store_event(create_event(0, "unwatched_run"))
+
+            attempts = 20
+            while any(len(watched[run_id]) < 4 for run_id in run_ids) and attempts > 0:
+                time.sleep(0.1)
+                attempts -= 1
+
+            for run_id in run_ids:
+                assert [int(evt.message) for evt in watched[run_id]] == [0, 1, 2, 3]
+                assert all(evt.run_id == run_id for evt in watched[run_id])
+            assert "unwatched_run" not in watched
+
+            # all runs are polled from a single thread
+            assert len([t for t in threading.enumerate() if t.name == "sql-event-watch"]) == 1
+        finally:
+            watcher.close()
+            storage.dispose()
+
+
+def test_unwatch_on_terminal_status():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        storage = ConsolidatedSqliteEventLogStorage(tmpdir_path)
+        watcher = SqlPollingEventWatcher(storage, unwatch_on_terminal_status=True)
+        try:
+            watched = []
+
+            def _callback(event, _cursor):
+                watched.append(event)
+                if event.message == "2":
+                    return DagsterRunStatus.SUCCESS
+
+            watcher.watch_run(RUN_ID, None, _callback)
+            for count in range(1, 5):
+                storage.store_event(create_event(count))
+
+            attempts = 20
+            while watcher.has_run_id(RUN_ID) and attempts > 0:
+                time.sleep(0.1)
+                attempts -= 1
+
+            assert not watcher.has_run_id(RUN_ID)
+            assert [int(evt.message) for evt in watched] == [1, 2]
+        finally:
+            watcher.close()
+            storage.dispose()
+
+
+class _ManualPollingThread:
+    """Stands in for SqlPollingEventWatcherThread, so that tests can call poll themselves."""
+
+    def __init__(self, _watcher):
+        self.daemon = True
+        self.should_thread_exit = threading.Event()
+
+    def start(self):
+        pass
+
+    def wake(self):
+        pass
+
+    def join(self):
+        pass
+
+
+def test_watch_during_poll(monkeypatch):
+    monkeypatch.setattr(polling_event_watcher, "SqlPollingEventWatcherThread", _ManualPollingThread)
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        storage = ConsolidatedSqliteEventLogStorage(tmpdir_path)
+        watcher = SqlPollingEventWatcher(storage)
+        try:
+            watched = []
+            storage.store_event(create_event(1))
+            storage.store_event(create_event(2))
+
+            watcher.watch_run("other_run", None, lambda _event, _cursor: None)
+            cursor = watcher.poll(None)
+            storage.store_event(create_event(3))
+
+            # the run is watched after the pending runs were caught up, but before the shared
+            # cursor query returns its new event
+            get_logs_for_all_runs_by_log_id = storage.get_logs_for_all_runs_by_log_id
+
+            def _get_logs_for_all_runs_by_log_id(*args, **kwargs):
+                if not watcher.has_run_id(RUN_ID):
+                    watcher.watch_run(RUN_ID, None, lambda event, _cursor: watched.append(event))
+                return get_logs_for_all_runs_by_log_id(*args, **kwargs)
+
+            monkeypatch.setattr(
+                storage, "get_logs_for_all_runs_by_log_id", _get_logs_for_all_runs_by_log_id
+            )
+
+            cursor = watcher.poll(cursor)
+            watcher.poll(cursor)
+            assert [int(evt.message) for evt in watched] == [1, 2, 3]
+        finally:
+            watcher.close()
+            storage.dispose()
@@ -0,0 +1,216 @@
+import os
+import pickle
+import tempfile
+
+import pytest
+from dagster import (
+    SharedMemoryIOManager,
+    asset,
+    job,
+    materialize,
+    op,
+    reconstructable,
+    shared_memory_io_manager,
+)
+from dagster._annotations import is_experimental
+from dagster._core.definitions.metadata import MetadataValue
+from dagster._core.events import DagsterEventType
+from dagster._core.execution.api import execute_job
+from dagster._core.storage.shared_memory_io_manager import _remove_finished_runs_at_exit
+from dagster._core.test_utils import instance_for_test
+
+LARGE_VALUE_SIZE = 1024 * 1024
+
+
+class LargeBuffer:
+    """Pickles its data out-of-band, like NumPy arrays do."""
+
+    def __init__(self, data):
+        self.data = data
+
+    def __reduce_ex__(self, protocol):
+        if protocol >= 5:
+            return LargeBuffer, (pickle.PickleBuffer(self.data),)
+        return LargeBuffer, (bytes(self.data),)
+
+
+@op
+def emit_buffer():
+    return LargeBuffer(bytearray(b"x" * LARGE_VALUE_SIZE))
+
+
+@op
+def check_buffer(value):
+    assert isinstance(value, LargeBuffer)
+    assert len(value.data) == LARGE_VALUE_SIZE
+    # loaded buffers are mapped copy-on-write, so mutating them does not affect the stored value
+    value.data[0] = ord("y")
+    return len(value.data)
+
+
+@op
+def check_buffer_again(value, _length):
+    assert value.data[0] == ord("x")
+    return {"small": [1, 2, 3]}
+
+
+@op
+def check_small(value):
+    assert value == {"small": [1, 2, 3]}
+
+
+def shared_memory_job():
+    @job(
+        resource_defs={
+            "io_manager": shared_memory_io_manager.configured(
+                {"base_dir": os.environ["SHARED_MEMORY_TEST_BASE_DIR"]}
+            )
+        }
+    )
+    def _shared_memory_job():
+        value = emit_buffer()
+        check_small(check_buffer_again(value, check_buffer(value)))
+
+    return _shared_memory_job
+
+
+def _get_output_metadata(result, step_key):
+    events = [
+        event
+        for event in result.all_node_events
+        if event.step_key == step_key and event.event_type == DagsterEventType.HANDLED_OUTPUT
+    ]
+    assert len(events) == 1
+    return events[0].event_specific_data.metadata
+
+
+def test_shared_memory_io_manager_in_process(monkeypatch):
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        monkeypatch.setenv("SHARED_MEMORY_TEST_BASE_DIR", tmpdir_path)
+        result = shared_memory_job().execute_in_process()
+        assert result.success
+
+        metadata = _get_output_metadata(result, "emit_buffer")
+        if pickle.HIGHEST_PROTOCOL >= 5:
+            assert metadata["shared_bytes"] == MetadataValue.int(LARGE_VALUE_SIZE)
+        path = metadata["path"].value
+        assert path == os.path.join(tmpdir_path, result.run_id, "emit_buffer", "result")
+        assert os.path.getsize(path) > LARGE_VALUE_SIZE
+
+        small_metadata = _get_output_metadata(result, "check_buffer_again")
+        assert small_metadata["shared_bytes"] == MetadataValue.int(0)
+
+
+def test_shared_memory_io_manager_multiprocess(monkeypatch):
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        monkeypatch.setenv("SHARED_MEMORY_TEST_BASE_DIR", tmpdir_path)
+        with instance_for_test() as instance:
+            with execute_job(
+                reconstructable(shared_memory_job),
+                instance=instance,
+                run_config={"execution": {"config": {"multiprocess": {}}}},
+            ) as result:
+                assert result.success
+                assert os.path.isdir(os.path.join(tmpdir_path, result.run_id))
+
+
+def test_shared_memory_io_manager_removes_finished_runs():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        with instance_for_test() as instance:
+
+            @asset
+            def upstream():
+                return bytearray(b"x" * 64)
+
+            @asset
+            def downstream(upstream):
+                return len(upstream)
+
+            io_manager = SharedMemoryIOManager(base_dir=tmpdir_path)
+            first = materialize([upstream, downstream], resources={"io_manager": io_manager})
+            assert first.success
+            assert os.listdir(tmpdir_path) == [first.run_id]
+
+            unrelated_dir = os.path.join(tmpdir_path, "not_a_run")
+            os.mkdir(unrelated_dir)
+
+            second = materialize(
+                [upstream, downstream], resources={"io_manager": io_manager}, instance=instance
+            )
+            assert second.success
+
+            # the first run belongs to a different instance, so its outputs are left untouched
+            assert sorted(os.listdir(tmpdir_path)) == sorted(
+                [first.run_id, second.run_id, "not_a_run"]
+            )
+
+            third = materialize(
+                [upstream, downstream], resources={"io_manager": io_manager}, instance=instance
+            )
+            assert third.success
+            assert sorted(os.listdir(tmpdir_path)) == sorted(
+                [first.run_id, third.run_id, "not_a_run"]
+            )
+
+
+def test_shared_memory_io_manager_removes_finished_runs_at_exit():
+    @asset
+    def upstream():
+        return bytearray(b"x" * 64)
+
+    @asset
+    def downstream(upstream):
+        return len(upstream)
+
+    @asset
+    def failing_downstream(upstream):
+        raise Exception("failed")
+
+    with tempfile.TemporaryDirectory() as tmpdir_path, instance_for_test() as instance:
+        io_manager = SharedMemoryIOManager(base_dir=tmpdir_path)
+        success = materialize(
+            [upstream, downstream], resources={"io_manager": io_manager}, instance=instance
+        )
+        assert success.success
+        failure = materialize(
+            [upstream, failing_downstream],
+            resources={"io_manager": io_manager},
+            instance=instance,
+            raise_on_error=False,
+        )
+        assert not failure.success
+
+        # initializing the IO manager for the failed run removed the outputs of the first run
+        assert os.listdir(tmpdir_path) == [failure.run_id]
+
+        _remove_finished_runs_at_exit()
+        assert os.listdir(tmpdir_path) == []
+
+
+def test_shared_memory_io_manager_is_experimental():
+    assert is_experimental(SharedMemoryIOManager)
+    assert is_experimental(shared_memory_io_manager.resource_fn)
+
+
+@pytest.mark.skipif(pickle.HIGHEST_PROTOCOL < 5, reason="Requires pickle protocol 5")
+def test_shared_memory_io_manager_numpy():
+    np = pytest.importorskip("numpy")
+
+    @asset
+    def array():
+        return np.arange(LARGE_VALUE_SIZE, dtype=np.float64)
+
+    @asset
+    def total(array):
+        assert array.flags.writeable
+        assert array.ctypes.data % 64 == 0
+        return float(array.sum())
+
+    with tempfile.TemporaryDirectory() as tmpdir_path, instance_for_test() as instance:
+        result = materialize(
+            [array, total],
+            resources={"io_manager": SharedMemoryIOManager(base_dir=tmpdir_path)},
+            instance=instance,
+        )
+        assert result.success
+        assert result.output_for_node("total") == float(np.arange(LARGE_VALUE_SIZE).sum())
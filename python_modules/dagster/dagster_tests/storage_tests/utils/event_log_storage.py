@@ -699,6 +699,36 @@ def test_get_logs_for_run_cursor_limit(self, test_run_id, storage):
 
         assert _event_types(out_events) == _event_types(events)
 
+    def test_iter_records_for_run(self, test_run_id, storage):
+        events, result = _synthesize_events(return_one_op_func, run_id=test_run_id)
+
+        for event in events:
+            storage.store_event(event)
+
+        all_records = storage.get_records_for_run(result.run_id).records
+
+        with storage.iter_records_for_run(result.run_id, page_size=2) as records:
+            assert [record.storage_id for record in records] == [
+                record.storage_id for record in all_records
+            ]
+            assert records.cursor == storage.get_records_for_run(result.run_id).cursor
+
+        # resume a partially consumed stream from its cursor
+        records = storage.iter_records_for_run(result.run_id, page_size=2)
+        first_records = [next(records) for _ in range(3)]
+        records.close()
+        resumed_records = list(storage.iter_records_for_run(result.run_id, cursor=records.cursor))
+        assert [record.storage_id for record in first_records + resumed_records] == [
+            record.storage_id for record in all_records
+        ]
+
+        with storage.iter_records_for_run(
+            result.run_id, of_type=DagsterEventType.STEP_SUCCESS, page_size=2
+        ) as records:
+            assert [record.event_log_entry.dagster_event_type for record in records] == [
+                DagsterEventType.STEP_SUCCESS
+            ]
+
     def test_wipe_sql_backed_event_log(self, test_run_id, storage):
         events, result = _synthesize_events(return_one_op_func, run_id=test_run_id)
 
@@ -1156,6 +1186,57 @@ def _one():
         assert step_stats[0].attempts == 4
         assert len(step_stats[0].attempts_list) == 4
 
+    def test_run_stats_incremental(self, storage, test_run_id):
+        @op(
+            ins={"_input": In(str)},
+            out=Out(str),
+        )
+        def should_fail(context, _input):
+            raise Exception("booo")
+
+        def _one():
+            should_fail(should_succeed())
+
+        events, result = _synthesize_events(_one, check_success=False, run_id=test_run_id)
+        split = next(
+            i
+            for i, event in enumerate(events)
+            if event.dagster_event
+            and event.dagster_event.event_type == DagsterEventType.STEP_SUCCESS
+        )
+
+        for event in events[: split + 1]:
+            storage.store_event(event)
+
+        stats = storage.get_stats_for_run(result.run_id)
+        assert stats.steps_succeeded == 1
+        assert stats.steps_failed == 0
+        assert stats.end_time is None
+        step_stats = storage.get_step_stats_for_run(result.run_id)
+        assert [stat.step_key for stat in step_stats] == ["should_succeed"]
+
+        # stats read after more events are stored include the new events
+        for event in events[split + 1 :]:
+            storage.store_event(event)
+
+        stats = storage.get_stats_for_run(result.run_id)
+        assert stats.steps_succeeded == 1
+        assert stats.steps_failed == 1
+        assert stats.end_time
+        step_stats = sorted(storage.get_step_stats_for_run(result.run_id), key=lambda x: x.end_time)
+        assert [stat.step_key for stat in step_stats] == ["should_succeed", "should_fail"]
+        assert step_stats[0].status == StepEventStatus.SUCCESS
+        assert step_stats[0].attempts == 1
+        assert step_stats[1].status == StepEventStatus.FAILURE
+        assert step_stats[1].attempts == 1
+
+        # stats are not served from a stale cache after the run's events are deleted
+        storage.delete_events(result.run_id)
+        stats = storage.get_stats_for_run(result.run_id)
+        assert stats.steps_succeeded == 0
+        assert stats.steps_failed == 0
+        assert storage.get_step_stats_for_run(result.run_id) == []
+
     # After adding the IN_PROGRESS field to the StepEventStatus enum, tests in internal fail
     # Temporarily skipping this test
     @pytest.mark.skip
@@ -2730,6 +2811,53 @@ def my_op():
                 {"dagster/partition/country": "US", "dagster/partition/date": "2022-10-13"}
             ]
 
+    def test_store_events(self, storage, instance):
+        key = AssetKey("hello")
+        observed_key = AssetKey("observed")
+
+        @op
+        def my_op():
+            yield AssetMaterialization(asset_key=key, tags={"dagster/code_version": "1"})
+            for i in range(3):
+                yield AssetObservation(asset_key=observed_key, metadata={"index": i})
+            yield AssetMaterialization(asset_key=key, tags={"dagster/code_version": "2"})
+            yield Output(5)
+
+        run_id_1 = make_new_run_id()
+        run_id_2 = make_new_run_id()
+        with create_and_delete_test_runs(instance, [run_id_1, run_id_2]):
+            events_1, _ = _synthesize_events(lambda: my_op(), run_id_1)
+            events_2 = [create_test_event_log_record(str(i), run_id_2) for i in range(3)]
+            storage.store_events([*events_1, *events_2])
+
+            assert _event_types(storage.get_logs_for_run(run_id_1)) == _event_types(events_1)
+            assert [event.user_message for event in storage.get_logs_for_run(run_id_2)] == [
+                "0",
+                "1",
+                "2",
+            ]
+
+            assert set(storage.all_asset_keys()) == {key, observed_key}
+            materializations = storage.get_event_records(
+                EventRecordsFilter(DagsterEventType.ASSET_MATERIALIZATION, asset_key=key)
+            )
+            assert len(materializations) == 2
+            observations = storage.get_event_records(
+                EventRecordsFilter(DagsterEventType.ASSET_OBSERVATION, asset_key=observed_key)
+            )
+            assert len(observations) == 3
+
+            # the asset record points at the latest materialization in the batch
+            asset_record = storage.get_asset_records([key])[0]
+            assert asset_record.asset_entry.last_materialization_record.storage_id == max(
+                record.storage_id for record in materializations
+            )
+            assert asset_record.asset_entry.last_run_id == run_id_1
+
+            assert sorted(
+                tags["dagster/code_version"] for tags in storage.get_event_tags_for_asset(key)
+            ) == ["1", "2"]
+
     def test_add_asset_event_tags(self, storage, instance):
         if not storage.supports_add_asset_event_tags():
             pytest.skip("storage does not support adding asset event tags")
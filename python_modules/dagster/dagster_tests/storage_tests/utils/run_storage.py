@@ -39,6 +39,7 @@
     PARENT_RUN_ID_TAG,
     PARTITION_NAME_TAG,
     PARTITION_SET_TAG,
+    PRIORITY_TAG,
     REPOSITORY_LABEL_TAG,
     ROOT_RUN_ID_TAG,
 )
@@ -821,6 +822,68 @@ def test_fetch_by_status_cursored(self, storage):
         assert len(cursor_four_limit_one) == 1
         assert cursor_four_limit_one[0].run_id == two
 
+    def test_get_run_tag_counts(self, storage):
+        assert storage
+        for status, tags in [
+            (DagsterRunStatus.STARTED, {"database": "tiny", "team": "a"}),
+            (DagsterRunStatus.STARTED, {"database": "tiny"}),
+            (DagsterRunStatus.STARTING, {"database": "large", "team": "a"}),
+            (DagsterRunStatus.QUEUED, {"database": "tiny", "team": "b"}),
+        ]:
+            storage.add_run(
+                TestRunStorage.build_run(
+                    run_id=make_new_run_id(),
+                    job_name="some_pipeline",
+                    status=status,
+                    tags=tags,
+                    external_job_origin=self.fake_job_origin("some_pipeline"),
+                )
+            )
+
+        in_progress = RunsFilter(statuses=[DagsterRunStatus.STARTED, DagsterRunStatus.STARTING])
+        assert storage.get_run_tag_counts(["database", "team"], in_progress) == {
+            ("database", "tiny"): 2,
+            ("database", "large"): 1,
+            ("team", "a"): 2,
+        }
+        assert storage.get_run_tag_counts(["team"]) == {("team", "a"): 2, ("team", "b"): 1}
+        assert storage.get_run_tag_counts([], in_progress) == {}
+
+    def test_get_queued_runs(self, storage):
+        assert storage
+        run_ids = {}
+        for name, status, priority in [
+            ("first", DagsterRunStatus.QUEUED, None),
+            ("started", DagsterRunStatus.STARTED, "10"),
+            ("low", DagsterRunStatus.QUEUED, "-1"),
+            ("high", DagsterRunStatus.QUEUED, "3"),
+            ("malformed", DagsterRunStatus.QUEUED, "foobar"),
+            ("zero", DagsterRunStatus.QUEUED, "0"),
+            ("second_high", DagsterRunStatus.QUEUED, "3"),
+        ]:
+            run_ids[name] = make_new_run_id()
+            storage.add_run(
+                TestRunStorage.build_run(
+                    run_id=run_ids[name],
+                    job_name="some_pipeline",
+                    status=status,
+                    tags={PRIORITY_TAG: priority} if priority else None,
+                    external_job_origin=self.fake_job_origin("some_pipeline"),
+                )
+            )
+
+        # ordered by descending priority, then by creation
+        expected = [
+            run_ids[name] for name in ["high", "second_high", "first", "malformed", "zero", "low"]
+        ]
+        assert [run.run_id for run in storage.get_queued_runs()] == expected
+        assert [run.run_id for run in storage.get_queued_runs(limit=2)] == expected[:2]
+        assert [
+            run.run_id for run in storage.get_queued_runs(cursor=expected[1], limit=3)
+        ] == expected[2:5]
+        assert [run.run_id for run in storage.get_queued_runs(cursor=expected[4])] == expected[5:]
+        assert not storage.get_queued_runs(cursor=expected[5])
+
     def test_delete(self, storage):
         if not self.can_delete_runs():
             pytest.skip("storage cannot delete runs")
@@ -248,6 +248,47 @@ def upload_to_cloud_storage(
             }
             self._s3_session.upload_fileobj(data, self._s3_bucket, s3_key, ExtraArgs=extra_args)
 
+    @property
+    def supports_chunked_upload(self) -> bool:
+        return True
+
+    def start_chunked_upload(self, log_key: Sequence[str], io_type: ComputeIOType):
+        s3_key = self._s3_key(log_key, io_type)
+        extra_args = {
+            "ContentType": "text/plain",
+            **(self._upload_extra_args if self._upload_extra_args else {}),
+        }
+        response = self._s3_session.create_multipart_upload(
+            Bucket=self._s3_bucket, Key=s3_key, **extra_args
+        )
+        return s3_key, response["UploadId"]
+
+    def upload_chunk(self, upload, chunk_number: int, data: bytes):
+        s3_key, upload_id = upload
+        response = self._s3_session.upload_part(
+            Bucket=self._s3_bucket,
+            Key=s3_key,
+            UploadId=upload_id,
+            PartNumber=chunk_number,
+            Body=data,
+        )
+        return {"ETag": response["ETag"], "PartNumber": chunk_number}
+
+    def complete_chunked_upload(self, upload, chunks: Sequence[Any]):
+        s3_key, upload_id = upload
+        self._s3_session.complete_multipart_upload(
+            Bucket=self._s3_bucket,
+            Key=s3_key,
+            UploadId=upload_id,
+            MultipartUpload={"Parts": list(chunks)},
+        )
+
+    def abort_chunked_upload(self, upload):
+        s3_key, upload_id = upload
+        self._s3_session.abort_multipart_upload(
+            Bucket=self._s3_bucket, Key=s3_key, UploadId=upload_id
+        )
+
     def download_from_cloud_storage(
         self, log_key: Sequence[str], io_type: ComputeIOType, partial=False
     ):
@@ -1,3 +1,4 @@
+import base64
 import os
 from contextlib import contextmanager
 from typing import Any, Mapping, Optional, Sequence
@@ -24,7 +25,7 @@
 from dagster._utils import ensure_dir, ensure_file
 from typing_extensions import Self
 
-from .utils import create_blob_client, generate_blob_sas
+from .utils import BlobBlock, create_blob_client, generate_blob_sas
 
 
 class AzureBlobComputeLogManager(CloudStorageComputeLogManager, ConfigurableClass):
@@ -237,6 +238,22 @@ def upload_to_cloud_storage(
             blob = self._container_client.get_blob_client(blob_key)
             blob.upload_blob(data)
 
+    @property
+    def supports_chunked_upload(self) -> bool:
+        return True
+
+    def start_chunked_upload(self, log_key: Sequence[str], io_type: ComputeIOType):
+        return self._container_client.get_blob_client(self._blob_key(log_key, io_type))
+
+    def upload_chunk(self, upload, chunk_number: int, data: bytes):
+        # block ids must have the same length for all blocks of a blob
+        block_id = base64.b64encode(f"{chunk_number:08d}".encode()).decode()
+        upload.stage_block(block_id, data)
+        return block_id
+
+    def complete_chunked_upload(self, upload, chunks: Sequence[Any]):
+        upload.commit_block_list([BlobBlock(block_id) for block_id in chunks])
+
     def download_from_cloud_storage(
         self, log_key: Sequence[str], io_type: ComputeIOType, partial=False
     ):
@@ -3,7 +3,7 @@
 try:
     # Centralise Azure imports here so we only need to warn in one place
     from azure.core.exceptions import ResourceNotFoundError
-    from azure.storage.blob import BlobServiceClient, generate_blob_sas
+    from azure.storage.blob import BlobBlock, BlobServiceClient, generate_blob_sas
 except ImportError:
     msg = (
         "Could not import required Azure objects. This probably means you have an old version "
@@ -28,4 +28,10 @@ def create_blob_client(storage_account, credential) -> BlobServiceClient:
     return BlobServiceClient(account_url, credential)
 
 
-__all__ = ["create_blob_client", "generate_blob_sas", "BlobServiceClient", "ResourceNotFoundError"]
+__all__ = [
+    "create_blob_client",
+    "generate_blob_sas",
+    "BlobBlock",
+    "BlobServiceClient",
+    "ResourceNotFoundError",
+]
@@ -1,4 +1,5 @@
-from typing import Any, ContextManager, Mapping, Optional, Sequence
+import threading
+from typing import Any, ContextManager, Dict, List, Mapping, Optional, Sequence, Tuple
 
 import dagster._check as check
 import sqlalchemy as db
@@ -38,6 +39,7 @@
     retry_pg_connection_fn,
     retry_pg_creation_fn,
 )
+from .event_watcher import PostgresEventNotificationThread
 
 CHANNEL_NAME = "run_events"
 
@@ -90,7 +92,9 @@ def __init__(
             self.postgres_url, isolation_level="AUTOCOMMIT", poolclass=db_pool.NullPool
         )
 
-        self._event_watcher = SqlPollingEventWatcher(self)
+        self._event_watcher = SqlPollingEventWatcher(self, use_notifications=True)
+        self._notification_thread: Optional[PostgresEventNotificationThread] = None
+        self._notification_thread_lock = threading.Lock()
 
         self._secondary_index_cache = {}
 
@@ -181,7 +185,8 @@ def store_event(self, event: EventLogEntry) -> None:
             res = result.fetchone()
             result.close()
 
-            # LISTEN/NOTIFY no longer used for pg event watch - preserved here to support version skew
+            # wakes the event watcher (see PostgresEventNotificationThread) of any process watching
+            # this run, so that idle watched runs do not need to be polled
             conn.execute(
                 f"""NOTIFY {CHANNEL_NAME}, %s; """,
                 (res[0] + "_" + str(res[1]),),  # type: ignore
@@ -202,6 +207,46 @@ def store_event(self, event: EventLogEntry) -> None:
 
             self.store_asset_event_tags(event, event_id)
 
+    def store_events(self, events: Sequence[EventLogEntry]) -> None:
+        """Store a batch of events with a single multi-row insert.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+        if not events:
+            return
+
+        rows = [self.get_event_insert_values(event) for event in events]
+        with self._connect() as conn:
+            result = conn.execute(
+                SqlEventLogStorageTable.insert()
+                .values(rows)
+                .returning(SqlEventLogStorageTable.c.run_id, SqlEventLogStorageTable.c.id)
+            )
+            res = result.fetchall()
+            result.close()
+
+            # one notification per run is enough to wake any process watching it
+            max_event_id_by_run_id = {}
+            for run_id, event_id in res:
+                max_event_id_by_run_id[run_id] = max(
+                    event_id, max_event_id_by_run_id.get(run_id, event_id)
+                )
+            for run_id, event_id in max_event_id_by_run_id.items():
+                conn.execute(f"""NOTIFY {CHANNEL_NAME}, %s; """, (run_id + "_" + str(event_id),))
+
+        # rows are returned in insertion order
+        self._store_asset_events_batch(
+            [
+                (event, int(event_id))
+                for event, (_, event_id) in zip(events, res)
+                if event.is_dagster_event
+                and event.dagster_event_type in ASSET_EVENTS
+                and event.dagster_event.asset_key  # type: ignore
+            ]
+        )
+
     def store_asset_event(self, event: EventLogEntry, event_id: int) -> None:
         check.inst_param(event, "event", EventLogEntry)
         if not (event.dagster_event and event.dagster_event.asset_key):
@@ -254,6 +299,32 @@ def store_asset_event(self, event: EventLogEntry, event_id: int) -> None:
                 query = query.on_conflict_do_nothing()
             conn.execute(query)
 
+    def store_asset_events(self, events_and_ids: Sequence[Tuple[EventLogEntry, int]]) -> None:
+        values_by_asset_key = self._get_asset_entry_values_by_asset_key(events_and_ids)
+
+        # a single upsert statement cannot touch the same row twice, and a multi-row insert needs
+        # the same columns for every row, so upsert once per distinct set of updated columns
+        asset_keys_by_columns: Dict[Tuple[str, ...], List[str]] = {}
+        for asset_key_str, values in values_by_asset_key.items():
+            asset_keys_by_columns.setdefault(tuple(sorted(values.keys())), []).append(asset_key_str)
+
+        with self.index_connection() as conn:
+            for columns, asset_key_strs in asset_keys_by_columns.items():
+                query = db_dialects.postgresql.insert(AssetKeyTable).values(
+                    [
+                        dict(asset_key=asset_key_str, **values_by_asset_key[asset_key_str])
+                        for asset_key_str in asset_key_strs
+                    ]
+                )
+                if columns:
+                    query = query.on_conflict_do_update(
+                        index_elements=[AssetKeyTable.c.asset_key],
+                        set_={column: query.excluded[column] for column in columns},
+                    )
+                else:
+                    query = query.on_conflict_do_nothing()
+                conn.execute(query)
+
     def add_dynamic_partitions(
         self, partitions_def_name: str, partition_keys: Sequence[str]
     ) -> None:
@@ -307,6 +378,13 @@ def watch(
         if cursor and EventLogCursor.parse(cursor).is_offset_cursor():
             check.failed("Cannot call `watch` with an offset cursor")
 
+        with self._notification_thread_lock:
+            if not self._notification_thread:
+                self._notification_thread = PostgresEventNotificationThread(
+                    self.postgres_url, CHANNEL_NAME, self._event_watcher
+                )
+                self._notification_thread.start()
+
         self._event_watcher.watch_run(run_id, cursor, callback)
 
     def _gen_event_log_entry_from_cursor(self, cursor) -> EventLogEntry:
@@ -328,6 +406,9 @@ def __del__(self) -> None:
     def dispose(self) -> None:
         if not self._disposed:
             self._disposed = True
+            with self._notification_thread_lock:
+                if self._notification_thread:
+                    self._notification_thread.should_thread_exit.set()
             self._event_watcher.close()
 
     def alembic_version(self) -> AlembicVersion:
@@ -0,0 +1,81 @@
+import logging
+import select
+import threading
+
+import dagster._check as check
+import sqlalchemy.pool as db_pool
+from dagster._core.storage.event_log.polling_event_watcher import SqlPollingEventWatcher
+from dagster._core.storage.sql import create_engine
+
+from ..utils import retry_pg_connection_fn
+
+LISTEN_TIMEOUT = 1  # seconds between checks for thread exit while waiting for notifications
+RECONNECT_INTERVAL = 5  # seconds to wait before re-establishing a dropped LISTEN connection
+
+
+class PostgresEventNotificationThread(threading.Thread):
+    """subclass of Thread that LISTENs on the Postgres channel that the event log storage NOTIFYs
+    on every insert, and wakes a notification-driven SqlPollingEventWatcher whenever an event is
+    stored for one of its watched runs.
+
+    Notification payloads are of the form `{run_id}_{storage_id}`. If the LISTEN connection drops,
+    the watcher's fallback polling covers the gap until the connection is re-established.
+    """
+
+    def __init__(
+        self,
+        postgres_url: str,
+        channel: str,
+        watcher: SqlPollingEventWatcher,
+    ):
+        super(PostgresEventNotificationThread, self).__init__()
+        self._postgres_url = check.str_param(postgres_url, "postgres_url")
+        self._channel = check.str_param(channel, "channel")
+        self._watcher = check.inst_param(watcher, "watcher", SqlPollingEventWatcher)
+        self._should_thread_exit = threading.Event()
+        self.name = "postgres-event-notify"
+        self.daemon = True
+
+    @property
+    def should_thread_exit(self) -> threading.Event:
+        return self._should_thread_exit
+
+    def _listen(self) -> None:
+        # use a dedicated connection, outside of the storage's connection pool, since it is held
+        # open for as long as runs are being watched
+        engine = create_engine(self._postgres_url, poolclass=db_pool.NullPool)
+        raw_conn = retry_pg_connection_fn(engine.raw_connection)
+        try:
+            pg_conn = raw_conn.connection
+            pg_conn.set_session(autocommit=True)
+            with pg_conn.cursor() as cursor:
+                cursor.execute(f"LISTEN {self._channel};")
+
+            # pick up anything stored while we were not listening
+            self._watcher.notify()
+
+            while not self._should_thread_exit.is_set():
+                if select.select([pg_conn], [], [], LISTEN_TIMEOUT) == ([], [], []):
+                    continue
+                pg_conn.poll()
+                while pg_conn.notifies:
+                    notification = pg_conn.notifies.pop(0)
+                    run_id = notification.payload.rsplit("_", 1)[0]
+                    self._watcher.notify(run_id)
+        finally:
+            raw_conn.close()
+            engine.dispose()
+
+    def run(self):
+        while not self._should_thread_exit.is_set():
+            try:
+                self._listen()
+            except Exception:
+                logging.exception(
+                    (
+                        "Lost LISTEN connection for event log notifications, reconnecting in %s"
+                        " seconds."
+                    ),
+                    RECONNECT_INTERVAL,
+                )
+                self._should_thread_exit.wait(RECONNECT_INTERVAL)
@@ -0,0 +1,155 @@
+# ruff: noqa: T201
+"""Benchmarks the orchestration loop of ActiveExecution on synthetic wide, deep, and dynamically
+mapped execution plans.
+
+Usage:
+    python scripts/benchmark_active_execution.py [--steps 1000 5000] [--max-concurrent 8]
+
+Each scenario drives a plan to completion the way the multiprocess executor does: every tick asks
+for steps to execute with a max concurrency and completes the oldest in-flight step, so the loop
+runs roughly once per step.
+"""
+import argparse
+import time
+from collections import deque
+from typing import Callable, Deque, List, Tuple
+
+from dagster import (
+    DependencyDefinition,
+    DynamicOut,
+    DynamicOutput,
+    GraphDefinition,
+    JobDefinition,
+    NodeInvocation,
+    job,
+    op,
+)
+from dagster._core.events import DagsterEvent, DagsterEventType
+from dagster._core.execution.api import create_execution_plan
+from dagster._core.execution.plan.outputs import StepOutputData, StepOutputHandle
+from dagster._core.execution.retries import RetryMode
+from tabulate import tabulate
+
+MAX_CHAIN_LENGTH = 500
+
+
+@op
+def root():
+    return 1
+
+
+@op
+def passthrough(x):
+    return x
+
+
+def _build_wide_job(num_steps: int) -> JobDefinition:
+    return GraphDefinition(
+        name="wide",
+        node_defs=[root, passthrough],
+        dependencies={
+            NodeInvocation("passthrough", f"op_{i}"): {"x": DependencyDefinition("root")}
+            for i in range(num_steps)
+        },
+    ).to_job()
+
+
+def _build_deep_job(num_steps: int) -> JobDefinition:
+    # chains of steps, capped in length since graph construction recurses along dependencies
+    dependencies = {}
+    for i in range(num_steps):
+        upstream = "root" if i % MAX_CHAIN_LENGTH == 0 else f"op_{i - 1}"
+        dependencies[NodeInvocation("passthrough", f"op_{i}")] = {
+            "x": DependencyDefinition(upstream)
+        }
+    return GraphDefinition(
+        name="deep", node_defs=[root, passthrough], dependencies=dependencies
+    ).to_job()
+
+
+@op(out=DynamicOut())
+def fan_out():
+    yield DynamicOutput(1, mapping_key="0")
+
+
+def _build_dynamic_job(_num_steps: int) -> JobDefinition:
+    @job
+    def dynamic():
+        fan_out().map(passthrough)
+
+    return dynamic
+
+
+def _output_event(job_name: str, step_output_handle: StepOutputHandle) -> DagsterEvent:
+    return DagsterEvent(
+        event_type_value=DagsterEventType.STEP_OUTPUT.value,
+        job_name=job_name,
+        step_key=step_output_handle.step_key,
+        event_specific_data=StepOutputData(step_output_handle=step_output_handle),
+    )
+
+
+def _run_plan(job_def: JobDefinition, num_steps: int, max_concurrent: int) -> Tuple[int, float]:
+    plan = create_execution_plan(job_def)
+    num_executed = 0
+    start = time.perf_counter()
+    with plan.start(RetryMode.DISABLED, max_concurrent=max_concurrent) as active_execution:
+        in_flight: Deque[str] = deque()
+        while True:
+            in_flight.extend(step.key for step in active_execution.get_steps_to_execute())
+            if active_execution.is_complete:
+                break
+
+            step_key = in_flight.popleft()
+            step = active_execution.get_step_by_key(step_key)
+            for step_output in step.step_outputs:
+                if step_output.is_dynamic:
+                    for i in range(num_steps):
+                        active_execution.handle_event(
+                            _output_event(
+                                job_def.name, StepOutputHandle(step_key, step_output.name, str(i))
+                            )
+                        )
+                else:
+                    active_execution.mark_step_produced_output(
+                        StepOutputHandle(step_key, step_output.name)
+                    )
+            active_execution.mark_success(step_key)
+            num_executed += 1
+
+    return num_executed, (time.perf_counter() - start) * 1000
+
+
+SCENARIOS: List[Tuple[str, Callable[[int], JobDefinition]]] = [
+    ("wide", _build_wide_job),
+    ("deep", _build_deep_job),
+    ("dynamic", _build_dynamic_job),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--steps", type=int, nargs="+", default=[1000, 5000], help="steps per plan")
+    parser.add_argument(
+        "--max-concurrent", type=int, default=8, help="max concurrent steps per tick"
+    )
+    args = parser.parse_args()
+
+    rows = []
+    for num_steps in args.steps:
+        for name, build_job in SCENARIOS:
+            job_def = build_job(num_steps)
+            num_executed, elapsed = _run_plan(job_def, num_steps, args.max_concurrent)
+            rows.append((name, num_executed, elapsed, elapsed * 1000 / num_executed))
+
+    print(
+        tabulate(
+            rows,
+            headers=["plan", "steps", "total (ms)", "per step (us)"],
+            floatfmt=".1f",
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
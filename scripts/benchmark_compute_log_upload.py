@@ -0,0 +1,149 @@
+# ruff: noqa: T201
+"""Benchmarks how long uploading captured compute logs stalls the completion of a step, comparing
+whole-file uploads when the capture completes to chunked uploads while logs are captured.
+
+Usage:
+    python scripts/benchmark_compute_log_upload.py [--megabytes 64 256] [--bandwidth 200]
+
+Cloud storage is stood in for by a local directory. Uploads are throttled to the given bandwidth
+in MB/s, so that upload time dominates like it does for remote storage. The step writes to stdout
+at the given write rate, like a chatty op that logs while it computes.
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from typing import List, Optional, Sequence, Tuple
+
+from dagster._core.storage.cloud_storage_compute_log_manager import CloudStorageComputeLogManager
+from dagster._core.storage.compute_log_manager import ComputeIOType
+from dagster._core.storage.local_compute_log_manager import (
+    IO_TYPE_EXTENSION,
+    LocalComputeLogManager,
+)
+from dagster._utils import ensure_dir, ensure_file
+from tabulate import tabulate
+
+MB = 1024 * 1024
+
+
+class ThrottledDirectoryComputeLogManager(CloudStorageComputeLogManager):
+    def __init__(self, local_dir: str, storage_dir: str, bandwidth: float, chunked: bool):
+        self._local_manager = LocalComputeLogManager(local_dir)
+        self._storage_manager = LocalComputeLogManager(storage_dir)
+        self._bandwidth = bandwidth
+        self._chunked = chunked
+
+    @property
+    def local_manager(self) -> LocalComputeLogManager:
+        return self._local_manager
+
+    @property
+    def upload_interval(self) -> Optional[int]:
+        return None
+
+    @property
+    def supports_chunked_upload(self) -> bool:
+        return self._chunked
+
+    def _storage_path(self, log_key: Sequence[str], io_type: ComputeIOType) -> str:
+        return self._storage_manager.get_captured_local_path(log_key, IO_TYPE_EXTENSION[io_type])
+
+    def _throttle(self, num_bytes: int) -> None:
+        time.sleep(num_bytes / (self._bandwidth * MB))
+
+    def delete_logs(self, log_key=None, prefix=None):
+        raise NotImplementedError()
+
+    def download_url_for_type(self, log_key, io_type):
+        return self._storage_path(log_key, io_type)
+
+    def display_path_for_type(self, log_key, io_type):
+        return self._storage_path(log_key, io_type)
+
+    def cloud_storage_has_logs(self, log_key, io_type, partial=False):
+        return not partial and os.path.exists(self._storage_path(log_key, io_type))
+
+    def upload_to_cloud_storage(self, log_key, io_type, partial=False):
+        path = self.local_manager.get_captured_local_path(log_key, IO_TYPE_EXTENSION[io_type])
+        ensure_file(path)
+        storage_path = self._storage_path(log_key, io_type)
+        ensure_dir(os.path.dirname(storage_path))
+        self._throttle(os.path.getsize(path))
+        shutil.copyfile(path, storage_path)
+
+    def start_chunked_upload(self, log_key, io_type):
+        storage_path = self._storage_path(log_key, io_type)
+        ensure_dir(os.path.dirname(storage_path))
+        return storage_path
+
+    def upload_chunk(self, upload, chunk_number, data):
+        self._throttle(len(data))
+        chunk_path = f"{upload}.part{chunk_number}"
+        with open(chunk_path, "wb") as f:
+            f.write(data)
+        return chunk_path
+
+    def complete_chunked_upload(self, upload, chunks):
+        with open(upload, "wb") as f:
+            for chunk_path in chunks:
+                with open(chunk_path, "rb") as chunk:
+                    shutil.copyfileobj(chunk, f)
+                os.remove(chunk_path)
+
+
+def _capture(
+    manager: CloudStorageComputeLogManager, megabytes: int, write_rate: float
+) -> Tuple[float, float]:
+    line = "x" * 1023 + "\n"
+    lines_per_mb = MB // len(line)
+    start = time.perf_counter()
+    with manager.capture_logs(["benchmark", str(megabytes)]):
+        for _ in range(megabytes):
+            for _ in range(lines_per_mb):
+                sys.stdout.write(line)
+            sys.stdout.flush()
+            # pace the writes like an op that logs while it computes
+            time.sleep(1 / write_rate)
+        body_end = time.perf_counter()
+    end = time.perf_counter()
+    return body_end - start, end - body_end
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--megabytes", type=int, nargs="+", default=[64, 256], help="MB written to stdout"
+    )
+    parser.add_argument("--bandwidth", type=float, default=200, help="upload bandwidth in MB/s")
+    parser.add_argument("--write-rate", type=float, default=100, help="stdout writes in MB/s")
+    args = parser.parse_args()
+
+    rows: List[Tuple[int, str, float, float]] = []
+    for megabytes in args.megabytes:
+        for chunked in [False, True]:
+            with tempfile.TemporaryDirectory() as local_dir, tempfile.TemporaryDirectory() as (
+                storage_dir
+            ):
+                manager = ThrottledDirectoryComputeLogManager(
+                    local_dir, storage_dir, args.bandwidth, chunked
+                )
+                step_seconds, stall_seconds = _capture(manager, megabytes, args.write_rate)
+                rows.append(
+                    (megabytes, "chunked" if chunked else "whole file", step_seconds, stall_seconds)
+                )
+
+    print(
+        tabulate(
+            rows,
+            headers=["stdout (MB)", "upload", "step (s)", "upload after step (s)"],
+            floatfmt=".2f",
+        ),
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+# ruff: noqa: T201
+"""Benchmarks how execution plan construction scales with the number of assets in a job, and
+compares it to rebuilding the plan for a single step from a stored execution plan snapshot, which
+is what pooled step workers do. They fetch the snapshot for the first step of a run and reuse it for
+the later ones.
+
+Usage:
+    python scripts/benchmark_execution_plan.py [--assets 1000 4000] [--width 100]
+
+Assets are laid out in layers of the given width, where each asset depends on two assets of the
+previous layer.
+"""
+import argparse
+import time
+from typing import Callable, List, Sequence, Tuple, TypeVar
+
+from dagster import AssetIn, AssetsDefinition, Definitions, JobDefinition, asset, define_asset_job
+from dagster._core.definitions.job_base import InMemoryJob
+from dagster._core.execution.api import (
+    create_execution_plan,
+    create_execution_plan_for_steps,
+    get_cached_execution_plan_snapshot,
+)
+from dagster._core.instance import DagsterInstance
+from tabulate import tabulate
+
+T = TypeVar("T")
+
+
+def _build_assets(num_assets: int, width: int) -> Sequence[AssetsDefinition]:
+    assets = []
+    for i in range(num_assets):
+        layer, position = divmod(i, width)
+        if layer == 0:
+            ins = {}
+        else:
+            upstream = [
+                f"asset_{(layer - 1) * width + position}",
+                f"asset_{(layer - 1) * width + (position + 1) % width}",
+            ]
+            ins = {f"in_{j}": AssetIn(key) for j, key in enumerate(upstream)}
+
+        @asset(name=f"asset_{i}", ins=ins)
+        def _asset(**kwargs):
+            return 1
+
+        assets.append(_asset)
+    return assets
+
+
+def _build_job(num_assets: int, width: int) -> JobDefinition:
+    defs = Definitions(
+        assets=_build_assets(num_assets, width), jobs=[define_asset_job("all_assets")]
+    )
+    return defs.get_job_def("all_assets")
+
+
+def _time(fn: Callable[[], T]) -> Tuple[T, float]:
+    start = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--assets", type=int, nargs="+", default=[1000, 4000], help="assets per job"
+    )
+    parser.add_argument("--width", type=int, default=100, help="assets per layer")
+    args = parser.parse_args()
+
+    rows: List[Tuple[int, float, float, float, float]] = []
+    with DagsterInstance.ephemeral() as instance:
+        for num_assets in args.assets:
+            job_def = _build_job(num_assets, args.width)
+            execution_plan, build_ms = _time(lambda: create_execution_plan(job_def))
+            dagster_run = instance.create_run_for_job(
+                job_def=job_def, execution_plan=execution_plan
+            )
+
+            step_key = execution_plan.step_keys_to_execute[-1]
+            _, step_build_ms = _time(
+                lambda: create_execution_plan(job_def, step_keys_to_execute=[step_key])
+            )
+
+            def _create_step_plan():
+                return create_execution_plan_for_steps(
+                    InMemoryJob(job_def),
+                    dagster_run,
+                    get_cached_execution_plan_snapshot(
+                        instance, dagster_run.execution_plan_snapshot_id
+                    ),
+                    step_keys_to_execute=[step_key],
+                    known_state=None,
+                )
+
+            # the first step executed in a process fetches the snapshot, later ones reuse it
+            _, step_rebuild_ms = _time(_create_step_plan)
+            _, cached_step_rebuild_ms = _time(_create_step_plan)
+            rows.append(
+                (num_assets, build_ms, step_build_ms, step_rebuild_ms, cached_step_rebuild_ms)
+            )
+
+    print(
+        tabulate(
+            rows,
+            headers=[
+                "assets",
+                "build plan (ms)",
+                "build step plan (ms)",
+                "step plan from snapshot (ms)",
+                "step plan from cached snapshot (ms)",
+            ],
+            floatfmt=".1f",
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+# ruff: noqa: T201
+"""Benchmarks the latency of calls from DagsterGrpcClient to a local code server, comparing calls
+on a pooled channel to calls that each open a new channel, and repository snapshots fetched with
+and without gzip compression.
+
+Usage:
+    python scripts/benchmark_grpc_client.py [--calls 200] [--jobs 200]
+
+The code server is started in a subprocess on a local port, loading a generated repository with
+the given number of jobs.
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from typing import Callable, List, Tuple
+
+import grpc
+from dagster._core.host_representation.origin import (
+    ExternalRepositoryOrigin,
+    GrpcServerCodeLocationOrigin,
+)
+from dagster._core.test_utils import instance_for_test
+from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
+from dagster._grpc.server import GrpcServerProcess
+from tabulate import tabulate
+
+REPOSITORY_SOURCE = """
+from dagster import job, op, repository
+
+
+@op
+def noop():
+    pass
+
+
+def _make_job(i):
+    @job(name=f"job_{{i}}")
+    def _job():
+        noop()
+
+    return _job
+
+
+@repository
+def benchmark_repo():
+    return [_make_job(i) for i in range({num_jobs})]
+"""
+
+
+def _time_calls(fn: Callable[[], object], num_calls: int) -> Tuple[float, float]:
+    timings = []
+    for _ in range(num_calls):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), statistics.quantiles(timings, n=100)[98]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--calls", type=int, default=200, help="calls per measurement")
+    parser.add_argument("--jobs", type=int, default=200, help="jobs in the repository")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir, instance_for_test() as instance:
+        python_file = os.path.join(temp_dir, "benchmark_repo.py")
+        with open(python_file, "w") as f:
+            f.write(REPOSITORY_SOURCE.format(num_jobs=args.jobs))
+
+        with GrpcServerProcess(
+            instance_ref=instance.get_ref(),
+            loadable_target_origin=LoadableTargetOrigin(python_file=python_file),
+            force_port=True,
+            wait_on_exit=True,
+        ) as server_process:
+            client = server_process.create_client()
+            repository_origin = ExternalRepositoryOrigin(
+                GrpcServerCodeLocationOrigin(port=client.port, host="localhost"), "benchmark_repo"
+            )
+
+            def _ping_new_channel():
+                client._discard_channel()  # noqa: SLF001
+                client.ping("")
+
+            def _fetch_repository(compression: grpc.Compression) -> Callable[[], object]:
+                return lambda: client.external_repository(
+                    repository_origin, compression=compression
+                )
+
+            rows: List[Tuple[str, float, float]] = []
+            for name, fn, num_calls in [
+                ("ping, new channel per call", _ping_new_channel, args.calls),
+                ("ping, pooled channel", lambda: client.ping(""), args.calls),
+                (
+                    "repository snapshot, gzip",
+                    _fetch_repository(grpc.Compression.Gzip),
+                    max(args.calls // 10, 2),
+                ),
+                (
+                    "repository snapshot, no compression",
+                    _fetch_repository(grpc.Compression.NoCompression),
+                    max(args.calls // 10, 2),
+                ),
+            ]:
+                fn()  # warm up
+                rows.append((name, *_time_calls(fn, num_calls)))
+
+    print(tabulate(rows, headers=["call", "median (ms)", "p99 (ms)"], floatfmt=".2f"))
+
+
+if __name__ == "__main__":
+    main()
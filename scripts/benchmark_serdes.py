@@ -0,0 +1,132 @@
+# ruff: noqa: T201
+"""Benchmarks serdes over objects of representative sizes: event log entries, runs, job snapshots,
+and repository snapshots.
+
+Usage:
+    python scripts/benchmark_serdes.py [--ops 500] [--assets 500] [--events 5000] [--repeat 5]
+"""
+import argparse
+import timeit
+from typing import Callable, List, Sequence, Tuple
+
+import dagster._check as check
+from dagster import AssetIn, Definitions, asset, job, op
+from dagster._core.events.log import EventLogEntry
+from dagster._core.host_representation.external_data import external_repository_data_from_def
+from dagster._core.instance import DagsterInstance
+from dagster._core.snap import JobSnapshot
+from dagster._core.storage.dagster_run import DagsterRun
+from dagster._serdes import deserialize_value, serialize_value
+from tabulate import tabulate
+
+
+def _build_job(num_ops: int):
+    @op
+    def first_op():
+        return 1
+
+    def _make_op(i: int):
+        @op(name=f"op_{i}")
+        def _op(x):
+            return x + 1
+
+        return _op
+
+    ops = [_make_op(i) for i in range(num_ops)]
+
+    @job
+    def big_job():
+        value = first_op()
+        for inner_op in ops:
+            value = inner_op(value)
+
+    return big_job
+
+
+def _build_definitions(num_assets: int, big_job) -> Definitions:
+    def _make_asset(i: int):
+        if i == 0:
+
+            @asset(name="asset_0", group_name="benchmark")
+            def _asset():
+                return 0
+
+        else:
+
+            @asset(
+                name=f"asset_{i}",
+                group_name="benchmark",
+                ins={"upstream": AssetIn(f"asset_{(i - 1) // 2}")},
+            )
+            def _asset(upstream):
+                return upstream + 1
+
+        return _asset
+
+    return Definitions(assets=[_make_asset(i) for i in range(num_assets)], jobs=[big_job])
+
+
+def _build_events(big_job, num_events: int) -> Tuple[Sequence[EventLogEntry], DagsterRun]:
+    events: List[EventLogEntry] = []
+    with DagsterInstance.ephemeral() as instance:
+        while len(events) < num_events:
+            result = big_job.execute_in_process(
+                instance=instance,
+                run_config={"loggers": {"console": {"config": {"log_level": "ERROR"}}}},
+            )
+            events.extend(instance.all_logs(result.run_id))
+        run = check.not_none(instance.get_run_by_id(result.run_id))
+    return events[:num_events], run
+
+
+def _time(fn: Callable[[], object], repeat: int) -> float:
+    return min(timeit.repeat(fn, number=1, repeat=repeat)) * 1000
+
+
+def _benchmark(name: str, values: Sequence[object], repeat: int) -> Tuple:
+    serialized_values = [serialize_value(value) for value in values]
+    return (
+        name,
+        sum(len(v) for v in serialized_values),
+        _time(lambda: [serialize_value(value) for value in values], repeat),
+        _time(lambda: [deserialize_value(value) for value in serialized_values], repeat),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--ops", type=int, default=500, help="number of ops in the job snapshot")
+    parser.add_argument("--assets", type=int, default=500, help="number of assets in the repo")
+    parser.add_argument("--events", type=int, default=5000, help="number of event log entries")
+    parser.add_argument("--repeat", type=int, default=5, help="number of timing repetitions")
+    args = parser.parse_args()
+
+    big_job = _build_job(args.ops)
+    defs = _build_definitions(args.assets, big_job)
+    repository_def = defs.get_repository_def()
+    events, run = _build_events(big_job, args.events)
+
+    rows = [
+        _benchmark(f"EventLogEntry x{len(events)}", events, args.repeat),
+        _benchmark("DagsterRun x1000", [run] * 1000, args.repeat),
+        _benchmark(
+            f"JobSnapshot ({args.ops} ops)", [JobSnapshot.from_job_def(big_job)], args.repeat
+        ),
+        _benchmark(
+            f"ExternalRepositoryData ({args.assets} assets)",
+            [external_repository_data_from_def(repository_def)],
+            args.repeat,
+        ),
+    ]
+
+    print(
+        tabulate(
+            rows,
+            headers=["value", "size (bytes)", "serialize (ms)", "deserialize (ms)"],
+            floatfmt=".1f",
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
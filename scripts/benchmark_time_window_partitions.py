@@ -0,0 +1,85 @@
+# ruff: noqa: T201
+"""Benchmarks partition key enumeration and lookups for time window partitions definitions with
+10^5 to 10^6 partitions.
+
+Usage:
+    python scripts/benchmark_time_window_partitions.py [--partitions 100000 1000000] [--repeat 3]
+"""
+import argparse
+import timeit
+from datetime import datetime, timedelta
+from typing import Callable, List, Tuple
+
+from dagster import TimeWindowPartitionsDefinition
+from tabulate import tabulate
+
+# (label, cron schedule, fmt, minutes per partition)
+SCHEDULES = [
+    ("minutely", "* * * * *", "%Y-%m-%d-%H:%M", 1),
+    ("hourly", "15 * * * *", "%Y-%m-%d-%H:%M", 60),
+    ("daily", "0 0 * * *", "%Y-%m-%d", 24 * 60),
+]
+
+
+def _time(fn: Callable[[], object], repeat: int) -> float:
+    return min(timeit.repeat(fn, number=1, repeat=repeat)) * 1000
+
+
+def _benchmark(
+    label: str, cron_schedule: str, fmt: str, minutes: int, num_partitions: int, repeat: int
+) -> Tuple:
+    start = datetime(2000, 1, 1)
+    current_time = start + timedelta(minutes=minutes * num_partitions)
+    partitions_def = TimeWindowPartitionsDefinition(
+        start=start, fmt=fmt, cron_schedule=cron_schedule, end_offset=0
+    )
+    partition_keys: List[str] = list(partitions_def.get_partition_keys(current_time=current_time))
+    sample_keys = partition_keys[:: max(len(partition_keys) // 1000, 1)]
+
+    return (
+        label,
+        len(partition_keys),
+        _time(lambda: partitions_def.get_num_partitions(current_time=current_time), repeat),
+        _time(lambda: partitions_def.get_partition_keys(current_time=current_time), repeat),
+        _time(
+            lambda: partitions_def.get_partition_keys_between_indexes(
+                len(partition_keys) - 100, len(partition_keys), current_time=current_time
+            ),
+            repeat,
+        ),
+        _time(lambda: partitions_def.time_windows_for_partition_keys(sample_keys), repeat),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--partitions", type=int, nargs="+", default=[100_000, 1_000_000], help="partition counts"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="number of timing repetitions")
+    args = parser.parse_args()
+
+    rows = [
+        _benchmark(label, cron_schedule, fmt, minutes, num_partitions, args.repeat)
+        for num_partitions in args.partitions
+        for label, cron_schedule, fmt, minutes in SCHEDULES
+    ]
+
+    print(
+        tabulate(
+            rows,
+            headers=[
+                "schedule",
+                "partitions",
+                "num partitions (ms)",
+                "all keys (ms)",
+                "last 100 keys (ms)",
+                "1000 key windows (ms)",
+            ],
+            floatfmt=".1f",
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()